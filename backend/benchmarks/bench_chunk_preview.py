@@ -0,0 +1,70 @@
+"""
+Benchmark: chunking preview latency on the real preprocessing path.
+
+Builds a representative sample (line structure preserved) of a generated
+document, then times ContentAnalyzer.preview_chunking for each strategy: the
+first call runs normalization, sectioning and the chunkers, repeated calls with
+the same settings are served from the result cache.
+
+Usage:
+    DATABASE_URL=sqlite:///:memory: python benchmarks/bench_chunk_preview.py --files 3
+"""
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from bench_chunking import make_document  # noqa: E402
+from loguru import logger  # noqa: E402
+
+from primedata.analysis.chunk_preview import clear_preview_caches  # noqa: E402
+from primedata.analysis.content_analyzer import (  # noqa: E402
+    ChunkingConfig,
+    ChunkingStrategy,
+    ContentType,
+    build_representative_sample,
+    content_analyzer,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=3, help="Number of file samples in the preview content")
+    parser.add_argument("--mb", type=float, default=2.0, help="Size of each generated document in MB")
+    parser.add_argument("--chunk-size", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    # Preprocessing logs every step; keep the output readable
+    logger.remove()
+    logging.disable(logging.WARNING)
+
+    document = make_document(int(args.mb * 2**20))
+    sample = build_representative_sample(document, preserve_structure=True)
+    content = "\n\n".join([sample] * args.files)
+    print(f"preview content: {len(content):,} chars ({args.files} file samples)")
+
+    for strategy in ChunkingStrategy:
+        config = ChunkingConfig(
+            args.chunk_size, args.chunk_size // 6, 100, 2000, strategy, ContentType.GENERAL, 1.0, "benchmark"
+        )
+        clear_preview_caches()
+        start = time.perf_counter()
+        preview = content_analyzer.preview_chunking(content, config, playbook_id="TECH")
+        first = time.perf_counter() - start
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            content_analyzer.preview_chunking(content, config, playbook_id="TECH")
+        cached = (time.perf_counter() - start) / args.repeat
+        print(
+            f"  {strategy.value:<20} {preview['total_chunks']:5d} chunks  "
+            f"first {first * 1000:7.1f} ms  cached {cached * 1000:6.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
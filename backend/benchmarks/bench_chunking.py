@@ -0,0 +1,140 @@
+"""
+Benchmark: sentence and paragraph chunking of multi-MB documents.
+
+Compares the previous join-per-candidate chunkers (each sentence re-joins the
+whole buffer and re-estimates its tokens) with the span-based chunkers in
+utils/chunking.py, and checks that both produce the same chunks.
+
+Usage:
+    python benchmarks/bench_chunking.py --mb 4 --max-tokens 900
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import regex as re  # noqa: E402
+
+from primedata.ingestion_pipeline.aird_stages.utils.chunking import (  # noqa: E402
+    SENT_SPLIT_RE,
+    _split_long_sentence_at_words,
+    paragraph_chunk,
+    sentence_chunk,
+    tokens_estimate,
+)
+
+WORDS = "the data pipeline stores vectors for each product version and the playground searches them".split()
+
+
+def make_document(n_bytes: int, seed: int = 42) -> str:
+    rng = random.Random(seed)
+    paragraphs, size = [], 0
+    while size < n_bytes:
+        sentences = []
+        for _ in range(rng.randint(2, 8)):
+            words = [rng.choice(WORDS) for _ in range(rng.randint(5, 30))]
+            sentences.append(" ".join(words).capitalize() + rng.choice([".", "?", "!"]))
+        paragraph = " ".join(sentences)
+        paragraphs.append(paragraph)
+        size += len(paragraph) + 2
+    return "\n\n".join(paragraphs)
+
+
+def legacy_sentence_chunk(body, max_tokens, overlap_sents, hard_overlap_chars):
+    sents = [s.strip() for s in re.split(SENT_SPLIT_RE, body) if s and s.strip()]
+    chunks, buf = [], []
+    for s in sents:
+        if tokens_estimate(s) > max_tokens:
+            if buf:
+                chunks.append(" ".join(buf))
+                buf = []
+            long_sentence_chunks = _split_long_sentence_at_words(s, max_tokens, hard_overlap_chars)
+            chunks.extend(long_sentence_chunks)
+            buf = [long_sentence_chunks[-1]] if long_sentence_chunks and overlap_sents > 0 else []
+        elif tokens_estimate(" ".join(buf + [s])) <= max_tokens:
+            buf.append(s)
+        else:
+            if buf:
+                chunks.append(" ".join(buf))
+            buf = buf[-overlap_sents:] if overlap_sents > 0 else []
+            buf.append(s)
+    if buf:
+        chunks.append(" ".join(buf))
+    out = []
+    for c in chunks:
+        if tokens_estimate(c) > max_tokens:
+            out.extend(_split_long_sentence_at_words(c, max_tokens, hard_overlap_chars))
+        else:
+            out.append(c)
+    return out
+
+
+def legacy_paragraph_chunk(body, max_tokens, overlap_paras, hard_overlap_chars):
+    # Blank-line paragraphs only (make_document always has them)
+    paras = [p.strip() for p in re.split(r"\n\s*\n+", body) if p and p.strip()]
+    sentence_overlap = max(1, overlap_paras * 2)
+    chunks, buf = [], []
+    for para in paras:
+        cand = "\n\n".join(buf + [para]) if buf else para
+        if tokens_estimate(para) > max_tokens:
+            if buf:
+                chunks.append("\n\n".join(buf))
+                buf = []
+            chunks.extend(legacy_sentence_chunk(para, max_tokens, sentence_overlap, hard_overlap_chars))
+        elif tokens_estimate(cand) <= max_tokens:
+            buf.append(para)
+        else:
+            if buf:
+                chunks.append("\n\n".join(buf))
+            buf = buf[-overlap_paras:] if overlap_paras > 0 else []
+            buf.append(para)
+    if buf:
+        chunks.append("\n\n".join(buf))
+    out = []
+    for c in chunks:
+        if tokens_estimate(c) > max_tokens:
+            out.extend(legacy_sentence_chunk(c, max_tokens, sentence_overlap, hard_overlap_chars))
+        else:
+            out.append(c)
+    return out
+
+
+def timed(label, n_bytes, fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<28} {elapsed:8.3f}s {n_bytes / elapsed / 2**20:8.2f} MB/s {len(result):8,} chunks")
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mb", type=float, default=4.0, help="Document size in MB")
+    parser.add_argument("--max-tokens", type=int, default=900)
+    parser.add_argument("--overlap", type=int, default=2, help="Overlap in sentences/paragraphs")
+    parser.add_argument("--hard-overlap", type=int, default=200)
+    args = parser.parse_args()
+
+    body = make_document(int(args.mb * 2**20))
+    # Sentence chunking of a body without paragraph structure (one huge "paragraph")
+    flat = body.replace("\n\n", " ")
+    chunk_args = (args.max_tokens, args.overlap, args.hard_overlap)
+    print(f"{len(body) / 2**20:.1f} MB document, max_tokens={args.max_tokens}, overlap={args.overlap}")
+
+    print("sentence_chunk:")
+    legacy = timed("join per candidate", len(flat), legacy_sentence_chunk, flat, *chunk_args)
+    current = timed("span buffer", len(flat), sentence_chunk, flat, *chunk_args)
+    print(f"  identical output: {legacy == current}")
+
+    print("paragraph_chunk:")
+    legacy = timed("join per candidate", len(body), legacy_paragraph_chunk, body, *chunk_args)
+    current = timed("span buffer", len(body), paragraph_chunk, body, *chunk_args)
+    print(f"  identical output: {legacy == current}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Benchmark: chunk-metric aggregation (fingerprint, per-file, validation summary).
+
+Compares the dict-scanning aggregation (one scan per file / per metric label)
+with the columnar MetricsFrame engine.
+
+Usage:
+    python benchmarks/bench_metrics_aggregation.py --chunks 1000000 --files 2000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from primedata.services.metrics_aggregation import MetricsFrame  # noqa: E402
+from primedata.services.reporting import generate_validation_summary  # noqa: E402
+
+METRIC_KEYS = [
+    "AI_Trust_Score",
+    "Completeness",
+    "Accuracy",
+    "Secure",
+    "Quality",
+    "Timeliness",
+    "Token_Count",
+    "GPT_Confidence",
+    "Context_Quality",
+    "Metadata_Presence",
+    "Audience_Intentionality",
+    "Diversity",
+    "Audience_Accessibility",
+    "KnowledgeBase_Ready",
+    "Chunk_Coherence",
+    "Noise_Free_Score",
+]
+SECTIONS = ["introduction", "overview", "details", "appendix", "faq", "unknown"]
+
+
+def make_metrics(n_chunks: int, n_files: int, seed: int = 42):
+    rng = random.Random(seed)
+    metrics = []
+    for i in range(n_chunks):
+        m = {k: round(rng.uniform(0, 100), 2) for k in METRIC_KEYS}
+        m["file"] = f"doc_{i % n_files}.jsonl"
+        m["section"] = SECTIONS[i % len(SECTIONS)]
+        m["chunk_id"] = f"chunk_{i}"
+        metrics.append(m)
+    return metrics
+
+
+def legacy_mean(metrics):
+    sums, counts = {}, {}
+    for m in metrics:
+        for k, v in m.items():
+            if isinstance(v, (int, float)) and k != "file":
+                sums[k] = sums.get(k, 0.0) + float(v)
+                counts[k] = counts.get(k, 0) + 1
+    return {k: round(total / counts[k], 4) for k, total in sums.items()}
+
+
+def legacy_by_file(metrics, file_tags):
+    return {tag: legacy_mean([m for m in metrics if m.get("file") == tag]) for tag in file_tags}
+
+
+def timed(label, fn, *args, **kwargs):
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<40} {elapsed:8.3f}s")
+    return result, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--chunks", type=int, default=1_000_000)
+    parser.add_argument("--files", type=int, default=2_000)
+    parser.add_argument(
+        "--legacy-files",
+        type=int,
+        default=50,
+        help="Number of files to aggregate with the legacy per-file scan (it is O(files x chunks))",
+    )
+    args = parser.parse_args()
+
+    print(f"Generating {args.chunks:,} chunk metrics across {args.files:,} files...")
+    metrics = make_metrics(args.chunks, args.files)
+
+    print("Legacy (dict scans):")
+    timed("global mean", legacy_mean, metrics)
+    sample_tags = [f"doc_{i}.jsonl" for i in range(min(args.legacy_files, args.files))]
+    _, legacy_subset = timed(f"per-file mean ({len(sample_tags)} files)", legacy_by_file, metrics, sample_tags)
+    print(f"  {'per-file mean (extrapolated, all files)':<40} {legacy_subset * args.files / max(1, len(sample_tags)):8.3f}s")
+
+    print("MetricsFrame (columnar):")
+    frame, _ = timed("load frame", MetricsFrame, metrics)
+    timed("global mean", frame.mean)
+    timed("global percentiles", frame.percentiles)
+    timed("per-file mean (all files)", frame.group_mean, "file")
+    timed("per-file + per-section summary", frame.summary)
+    timed("validation summary CSV", generate_validation_summary, metrics, 70.0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+Benchmark: preprocess wall time and log volume on many small files.
+
+Runs PreprocessStage.execute over N small text files held by an in-memory
+MinIO stand-in, with log sinks set up like a deployment: a loguru sink at
+DEBUG (like logs/app.log) and a standard logging handler at INFO (like
+Airflow's task log handler). Both sinks only count records and bytes.
+
+Usage:
+    DATABASE_URL=sqlite:///:memory: python benchmarks/bench_preprocess_logging.py --files 5000
+"""
+
+import argparse
+import logging
+import random
+import sys
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from loguru import logger  # noqa: E402
+
+from primedata.ingestion_pipeline.aird_stages.preprocess import PreprocessStage  # noqa: E402
+from primedata.ingestion_pipeline.aird_stages.storage import AirdStorageAdapter  # noqa: E402
+
+WORDS = "the data pipeline stores vectors for each product version and the playground searches them".split()
+
+
+class InMemoryMinIO:
+    """The MinIO client methods used by AirdStorageAdapter during preprocessing."""
+
+    def __init__(self):
+        self.objects = {}
+
+    def get_bytes(self, bucket, key):
+        return self.objects.get((bucket, key))
+
+    def _info(self, data):
+        return {"size": len(data), "sha256": None, "etag": None}
+
+    def put_bytes_with_info(self, bucket, key, data, content_type=None):
+        return self._info(data)
+
+    def put_json_with_info(self, bucket, key, obj):
+        return self._info(b"")
+
+    def put_stream(self, bucket, key, produce, content_type=None):
+        sink = _CountingSink()
+        produce(sink)
+        return {"size": sink.size, "sha256": None, "etag": None}
+
+
+class _CountingSink:
+    def __init__(self):
+        self.size = 0
+
+    def write(self, data):
+        self.size += len(data)
+        return len(data)
+
+
+class LogCounter(logging.Handler):
+    """Counts formatted records (stands in for a log store)."""
+
+    def __init__(self):
+        super().__init__(level=logging.INFO)
+        self.records = 0
+        self.bytes = 0
+
+    def emit(self, record):
+        self.records += 1
+        self.bytes += len(self.format(record))
+
+    def write(self, message):
+        # loguru sink
+        self.records += 1
+        self.bytes += len(message)
+
+
+def make_text(rng: random.Random, sentences: int) -> str:
+    return "\n\n".join(
+        " ".join(rng.choice(WORDS) for _ in range(rng.randint(8, 20))).capitalize() + "."
+        for _ in range(sentences)
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=5000)
+    parser.add_argument("--sentences", type=int, default=12, help="Sentences per file")
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    product_id, workspace_id = uuid.uuid4(), uuid.uuid4()
+    minio = InMemoryMinIO()
+    storage = AirdStorageAdapter(workspace_id, product_id, 1, minio_client=minio)
+    file_map = {}
+    for i in range(args.files):
+        stem = f"file_{i:05d}"
+        key = f"ws/{workspace_id}/prod/{product_id}/v/1/raw/{stem}.txt"
+        minio.objects[("primedata-raw", key)] = make_text(rng, args.sentences).encode("utf-8")
+        file_map[stem] = {"storage_key": key, "storage_bucket": "primedata-raw", "filename": f"{stem}.txt"}
+
+    loguru_sink, std_sink = LogCounter(), LogCounter()
+    logger.remove()
+    logger.add(loguru_sink, level="DEBUG", format="{time} | {level} | {name}:{function}:{line} - {message}")
+    logging.getLogger().addHandler(std_sink)
+    logging.getLogger().setLevel(logging.INFO)
+
+    stage = PreprocessStage(product_id=product_id, version=1, workspace_id=workspace_id)
+    context = {
+        "storage": storage,
+        "raw_files": list(file_map),
+        "file_stem_to_storage_key": file_map,
+        "playbook_id": "TECH",
+        "chunking_config": {
+            "mode": "manual",
+            "manual_settings": {"chunking_strategy": "sentence", "chunk_size": 200, "chunk_overlap": 20},
+        },
+    }
+    start = time.perf_counter()
+    result = stage.execute(context)
+    elapsed = time.perf_counter() - start
+
+    print(f"{args.files} files: {result.status.value}, {result.metrics.get('total_chunks')} chunks")
+    print(f"  wall time       {elapsed:8.2f}s ({elapsed / args.files * 1000:.2f} ms/file)")
+    print(f"  loguru (DEBUG)  {loguru_sink.records:8,} records {loguru_sink.bytes / 2**20:8.1f} MiB")
+    print(f"  std (INFO)      {std_sink.records:8,} records {std_sink.bytes / 2**20:8.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
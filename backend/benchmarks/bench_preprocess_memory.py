@@ -0,0 +1,106 @@
+"""
+Benchmark: peak memory of preprocessing one large document and writing its JSONL.
+
+Runs PreprocessStage._process_document on a generated multi-page document and
+compares, under tracemalloc, the previous way of writing the processed JSONL
+(every record holding its own text copy, serialized into one string) with the
+span-based records whose text is materialized record by record while streaming.
+
+Usage:
+    DATABASE_URL=sqlite:///:memory: python benchmarks/bench_preprocess_memory.py --mb 8
+"""
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from bench_chunking import make_document  # noqa: E402
+
+from primedata.ingestion_pipeline.aird_stages.playbooks import load_playbook_yaml  # noqa: E402
+from primedata.ingestion_pipeline.aird_stages.preprocess import PreprocessStage  # noqa: E402
+from primedata.ingestion_pipeline.aird_stages.storage import AirdStorageAdapter  # noqa: E402
+
+
+class _NullStorage:
+    """put_stream target that only counts the bytes (no MinIO needed)."""
+
+    def put_stream(self, bucket, key, produce, content_type=None):
+        sink = _CountingSink()
+        produce(sink)
+        return {"size": sink.size, "sha256": None, "etag": None}
+
+
+class _CountingSink:
+    def __init__(self):
+        self.size = 0
+
+    def write(self, data):
+        self.size += len(data)
+        return len(data)
+
+
+def measure(label, fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  {label:<40} {elapsed:8.2f}s  peak {peak / 2**20:8.1f} MiB")
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mb", type=float, default=8.0, help="Document size in MB")
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--strategy", default="sentence", choices=["sentence", "paragraph", "fixed_size"])
+    parser.add_argument("--chunk-size", type=int, default=300)
+    args = parser.parse_args()
+
+    body = make_document(int(args.mb * 2**20))
+    page_size = len(body) // args.pages + 1
+    raw_text = "\n".join(
+        f"=== PAGE {i + 1} ===\n{body[offset : offset + page_size]}"
+        for i, offset in enumerate(range(0, len(body), page_size))
+    )
+    del body
+    stage = PreprocessStage(product_id=uuid.uuid4(), version=1, workspace_id=uuid.uuid4())
+    chunking_config = {
+        "mode": "manual",
+        "manual_settings": {"chunking_strategy": args.strategy, "chunk_size": args.chunk_size, "chunk_overlap": 60},
+    }
+    print(f"{len(raw_text) / 2**20:.1f} MB document, {args.pages} pages, strategy={args.strategy}")
+
+    document, stats = measure(
+        "process document",
+        lambda: stage._process_document(
+            raw_text, "bench", "bench.txt", load_playbook_yaml("TECH"), "TECH", chunking_config=chunking_config
+        ),
+    )
+    print(f"  {stats['chunks']:,} chunks")
+
+    def write_legacy():
+        # Records with their own text, JSONL built as one string
+        records = list(document.iter_records())
+        return len("\n".join(json.dumps(rec, ensure_ascii=False) for rec in records).encode("utf-8"))
+
+    storage = AirdStorageAdapter(uuid.uuid4(), uuid.uuid4(), 1, minio_client=_NullStorage())
+
+    def write_streamed():
+        key = storage.put_processed_jsonl("bench", document.iter_records())
+        return storage.get_written_info("primedata-clean", key)["size"]
+
+    legacy_size = measure("text records + JSONL string", write_legacy)
+    streamed_size = measure("span records + streamed JSONL", write_streamed)
+    print(f"  identical JSONL size: {legacy_size == streamed_size} ({streamed_size / 2**20:.1f} MiB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Benchmark: per-version collections vs tenant-partitioned shared collections.
+
+Creates --products product versions with a few points each in one layout, then
+reports setup time, Qdrant resident memory (from its /metrics endpoint) and
+p50/p95 filtered search latency for random tenants. Run it once per layout
+against a fresh Qdrant so the memory numbers are comparable; the per-version
+run creates one collection per product.
+
+Usage:
+    docker run -p 6333:6333 qdrant/qdrant
+    python benchmarks/bench_qdrant_layout.py --layout per_version --products 5000
+    python benchmarks/bench_qdrant_layout.py --layout shared --products 5000
+"""
+
+import argparse
+import os
+import random
+import re
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import requests  # noqa: E402
+
+WORKSPACE_ID = "00000000-0000-0000-0000-0000000be7c4"
+
+
+def qdrant_memory_bytes(client):
+    """Resident memory reported by Qdrant's Prometheus endpoint (0 if unavailable)."""
+    try:
+        text = requests.get(f"http://{client.host}:{client.port}/metrics", timeout=10).text
+    except Exception:
+        return 0
+    for metric in ("memory_resident_bytes", "memory_allocated_bytes"):
+        match = re.search(rf"^{metric}\s+([0-9.e+]+)$", text, re.MULTILINE)
+        if match:
+            return float(match.group(1))
+    return 0
+
+
+def random_vector(dimension):
+    return [random.uniform(-1, 1) for _ in range(dimension)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--layout", choices=["per_version", "shared"], required=True)
+    parser.add_argument("--products", type=int, default=5000)
+    parser.add_argument("--points", type=int, default=20, help="Points per product version")
+    parser.add_argument("--dimension", type=int, default=384)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--keep", action="store_true", help="Do not delete the benchmark collections")
+    args = parser.parse_args()
+
+    os.environ["QDRANT_COLLECTION_LAYOUT"] = args.layout
+    from primedata.indexing.qdrant_client import QdrantClient
+
+    client = QdrantClient()
+    if not client.is_connected():
+        raise SystemExit("Qdrant client not connected")
+
+    memory_before = qdrant_memory_bytes(client)
+    names = []
+    start = time.perf_counter()
+    for i in range(args.products):
+        product_id = str(uuid.uuid4())
+        name = client.get_collection_name(WORKSPACE_ID, product_id, 1, f"bench-{i:05d}")
+        tenant = {"workspace_id": WORKSPACE_ID, "product_id": product_id}
+        client.ensure_collection(name, args.dimension, tenant=tenant, embedding_model="bench")
+        points = [
+            {
+                "id": str(uuid.uuid4()),
+                "vector": random_vector(args.dimension),
+                "payload": {"product_id": product_id, "version": 1, "chunk_id": f"chunk-{j}"},
+            }
+            for j in range(args.points)
+        ]
+        client.upsert_points(name, points, batch_size=args.points)
+        names.append(name)
+    setup_seconds = time.perf_counter() - start
+    memory_after = qdrant_memory_bytes(client)
+
+    latencies = []
+    for _ in range(args.queries):
+        name = random.choice(names)
+        query_start = time.perf_counter()
+        client.search_points(name, random_vector(args.dimension), limit=5)
+        latencies.append((time.perf_counter() - query_start) * 1000)
+    latencies.sort()
+
+    print(f"Layout {args.layout}: {args.products:,} product versions x {args.points} points, dim {args.dimension}")
+    print(f"  setup                {setup_seconds:10.1f}s")
+    print(f"  Qdrant memory delta  {(memory_after - memory_before) / 2**20:10.1f} MiB")
+    print(f"  search p50           {statistics.median(latencies):10.2f} ms")
+    print(f"  search p95           {latencies[int(len(latencies) * 0.95) - 1]:10.2f} ms")
+
+    if not args.keep:
+        for name in names:
+            client.delete_collection(name)
+
+
+if __name__ == "__main__":
+    main()
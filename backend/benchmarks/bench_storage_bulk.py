@@ -0,0 +1,86 @@
+"""
+Benchmark: bulk object storage operations against a local MinIO.
+
+Compares serial put_bytes/stat_object/get_object/remove loops with the
+concurrent put_many/stat_many/get_many/delete_many APIs and reports objects/s.
+Uses the MINIO_* settings (e.g. from backend/.env) and writes under a
+throwaway prefix in primedata-raw.
+
+Usage:
+    docker run -p 9000:9000 minio/minio server /data
+    python benchmarks/bench_storage_bulk.py --objects 10000 --size 2048 --workers 16
+"""
+
+import argparse
+import os
+import sys
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from primedata.storage.minio_client import get_storage_client  # noqa: E402
+
+BUCKET = "primedata-raw"
+
+
+def timed(label, n_objects, fn, *args, **kwargs):
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<28} {elapsed:8.3f}s {n_objects / elapsed:10.0f} objects/s")
+    return result
+
+
+def serial_put(client, objects):
+    return [client.put_bytes(bucket, key, data, content_type) for bucket, key, data, content_type in objects]
+
+
+def serial_stat(client, keys):
+    return [client.stat_object(bucket, key) for bucket, key in keys]
+
+
+def serial_get(client, keys):
+    return [client.get_object(bucket, key) for bucket, key in keys]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--objects", type=int, default=10_000)
+    parser.add_argument("--size", type=int, default=2048, help="Object size in bytes")
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument(
+        "--serial-objects",
+        type=int,
+        default=1_000,
+        help="Number of objects for the serial baseline (kept smaller, it is slow)",
+    )
+    args = parser.parse_args()
+
+    client = get_storage_client()
+    prefix = f"bench/{uuid.uuid4().hex}/"
+    payload = os.urandom(args.size)
+    objects = [(BUCKET, f"{prefix}obj-{i:06d}", payload, "application/octet-stream") for i in range(args.objects)]
+    keys = [(bucket, key) for bucket, key, _, _ in objects]
+    serial_n = min(args.serial_objects, args.objects)
+
+    print(f"{args.objects:,} objects of {args.size:,} bytes, {args.workers} workers (MinIO at {client.host})")
+
+    print(f"Serial loops ({serial_n:,} objects):")
+    timed("put_bytes", serial_n, serial_put, client, objects[:serial_n])
+    timed("stat_object", serial_n, serial_stat, client, keys[:serial_n])
+    timed("get_object", serial_n, serial_get, client, keys[:serial_n])
+
+    print(f"Bulk API ({args.objects:,} objects):")
+    puts = timed("put_many", args.objects, client.put_many, objects, max_workers=args.workers)
+    stats = timed("stat_many", args.objects, client.stat_many, keys, max_workers=args.workers)
+    gets = timed("get_many", args.objects, client.get_many, keys, max_workers=args.workers)
+    deletes = timed("delete_many", args.objects, client.delete_many, keys, max_workers=args.workers)
+
+    failed = sum(1 for results in (puts, stats, gets, deletes) for r in results if not r.ok)
+    print(f"Failed operations: {failed}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Compare two benchmark suite result files (benchmarks/suite.py --output).
+
+Prints the change of every benchmark against the baseline and flags slowdowns
+above the threshold; exits with status 1 if there are any, so it can gate CI.
+Baselines are machine-specific: compare results taken on the same machine.
+
+Usage:
+    python benchmarks/compare.py benchmarks/baselines/suite_baseline.json results.json
+    python benchmarks/compare.py baseline.json results.json --threshold 0.25 --stat min
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+
+def compare_results(
+    baseline: Dict[str, Any], current: Dict[str, Any], threshold: float = 0.15, stat: str = "median_s"
+) -> List[Dict[str, Any]]:
+    """Compare current results against a baseline.
+
+    Args:
+        baseline: Baseline suite output ({"meta": ..., "results": {name: stats}})
+        current: Current suite output
+        threshold: Relative slowdown (0.15 = 15%) above which a benchmark is flagged
+        stat: Statistic to compare (median_s or min_s)
+
+    Returns:
+        One row per benchmark: name, baseline_s, current_s, change and status
+        (slower, faster, ok, missing or new)
+    """
+    base_results = baseline.get("results", {})
+    current_results = current.get("results", {})
+    rows = []
+    for name in sorted(set(base_results) | set(current_results)):
+        base, cur = base_results.get(name), current_results.get(name)
+        if cur is None or base is None:
+            rows.append(
+                {
+                    "name": name,
+                    "baseline_s": base.get(stat) if base else None,
+                    "current_s": cur.get(stat) if cur else None,
+                    "change": None,
+                    "status": "missing" if cur is None else "new",
+                }
+            )
+            continue
+        change = cur[stat] / base[stat] - 1 if base[stat] else 0.0
+        if change > threshold:
+            status = "slower"
+        elif change < -threshold:
+            status = "faster"
+        else:
+            status = "ok"
+        rows.append({"name": name, "baseline_s": base[stat], "current_s": cur[stat], "change": change, "status": status})
+    return rows
+
+
+def format_comparison(rows: List[Dict[str, Any]], threshold: float = 0.15) -> str:
+    """Render comparison rows as a table followed by a summary line."""
+
+    def _ms(value):
+        return f"{value * 1000:11.3f}" if value is not None else f"{'-':>11}"
+
+    lines = [f"{'benchmark':62} {'base ms':>11} {'now ms':>11} {'change':>8}"]
+    for row in rows:
+        change = f"{row['change']:+8.1%}" if row["change"] is not None else f"{'':8}"
+        flag = {"slower": "  SLOWER", "faster": "  faster", "missing": "  missing", "new": "  new"}.get(row["status"], "")
+        lines.append(f"{row['name']:62} {_ms(row['baseline_s'])} {_ms(row['current_s'])} {change}{flag}")
+
+    counts = {status: sum(1 for row in rows if row["status"] == status) for status in ("slower", "faster", "missing", "new")}
+    lines.append(
+        f"\n{counts['slower']} slower, {counts['faster']} faster than baseline by more than {threshold:.0%}"
+        f" ({counts['missing']} missing, {counts['new']} new)"
+    )
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("baseline", help="Baseline results JSON")
+    parser.add_argument("current", help="Current results JSON")
+    parser.add_argument("--threshold", type=float, default=0.15, help="Flag slowdowns above this fraction")
+    parser.add_argument("--stat", choices=["median", "min"], default="median")
+    args = parser.parse_args()
+
+    baseline = json.loads(Path(args.baseline).read_text())
+    current = json.loads(Path(args.current).read_text())
+    rows = compare_results(baseline, current, args.threshold, f"{args.stat}_s")
+    print(format_comparison(rows, args.threshold))
+    if any(row["status"] == "slower" for row in rows):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+"""
+Deterministic synthetic corpus for the AIRD benchmarks.
+
+Generates documents of several kinds and sizes from a seed, so every run of the
+suite (and every machine) processes the same input:
+
+- prose:        headed sections of paragraphs (technical writing)
+- boilerplate:  prose pages wrapped in repeated headers, footers, page numbers,
+                copyright lines and tables of contents
+- table:        pipe tables, tab-separated and CSV-like rows with numbers
+- pdf:          multi-page PDF (Helvetica text objects) of prose
+
+Usage:
+    python benchmarks/corpus.py --out /tmp/aird-corpus --sizes small,medium --seed 42
+"""
+
+import argparse
+import random
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+KINDS = ("prose", "boilerplate", "table", "pdf")
+# Approximate document size in characters
+SIZES: Dict[str, int] = {"small": 4 * 1024, "medium": 64 * 1024, "large": 512 * 1024}
+
+WORDS = (
+    "the data pipeline stores vectors for each product version and the playground searches them "
+    "ingestion normalizes raw documents before chunking sections into retrieval units with metadata "
+    "quality scores measure completeness accuracy coherence and noise across every indexed chunk"
+).split()
+TERMS = ["API", "Qdrant", "MinIO", "JSONL", "embedding", "retrieval", "latency", "throughput", "schema"]
+HEADINGS = ["Introduction", "Overview", "Architecture", "Methods", "Results", "Configuration", "Summary"]
+TABLE_HEADER = ["Region", "Quarter", "Revenue", "Cost", "Margin", "Units"]
+REGIONS = ["North", "South", "East", "West", "Central"]
+PDF_LINE_CHARS = 90
+PDF_LINES_PER_PAGE = 50
+
+
+@dataclass
+class CorpusDocument:
+    """One generated document; ``text`` is the source text (also for PDFs)."""
+
+    name: str
+    kind: str
+    size: str
+    filename: str
+    text: str
+    data: bytes
+
+
+def _rng(kind: str, size: str, seed: int) -> random.Random:
+    # Stable across processes (unlike hash())
+    return random.Random(seed * 1_000_003 + zlib.crc32(f"{kind}-{size}".encode()))
+
+
+def _sentence(rng: random.Random) -> str:
+    words = [rng.choice(WORDS) for _ in range(rng.randint(6, 22))]
+    if rng.random() < 0.4:
+        words.insert(rng.randrange(len(words)), rng.choice(TERMS))
+    if rng.random() < 0.1:
+        words.append(f"v{rng.randint(1, 9)}.{rng.randint(0, 20)}")
+    words[0] = words[0][:1].upper() + words[0][1:]
+    return " ".join(words) + rng.choice([".", ".", ".", "?", "!"])
+
+
+def _paragraph(rng: random.Random, wrap: Optional[int] = None) -> str:
+    text = " ".join(_sentence(rng) for _ in range(rng.randint(2, 7)))
+    if not wrap:
+        return text
+    # Hard-wrapped lines, as extracted from PDFs or e-mails
+    lines, line = [], ""
+    for word in text.split(" "):
+        if line and len(line) + 1 + len(word) > wrap:
+            lines.append(line)
+            line = word
+        else:
+            line = f"{line} {word}" if line else word
+    lines.append(line)
+    return "\n".join(lines)
+
+
+def _prose(rng: random.Random, n_chars: int, wrap: Optional[int] = None) -> str:
+    parts, size, section = [], 0, 0
+    while size < n_chars:
+        if section == 0 or rng.random() < 0.15:
+            section += 1
+            heading = f"{section}. {rng.choice(HEADINGS)}"
+            parts.append(heading)
+            size += len(heading)
+        paragraph = _paragraph(rng, wrap)
+        parts.append(paragraph)
+        size += len(paragraph) + 2
+    return "\n\n".join(parts)
+
+
+def _boilerplate(rng: random.Random, n_chars: int) -> str:
+    pages, size = [], 0
+    while size < n_chars:
+        body = _prose(rng, rng.randint(1500, 3000), wrap=80)
+        pages.append(body)
+        size += len(body)
+    total = len(pages)
+    out = []
+    for number, body in enumerate(pages, start=1):
+        page = ["ACME Data Platform — Internal Use", "CONFIDENTIAL"]
+        if number == 1:
+            page += ["Table of Contents"] + [f"{i}. {h} .......... {i + 1}" for i, h in enumerate(HEADINGS, start=1)]
+        page += [body, f"Page {number} of {total}", "Copyright 2024 ACME Corp. All rights reserved."]
+        out.append("\n".join(page))
+    return "\n\n".join(out)
+
+
+def _table(rng: random.Random, n_chars: int) -> str:
+    parts, size = [], 0
+    while size < n_chars:
+        style = rng.choice(["pipe", "tsv", "csv"])
+        rows = [TABLE_HEADER]
+        for _ in range(rng.randint(8, 30)):
+            revenue, cost = rng.randint(10_000, 900_000), rng.randint(5_000, 600_000)
+            rows.append(
+                [
+                    rng.choice(REGIONS),
+                    f"Q{rng.randint(1, 4)} {rng.randint(2019, 2025)}",
+                    f"{revenue:,}",
+                    f"{cost:,}",
+                    f"{(revenue - cost) / revenue:.1%}",
+                    str(rng.randint(1, 5000)),
+                ]
+            )
+        if style == "pipe":
+            lines = ["| " + " | ".join(row) + " |" for row in rows]
+            lines.insert(1, "|" + "---|" * len(TABLE_HEADER))
+        elif style == "tsv":
+            lines = ["\t".join(row) for row in rows]
+        else:
+            lines = [",".join(f'"{cell}"' if "," in cell else cell for cell in row) for row in rows]
+        block = f"Table {len(parts) // 2 + 1}. {rng.choice(HEADINGS)} by region\n" + "\n".join(lines)
+        parts.append(block)
+        parts.append(_paragraph(rng))
+        size += len(block) + len(parts[-1])
+    return "\n\n".join(parts)
+
+
+def _pdf_escape(line: str) -> str:
+    return line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def make_pdf(text: str) -> bytes:
+    """Minimal multi-page PDF with the text set in Helvetica (extractable with pypdf)."""
+    lines: List[str] = []
+    for paragraph in text.split("\n"):
+        while len(paragraph) > PDF_LINE_CHARS:
+            cut = paragraph.rfind(" ", 0, PDF_LINE_CHARS)
+            cut = cut if cut > 0 else PDF_LINE_CHARS
+            lines.append(paragraph[:cut])
+            paragraph = paragraph[cut:].lstrip()
+        lines.append(paragraph)
+    pages = [lines[i : i + PDF_LINES_PER_PAGE] for i in range(0, len(lines), PDF_LINES_PER_PAGE)] or [[]]
+
+    # Objects: 1 catalog, 2 page tree, 3 font, then a (page, content) pair per page
+    objects: List[bytes] = [b"", b"", b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>"]
+    page_ids = []
+    for page_lines in pages:
+        content = "BT /F1 10 Tf 12 TL 50 760 Td " + " ".join(f"({_pdf_escape(line)}) Tj T*" for line in page_lines) + " ET"
+        stream = content.encode("cp1252", errors="replace")
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % (len(objects) + 2)
+        )
+        page_ids.append(len(objects))
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+    objects[0] = b"<< /Type /Catalog /Pages 2 0 R >>"
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+        b" ".join(b"%d 0 R" % page_id for page_id in page_ids),
+        len(page_ids),
+    )
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
+
+
+def make_document(kind: str, size: str, seed: int = 42) -> CorpusDocument:
+    """Generate one document.
+
+    Args:
+        kind: One of KINDS
+        size: One of SIZES
+        seed: Corpus seed
+
+    Returns:
+        CorpusDocument (same output for the same arguments)
+    """
+    rng = _rng(kind, size, seed)
+    n_chars = SIZES[size]
+    name = f"{kind}-{size}"
+    if kind == "pdf":
+        text = _prose(rng, n_chars)
+        return CorpusDocument(name, kind, size, f"{name}.pdf", text, make_pdf(text))
+    if kind == "prose":
+        text = _prose(rng, n_chars)
+    elif kind == "boilerplate":
+        text = _boilerplate(rng, n_chars)
+    elif kind == "table":
+        text = _table(rng, n_chars)
+    else:
+        raise ValueError(f"Unknown document kind: {kind}")
+    return CorpusDocument(name, kind, size, f"{name}.txt", text, text.encode("utf-8"))
+
+
+def generate_corpus(
+    kinds: Iterable[str] = KINDS, sizes: Iterable[str] = ("small", "medium"), seed: int = 42
+) -> List[CorpusDocument]:
+    """Generate every kind at every size."""
+    return [make_document(kind, size, seed) for size in sizes for kind in kinds]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--out", required=True, help="Directory to write the documents to")
+    parser.add_argument("--kinds", default=",".join(KINDS))
+    parser.add_argument("--sizes", default="small,medium", help=f"Comma-separated, of {', '.join(SIZES)}")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    out = Path(args.out)
+    out.mkdir(parents=True, exist_ok=True)
+    for doc in generate_corpus(args.kinds.split(","), args.sizes.split(","), args.seed):
+        (out / doc.filename).write_bytes(doc.data)
+        print(f"{doc.filename:28} {len(doc.data):>10,} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,425 @@
+"""
+Service-free end-to-end pipeline harness.
+
+Runs the Airflow task functions of the AIRD pipeline (dag_tasks.task_preprocess,
+task_scoring, task_fingerprint, ..., task_indexing, task_finalize) in DAG order on
+a corpus, with local stand-ins for every service:
+
+- MinIO/GCS:   FilesystemStorageClient under <workdir>/storage
+- Postgres:    SQLite database <workdir>/primedata.db (tables created from the models)
+- Qdrant:      one qdrant-client local mode client (--qdrant-location, in memory by default)
+- Embeddings:  deterministic feature-hashing embedder (no model download)
+- Airflow:     a task instance keeping XComs in a dict
+
+Reports wall time, CPU time, throughput and memory per stage (process peak RSS,
+and the peak of Python allocations with --trace-memory), plus the stage span
+profiles recorded in the pipeline run metrics. The indexing stage is skipped when
+qdrant-client is not installed.
+
+Usage:
+    python benchmarks/pipeline_harness.py --sizes small,medium --copies 5
+    python benchmarks/pipeline_harness.py --corpus /path/to/docs --output harness.json
+    python benchmarks/pipeline_harness.py --stages preprocess,scoring --trace-memory
+"""
+
+import argparse
+import contextlib
+import hashlib
+import importlib.util
+import json
+import os
+import re
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+import uuid
+import zlib
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from corpus import KINDS, SIZES, generate_corpus  # noqa: E402
+
+# Task ids and callables of infra/airflow/dags/dag_primedata_simple.py, in dependency order
+DAG_STAGES = [
+    "preprocess",
+    "scoring",
+    "fingerprint",
+    "validation",
+    "policy",
+    "reporting",
+    "indexing",
+    "validate_data_quality",
+    "finalize",
+]
+EMBEDDING_DIMENSION = 384
+HAS_QDRANT = importlib.util.find_spec("qdrant_client") is not None
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def _patched_sqlite_types() -> None:
+    """Render the PostgreSQL column types of the models on SQLite."""
+    from sqlalchemy.dialects.postgresql import JSONB, UUID
+    from sqlalchemy.ext.compiler import compiles
+
+    @compiles(UUID, "sqlite")
+    def _uuid(type_, compiler, **kw):
+        return "CHAR(32)"
+
+    @compiles(JSONB, "sqlite")
+    def _jsonb(type_, compiler, **kw):
+        return "JSON"
+
+
+def _hashing_embedder_class():
+    from primedata.indexing.embeddings import EmbeddingGenerator
+    import numpy as np
+
+    class HashingEmbedder(EmbeddingGenerator):
+        """Deterministic bag-of-words embeddings via feature hashing (signed, L2-normalized).
+
+        Texts sharing words get similar vectors, so retrieval metrics computed during
+        indexing stay meaningful, at a fraction of the cost of a real model.
+        """
+
+        def _load_model(self):
+            self.model = None
+            self.dimension = self.dimension or EMBEDDING_DIMENSION
+
+        def embed(self, text: str) -> "np.ndarray":
+            vector = np.zeros(self.dimension, dtype=np.float32)
+            for token in _TOKEN_RE.findall(text.lower()):
+                h = zlib.crc32(token.encode("utf-8"))
+                vector[h % self.dimension] += 1.0 if h & 0x80000000 else -1.0
+            norm = float(np.linalg.norm(vector))
+            return vector / norm if norm else vector
+
+        def embed_batch(self, texts: List[str], batch_size: Optional[int] = None) -> List["np.ndarray"]:
+            return [self.embed(text) for text in texts]
+
+        def get_model_info(self) -> dict:
+            return {**super().get_model_info(), "model_type": "hashing"}
+
+    return HashingEmbedder
+
+
+@contextlib.contextmanager
+def local_services(workdir: Path, qdrant_location: str = ":memory:") -> Iterator[Dict[str, Any]]:
+    """Point the pipeline at local stand-ins for storage, database, Qdrant and embeddings.
+
+    Must be entered before anything opens a database session; DATABASE_URL has to be
+    set before primedata is imported (main() does this). Module-level clients are
+    swapped and restored on exit.
+
+    Args:
+        workdir: Directory for the storage root and the SQLite database
+        qdrant_location: qdrant-client local mode location (":memory:" or a directory)
+
+    Yields:
+        Dict with the storage client, the database engine and the Qdrant client
+    """
+    from primedata.db import database
+    from primedata.db import models  # noqa: F401  (registers the tables)
+    from primedata.indexing import qdrant_client as qdrant_module
+    from primedata.ingestion_pipeline import dag_tasks
+    from primedata.ingestion_pipeline.aird_stages import indexing
+    from primedata.storage import minio_client as minio_module
+    from primedata.storage.filesystem_client import FilesystemStorageClient
+
+    _patched_sqlite_types()
+    # ENV=development turns on SQL echo, which would dominate the timings
+    database.engine.echo = False
+    database.Base.metadata.create_all(database.engine)
+
+    storage = FilesystemStorageClient(workdir / "storage")
+    patches: List[Tuple[Any, str, Any]] = [
+        (minio_module, "_storage_client", storage),
+        (minio_module, "minio_client", storage),
+        (dag_tasks, "minio_client", storage),
+        (indexing, "EmbeddingGenerator", _hashing_embedder_class()),
+    ]
+    qdrant = None
+    if HAS_QDRANT:
+        qdrant = qdrant_module.QdrantClient(location=qdrant_location)
+        patches += [(qdrant_module, "qdrant_client", qdrant), (indexing, "qdrant_client", qdrant)]
+    saved = [(obj, name, getattr(obj, name)) for obj, name, _ in patches]
+    for obj, name, value in patches:
+        setattr(obj, name, value)
+    try:
+        yield {"storage": storage, "engine": database.engine, "qdrant": qdrant}
+    finally:
+        for obj, name, value in saved:
+            setattr(obj, name, value)
+
+
+class LocalTaskInstance:
+    """The part of Airflow's TaskInstance used by the tasks: XCom push/pull."""
+
+    def __init__(self, dag_run: Any):
+        self.dag_run = dag_run
+        self.task_id: Optional[str] = None
+        self.xcoms: Dict[Tuple[str, str], Any] = {}
+
+    def xcom_push(self, key: str, value: Any) -> None:
+        self.xcoms[(self.task_id, key)] = value
+
+    def xcom_pull(self, task_ids: Optional[str] = None, key: str = "return_value") -> Any:
+        return self.xcoms.get((task_ids or self.task_id, key))
+
+
+def _load_documents(args) -> List[Tuple[str, bytes]]:
+    """(filename, data) of the documents to ingest."""
+    if args.corpus:
+        paths = sorted(p for p in Path(args.corpus).rglob("*") if p.is_file() and not p.name.startswith("."))
+        docs = [(p.name, p.read_bytes()) for p in paths]
+    else:
+        corpus = generate_corpus(args.kinds.split(","), args.sizes.split(","), args.seed)
+        docs = [(doc.filename, doc.data) for doc in corpus]
+    if args.copies > 1:
+        docs = [(f"{Path(name).stem}_{i:03d}{Path(name).suffix}", data) for i in range(args.copies) for name, data in docs]
+    return docs
+
+
+def seed_product(db: Any, storage: Any, docs: List[Tuple[str, bytes]], playbook_id: str, chunking_config: Dict[str, Any]):
+    """Create a user, workspace, product, raw files (uploaded to storage) and a queued pipeline run.
+
+    Returns:
+        (product, pipeline_run)
+    """
+    from primedata.db.models import PipelineRun, Product, RawFile, RawFileStatus, User, Workspace
+    from primedata.storage.paths import raw_prefix, safe_filename
+
+    user = User(email="harness@example.com", name="Pipeline Harness", auth_provider="simple")
+    workspace = Workspace(name="Pipeline Harness")
+    db.add_all([user, workspace])
+    db.flush()
+    product = Product(
+        workspace_id=workspace.id,
+        owner_user_id=user.id,
+        name="harness-corpus",
+        current_version=1,
+        playbook_id=playbook_id,
+        chunking_config=chunking_config,
+    )
+    db.add(product)
+    db.flush()
+
+    prefix = raw_prefix(workspace.id, product.id, 1)
+    for filename, data in docs:
+        key = f"{prefix}{safe_filename(filename)}"
+        storage.put_bytes("primedata-raw", key, data)
+        db.add(
+            RawFile(
+                workspace_id=workspace.id,
+                product_id=product.id,
+                version=1,
+                filename=filename,
+                file_stem=Path(filename).stem,
+                storage_key=key,
+                storage_bucket="primedata-raw",
+                file_size=len(data),
+                content_type="application/pdf" if filename.endswith(".pdf") else "text/plain",
+                status=RawFileStatus.INGESTED,
+                file_checksum=hashlib.sha256(data).hexdigest(),
+            )
+        )
+    pipeline_run = PipelineRun(
+        workspace_id=workspace.id, product_id=product.id, version=1, dag_run_id="harness", metrics_path="", metrics={}
+    )
+    db.add(pipeline_run)
+    db.commit()
+    return product, pipeline_run
+
+
+def _stage_counts(stage: str, returned: Any) -> Dict[str, Any]:
+    if not isinstance(returned, dict):
+        return {}
+    keys = {
+        "preprocess": ("total_chunks", "files_count"),
+        "scoring": ("total_chunks", "scored_files"),
+        "indexing": ("vectors_indexed",),
+    }.get(stage, ())
+    return {key: returned[key] for key in keys if key in returned}
+
+
+def run_stages(
+    stages: List[str], conf: Dict[str, Any], input_bytes: int, trace_memory: bool = False
+) -> Dict[str, Dict[str, Any]]:
+    """Run the dag_tasks functions of ``stages`` in order, measuring each.
+
+    Args:
+        stages: Task ids from DAG_STAGES
+        conf: DAG run conf (workspace_id, product_id, version, pipeline_run_id, ...)
+        input_bytes: Raw corpus size, for throughput
+        trace_memory: Also measure the peak of Python allocations per stage (slower)
+
+    Returns:
+        Per stage: status, wall_s, cpu_s, mb_per_s, peak_rss_mb, python_peak_mb, counts, error
+    """
+    from primedata.ingestion_pipeline import dag_tasks
+    from primedata.ingestion_pipeline.aird_stages.tracing import peak_rss_mb
+
+    dag_run = SimpleNamespace(run_id="harness", conf=conf)
+    task_instance = LocalTaskInstance(dag_run)
+    context = {"dag_run": dag_run, "task_instance": task_instance, "ti": task_instance, "params": conf}
+
+    if trace_memory:
+        tracemalloc.start()
+    report = {}
+    try:
+        for stage in stages:
+            task_instance.task_id = stage
+            if trace_memory:
+                tracemalloc.reset_peak()
+            wall, cpu = time.perf_counter(), time.process_time()
+            error, returned = None, None
+            try:
+                returned = getattr(dag_tasks, f"task_{stage}")(**context)
+                task_instance.xcom_push("return_value", returned)
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+            wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+            status = (
+                "failed" if error else (returned.get("status", "succeeded") if isinstance(returned, dict) else "succeeded")
+            )
+            report[stage] = {
+                "status": status,
+                "wall_s": round(wall, 3),
+                "cpu_s": round(cpu, 3),
+                "mb_per_s": round(input_bytes / wall / 2**20, 3) if wall > 0 else None,
+                "peak_rss_mb": peak_rss_mb(),
+                "python_peak_mb": round(tracemalloc.get_traced_memory()[1] / 2**20, 1) if trace_memory else None,
+                "counts": _stage_counts(stage, returned),
+                "error": error,
+            }
+            print(
+                f"{stage:24} {status:10} {wall:9.2f}s wall {cpu:9.2f}s cpu "
+                f"{report[stage]['mb_per_s'] or 0:8.2f} MiB/s  peak RSS {report[stage]['peak_rss_mb']} MiB"
+                + (f"  ({error})" if error else ""),
+                flush=True,
+            )
+            if error and stage in ("preprocess", "scoring"):
+                # Everything downstream depends on these
+                break
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--corpus", help="Directory of documents to ingest (default: synthetic corpus)")
+    parser.add_argument("--kinds", default=",".join(KINDS), help="Synthetic corpus document kinds")
+    parser.add_argument("--sizes", default="small,medium", help=f"Synthetic corpus sizes, of {', '.join(SIZES)}")
+    parser.add_argument("--copies", type=int, default=1, help="Ingest every document this many times")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--stages", default=",".join(DAG_STAGES), help="Comma-separated task ids to run, in DAG order")
+    parser.add_argument("--playbook", default="TECH")
+    parser.add_argument("--chunk-size", type=int, default=250, help="Manual chunk size in tokens")
+    parser.add_argument("--workdir", help="Directory for storage and database (default: temporary, removed afterwards)")
+    parser.add_argument("--qdrant-location", default=":memory:", help='":memory:" or a directory for local Qdrant')
+    parser.add_argument("--trace-memory", action="store_true", help="Measure Python allocation peaks per stage")
+    parser.add_argument("--output", help="Write the report as JSON")
+    parser.add_argument("--top-spans", type=int, default=10, help="Number of slowest spans to print")
+    parser.add_argument("--verbose", action="store_true", help="Show pipeline logs")
+    args = parser.parse_args()
+
+    workdir = Path(args.workdir) if args.workdir else Path(tempfile.mkdtemp(prefix="aird-harness-"))
+    workdir.mkdir(parents=True, exist_ok=True)
+    # Before primedata is imported: the engine is created from DATABASE_URL at import time
+    database_path = workdir / "primedata.db"
+    if database_path.exists():
+        database_path.unlink()
+    os.environ["DATABASE_URL"] = f"sqlite:///{database_path}"
+    os.environ.setdefault("PRIMEDATA_PIPELINE_TRACE", "1")
+
+    import logging
+
+    from loguru import logger
+
+    if not args.verbose:
+        logger.remove()
+        logger.add(sys.stderr, level="ERROR")
+        logging.basicConfig(level=logging.ERROR)
+        logging.getLogger().setLevel(logging.ERROR)
+
+    stages = [stage for stage in DAG_STAGES if stage in args.stages.split(",")]
+    if "indexing" in stages and not HAS_QDRANT:
+        print("qdrant-client is not installed: skipping the indexing stage")
+        stages.remove("indexing")
+
+    docs = _load_documents(args)
+    input_bytes = sum(len(data) for _, data in docs)
+    print(f"Corpus: {len(docs)} documents, {input_bytes / 2**20:.2f} MiB; workdir {workdir}")
+
+    try:
+        with local_services(workdir, args.qdrant_location) as services:
+            from primedata.db.database import SessionLocal
+            from primedata.db.models import PipelineRun
+            from primedata.services.lazy_json_loader import load_pipeline_run_metrics
+
+            chunking_config = {
+                "mode": "manual",
+                "manual_settings": {"chunking_strategy": "sentence", "chunk_size": args.chunk_size, "chunk_overlap": 20},
+            }
+            db = SessionLocal()
+            try:
+                product, pipeline_run = seed_product(db, services["storage"], docs, args.playbook, chunking_config)
+                conf = {
+                    "workspace_id": str(product.workspace_id),
+                    "product_id": str(product.id),
+                    "version": 1,
+                    "pipeline_run_id": str(pipeline_run.id),
+                    "playbook_id": args.playbook,
+                    "chunking_config": chunking_config,
+                    "embedding_config": {"embedder_name": "minilm", "embedding_dimension": EMBEDDING_DIMENSION},
+                }
+            finally:
+                db.close()
+
+            started = time.perf_counter()
+            report = run_stages(stages, conf, input_bytes, args.trace_memory)
+            total = time.perf_counter() - started
+
+            # Full run metrics (with the stage span profiles) live in object storage
+            db = SessionLocal()
+            try:
+                run = db.get(PipelineRun, uuid.UUID(conf["pipeline_run_id"]))
+                profile = (load_pipeline_run_metrics(run) or {}).get("profile") if run else None
+            finally:
+                db.close()
+    finally:
+        if not args.workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    print(f"\nTotal {total:.2f}s for {input_bytes / 2**20:.2f} MiB ({input_bytes / total / 2**20:.2f} MiB/s)")
+    if profile:
+        spans = [
+            (f"{stage}/{path}", stats)
+            for stage, stage_profile in profile.get("stages", {}).items()
+            for path, stats in stage_profile.get("spans", {}).items()
+        ]
+        print("\nSlowest spans:")
+        for path, stats in sorted(spans, key=lambda item: -item[1]["total_s"])[: args.top_spans]:
+            print(f"  {path:48} {stats['total_s']:9.3f}s over {stats['count']:>6} calls")
+    if args.output:
+        output = {
+            "corpus": {"documents": len(docs), "bytes": input_bytes, "source": args.corpus or "synthetic"},
+            "total_s": round(total, 3),
+            "stages": report,
+            "profile": profile,
+        }
+        Path(args.output).write_text(json.dumps(output, indent=2, default=str) + "\n")
+        print(f"Wrote {args.output}")
+    if any(stage["status"] == "failed" for stage in report.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
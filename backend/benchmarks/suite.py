@@ -0,0 +1,372 @@
+"""
+Benchmark suite for the AIRD stages.
+
+Times the text utilities, chunkers, noise/coherence/trust scoring, metrics
+index, PDF extraction and the preprocess and scoring stages end to end on the
+deterministic synthetic corpus (benchmarks/corpus.py). Results are written as
+JSON and can be compared against a stored baseline (benchmarks/compare.py);
+slowdowns beyond the threshold are flagged and make the run exit with status 1.
+
+Each benchmark is calibrated so one sample takes at least --min-time seconds,
+then sampled --repeat times after a warmup; the median is the headline number.
+The indexing stage is not run end to end (it needs Qdrant, the embedding model
+and the database); its pure part, load_metrics_index, is timed instead.
+
+Usage:
+    DATABASE_URL=sqlite:///:memory: python benchmarks/suite.py --output results.json
+    DATABASE_URL=sqlite:///:memory: python benchmarks/suite.py --sizes small --filter chunking
+    DATABASE_URL=sqlite:///:memory: python benchmarks/suite.py --baseline benchmarks/baselines/suite_baseline.json
+"""
+
+import argparse
+import copy
+import json
+import logging
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from loguru import logger  # noqa: E402
+
+from compare import compare_results, format_comparison  # noqa: E402
+from corpus import SIZES, CorpusDocument, generate_corpus  # noqa: E402
+from primedata.ingestion_pipeline.aird_stages.indexing import load_metrics_index  # noqa: E402
+from primedata.ingestion_pipeline.aird_stages.playbooks.loader import load_playbook_yaml  # noqa: E402
+from primedata.ingestion_pipeline.aird_stages.preprocess import PreprocessStage  # noqa: E402
+from primedata.ingestion_pipeline.aird_stages.scoring import ScoringStage  # noqa: E402
+from primedata.ingestion_pipeline.aird_stages.storage import AirdStorageAdapter  # noqa: E402
+from primedata.ingestion_pipeline.aird_stages.utils.chunking import (  # noqa: E402
+    char_chunk_spans,
+    paragraph_chunk_spans,
+    sentence_chunk,
+    sentence_chunk_spans,
+)
+from primedata.ingestion_pipeline.aird_stages.utils.text_processing import (  # noqa: E402
+    apply_normalizers,
+    normalize_wrapped_lines,
+)
+from primedata.services.chunk_coherence import calculate_chunk_coherence  # noqa: E402
+from primedata.services.noise_detection import calculate_noise_ratio, compile_noise_patterns  # noqa: E402
+from primedata.services.trust_scoring import get_scoring_weights, score_record_with_ai_ready_metrics  # noqa: E402
+
+MAX_TOKENS = 250
+OVERLAP_CHARS = 100
+TEXT_KINDS = ("prose", "boilerplate", "table")
+# The embedding method depends on whether sentence-transformers is installed;
+# time the method that runs everywhere so results are comparable across machines.
+COHERENCE_METHOD = "sentence_connectivity"
+
+
+class InMemoryMinIO:
+    """The MinIO client methods used by AirdStorageAdapter, keeping objects in a dict."""
+
+    def __init__(self):
+        self.objects: Dict[tuple, bytes] = {}
+
+    def get_bytes(self, bucket, key):
+        return self.objects.get((bucket, key))
+
+    def get_json(self, bucket, key):
+        data = self.objects.get((bucket, key))
+        return json.loads(data) if data is not None else None
+
+    def _put(self, bucket, key, data):
+        self.objects[(bucket, key)] = data
+        return {"size": len(data), "sha256": None, "etag": None}
+
+    def put_bytes_with_info(self, bucket, key, data, content_type=None):
+        return self._put(bucket, key, data)
+
+    def put_json_with_info(self, bucket, key, obj):
+        return self._put(bucket, key, json.dumps(obj, default=str).encode("utf-8"))
+
+    def put_stream(self, bucket, key, produce, content_type=None):
+        sink = _BufferSink()
+        produce(sink)
+        return self._put(bucket, key, b"".join(sink.parts))
+
+
+class _BufferSink:
+    def __init__(self):
+        self.parts: List[bytes] = []
+
+    def write(self, data):
+        self.parts.append(data)
+        return len(data)
+
+
+@dataclass
+class Benchmark:
+    """A named, timed callable; ``bytes`` is the input size used for throughput."""
+
+    name: str
+    fn: Callable[[], Any]
+    bytes: int = 0
+
+
+def time_benchmark(bench: Benchmark, repeat: int, min_time: float) -> Dict[str, Any]:
+    """Time one benchmark.
+
+    Args:
+        bench: Benchmark to run
+        repeat: Number of timed samples
+        min_time: Minimum duration of one sample in seconds (fast calls are looped)
+
+    Returns:
+        Dict with per-call median_s, min_s, mean_s, the loop count, runs and throughput
+    """
+    # Warmup, which also calibrates the loop count
+    start = time.perf_counter()
+    bench.fn()
+    once = time.perf_counter() - start
+    loops = max(1, int(min_time / once)) if once > 0 else 1000
+
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(loops):
+            bench.fn()
+        samples.append((time.perf_counter() - start) / loops)
+
+    median = statistics.median(samples)
+    return {
+        "median_s": median,
+        "min_s": min(samples),
+        "mean_s": statistics.fmean(samples),
+        "loops": loops,
+        "runs": repeat,
+        "bytes": bench.bytes,
+        "mb_per_s": round(bench.bytes / median / 2**20, 3) if bench.bytes and median > 0 else None,
+    }
+
+
+def _bench_playbook() -> Dict[str, Any]:
+    playbook = copy.deepcopy(load_playbook_yaml("TECH"))
+    playbook.setdefault("coherence", {})["method"] = COHERENCE_METHOD
+    return playbook
+
+
+def _text_benchmarks(docs: List[CorpusDocument], playbook: Dict[str, Any]) -> List[Benchmark]:
+    steps = playbook.get("pre_normalizers") or []
+    compiled_noise = compile_noise_patterns(playbook.get("noise_patterns"))
+    weights = get_scoring_weights()
+    benches = []
+    for doc in docs:
+        if doc.kind not in TEXT_KINDS:
+            continue
+        text, size = doc.text, len(doc.data)
+        benches += [
+            Benchmark(f"text.normalize_wrapped_lines/{doc.name}", lambda t=text: normalize_wrapped_lines(t), size),
+            Benchmark(f"text.apply_normalizers/{doc.name}", lambda t=text: apply_normalizers(t, steps), size),
+            Benchmark(f"chunking.char/{doc.name}", lambda t=text: char_chunk_spans(t, MAX_TOKENS, OVERLAP_CHARS), size),
+            Benchmark(
+                f"chunking.sentence/{doc.name}",
+                lambda t=text: sentence_chunk_spans(t, MAX_TOKENS, 1, OVERLAP_CHARS),
+                size,
+            ),
+            Benchmark(
+                f"chunking.paragraph/{doc.name}",
+                lambda t=text: paragraph_chunk_spans(t, MAX_TOKENS, 1, OVERLAP_CHARS),
+                size,
+            ),
+        ]
+
+        # Per-chunk metrics over the chunks of the document
+        chunks = sentence_chunk(text, MAX_TOKENS, 1, OVERLAP_CHARS)
+        chunk_bytes = sum(len(chunk.encode("utf-8")) for chunk in chunks)
+        records = [
+            {"chunk_id": f"{doc.name}_{i}", "file": doc.name, "section": "body", "text": chunk, "source": "bench"}
+            for i, chunk in enumerate(chunks)
+        ]
+        benches += [
+            Benchmark(
+                f"noise.calculate_noise_ratio/{doc.name}",
+                lambda c=chunks: [calculate_noise_ratio(chunk, compiled_patterns=compiled_noise) for chunk in c],
+                chunk_bytes,
+            ),
+            Benchmark(
+                f"coherence.calculate_chunk_coherence/{doc.name}",
+                lambda c=chunks: [calculate_chunk_coherence(chunk, method=COHERENCE_METHOD) for chunk in c],
+                chunk_bytes,
+            ),
+            Benchmark(
+                f"scoring.score_record_with_ai_ready_metrics/{doc.name}",
+                lambda r=records: [score_record_with_ai_ready_metrics(rec, weights, playbook) for rec in r],
+                chunk_bytes,
+            ),
+        ]
+    return benches
+
+
+def _metrics_index_benchmarks(sizes: List[str]) -> List[Benchmark]:
+    benches = []
+    for size in sizes:
+        # One metrics entry per chunk of a corpus of that many KiB
+        count = SIZES[size]
+        metrics = [
+            {"file": f"file_{i // 40}", "chunk_id": f"file_{i // 40}_{i % 40}", "section": f"s{i % 7}", "AI_Trust_Score": (i * 37) % 100}
+            for i in range(count)
+        ]
+        benches.append(Benchmark(f"indexing.load_metrics_index/{count}", lambda m=metrics: load_metrics_index(m)))
+    return benches
+
+
+def _pdf_benchmarks(docs: List[CorpusDocument]) -> List[Benchmark]:
+    storage = AirdStorageAdapter(uuid.uuid4(), uuid.uuid4(), 1, minio_client=InMemoryMinIO())
+    return [
+        Benchmark(f"storage.pdf_extract/{doc.name}", lambda d=doc.data: storage._extract_pdf_text(d), len(doc.data))
+        for doc in docs
+        if doc.kind == "pdf"
+    ]
+
+
+def _load_raw(docs: List[CorpusDocument]):
+    product_id, workspace_id = uuid.UUID(int=1), uuid.UUID(int=2)
+    minio = InMemoryMinIO()
+    storage = AirdStorageAdapter(workspace_id, product_id, 1, minio_client=minio)
+    file_map = {}
+    for doc in docs:
+        key = f"ws/{workspace_id}/prod/{product_id}/v/1/raw/{doc.filename}"
+        minio.objects[("primedata-raw", key)] = doc.data
+        file_map[doc.name] = {"storage_key": key, "storage_bucket": "primedata-raw", "filename": doc.filename}
+    return product_id, workspace_id, storage, file_map
+
+
+def _preprocess_context(storage, file_map) -> Dict[str, Any]:
+    return {
+        "storage": storage,
+        "raw_files": list(file_map),
+        "file_stem_to_storage_key": file_map,
+        "playbook_id": "TECH",
+        "chunking_config": {
+            "mode": "manual",
+            "manual_settings": {"chunking_strategy": "sentence", "chunk_size": MAX_TOKENS, "chunk_overlap": 20},
+        },
+    }
+
+
+def _stage_benchmarks(docs: List[CorpusDocument], sizes: List[str], playbook: Dict[str, Any]) -> List[Benchmark]:
+    benches = []
+    for size in sizes:
+        size_docs = [doc for doc in docs if doc.size == size]
+        size_bytes = sum(len(doc.data) for doc in size_docs)
+
+        def run_preprocess(size_docs=size_docs):
+            product_id, workspace_id, storage, file_map = _load_raw(size_docs)
+            stage = PreprocessStage(product_id=product_id, version=1, workspace_id=workspace_id)
+            result = stage.execute(_preprocess_context(storage, file_map))
+            if result.status.value != "succeeded":
+                raise RuntimeError(f"preprocess {result.status.value}: {result.error}")
+            return storage, result
+
+        # Scoring reads the output of one preprocess run (prepared outside the timing)
+        storage, preprocess_result = run_preprocess()
+        processed_files = preprocess_result.metrics["processed_file_list"]
+
+        def run_scoring(storage=storage, processed_files=processed_files):
+            stage = ScoringStage(product_id=uuid.UUID(int=1), version=1, workspace_id=uuid.UUID(int=2))
+            context = {
+                "storage": storage,
+                "processed_files": processed_files,
+                "playbook": playbook,
+                "playbook_id": "TECH",
+                "scoring_workers": 1,
+            }
+            result = stage.execute(context)
+            if result.status.value != "succeeded":
+                raise RuntimeError(f"scoring {result.status.value}: {result.error}")
+
+        benches += [
+            Benchmark(f"stages.preprocess/{size}", run_preprocess, size_bytes),
+            Benchmark(f"stages.scoring/{size}", run_scoring, size_bytes),
+        ]
+    return benches
+
+
+def build_benchmarks(sizes: List[str], seed: int, name_filter: Optional[str] = None) -> List[Benchmark]:
+    """All benchmarks for the given corpus sizes, optionally filtered by a regex on the name."""
+    docs = generate_corpus(sizes=sizes, seed=seed)
+    playbook = _bench_playbook()
+    pattern = re.compile(name_filter) if name_filter else None
+    wanted = (lambda name: pattern.search(name) is not None) if pattern else (lambda name: True)
+
+    benches = [b for b in _text_benchmarks(docs, playbook) if wanted(b.name)]
+    benches += [b for b in _metrics_index_benchmarks(sizes) if wanted(b.name)]
+    benches += [b for b in _pdf_benchmarks(docs) if wanted(b.name)]
+    if not pattern or wanted("stages.preprocess/") or wanted("stages.scoring/"):
+        benches += [b for b in _stage_benchmarks(docs, sizes, playbook) if wanted(b.name)]
+    return benches
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, cwd=Path(__file__).parent, timeout=10
+        )
+        return out.stdout.strip() or None
+    except Exception:
+        return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="small,medium", help=f"Comma-separated corpus sizes, of {', '.join(SIZES)}")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed samples per benchmark")
+    parser.add_argument("--min-time", type=float, default=0.05, help="Minimum seconds per sample")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--filter", help="Only run benchmarks whose name matches this regex")
+    parser.add_argument("--output", default="benchmark_results.json", help="Where to write the JSON results")
+    parser.add_argument("--baseline", help="Baseline results to compare against")
+    parser.add_argument("--threshold", type=float, default=0.15, help="Flag slowdowns above this fraction")
+    args = parser.parse_args()
+
+    # Stage logs (warnings about the synthetic documents included) would flood the output and skew timings
+    logger.remove()
+    logger.add(sys.stderr, level="ERROR")
+    logging.getLogger().setLevel(logging.ERROR)
+
+    sizes = [s for s in args.sizes.split(",") if s]
+    benches = build_benchmarks(sizes, args.seed, args.filter)
+    results: Dict[str, Dict[str, Any]] = {}
+    for bench in benches:
+        results[bench.name] = result = time_benchmark(bench, args.repeat, args.min_time)
+        throughput = f"{result['mb_per_s']:9.2f} MiB/s" if result["mb_per_s"] else ""
+        print(f"{bench.name:62} {result['median_s'] * 1000:11.3f} ms {throughput}", flush=True)
+
+    output = {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "git_commit": _git_commit(),
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "sizes": sizes,
+        },
+        "results": results,
+    }
+    Path(args.output).write_text(json.dumps(output, indent=2) + "\n")
+    print(f"\nWrote {len(results)} results to {args.output}")
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        rows = compare_results(baseline, output, threshold=args.threshold)
+        print()
+        print(format_comparison(rows, args.threshold))
+        if any(row["status"] == "slower" for row in rows):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""
+Chunking preview on the real preprocessing path.
+
+The chunking settings UI previews a configuration on a representative sample of
+the product's documents. The sample is run through PreprocessStage._process_document
+(normalizers, page and section detection, sentence/paragraph/char chunkers) so
+the preview shows the chunk boundaries a pipeline run would produce.
+
+Two bounded in-process LRUs keep interactive tweaking fast:
+- extracted samples, keyed by the raw file's storage location and etag (or
+  checksum), so PDFs are not downloaded and extracted again for every preview;
+- preview results, keyed by the sample hash, playbook and chunking settings.
+"""
+
+import json
+import os
+import threading
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+from primedata.analysis.content_analyzer import build_representative_sample
+from primedata.services.llm_cache import make_cache_key, text_hash
+
+DEFAULT_SAMPLE_CACHE_ENTRIES = 64
+DEFAULT_RESULT_CACHE_ENTRIES = 256
+SAMPLE_CHUNK_CHARS = 5000
+SAMPLE_MAX_CHARS = 20000
+
+# Placeholder ids for the stage that runs previews (nothing is written anywhere)
+PREVIEW_ID = uuid.UUID(int=0)
+
+
+class _LRUCache:
+    """Small thread-safe LRU mapping."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max(1, max_entries)
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_sample_cache = _LRUCache(int(os.getenv("PRIMEDATA_PREVIEW_SAMPLE_CACHE_ENTRIES", DEFAULT_SAMPLE_CACHE_ENTRIES)))
+_result_cache = _LRUCache(int(os.getenv("PRIMEDATA_PREVIEW_RESULT_CACHE_ENTRIES", DEFAULT_RESULT_CACHE_ENTRIES)))
+
+
+def clear_preview_caches() -> None:
+    """Drop all cached samples and preview results."""
+    _sample_cache.clear()
+    _result_cache.clear()
+
+
+def raw_file_sample_key(raw_file: Any) -> Optional[str]:
+    """Cache key of a raw file's content, or None when it has no etag or checksum."""
+    version = getattr(raw_file, "storage_etag", None) or getattr(raw_file, "file_checksum", None)
+    if not version:
+        return None
+    return make_cache_key(raw_file.storage_bucket, raw_file.storage_key, version)
+
+
+def get_document_sample(storage: Any, raw_file: Any) -> str:
+    """
+    Representative sample of a raw file's text, with line structure preserved.
+
+    Args:
+        storage: AirdStorageAdapter of the raw file's product version
+        raw_file: RawFile record
+
+    Returns:
+        Sample text ("" when no text could be extracted)
+    """
+    key = raw_file_sample_key(raw_file)
+    if key is not None:
+        cached = _sample_cache.get(key)
+        if cached is not None:
+            return cached
+
+    text = storage.get_raw_text(raw_file.file_stem, minio_key=raw_file.storage_key, minio_bucket=raw_file.storage_bucket)
+    sample = build_representative_sample(
+        text or "", chunk=SAMPLE_CHUNK_CHARS, max_total=SAMPLE_MAX_CHARS, preserve_structure=True
+    )
+    if key is not None:
+        _sample_cache.set(key, sample)
+    return sample
+
+
+def preview_chunks(
+    content: str,
+    chunking_config: Dict[str, Any],
+    playbook_id: Optional[str] = None,
+    playbook: Optional[Dict[str, Any]] = None,
+    filename: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Chunk content exactly as the preprocess stage would.
+
+    Args:
+        content: Sample text to chunk
+        chunking_config: Product chunking configuration (e.g. mode "manual" with manual_settings)
+        playbook_id: Playbook to normalize and section with (routed from the content when None)
+        playbook: Already loaded playbook (e.g. a workspace's custom playbook)
+        filename: Optional filename hint for playbook routing
+
+    Returns:
+        Chunks with chunk_index, text, start_char/end_char (offsets in the
+        normalized document), size, page and section
+    """
+    from primedata.ingestion_pipeline.aird_stages.playbooks import load_playbook_yaml, route_playbook
+    from primedata.ingestion_pipeline.aird_stages.preprocess import PreprocessStage
+
+    if not content or not content.strip():
+        return []
+    if playbook is None:
+        if not playbook_id:
+            playbook_id, _ = route_playbook(sample_text=content, filename=filename)
+        playbook = load_playbook_yaml(playbook_id)
+    # Previews never call an LLM
+    chunking_config = {**chunking_config, "optimization_mode": "pattern"}
+
+    key = make_cache_key(
+        "chunk_preview",
+        text_hash(content),
+        playbook_id,
+        text_hash(json.dumps(playbook, sort_keys=True, default=str)),
+        json.dumps(chunking_config, sort_keys=True, default=str),
+    )
+    cached = _result_cache.get(key)
+    if cached is not None:
+        return cached
+
+    stage = PreprocessStage(product_id=PREVIEW_ID, version=0, workspace_id=PREVIEW_ID)
+    document, _ = stage._process_document(
+        content, "preview", filename or "preview.txt", playbook, playbook_id or "", chunking_config=chunking_config
+    )
+    chunks = [
+        {
+            "chunk_index": index,
+            "text": record["text"],
+            "start_char": record.get("char_start"),
+            "end_char": record.get("char_end"),
+            "size": len(record["text"]),
+            "page": record["page"],
+            "section": record["section"],
+        }
+        for index, record in enumerate(document.iter_records())
+    ]
+    logger.debug(f"Chunk preview: {len(chunks)} chunks from {len(content):,} chars (playbook={playbook_id})")
+    _result_cache.set(key, chunks)
+    return chunks
@@ -15,11 +15,44 @@ from typing import Any, Dict, List, Optional, Tuple
 logger = logging.getLogger(__name__)
 
 
-def build_representative_sample(text: str, chunk: int = 5000, max_total: int = 20000) -> str:
-    """Build a representative text sample using head, middle, and tail segments."""
+def _line_aligned(text: str, start: int, end: int) -> str:
+    """text[start:end] shrunk to whole lines (the segment is kept as is when it has no line break)."""
+    if start > 0:
+        newline = text.find("\n", start, end)
+        if newline != -1:
+            start = newline + 1
+    if end < len(text):
+        newline = text.rfind("\n", start, end)
+        if newline != -1:
+            end = newline
+    return text[start:end].strip()
+
+
+def build_representative_sample(
+    text: str, chunk: int = 5000, max_total: int = 20000, preserve_structure: bool = False
+) -> str:
+    """Build a representative text sample using head, middle, and tail segments.
+
+    By default whitespace is collapsed and the segments are joined with sample markers.
+    With preserve_structure the segments keep their line breaks (cut at line boundaries)
+    and are joined as paragraphs, so the sample can be run through preprocessing.
+    """
     if not text:
         return ""
 
+    if preserve_structure:
+        text = text.strip()
+        if len(text) <= max_total:
+            return text
+        segment_size = min(chunk, max_total // 3)
+        middle_start = max(0, len(text) // 2 - segment_size // 2)
+        segments = (
+            _line_aligned(text, 0, segment_size),
+            _line_aligned(text, middle_start, middle_start + segment_size),
+            _line_aligned(text, len(text) - segment_size, len(text)),
+        )
+        return "\n\n".join(segment for segment in segments if segment)
+
     normalized = " ".join(text.split())
     if not normalized:
         return ""
@@ -83,6 +116,128 @@ class ChunkingConfig:
     evidence: Optional[Dict[str, Any]] = None  # Detection evidence for UI display
 
 
+_WORD_RE = re.compile(r"\w+")
+_TERM_SEPARATOR_RE = re.compile(r"(\\s\+| )")
+
+
+def _parse_keyword_pattern(pattern: str) -> Optional[List[Tuple[Tuple[str, ...], Tuple[bool, ...]]]]:
+    """
+    Terms of a keyword pattern such as r"\b(whereas|pursuant to|market\s+risk)\b".
+
+    Returns:
+        (lowercased words, separators) per alternative, in pattern order, where a
+        separator is True for r"\s+" and False for a literal space; None when the
+        pattern is not a plain keyword alternation
+    """
+    if not (pattern.startswith(r"\b(") and pattern.endswith(r")\b")):
+        return None
+    terms = []
+    for alternative in pattern[3:-3].split("|"):
+        parts = _TERM_SEPARATOR_RE.split(alternative)
+        words, separators = parts[::2], parts[1::2]
+        if not all(word.isascii() and word.isalnum() for word in words):
+            return None
+        terms.append((tuple(word.lower() for word in words), tuple(sep != " " for sep in separators)))
+    return terms
+
+
+class _PatternScanner:
+    """
+    Finds the matches of all content patterns with one pass over the words of a text.
+
+    Keyword patterns (r"\b(term|term ...)\b", the bulk of the table) are indexed by
+    the first word of each term: a match of such a pattern always spans whole
+    words, so walking the text's words once and looking each one up finds every
+    pattern's matches. Non-overlap and alternative order are tracked per pattern,
+    so the result equals re.findall(pattern, text, re.IGNORECASE | re.MULTILINE).
+    The remaining structural patterns (line-anchored code, list and chat markers)
+    are compiled once and matched with findall.
+    """
+
+    FLAGS = re.IGNORECASE | re.MULTILINE
+
+    def __init__(self, content_patterns: Dict[Any, List[str]]):
+        self.regex_patterns: Dict[Tuple[Any, int], "re.Pattern"] = {}
+        # First word -> [(pattern key, [(words, separators), ...] in alternative order)]
+        self._first_words: Dict[str, List[Tuple[Tuple[Any, int], List[Tuple[Tuple[str, ...], Tuple[bool, ...]]]]]] = {}
+        self._words_by_length: Dict[int, set] = {}
+        for content_type, patterns in content_patterns.items():
+            for index, pattern in enumerate(patterns):
+                key = (content_type, index)
+                terms = _parse_keyword_pattern(pattern)
+                if terms is None:
+                    self.regex_patterns[key] = re.compile(pattern, self.FLAGS)
+                    continue
+                by_first_word: Dict[str, list] = {}
+                for words, separators in terms:
+                    by_first_word.setdefault(words[0], []).append((words, separators))
+                    for word in words:
+                        self._words_by_length.setdefault(len(word), set()).add(word)
+                for first_word, alternatives in by_first_word.items():
+                    self._first_words.setdefault(first_word, []).append((key, alternatives))
+
+    def _fold(self, word: str, folded: Dict[str, str]) -> str:
+        """Lookup key of a non-ASCII word: the term word it matches case-insensitively (e.g. "K" -> "k")."""
+        key = folded.get(word)
+        if key is None:
+            key = next(
+                (term for term in self._words_by_length.get(len(word), ()) if re.fullmatch(term, word, re.IGNORECASE)),
+                "",
+            )
+            folded[word] = key
+        return key
+
+    def scan(self, content: str) -> Dict[Tuple[Any, int], List[str]]:
+        """
+        Matches of every pattern in content.
+
+        Returns:
+            (content type, pattern index) -> matched strings, as re.findall returns them
+        """
+        results: Dict[Tuple[Any, int], List[str]] = {
+            key: pattern.findall(content) for key, pattern in self.regex_patterns.items()
+        }
+        folded: Dict[str, str] = {}
+        words = [
+            (m.start(), m.end(), word.lower() if word.isascii() else self._fold(word, folded))
+            for m in _WORD_RE.finditer(content)
+            for word in (m.group(),)
+        ]
+        last_end: Dict[Tuple[Any, int], int] = {}
+        for position, (start, word_end, word) in enumerate(words):
+            candidates = self._first_words.get(word)
+            if not candidates:
+                continue
+            for key, alternatives in candidates:
+                if start < last_end.get(key, 0):
+                    continue
+                for term_words, separators in alternatives:
+                    if len(term_words) == 1:
+                        end = word_end
+                    else:
+                        end = self._match_end(content, words, position, term_words, separators)
+                    if end is not None:
+                        results.setdefault(key, []).append(content[start:end])
+                        last_end[key] = end
+                        break
+        return results
+
+    @staticmethod
+    def _match_end(content: str, words: list, position: int, term_words: Tuple[str, ...], separators: Tuple[bool, ...]):
+        """End offset of a term matched at words[position] (its first word already matches), or None."""
+        if position + len(term_words) > len(words):
+            return None
+        for offset in range(1, len(term_words)):
+            previous_end = words[position + offset - 1][1]
+            start, _, word = words[position + offset]
+            if word != term_words[offset]:
+                return None
+            gap = content[previous_end:start]
+            if not (gap.isspace() if separators[offset - 1] else gap == " "):
+                return None
+        return words[position + len(term_words) - 1][1]
+
+
 class ContentAnalyzer:
     """Analyzes content to determine optimal chunking configuration."""
 
@@ -143,6 +298,8 @@ class ContentAnalyzer:
             ],
         }
 
+        self._pattern_scanner = _PatternScanner(self.content_patterns)
+
         # Optimal configurations for each content type
         # All sizes are in TOKENS (not characters)
         self.optimal_configs = {
@@ -320,15 +477,15 @@ class ContentAnalyzer:
             elif ext in [".pdf", ".doc", ".docx"]:
                 scores[ContentType.GENERAL] = 0.5
 
-        # Analyze content patterns
+        # Analyze content patterns (all patterns found in one scan of the content)
+        all_matches = self._pattern_scanner.scan(content)
         for content_type, patterns in self.content_patterns.items():
             score = 0.0
             matches = 0
             pattern_details = []
 
-            for pattern in patterns:
-                # Find all matches (not just count)
-                pattern_matches = re.findall(pattern, content, re.IGNORECASE | re.MULTILINE)
+            for index, pattern in enumerate(patterns):
+                pattern_matches = all_matches.get((content_type, index), [])
                 match_count = len(pattern_matches)
                 
                 if match_count > 0:
@@ -465,18 +622,28 @@ class ContentAnalyzer:
         total_words = sum(len(sentence.split()) for sentence in sentences if sentence.strip())
         return total_words / len([s for s in sentences if s.strip()])
 
-    def preview_chunking(self, content: str, config: ChunkingConfig) -> Dict[str, Any]:
+    def preview_chunking(
+        self,
+        content: str,
+        config: ChunkingConfig,
+        playbook_id: Optional[str] = None,
+        playbook: Optional[Dict[str, Any]] = None,
+        preprocessing_flags: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
         """
         Preview how content would be chunked with given configuration.
 
         Args:
             content: Content to preview
             config: Chunking configuration to use
+            playbook_id: Optional playbook to preprocess with (routed from the content when None)
+            playbook: Optional already loaded playbook (e.g. a custom playbook)
+            preprocessing_flags: Optional product preprocessing flags
 
         Returns:
             Dictionary with preview information
         """
-        chunks = self._simulate_chunking(content, config)
+        chunks = self._simulate_chunking(content, config, playbook_id, playbook, preprocessing_flags)
 
         return {
             "total_chunks": len(chunks),
@@ -487,46 +654,34 @@ class ContentAnalyzer:
             "estimated_retrieval_quality": self._estimate_retrieval_quality(chunks, config),
         }
 
-    def _simulate_chunking(self, content: str, config: ChunkingConfig) -> List[Dict[str, Any]]:
+    def _simulate_chunking(
+        self,
+        content: str,
+        config: ChunkingConfig,
+        playbook_id: Optional[str] = None,
+        playbook: Optional[Dict[str, Any]] = None,
+        preprocessing_flags: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
         """
-        Simulate chunking process to preview results.
-        
-        FIX #3: Convert tokens to approximate characters for preview
-        (matches preprocess.py convention: 1 token ≈ 4 chars)
-        """
-        chunks = []
-        start = 0
-        chunk_index = 0
-
-        # Convert tokens to approximate characters (1 token ≈ 4 chars)
-        approx_chars = int(config.chunk_size * 4)
-        approx_overlap_chars = int(config.chunk_overlap * 4)
-
-        while start < len(content):
-            end = min(start + approx_chars, len(content))
-            chunk_text = content[start:end]
-
-            if not chunk_text.strip():
-                break
-
-            chunks.append(
-                {
-                    "chunk_index": chunk_index,
-                    "text": chunk_text.strip(),
-                    "start_char": start,
-                    "end_char": end,
-                    "size": len(chunk_text.strip()),
-                }
-            )
+        Chunk content with the preprocess stage's normalizers, sectioning and chunkers.
 
-            chunk_index += 1
-            step_size = max(1, approx_chars - approx_overlap_chars)
-            start += step_size
-
-            if start >= len(content):
-                break
-
-        return chunks
+        The configuration is applied as manual chunking settings, so the preview
+        matches what a pipeline run with these settings produces.
+        """
+        from primedata.analysis.chunk_preview import preview_chunks
+
+        chunking_config = {
+            "mode": "manual",
+            "manual_settings": {
+                "chunk_size": config.chunk_size,
+                "chunk_overlap": config.chunk_overlap,
+                "min_chunk_size": config.min_chunk_size,
+                "max_chunk_size": config.max_chunk_size,
+                "chunking_strategy": config.strategy.value,
+            },
+            "preprocessing_flags": preprocessing_flags or {},
+        }
+        return preview_chunks(content, chunking_config, playbook_id=playbook_id, playbook=playbook)
 
     def _estimate_retrieval_quality(self, chunks: List[Dict], config: ChunkingConfig) -> str:
         """Estimate retrieval quality based on chunk characteristics."""
@@ -7,6 +7,7 @@ from typing import Any, Dict
 
 from fastapi import Depends, FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response
 from primedata.api.acl import router as acl_router  # M5
 from primedata.api.ai_readiness import router as ai_readiness_router
 from primedata.api.analytics import router as analytics_router
@@ -28,8 +29,11 @@ from primedata.api.settings import router as settings_router
 from primedata.api.team import router as team_router
 from primedata.core.auth_middleware import AuthMiddleware
 from primedata.core.jwt_keys import get_public_jwks
+from primedata.core.metrics import CONTENT_TYPE_LATEST, REGISTRY, instrument_engine, metrics_enabled, monitor_event_loop_lag
+from primedata.core.metrics_middleware import MetricsMiddleware
 from primedata.core.settings import get_settings
 from primedata.db.database import engine, get_db
+from primedata.services.rag_logging import shutdown_rag_log_writer
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
@@ -72,6 +76,11 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Add metrics middleware last so request latency includes auth and CORS handling
+if metrics_enabled():
+    app.add_middleware(MetricsMiddleware)
+    instrument_engine(engine)
+
 # Include routers
 app.include_router(auth_router)
 app.include_router(products_router)
@@ -250,6 +259,43 @@ async def simple_health_check():
     return {"status": "ok", "service": "AIRDops", "version": "0.1.0"}
 
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics(request: Request):
+    """Prometheus metrics (set PRIMEDATA_METRICS_TOKEN to require it as a bearer token)."""
+    import hmac
+    import os
+
+    if not metrics_enabled():
+        raise HTTPException(status_code=404, detail="Not Found")
+    token = os.getenv("PRIMEDATA_METRICS_TOKEN", "")
+    if token and not hmac.compare_digest(request.headers.get("authorization", ""), f"Bearer {token}"):
+        raise HTTPException(status_code=401, detail="Invalid metrics token")
+    return Response(content=REGISTRY.render(), media_type=CONTENT_TYPE_LATEST)
+
+
+_event_loop_lag_task = None
+
+
+@app.on_event("startup")
+async def start_event_loop_lag_monitor():
+    """Sample event-loop lag in the background while the app runs."""
+    global _event_loop_lag_task
+    if metrics_enabled():
+        _event_loop_lag_task = asyncio.create_task(monitor_event_loop_lag())
+
+
+@app.on_event("shutdown")
+async def stop_event_loop_lag_monitor():
+    if _event_loop_lag_task is not None:
+        _event_loop_lag_task.cancel()
+
+
+@app.on_event("shutdown")
+async def flush_rag_request_logs():
+    """Write RAG request logs still queued for the background writer."""
+    await asyncio.to_thread(shutdown_rag_log_writer)
+
+
 @app.get("/.well-known/jwks.json")
 async def get_jwks():
     """JWKS endpoint for JWT key discovery."""
@@ -71,11 +71,9 @@ async def list_raw_artifacts(
         artifacts = []
         total_bytes = 0
 
-        # Process raw artifacts
-        for obj in objects:
-            # Generate presigned URL
-            presigned_url = minio_client.presign("primedata-raw", obj["name"], expiry=3600)
-
+        # Process raw artifacts (presigned URLs generated in one batch)
+        presigned_urls = minio_client.presign_many([("primedata-raw", obj["name"]) for obj in objects], expiry=3600)
+        for obj, presigned_url in zip(objects, presigned_urls):
             if presigned_url:
                 artifacts.append(
                     ArtifactInfo(
@@ -91,8 +89,10 @@ async def list_raw_artifacts(
         # Add artifacts from primedata-exports bucket (M3: validation summary and trust report)
         try:
             artifact_objects = minio_client.list_objects("primedata-exports", artifacts_prefix)
-            for obj in artifact_objects:
-                presigned_url = minio_client.presign("primedata-exports", obj["name"], expiry=3600)
+            presigned_urls = minio_client.presign_many(
+                [("primedata-exports", obj["name"]) for obj in artifact_objects], expiry=3600
+            )
+            for obj, presigned_url in zip(artifact_objects, presigned_urls):
                 if presigned_url:
                     artifacts.append(
                         ArtifactInfo(
@@ -23,6 +23,7 @@ from primedata.db.database import get_db
 from primedata.db.models import Product, Workspace
 from primedata.indexing.qdrant_client import QdrantClient
 from primedata.services.acl import get_acls_for_user, apply_acl_filter_to_payloads
+from primedata.services.query_cache import acl_fingerprint, get_query_cache
 from primedata.services.rag_logging import RAGLoggingService
 
 router = APIRouter(prefix="/api/v1/chat", tags=["Chat"])
@@ -158,6 +159,57 @@ Answer (MUST include citations [1], [2], [3] etc. after every fact from the cont
     return prompt
 
 
+def _retrieve_chunks(
+    qdrant_client: QdrantClient,
+    collection_name: str,
+    query: str,
+    top_k: int,
+    model_name: str,
+    product: Product,
+    user_acls: List[Any],
+    db: Session,
+) -> Dict[str, Any]:
+    """
+    Embed the query, search the collection and apply the user's ACLs.
+
+    Returns:
+        Dictionary with results (search result dicts), acl_applied and acl_denied
+    """
+    from primedata.indexing.embeddings import EmbeddingGenerator
+
+    embedder = EmbeddingGenerator(model_name=model_name, workspace_id=product.workspace_id, db=db)
+    query_embedding = embedder.embed_batch([query])[0]
+
+    # Search Qdrant
+    search_results = qdrant_client.search(
+        collection_name=collection_name,
+        query_vector=query_embedding.tolist(),
+        limit=top_k,
+    )
+    # Keep results JSON-serializable so they can be cached
+    search_results = [
+        {"id": str(r["id"]), "score": r["score"], "payload": r.get("payload") or {}} for r in search_results
+    ]
+
+    if not user_acls:
+        # No ACLs configured, allow all results
+        return {"results": search_results, "acl_applied": False, "acl_denied": False}
+
+    # Apply ACL filtering
+    filtered_payloads = apply_acl_filter_to_payloads(search_results, user_acls, product.id)
+
+    # Create a set of allowed chunk IDs for fast lookup
+    allowed_chunk_ids = {p.get("chunk_id") for p in filtered_payloads if p.get("chunk_id")}
+
+    # Filter search results based on allowed chunk IDs
+    filtered_results = [r for r in search_results if r["payload"].get("chunk_id") in allowed_chunk_ids]
+    return {
+        "results": filtered_results,
+        "acl_applied": True,
+        "acl_denied": len(filtered_results) < len(search_results),
+    }
+
+
 @router.post("/query", response_model=ChatResponse)
 async def chat_query(
     request: ChatRequest,
@@ -217,50 +269,40 @@ async def chat_query(
             if not collection_name:
                 raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Collection not found")
 
-        # Retrieve chunks
-        from primedata.indexing.embeddings import EmbeddingGenerator
-
         # Get embedding model from product config
         embedding_config = product.embedding_config or {}
         model_name = embedding_config.get("embedder_name", "minilm")
-        
-        embedder = EmbeddingGenerator(model_name=model_name, workspace_id=product.workspace_id, db=db)
-        query_embedding = embedder.embed_batch([request.query])[0]
 
-        # Search Qdrant
-        search_results = qdrant_client.search(
-            collection_name=collection_name,
-            query_vector=query_embedding.tolist(),
-            limit=request.top_k,
-        )
-
-        # Apply ACL filtering if enabled
-        user_id = get_user_id(current_user)
-        acl_applied = False
-        acl_denied = False
-        
         # Get user ACLs for this product
+        user_id = get_user_id(current_user)
         user_acls = []
         if user_id:
             user_acls = get_acls_for_user(db, user_id, product.id)
-        
-        # Apply ACL filtering
-        if user_acls:
-            # Convert search results to format expected by ACL filter
-            search_points = [{"id": r.id, "payload": r.payload} for r in search_results]
-            filtered_payloads = apply_acl_filter_to_payloads(search_points, user_acls, product.id)
-            
-            # Create a set of allowed chunk IDs for fast lookup
-            allowed_chunk_ids = {p.get("chunk_id") for p in filtered_payloads if p.get("chunk_id")}
-            
-            # Filter search results based on allowed chunk IDs
-            filtered_results = [r for r in search_results if r.payload.get("chunk_id") in allowed_chunk_ids]
-            acl_applied = True
-            if len(filtered_results) < len(search_results):
-                acl_denied = True
-        else:
-            # No ACLs configured, allow all results
-            filtered_results = search_results
+
+        # Retrieval (embed + search + ACL filter) is served from the query cache when possible
+        retrieval_start = time.time()
+        query_cache = get_query_cache()
+        cache_key = query_cache.make_key(
+            "chat",
+            product_id=product.id,
+            collection_name=collection_name,
+            version=version,
+            query=request.query,
+            top_k=request.top_k,
+            filters={"embedder_name": model_name},
+            acl_fp=acl_fingerprint(user_acls),
+        )
+        retrieval = query_cache.get(cache_key)
+        if retrieval is None:
+            retrieval = _retrieve_chunks(
+                qdrant_client, collection_name, request.query, request.top_k, model_name, product, user_acls, db
+            )
+            query_cache.set(cache_key, retrieval, latency_ms=(time.time() - retrieval_start) * 1000)
+
+        filtered_results = retrieval["results"]
+        acl_applied = retrieval["acl_applied"]
+        acl_denied = retrieval["acl_denied"]
+        chunk_ids = []
 
         if not filtered_results and acl_denied:
             # All results were filtered by ACL
@@ -270,13 +312,13 @@ async def chat_query(
         else:
             # Prepare chunks for RAG
             retrieved_chunks = []
-            chunk_ids = []
             for result in filtered_results:
+                payload = result.get("payload") or {}
                 chunk_data = {
-                    "id": result.payload.get("chunk_id"),
-                    "text": result.payload.get("text", ""),
-                    "score": result.score,
-                    "doc_path": result.payload.get("doc_path", ""),
+                    "id": payload.get("chunk_id"),
+                    "text": payload.get("text", ""),
+                    "score": result.get("score", 0.0),
+                    "doc_path": payload.get("doc_path", ""),
                 }
                 retrieved_chunks.append(chunk_data)
                 if chunk_data["id"]:
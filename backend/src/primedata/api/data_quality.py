@@ -18,7 +18,7 @@ from ..db.database import get_db
 from ..db.models import DqViolation, Product
 from ..db.models_enterprise import AuditAction, DataQualityRule, DataQualityRuleAudit, RuleSeverity, RuleStatus
 from ..dq.rules_schema import DataQualityRules, DataQualityViolation
-from ..storage.minio_client import MinIOClient
+from ..storage.minio_client import get_storage_client
 
 router = APIRouter(prefix="/data-quality", tags=["data-quality"])
 
@@ -443,7 +443,7 @@ async def delete_data_quality_rules(
         product = ensure_product_access(db, request, UUID(product_id))
 
         # Delete rules from MinIO
-        minio_client = MinIOClient()
+        minio_client = get_storage_client()
         rules_key = f"ws/{product.workspace_id}/prod/{product_id}/dq/rules.yaml"
 
         try:
@@ -447,7 +447,7 @@ async def generate_compliance_report(
             get_compliance_report_data_path,
             save_text_to_s3,
         )
-        from primedata.storage.minio_client import MinIOClient
+        from primedata.storage.minio_client import get_storage_client
         import json
         
         # Create report first to get ID
@@ -468,7 +468,7 @@ async def generate_compliance_report(
         
         # Save full report data to S3
         report_data_path = get_compliance_report_data_path(workspace_id, report.id)
-        minio_client = MinIOClient()
+        minio_client = get_storage_client()
         if not minio_client.put_json("primedata-exports", report_data_path, report_data):
             db.rollback()
             raise HTTPException(
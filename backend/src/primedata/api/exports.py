@@ -5,16 +5,12 @@ This module provides endpoints for creating and managing export bundles
 that contain chunked data, embeddings, and provenance information.
 """
 
-import json
 import os
-import tempfile
-import zipfile
 from datetime import datetime
-from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import List, Optional, Union
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, status
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
@@ -22,9 +18,16 @@ from ..core.scope import ensure_product_access
 from ..core.security import get_current_user
 from ..db.database import get_db
 from ..db.models import Product, Workspace
-from ..indexing.qdrant_client import QdrantClient
+from ..services.bundle_import import create_import_run, run_import_job
+from ..services.export_bundles import (
+    EXPORTS_BUCKET,
+    bundle_key,
+    get_export_job,
+    new_bundle_id,
+    run_export_job,
+    save_export_job,
+)
 from ..storage.minio_client import minio_client
-from ..storage.paths import chunk_prefix, embed_prefix, export_prefix
 
 router = APIRouter()
 
@@ -48,35 +51,72 @@ class CreateExportRequest(BaseModel):
 
 
 class CreateExportResponse(BaseModel):
-    """Response model for export creation."""
+    """Response model for export creation (the bundle is built by a background job)."""
 
     bundle_id: str
     bundle_name: str
-    size_bytes: int
+    status: str
+    size_bytes: int = 0
+    created_at: str
+    download_url: Optional[str] = None
+
+
+class ExportJobResponse(BaseModel):
+    """Response model for export job status."""
+
+    bundle_id: str
+    bundle_name: str
+    version: int
+    status: str  # "queued", "running", "succeeded" or "failed"
+    size_bytes: int = 0
+    points: int = 0
     created_at: str
-    download_url: str
+    finished_at: Optional[str] = None
+    error: Optional[str] = None
+    download_url: Optional[str] = None
+
+
+class ImportBundleRequest(BaseModel):
+    """Request model for importing an export bundle into a product."""
 
+    bundle_key: str  # Object key of the bundle in primedata-exports, e.g. ws/{ws}/prod/{product}/exports/bundle-...zip
+    version: Optional[int] = None  # None means the next version
 
-@router.post("/{product_id}/create", response_model=CreateExportResponse)
+
+class ImportBundleResponse(BaseModel):
+    """Response model for a started bundle import (track it as a pipeline run)."""
+
+    pipeline_run_id: str
+    product_id: str
+    version: int
+    status: str
+
+
+@router.post("/{product_id}/create", response_model=CreateExportResponse, status_code=status.HTTP_202_ACCEPTED)
 async def create_export_bundle(
     product_id: str,
     request_body: CreateExportRequest,
     request: Request,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user),
 ):
     """
-    Create an export bundle for a product.
+    Start an export bundle job for a product.
+
+    The bundle is built in the background; poll GET /{product_id}/jobs/{bundle_id}
+    for its status and download URL.
 
     Args:
         product_id: ID of the product to export
         request_body: Export creation request with optional version
         request: FastAPI request object
+        background_tasks: FastAPI background tasks (runs the export job)
         db: Database session
         current_user: Current authenticated user
 
     Returns:
-        Export bundle information with download URL
+        Export job information
     """
     try:
         from uuid import UUID
@@ -106,20 +146,33 @@ async def create_export_bundle(
         if not workspace:
             raise HTTPException(status_code=404, detail="Workspace not found")
 
-        # Create export bundle
-        try:
-            bundle_info = await _create_export_bundle(
-                workspace_id=str(workspace.id), product_id=product_id, version=version, product_name=product.name
-            )
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Failed to create export bundle: {str(e)}")
+        bundle_id = new_bundle_id(version)
+        job = {
+            "bundle_id": bundle_id,
+            "bundle_name": f"{bundle_id}.zip",
+            "workspace_id": str(workspace.id),
+            "product_id": product_id,
+            "version": version,
+            "status": "queued",
+            "created_at": datetime.utcnow().isoformat(),
+        }
+        if not save_export_job(job):
+            raise HTTPException(status_code=500, detail="Failed to create export job")
+
+        background_tasks.add_task(
+            run_export_job,
+            workspace_id=str(workspace.id),
+            product_id=product_id,
+            version=version,
+            product_name=product.name,
+            bundle_id=bundle_id,
+        )
 
         return CreateExportResponse(
-            bundle_id=bundle_info["bundle_id"],
-            bundle_name=bundle_info["bundle_name"],
-            size_bytes=bundle_info["size_bytes"],
-            created_at=bundle_info["created_at"],
-            download_url=bundle_info["download_url"],
+            bundle_id=bundle_id,
+            bundle_name=job["bundle_name"],
+            status=job["status"],
+            created_at=job["created_at"],
         )
 
     except HTTPException:
@@ -128,6 +181,52 @@ async def create_export_bundle(
         raise HTTPException(status_code=500, detail=f"Failed to create export bundle: {str(e)}")
 
 
+@router.get("/{product_id}/jobs/{bundle_id}", response_model=ExportJobResponse)
+async def get_export_job_status(
+    product_id: str,
+    bundle_id: str,
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user),
+):
+    """
+    Get the status of an export bundle job.
+
+    Args:
+        product_id: ID of the exported product
+        bundle_id: Bundle ID returned when the export was created
+        request: FastAPI request object
+        db: Database session
+        current_user: Current authenticated user
+
+    Returns:
+        Export job status, with a download URL once the bundle is ready
+    """
+    product = ensure_product_access(db, request, UUID(product_id))
+    job = get_export_job(str(product.workspace_id), product_id, bundle_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Export job not found")
+
+    download_url = None
+    if job.get("status") == "succeeded":
+        download_url = minio_client.presign(
+            EXPORTS_BUCKET, bundle_key(str(product.workspace_id), product_id, bundle_id), expiry=3600
+        )
+
+    return ExportJobResponse(
+        bundle_id=job["bundle_id"],
+        bundle_name=job["bundle_name"],
+        version=job["version"],
+        status=job["status"],
+        size_bytes=job.get("size_bytes", 0),
+        points=job.get("points", 0),
+        created_at=job["created_at"],
+        finished_at=job.get("finished_at"),
+        error=job.get("error"),
+        download_url=download_url,
+    )
+
+
 @router.get("", response_model=List[ExportBundleResponse])
 async def list_export_bundles(
     request: Request,
@@ -163,38 +262,39 @@ async def list_export_bundles(
         export_prefix_path = f"ws/{workspace.id}/prod/{product_id}/"
         export_objects = minio_client.list_objects("primedata-exports", export_prefix_path)
 
+        bundle_objects = [obj for obj in export_objects if obj.get("name", "").endswith(".zip")]
+
+        # Generate presigned download URLs in one batch (1 hour)
+        download_urls = minio_client.presign_many([("primedata-exports", obj["name"]) for obj in bundle_objects], expiry=3600)
+
         bundles = []
-        for obj in export_objects:
-            if obj.get("name", "").endswith(".zip"):
-                # Extract bundle information from object name
-                bundle_name = os.path.basename(obj["name"])
-                bundle_id = bundle_name.replace(".zip", "")
-
-                # Try to extract version from bundle name or use current version as fallback
-                version = product.current_version
-                if "v" in bundle_id:
-                    try:
-                        # Extract version from bundle name like "bundle-20250126_123456-v7"
-                        version_part = bundle_id.split("-v")[-1]
-                        version = int(version_part)
-                    except (ValueError, IndexError):
-                        # If extraction fails, use current version
-                        version = product.current_version
-
-                # Generate presigned download URL
-                download_url = minio_client.presign("primedata-exports", obj["name"], expiry=3600)  # 1 hour
-
-                bundles.append(
-                    ExportBundleResponse(
-                        id=bundle_id,
-                        product_id=product_id,
-                        version=version,
-                        bundle_name=bundle_name,
-                        size_bytes=obj.get("size", 0),
-                        created_at=obj.get("last_modified", "").replace("T", " ").replace("+00:00", ""),
-                        download_url=download_url,
-                    )
+        for obj, download_url in zip(bundle_objects, download_urls):
+            # Extract bundle information from object name
+            bundle_name = os.path.basename(obj["name"])
+            bundle_id = bundle_name.replace(".zip", "")
+
+            # Try to extract version from bundle name or use current version as fallback
+            version = product.current_version
+            if "v" in bundle_id:
+                try:
+                    # Extract version from bundle name like "bundle-20250126_123456-v7"
+                    version_part = bundle_id.split("-v")[-1]
+                    version = int(version_part)
+                except (ValueError, IndexError):
+                    # If extraction fails, use current version
+                    version = product.current_version
+
+            bundles.append(
+                ExportBundleResponse(
+                    id=bundle_id,
+                    product_id=product_id,
+                    version=version,
+                    bundle_name=bundle_name,
+                    size_bytes=obj.get("size", 0),
+                    created_at=obj.get("last_modified", "").replace("T", " ").replace("+00:00", ""),
+                    download_url=download_url,
                 )
+            )
 
         # Sort by creation date (newest first)
         bundles.sort(key=lambda x: x.created_at, reverse=True)
@@ -207,150 +307,53 @@ async def list_export_bundles(
         raise HTTPException(status_code=500, detail=f"Failed to list export bundles: {str(e)}")
 
 
-async def _create_export_bundle(workspace_id: str, product_id: str, version: int, product_name: str) -> Dict[str, Any]:
+@router.post("/{product_id}/import", response_model=ImportBundleResponse, status_code=status.HTTP_202_ACCEPTED)
+async def import_export_bundle(
+    product_id: str,
+    request_body: ImportBundleRequest,
+    request: Request,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user),
+):
     """
-    Create an export bundle containing chunked data, embeddings, and provenance.
+    Import an export bundle into a new version of a product, without re-embedding.
+
+    The bundle may come from another product or workspace the user has access to.
+    The import runs in the background and is tracked as a pipeline run of the new version.
 
     Args:
-        workspace_id: Workspace ID
-        product_id: Product ID
-        version: Version to export
-        product_name: Name of the product
+        product_id: ID of the target product
+        request_body: Bundle to import and optional target version
+        request: FastAPI request object
+        background_tasks: FastAPI background tasks (runs the import job)
+        db: Database session
+        current_user: Current authenticated user
 
     Returns:
-        Bundle information including ID, name, size, and download URL
+        Pipeline run of the import
     """
-    timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-    bundle_id = f"bundle-{timestamp}-v{version}"
-    bundle_name = f"{bundle_id}.zip"
-
-    # Create temporary directory for bundle assembly
-    with tempfile.TemporaryDirectory() as temp_dir:
-        bundle_path = Path(temp_dir) / bundle_name
-
-        with zipfile.ZipFile(bundle_path, "w", zipfile.ZIP_DEFLATED) as zip_file:
-            # 1. Gather chunked data (JSONL format)
-            await _add_chunked_data(zip_file, workspace_id, product_id, version)
-
-            # 2. Gather embedding data (Parquet format)
-            await _add_embedding_data(zip_file, workspace_id, product_id, version)
-
-            # 3. Create provenance.json
-            await _add_provenance_info(zip_file, workspace_id, product_id, version, product_name)
-
-            # 4. Add Qdrant collection info if available
-            await _add_qdrant_info(zip_file, workspace_id, product_id, version)
-
-        # Upload bundle to MinIO
-        # Use a general export path for this product
-        bundle_key = f"ws/{workspace_id}/prod/{product_id}/exports/{bundle_name}"
-
-        with open(bundle_path, "rb") as f:
-            bundle_data = f.read()
-            minio_client.put_object("primedata-exports", bundle_key, bundle_data)
-
-        # Get bundle size
-        bundle_size = bundle_path.stat().st_size
-
-        # Generate presigned download URL
-        download_url = minio_client.presign("primedata-exports", bundle_key, expiry=3600)  # 1 hour
-
-        return {
-            "bundle_id": bundle_id,
-            "bundle_name": bundle_name,
-            "size_bytes": bundle_size,
-            "created_at": datetime.utcnow().isoformat(),
-            "download_url": download_url,
-        }
-
-
-async def _add_chunked_data(zip_file: zipfile.ZipFile, workspace_id: str, product_id: str, version: int):
-    """Add chunked data in JSONL format to the export bundle."""
-    try:
-        chunk_prefix_path = chunk_prefix(workspace_id, product_id, version)
-        chunk_objects = minio_client.list_objects("primedata-chunk", chunk_prefix_path)
-
-        if chunk_objects:
-            # Create JSONL file with all chunks
-            jsonl_content = []
-            for obj in chunk_objects:
-                chunk_data = minio_client.get_object("primedata-chunk", obj["name"])
-                if chunk_data:
-                    chunk_info = json.loads(chunk_data)
-                    jsonl_content.append(chunk_info)
-
-            # Write JSONL content
-            jsonl_content_str = "\n".join(json.dumps(item) for item in jsonl_content)
-            zip_file.writestr("chunks.jsonl", jsonl_content_str)
-
-    except Exception as e:
-        # Add empty file if chunks not available
-        zip_file.writestr("chunks.jsonl", "")
-
+    product = ensure_product_access(db, request, UUID(product_id))
 
-async def _add_embedding_data(zip_file: zipfile.ZipFile, workspace_id: str, product_id: str, version: int):
-    """Add embedding data in Parquet format to the export bundle."""
+    # Bundle keys look like ws/{workspace_id}/prod/{product_id}/exports/{bundle_id}.zip
+    key_parts = request_body.bundle_key.split("/")
+    if len(key_parts) != 6 or key_parts[0] != "ws" or key_parts[2] != "prod" or key_parts[4] != "exports":
+        raise HTTPException(status_code=400, detail="Invalid bundle key")
     try:
-        embed_prefix_path = embed_prefix(workspace_id, product_id, version)
-        embed_objects = minio_client.list_objects("primedata-embed", embed_prefix_path)
-
-        if embed_objects:
-            # Create a simple JSON representation of embeddings
-            # In a real implementation, you'd want to use proper Parquet format
-            embedding_data = []
-            for obj in embed_objects:
-                embed_data = minio_client.get_object("primedata-embed", obj["name"])
-                if embed_data:
-                    embed_info = json.loads(embed_data)
-                    embedding_data.append(embed_info)
-
-            # Write embeddings as JSON (for now)
-            embeddings_json = json.dumps(embedding_data, indent=2)
-            zip_file.writestr("embeddings.json", embeddings_json)
-
-    except Exception as e:
-        # Add empty file if embeddings not available
-        zip_file.writestr("embeddings.json", "[]")
-
-
-async def _add_provenance_info(zip_file: zipfile.ZipFile, workspace_id: str, product_id: str, version: int, product_name: str):
-    """Add provenance information to the export bundle."""
-    provenance = {
-        "export_info": {
-            "product_id": product_id,
-            "product_name": product_name,
-            "workspace_id": workspace_id,
-            "version": version,
-            "exported_at": datetime.utcnow().isoformat(),
-            "export_type": "full_bundle",
-        },
-        "data_sources": {"chunks": "chunks.jsonl", "embeddings": "embeddings.json"},
-        "metadata": {"created_by": "primedata_export_api", "api_version": "1.0", "bundle_format": "zip"},
-    }
-
-    zip_file.writestr("provenance.json", json.dumps(provenance, indent=2))
-
-
-async def _add_qdrant_info(zip_file: zipfile.ZipFile, workspace_id: str, product_id: str, version: int):
-    """Add Qdrant collection information to the export bundle."""
-    try:
-        # Get Qdrant collection info
-        qdrant_client = QdrantClient()
-        collection_name = f"ws_{workspace_id}_prod_{product_id}_v{version}"
-
-        qdrant_info = {
-            "collection_name": collection_name,
-            "collection_info": "Collection metadata would be included here",
-            "note": "Full Qdrant snapshot not included in this bundle",
-        }
-
-        zip_file.writestr("qdrant_info.json", json.dumps(qdrant_info, indent=2))
-
-    except Exception as e:
-        # Add minimal info if Qdrant not available
-        qdrant_info = {
-            "collection_name": f"ws_{workspace_id}_prod_{product_id}_v{version}",
-            "status": "unavailable",
-            "error": str(e),
-        }
-        zip_file.writestr("qdrant_info.json", json.dumps(qdrant_info, indent=2))
+        source_product_id = UUID(key_parts[3])
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid bundle key")
+    ensure_product_access(db, request, source_product_id)
+
+    if not minio_client.object_exists(EXPORTS_BUCKET, request_body.bundle_key):
+        raise HTTPException(status_code=404, detail="Export bundle not found")
+
+    pipeline_run = create_import_run(db, product, request_body.version, source=request_body.bundle_key)
+    background_tasks.add_task(run_import_job, EXPORTS_BUCKET, request_body.bundle_key, pipeline_run.id)
+
+    return ImportBundleResponse(
+        pipeline_run_id=str(pipeline_run.id),
+        product_id=product_id,
+        version=pipeline_run.version,
+        status=pipeline_run.status.value,
+    )
@@ -52,6 +52,8 @@ class PipelineRunResponse(BaseModel):
     dag_run_id: Optional[str]
     metrics: Dict[str, Any]
     created_at: datetime
+    # Per-stage tracing profile (span durations, bytes, records, peak RSS); set on the run detail endpoint
+    profile: Optional[Dict[str, Any]] = None
 
 
 class TriggerPipelineResponse(BaseModel):
@@ -469,8 +471,8 @@ async def trigger_pipeline(
         pipeline_run.metrics_path = metrics_path
         
         # Save initial metrics to S3
-        from primedata.storage.minio_client import MinIOClient
-        minio_client = MinIOClient()
+        from primedata.storage.minio_client import get_storage_client
+        minio_client = get_storage_client()
         initial_metrics = {
             "raw_file_version": raw_file_version,
             "aird_stages": {},
@@ -622,7 +624,7 @@ async def get_pipeline_run(
     run_id: UUID, request_obj: Request, db: Session = Depends(get_db), current_user: dict = Depends(get_current_user)
 ):
     """
-    Get details of a specific pipeline run.
+    Get details of a specific pipeline run, including its per-stage tracing profile.
     """
     # Get pipeline run
     run = db.query(PipelineRun).filter(PipelineRun.id == run_id).first()
@@ -647,6 +649,7 @@ async def get_pipeline_run(
         dag_run_id=run.dag_run_id,
         metrics=metrics,
         created_at=run.created_at,
+        profile=metrics.get("profile"),
     )
 
 
@@ -741,7 +744,7 @@ async def update_pipeline_run(
 
     if request_body.metrics is not None:
         from primedata.services.lazy_json_loader import load_pipeline_run_metrics
-        from primedata.storage.minio_client import MinIOClient
+        from primedata.storage.minio_client import get_storage_client
         
         # Load current metrics from S3 or DB
         current_metrics = load_pipeline_run_metrics(run)
@@ -761,7 +764,7 @@ async def update_pipeline_run(
                 run.id,
             )
         
-        minio_client = MinIOClient()
+        minio_client = get_storage_client()
         if minio_client.put_json("primedata-exports", run.metrics_path, current_metrics):
             # Store small summary in DB
             run.metrics = {
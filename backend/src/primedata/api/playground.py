@@ -15,7 +15,8 @@ from ..core.user_utils import get_user_id
 from ..db.database import get_db
 from ..db.models import Product
 from ..indexing.qdrant_client import QdrantClient
-from ..storage.minio_client import MinIOClient
+from ..services.query_cache import acl_fingerprint, get_query_cache
+from ..storage.minio_client import get_storage_client
 from .search_utils import expand_query_terms, calculate_keyword_boost
 
 logger = logging.getLogger(__name__)
@@ -58,6 +59,7 @@ class PlaygroundResponse(BaseModel):
     collection_name: str = Field(..., description="Qdrant collection name used")
     total_results: int = Field(..., description="Total number of results found")
     acl_applied: bool = Field(default=False, description="Whether ACL filtering was applied (M5)")
+    cached: bool = Field(default=False, description="Whether the results were served from the query cache")
 
 
 @router.post("/api/v1/playground/query", response_model=PlaygroundResponse)
@@ -133,6 +135,35 @@ async def query_playground(
                     status_code=status.HTTP_404_NOT_FOUND, detail=f"Collection not found. Please run a pipeline first."
                 )
 
+        # Get user's ACLs for this product (M5); they are part of the cache key
+        user_acls = []
+        try:
+            from ..services.acl import get_acls_for_user
+
+            user_id = get_user_id(current_user)
+            user_acls = get_acls_for_user(db, user_id, product.id)
+        except Exception as e:
+            logger.warning(f"Failed to load ACLs, proceeding without filter: {e}", exc_info=True)
+
+        # Serve repeated queries from the result cache
+        query_cache = get_query_cache()
+        cache_key = query_cache.make_key(
+            "playground",
+            product_id=product.id,
+            collection_name=collection_name,
+            version=version_to_use,
+            query=query_data.query,
+            top_k=query_data.top_k,
+            filters={"use": query_data.use, "compat_mode": query_data.compat_mode},
+            acl_fp=acl_fingerprint(user_acls),
+        )
+        cached_response = query_cache.get(cache_key)
+        if cached_response is not None:
+            logger.info(f"Query cache hit for collection {collection_name}")
+            return PlaygroundResponse(
+                **{**cached_response, "latency_ms": (time.time() - start_time) * 1000, "cached": True}
+            )
+
         # Get embedding configuration for the specific version being queried
         # Priority: PipelineRun metrics > Collection dimension > Product config (with validation)
         from ..indexing.embeddings import EmbeddingGenerator
@@ -345,11 +376,7 @@ async def query_playground(
         filter_conditions = None
 
         try:
-            from ..services.acl import apply_acl_filter_to_payloads, get_acls_for_user, get_allowed_chunk_ids_from_payloads
-
-            # Get user's ACLs for this product
-            user_id = get_user_id(current_user)
-            user_acls = get_acls_for_user(db, user_id, product.id)
+            from ..services.acl import apply_acl_filter_to_payloads, get_allowed_chunk_ids_from_payloads
 
             if user_acls:
                 # Get all points from Qdrant for this product/version (using scroll API)
@@ -439,12 +466,36 @@ async def query_playground(
                 detail=f"Search operation failed: {str(e)}"
             )
 
-        # Initialize MinIO client for presigned URLs
-        minio_client = MinIOClient()
+        # Generate presigned URLs for all source documents in one batch
+        from primedata.storage.paths import clean_prefix
+
+        clean_path_prefix = clean_prefix(workspace_id=product.workspace_id, product_id=product.id, version=version_to_use)
+        document_keys = []
+        for result in search_results:
+            payload = result.get("payload", {})
+            file_to_use = payload.get("source_file") or payload.get("filename", "")
+            if file_to_use and not file_to_use.startswith("ws/"):
+                # Construct path using clean_prefix helper: "ws/{ws}/prod/{prod}/v/{version}/clean/{filename}"
+                file_to_use = f"{clean_path_prefix}{file_to_use}"
+            document_keys.append(("primedata-clean", file_to_use))
+
+        presigned_urls = [None] * len(search_results)
+        try:
+            minio_client = get_storage_client()
+            presigned_urls = minio_client.presign_many(
+                document_keys,
+                expiry=3600,  # 1 hour
+                inline=True,  # Display in browser instead of downloading
+            )
+            missing = [key for (_, key), url in zip(document_keys, presigned_urls) if key and not url]
+            if missing:
+                logger.warning(f"Failed to generate presigned URLs for {len(missing)} documents, e.g. {missing[0]}")
+        except Exception as e:
+            logger.warning(f"Failed to generate presigned URLs: {e}", exc_info=True)
 
         # Process results
         results = []
-        for result in search_results:
+        for result, presigned_url in zip(search_results, presigned_urls):
             payload = result.get("payload", {})
             text = payload.get("text", "")
             filename = payload.get("filename", "")  # Use filename from payload
@@ -459,38 +510,6 @@ async def query_playground(
             # If text was truncated, note it in metadata
             is_truncated = text_length > len(text)
 
-            # Generate presigned URL for the source document
-            presigned_url = None
-            if filename or source_file:
-                try:
-                    # Use clean_prefix helper to ensure correct path format
-                    from primedata.storage.paths import clean_prefix
-
-                    file_to_use = source_file if source_file else filename
-                    if not file_to_use.startswith("ws/"):
-                        # Construct path using clean_prefix helper: "ws/{ws}/prod/{prod}/v/{version}/clean/{filename}"
-                        clean_path_prefix = clean_prefix(
-                            workspace_id=product.workspace_id, product_id=product.id, version=version_to_use
-                        )
-                        file_to_use = f"{clean_path_prefix}{file_to_use}"
-
-                    logger.debug(f"Generating presigned URL for: bucket=primedata-clean, key={file_to_use}")
-                    presigned_url = minio_client.presign(
-                        bucket="primedata-clean",
-                        key=file_to_use,
-                        expiry=3600,  # 1 hour
-                        inline=True,  # Display in browser instead of downloading
-                    )
-                    if presigned_url:
-                        logger.debug(f"Successfully generated presigned URL for {file_to_use}")
-                    else:
-                        logger.warning(f"Failed to generate presigned URL (returned None) for {file_to_use}")
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to generate presigned URL for {file_to_use if 'file_to_use' in locals() else filename}: {e}",
-                        exc_info=True,
-                    )
-
             # Create section label with better information
             section_label = f"{section}"
             if page:
@@ -532,13 +551,15 @@ async def query_playground(
         # Calculate latency
         latency_ms = (time.time() - start_time) * 1000
 
-        return PlaygroundResponse(
+        response = PlaygroundResponse(
             results=results,
             latency_ms=latency_ms,
             collection_name=collection_name,
             total_results=len(results),
             acl_applied=acl_applied,  # M5
         )
+        query_cache.set(cache_key, response.dict(), latency_ms=latency_ms)
+        return response
 
     except HTTPException:
         raise
@@ -547,6 +568,14 @@ async def query_playground(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Query failed: {str(e)}")
 
 
+@router.get("/api/v1/playground/cache/stats")
+async def get_query_cache_stats(current_user: dict = Depends(get_current_user_from_request)):
+    """
+    Get query result cache metrics (hit ratio, saved latency) for the playground and chat endpoints.
+    """
+    return get_query_cache().stats()
+
+
 @router.get("/api/v1/playground/status/{product_id}")
 async def get_playground_status(
     product_id: str, request: Request, current_user: dict = Depends(get_current_user_from_request), db=Depends(get_db)
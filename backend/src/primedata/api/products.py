@@ -1797,7 +1797,7 @@ class ContentAnalysisResponse(BaseModel):
 
 
 class ChunkingPreviewRequest(BaseModel):
-    content: str
+    content: Optional[str] = None  # Defaults to a sample of the product's raw files
     config: Dict[str, Any]
 
 
@@ -1845,6 +1845,48 @@ async def analyze_content(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Content analysis failed: {str(e)}")
 
 
+def _product_raw_files(db: Session, product: Product, limit: int = 3) -> List[Any]:
+    """First raw files of the product's current version (used as content samples)."""
+    from primedata.db.models import RawFile
+
+    return (
+        db.query(RawFile)
+        .filter(
+            RawFile.product_id == product.id,
+            RawFile.version == (product.current_version or 1),
+            RawFile.status != "DELETED",
+        )
+        .limit(limit)
+        .all()
+    )
+
+
+def _document_samples(product: Product, raw_files: List[Any]) -> List[tuple]:
+    """
+    Representative text samples of raw files, cached per file etag.
+
+    Returns:
+        List of (filename, sample) for the files with extractable text
+    """
+    from primedata.analysis.chunk_preview import get_document_sample
+    from primedata.ingestion_pipeline.aird_stages.storage import AirdStorageAdapter
+
+    # Storage adapter extracts text from PDFs and other formats
+    storage = AirdStorageAdapter(
+        workspace_id=product.workspace_id, product_id=product.id, version=product.current_version or 1
+    )
+    samples = []
+    for raw_file in raw_files:
+        try:
+            sample = get_document_sample(storage, raw_file)
+        except Exception as e:
+            logger.warning(f"Failed to extract text from {raw_file.filename}: {e}")
+            continue
+        if sample:
+            samples.append((raw_file.filename, sample))
+    return samples
+
+
 @router.post("/{product_id}/preview-chunking", response_model=ChunkingPreviewResponse)
 async def preview_chunking(
     product_id: UUID,
@@ -1874,8 +1916,30 @@ async def preview_chunking(
             reasoning="User preview",
         )
 
-        # Generate preview
-        preview = content_analyzer.preview_chunking(request_body.content, config)
+        content = request_body.content
+        if not content:
+            samples = _document_samples(product, _product_raw_files(db, product))
+            content = "\n\n".join(sample for _, sample in samples)
+        if not content.strip():
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="No content to preview. Provide content or run data ingestion first.",
+            )
+
+        # Generate preview on the real preprocessing path with the product's playbook
+        playbook = None
+        if product.playbook_id:
+            from primedata.ingestion_pipeline.aird_stages.playbooks import load_playbook_yaml
+
+            playbook = load_playbook_yaml(product.playbook_id, workspace_id=str(product.workspace_id), db_session=db)
+        preprocessing_flags = (product.chunking_config or {}).get("preprocessing_flags") or {}
+        preview = content_analyzer.preview_chunking(
+            content,
+            config,
+            playbook_id=product.playbook_id,
+            playbook=playbook,
+            preprocessing_flags=preprocessing_flags,
+        )
 
         return ChunkingPreviewResponse(
             total_chunks=preview["total_chunks"],
@@ -1886,6 +1950,8 @@ async def preview_chunking(
             preview_chunks=preview["chunks"],
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Chunking preview failed: {str(e)}")
 
@@ -1902,52 +1968,17 @@ async def auto_configure_chunking(
     product = ensure_product_access(db, request, product_id)
 
     try:
-        # Use AirdStorageAdapter to properly extract text from files (handles PDFs)
-        from primedata.ingestion_pipeline.aird_stages.storage import AirdStorageAdapter
-        from primedata.db.models import RawFile
         from primedata.analysis.content_analyzer import content_analyzer
 
-        # Get raw files for the product
-        version = product.current_version or 1
-        raw_files = db.query(RawFile).filter(
-            RawFile.product_id == product_id,
-            RawFile.version == version,
-            RawFile.status != "DELETED"
-        ).limit(3).all()  # Sample first 3 files
-        
+        raw_files = _product_raw_files(db, product)
         if not raw_files:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST, 
                 detail="No raw files found to analyze. Please run data ingestion first."
             )
-        
-        # Use storage adapter to extract text (handles PDFs properly)
-        storage = AirdStorageAdapter(
-            workspace_id=product.workspace_id,
-            product_id=product_id,
-            version=version
-        )
-        
-        sample_content = ""
-        filename_hint = None
-        for raw_file in raw_files:
-            try:
-                # Use get_raw_text which handles PDF extraction
-                file_stem = raw_file.file_stem
-                text = storage.get_raw_text(
-                    file_stem,
-                    minio_key=raw_file.storage_key,
-                    minio_bucket=raw_file.storage_bucket
-                )
-                if text:
-                    sample_content += text[:5000]  # First 5000 chars per file
-                    if not filename_hint:
-                        filename_hint = raw_file.filename
-                    if len(sample_content) > 15000:  # Limit total sample size
-                        break
-            except Exception as e:
-                logger.warning(f"Failed to extract text from {raw_file.filename}: {e}")
-                continue
+        samples = _document_samples(product, raw_files)
+        sample_content = "\n\n".join(sample for _, sample in samples)
+        filename_hint = samples[0][0] if samples else None
         
         if not sample_content or len(sample_content.strip()) < 100:
             raise HTTPException(
@@ -2255,13 +2286,13 @@ async def promote_version(
             )
 
         # Verify the collection actually exists in Qdrant
-        collections = qdrant_client.client.get_collections()
-        collection_exists = any(col.name == collection_name for col in collections.collections)
+        collections = qdrant_client.list_collections()
+        collection_exists = collection_name in collections
 
         if not collection_exists:
             # Try alternative collection name format (product_id based) as fallback
             alt_collection_name = f"ws_{product.workspace_id}__prod_{product_id}__v_{version}"
-            collection_exists = any(col.name == alt_collection_name for col in collections.collections)
+            collection_exists = alt_collection_name in collections
 
             if collection_exists:
                 collection_name = alt_collection_name
@@ -2270,9 +2301,9 @@ async def promote_version(
                 # Find available collections for this product to suggest alternatives
                 available_versions = []
                 product_collections = [
-                    col.name for col in collections.collections
-                    if (f"ws_{product.workspace_id}__" in col.name and
-                        (str(product_id) in col.name or product.name.lower().replace(" ", "_") in col.name.lower()))
+                    col_name for col_name in collections
+                    if (f"ws_{product.workspace_id}__" in col_name and
+                        (str(product_id) in col_name or product.name.lower().replace(" ", "_") in col_name.lower()))
                 ]
 
                 # Extract version numbers from collection names
@@ -6,6 +6,7 @@ import fnmatch
 import logging
 import os
 import time
+from contextlib import ExitStack
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
@@ -15,6 +16,9 @@ from .base import BaseConnector
 
 logger = logging.getLogger(__name__)
 
+# Number of files opened and uploaded concurrently per batch
+UPLOAD_BATCH_SIZE = 64
+
 
 class FolderConnector(BaseConnector):
     """Connector for reading files from local filesystem directories."""
@@ -256,56 +260,66 @@ class FolderConnector(BaseConnector):
             logger.info(f"Exclude patterns: {self.exclude_patterns}")
             logger.info(f"Recursive: {self.recursive}")
 
-            for file_path in files_to_process:
-                try:
-                    # Check file size
-                    file_size = file_path.stat().st_size
-                    if file_size > self.max_file_size:
-                        details["files_skipped"].append(
-                            {"path": str(file_path), "reason": f"File too large: {file_size} bytes"}
-                        )
-                        logger.warning(f"Skipping large file: {file_path} ({file_size} bytes)")
-                        continue
-
-                    # Read file content
-                    with open(file_path, "rb") as f:
-                        content = f.read()
-
-                    # Generate safe key
-                    relative_path = file_path.relative_to(Path(self.root_path))
-                    safe_key = safe_filename(str(relative_path))
-                    key = f"{output_prefix}{safe_key}"
-
-                    # Determine content type
-                    content_type = self._get_content_type(file_path)
+            # Files are streamed to storage in batches of concurrent uploads
+            for batch_start in range(0, len(files_to_process), UPLOAD_BATCH_SIZE):
+                batch = files_to_process[batch_start : batch_start + UPLOAD_BATCH_SIZE]
+                with ExitStack() as open_files:
+                    uploads = []  # (file_path, key, size, content_type)
+                    for file_path in batch:
+                        try:
+                            # Check file size
+                            file_size = file_path.stat().st_size
+                            if file_size > self.max_file_size:
+                                details["files_skipped"].append(
+                                    {"path": str(file_path), "reason": f"File too large: {file_size} bytes"}
+                                )
+                                logger.warning(f"Skipping large file: {file_path} ({file_size} bytes)")
+                                continue
+
+                            # Open file for streaming upload
+                            file_obj = open_files.enter_context(open(file_path, "rb"))
+
+                            # Generate safe key
+                            relative_path = file_path.relative_to(Path(self.root_path))
+                            safe_key = safe_filename(str(relative_path))
+                            key = f"{output_prefix}{safe_key}"
+
+                            # Determine content type
+                            content_type = self._get_content_type(file_path)
+                            uploads.append((file_path, key, file_size, content_type, file_obj))
+
+                        except FileNotFoundError:
+                            errors += 1
+                            details["files_failed"].append({"path": str(file_path), "error": "File not found"})
+                            logger.error(f"File not found: {file_path}")
+                        except PermissionError:
+                            errors += 1
+                            details["files_failed"].append({"path": str(file_path), "error": "Permission denied"})
+                            logger.error(f"Permission denied: {file_path}")
+                        except Exception as e:
+                            errors += 1
+                            details["files_failed"].append({"path": str(file_path), "error": str(e)})
+                            logger.error(f"Error processing {file_path}: {e}")
 
                     # Upload to MinIO
-                    success = minio_client.put_bytes(output_bucket, key, content, content_type)
+                    results = minio_client.put_many(
+                        [(output_bucket, key, file_obj, content_type) for _, key, _, content_type, file_obj in uploads]
+                    )
 
-                    if success:
+                for (file_path, key, file_size, content_type, _), upload in zip(uploads, results):
+                    if upload.ok:
                         files_processed += 1
-                        bytes_transferred += len(content)
+                        bytes_transferred += file_size
                         details["files_processed"].append(
-                            {"path": str(file_path), "key": key, "size": len(content), "content_type": content_type}
+                            {"path": str(file_path), "key": key, "size": file_size, "content_type": content_type}
                         )
-                        logger.info(f"Uploaded {file_path} as {key} ({len(content)} bytes)")
+                        logger.info(f"Uploaded {file_path} as {key} ({file_size} bytes)")
                     else:
                         errors += 1
-                        details["files_failed"].append({"path": str(file_path), "error": "Failed to upload to MinIO"})
-                        logger.error(f"Failed to upload {file_path}")
-
-                except FileNotFoundError:
-                    errors += 1
-                    details["files_failed"].append({"path": str(file_path), "error": "File not found"})
-                    logger.error(f"File not found: {file_path}")
-                except PermissionError:
-                    errors += 1
-                    details["files_failed"].append({"path": str(file_path), "error": "Permission denied"})
-                    logger.error(f"Permission denied: {file_path}")
-                except Exception as e:
-                    errors += 1
-                    details["files_failed"].append({"path": str(file_path), "error": str(e)})
-                    logger.error(f"Error processing {file_path}: {e}")
+                        details["files_failed"].append(
+                            {"path": str(file_path), "error": f"Failed to upload to MinIO: {upload.error}"}
+                        )
+                        logger.error(f"Failed to upload {file_path}: {upload.error}")
 
         except Exception as e:
             logger.error(f"Error during folder sync: {e}")
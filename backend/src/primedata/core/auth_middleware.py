@@ -23,6 +23,7 @@ class AuthMiddleware(BaseHTTPMiddleware):
         # Routes that allow anonymous access
         self.anonymous_routes = [
             r"^/health$",
+            r"^/metrics$",  # Prometheus scrape endpoint (optionally protected by PRIMEDATA_METRICS_TOKEN)
             r"^/openapi\.json$",
             r"^/docs.*",
             r"^/redoc.*",
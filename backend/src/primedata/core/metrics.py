@@ -0,0 +1,428 @@
+"""
+In-process metrics registry with Prometheus text exposition.
+
+Counters, gauges and histograms live in a process-wide registry (REGISTRY) that
+the API serves at ``/metrics``. Covered hot paths:
+
+- request latency per route template (MetricsMiddleware)
+- time each request spends in embedding, Qdrant, object storage and the database
+  (``track_dependency`` / ``timed_dependency`` accumulate into the request context)
+- embedder loads, cache hits and misses, event-loop lag, DB pool checkout wait
+
+The registry has no dependencies so it also works in Airflow workers, where
+``render()`` output is written to a textfile collector or pushed to a pushgateway
+(see ``primedata.ingestion_pipeline.aird_stages.stage_metrics``).
+
+Set PRIMEDATA_METRICS_ENABLED=false to turn off the ``/metrics`` endpoint and the
+request middleware.
+"""
+
+import asyncio
+import functools
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Optional, Sequence, Tuple
+
+from loguru import logger
+
+# Latency buckets in seconds (request latencies, dependency time, pool waits)
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+EVENT_LOOP_LAG_INTERVAL_SECONDS = 0.5
+
+
+def metrics_enabled() -> bool:
+    """Whether the metrics endpoint and request middleware are on (PRIMEDATA_METRICS_ENABLED, default on)."""
+    return os.getenv("PRIMEDATA_METRICS_ENABLED", "1").strip().lower() not in ("0", "false", "no", "off")
+
+
+def _format_value(value: float) -> str:
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape_label(str(value))}"' for name, value in zip(names, values)) + "}"
+
+
+class _Metric:
+    """Base class: one metric family with a fixed set of label names."""
+
+    type_name = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values: Dict[Tuple[str, ...], Any] = {}
+        if not self.labelnames:
+            # Metrics without labels are exposed from the start
+            self._values[()] = self._initial_value()
+
+    def _initial_value(self) -> Any:
+        return 0.0
+
+    def _key(self, labels: Dict[str, Any]) -> Tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def clear(self) -> None:
+        """Drop all label combinations."""
+        with self._lock:
+            self._values.clear()
+            if not self.labelnames:
+                self._values[()] = self._initial_value()
+
+    def _samples(self) -> List[Tuple[str, Sequence[str], Sequence[str], float]]:
+        with self._lock:
+            return [(self.name, self.labelnames, key, value) for key, value in sorted(self._values.items())]
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+        for name, labelnames, labelvalues, value in self._samples():
+            lines.append(f"{name}{_format_labels(labelnames, labelvalues)} {_format_value(value)}")
+        return lines
+
+
+class Counter(_Metric):
+    """Monotonically increasing value."""
+
+    type_name = "counter"
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: Any) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def values(self) -> Dict[Tuple[str, ...], float]:
+        """Current value of every label combination."""
+        with self._lock:
+            return dict(self._values)
+
+
+class Gauge(_Metric):
+    """Value that can go up and down."""
+
+    type_name = "gauge"
+
+    def set(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: Any) -> None:
+        self.inc(-amount, **labels)
+
+    def value(self, **labels: Any) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+
+class Histogram(_Metric):
+    """Observations counted into cumulative buckets, with their sum and count."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        if "le" in labelnames:
+            raise ValueError("'le' is reserved for histogram buckets")
+        self.buckets = tuple(sorted(float(b) for b in buckets if not math.isinf(b))) + (math.inf,)
+        super().__init__(name, documentation, labelnames)
+
+    def _initial_value(self) -> Any:
+        return [[0] * len(self.buckets), 0.0, 0]
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = self._initial_value()
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[0][index] += 1
+                    break
+            state[1] += value
+            state[2] += 1
+
+    @contextmanager
+    def time(self, **labels: Any) -> Iterator[None]:
+        """Observe the duration of the with-block."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels: Any) -> int:
+        with self._lock:
+            state = self._values.get(self._key(labels))
+            return state[2] if state else 0
+
+    def _samples(self) -> List[Tuple[str, Sequence[str], Sequence[str], float]]:
+        samples = []
+        with self._lock:
+            items = sorted((key, (list(state[0]), state[1], state[2])) for key, state in self._values.items())
+        bucket_labels = self.labelnames + ("le",)
+        for key, (counts, total, count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                samples.append((f"{self.name}_bucket", bucket_labels, key + (_format_value(bound),), cumulative))
+            samples.append((f"{self.name}_sum", self.labelnames, key, total))
+            samples.append((f"{self.name}_count", self.labelnames, key, count))
+        return samples
+
+
+class MetricsRegistry:
+    """Named metric families plus collectors run before each exposition."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: List[Callable[[], None]] = []
+
+    def _register(self, cls: type, name: str, documentation: str, labelnames: Sequence[str], **kwargs: Any) -> Any:
+        with self._lock:
+            existing = self._metrics.get(name)
+            if existing is not None:
+                if type(existing) is not cls or existing.labelnames != tuple(labelnames):
+                    raise ValueError(f"Metric {name} is already registered with a different type or labels")
+                return existing
+            metric = self._metrics[name] = cls(name, documentation, labelnames, **kwargs)
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Get or create a counter."""
+        return self._register(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        """Get or create a gauge."""
+        return self._register(Gauge, name, documentation, labelnames)
+
+    def histogram(
+        self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        """Get or create a histogram."""
+        return self._register(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def add_collector(self, collector: Callable[[], None]) -> None:
+        """Register a callback that refreshes gauges right before exposition."""
+        with self._lock:
+            if collector not in self._collectors:
+                self._collectors.append(collector)
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format (version 0.0.4)."""
+        with self._lock:
+            collectors = list(self._collectors)
+        for collector in collectors:
+            try:
+                collector()
+            except Exception as e:
+                logger.warning(f"Metrics collector {getattr(collector, '__name__', collector)} failed: {e}")
+        with self._lock:
+            metrics = [self._metrics[name] for name in sorted(self._metrics)]
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+CONTENT_TYPE_LATEST = "text/plain; version=0.0.4; charset=utf-8"
+
+REGISTRY = MetricsRegistry()
+
+HTTP_REQUEST_DURATION = REGISTRY.histogram(
+    "primedata_http_request_duration_seconds", "API request latency by route template", ("method", "route", "status")
+)
+HTTP_REQUESTS_IN_PROGRESS = REGISTRY.gauge("primedata_http_requests_in_progress", "API requests being served", ("method",))
+REQUEST_DEPENDENCY_DURATION = REGISTRY.histogram(
+    "primedata_request_dependency_seconds",
+    "Time an API request spent in a dependency (embedding, qdrant, storage, db)",
+    ("route", "dependency"),
+)
+DEPENDENCY_CALLS = REGISTRY.counter("primedata_dependency_calls_total", "Timed dependency calls", ("dependency",))
+DEPENDENCY_SECONDS = REGISTRY.counter("primedata_dependency_seconds_total", "Time spent in dependency calls", ("dependency",))
+EMBEDDER_LOADS = REGISTRY.counter("primedata_embedder_loads_total", "Embedding model loads", ("model", "backend"))
+EMBEDDER_LOAD_DURATION = REGISTRY.histogram("primedata_embedder_load_seconds", "Time to load an embedding model", ("backend",))
+CACHE_REQUESTS = REGISTRY.counter("primedata_cache_requests_total", "Cache lookups by result", ("cache", "result"))
+CACHE_HIT_RATIO = REGISTRY.gauge("primedata_cache_hit_ratio", "Share of cache lookups that were hits", ("cache",))
+EVENT_LOOP_LAG = REGISTRY.histogram("primedata_event_loop_lag_seconds", "Event-loop scheduling lag samples")
+EVENT_LOOP_LAG_LAST = REGISTRY.gauge("primedata_event_loop_lag_last_seconds", "Most recent event-loop scheduling lag")
+DB_POOL_CHECKOUT_WAIT = REGISTRY.histogram(
+    "primedata_db_pool_checkout_wait_seconds", "Time to get a connection from the SQLAlchemy pool"
+)
+DB_POOL_CHECKOUTS = REGISTRY.counter("primedata_db_pool_checkouts_total", "Connections checked out of the pool")
+DB_POOL_CONNECTIONS = REGISTRY.gauge("primedata_db_pool_connections", "SQLAlchemy pool connections by state", ("state",))
+
+
+def record_cache_lookup(cache: str, hit: bool) -> None:
+    """Count a cache hit or miss (the hit ratio is derived at exposition time)."""
+    CACHE_REQUESTS.inc(cache=cache, result="hit" if hit else "miss")
+
+
+def _collect_cache_hit_ratios() -> None:
+    totals: Dict[str, List[float]] = {}
+    for (cache, result), value in CACHE_REQUESTS.values().items():
+        hits_total = totals.setdefault(cache, [0.0, 0.0])
+        hits_total[1] += value
+        if result == "hit":
+            hits_total[0] += value
+    for cache, (hits, total) in totals.items():
+        CACHE_HIT_RATIO.set(hits / total if total else 0.0, cache=cache)
+
+
+REGISTRY.add_collector(_collect_cache_hit_ratios)
+
+# ---- Per-request dependency time ----
+
+# Seconds per dependency for the API request being served (set by MetricsMiddleware)
+_request_timings: ContextVar[Optional[Dict[str, float]]] = ContextVar("primedata_request_timings", default=None)
+# Dependencies with a timer open in this context (nested calls are only counted once)
+_active_dependencies: ContextVar[FrozenSet[str]] = ContextVar("primedata_active_dependencies", default=frozenset())
+
+
+def start_request_timings() -> Tuple[Dict[str, float], Any]:
+    """Start accumulating dependency time for a request; returns (timings, token for end_request_timings)."""
+    timings: Dict[str, float] = {}
+    return timings, _request_timings.set(timings)
+
+
+def end_request_timings(token: Any) -> None:
+    _request_timings.reset(token)
+
+
+def record_dependency_time(dependency: str, seconds: float) -> None:
+    """Add time spent in a dependency to the global counters and the current request."""
+    DEPENDENCY_CALLS.inc(dependency=dependency)
+    DEPENDENCY_SECONDS.inc(seconds, dependency=dependency)
+    timings = _request_timings.get()
+    if timings is not None:
+        timings[dependency] = timings.get(dependency, 0.0) + seconds
+
+
+@contextmanager
+def track_dependency(dependency: str) -> Iterator[None]:
+    """Time the with-block as a call into ``dependency`` (no-op if already inside one)."""
+    active = _active_dependencies.get()
+    if dependency in active:
+        yield
+        return
+    token = _active_dependencies.set(active | {dependency})
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        _active_dependencies.reset(token)
+        record_dependency_time(dependency, elapsed)
+
+
+def timed_dependency(dependency: str) -> Callable[[Callable], Callable]:
+    """Decorator timing every call of a function as a call into ``dependency``."""
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with track_dependency(dependency):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+# ---- Event loop and database ----
+
+
+async def monitor_event_loop_lag(interval: float = EVENT_LOOP_LAG_INTERVAL_SECONDS) -> None:
+    """Measure how late the event loop wakes up from a sleep, forever (run as a background task)."""
+    loop = asyncio.get_running_loop()
+    while True:
+        start = loop.time()
+        await asyncio.sleep(interval)
+        lag = max(0.0, loop.time() - start - interval)
+        EVENT_LOOP_LAG_LAST.set(lag)
+        EVENT_LOOP_LAG.observe(lag)
+
+
+def instrument_engine(engine: Any) -> None:
+    """Record DB query time, pool checkout wait and pool usage for a SQLAlchemy engine.
+
+    Query time comes from the cursor execute events and counts as the "db"
+    dependency of the current request. Pool checkout wait covers the whole
+    ``raw_connection()`` call (queueing for a free connection, opening a new one
+    and the pre-ping), since the pool has no event before a checkout starts.
+    """
+    from sqlalchemy import event
+
+    if getattr(engine, "_primedata_metrics", False):
+        return
+    engine._primedata_metrics = True
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            context._primedata_query_start = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        start = getattr(context, "_primedata_query_start", None)
+        if start is not None:
+            record_dependency_time("db", time.perf_counter() - start)
+
+    @event.listens_for(engine, "checkout")
+    def _checkout(dbapi_connection, connection_record, connection_proxy):
+        DB_POOL_CHECKOUTS.inc()
+
+    raw_connection = engine.raw_connection
+
+    @functools.wraps(raw_connection)
+    def _timed_raw_connection(*args: Any, **kwargs: Any) -> Any:
+        start = time.perf_counter()
+        try:
+            return raw_connection(*args, **kwargs)
+        finally:
+            DB_POOL_CHECKOUT_WAIT.observe(time.perf_counter() - start)
+
+    engine.raw_connection = _timed_raw_connection
+
+    def _collect_pool() -> None:
+        pool = engine.pool
+        for state, attr in (("checked_out", "checkedout"), ("idle", "checkedin"), ("overflow", "overflow")):
+            method = getattr(pool, attr, None)
+            if method is not None:
+                DB_POOL_CONNECTIONS.set(max(0, method()), state=state)
+
+    REGISTRY.add_collector(_collect_pool)
@@ -0,0 +1,69 @@
+"""
+Request metrics middleware for FastAPI.
+"""
+
+import time
+from typing import Any, Dict, List
+
+from fastapi import Request
+from primedata.core.metrics import (
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUESTS_IN_PROGRESS,
+    REQUEST_DEPENDENCY_DURATION,
+    end_request_timings,
+    start_request_timings,
+)
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.routing import Match
+from starlette.types import ASGIApp
+
+# Label for requests that matched no route (keeps 404 scans from adding label values)
+UNMATCHED_ROUTE = "unmatched"
+
+
+class MetricsMiddleware(BaseHTTPMiddleware):
+    """Records latency per route template and the time each request spent in dependencies."""
+
+    def __init__(self, app: ASGIApp, excluded_paths: tuple = ("/metrics",)):
+        super().__init__(app)
+        self.excluded_paths = excluded_paths
+        self._routes_by_endpoint: Dict[Any, List[Any]] = {}
+
+    def _route_template(self, request: Request) -> str:
+        """Path template of the route that served the request (e.g. /api/v1/products/{product_id})."""
+        endpoint = request.scope.get("endpoint")
+        if endpoint is None:
+            return UNMATCHED_ROUTE
+        routes = self._routes_by_endpoint.get(endpoint)
+        if routes is None:
+            routes = [route for route in request.app.router.routes if getattr(route, "endpoint", None) is endpoint]
+            self._routes_by_endpoint[endpoint] = routes
+        if len(routes) == 1:
+            return routes[0].path
+        for route in routes:
+            match, _ = route.matches(request.scope)
+            if match == Match.FULL:
+                return route.path
+        return UNMATCHED_ROUTE
+
+    async def dispatch(self, request: Request, call_next):
+        if request.url.path in self.excluded_paths:
+            return await call_next(request)
+
+        method = request.method
+        timings, token = start_request_timings()
+        HTTP_REQUESTS_IN_PROGRESS.inc(method=method)
+        start = time.perf_counter()
+        status_code = 500
+        try:
+            response = await call_next(request)
+            status_code = response.status_code
+            return response
+        finally:
+            elapsed = time.perf_counter() - start
+            HTTP_REQUESTS_IN_PROGRESS.dec(method=method)
+            end_request_timings(token)
+            route = self._route_template(request)
+            HTTP_REQUEST_DURATION.observe(elapsed, method=method, route=route, status=str(status_code))
+            for dependency, seconds in timings.items():
+                REQUEST_DEPENDENCY_DURATION.observe(seconds, route=route, dependency=dependency)
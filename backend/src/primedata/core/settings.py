@@ -93,9 +93,17 @@ class Settings(BaseSettings):
     MINIO_ACCESS_KEY: str = "changeme"
     MINIO_SECRET_KEY: str = "CHANGE_ME"
     MINIO_SECURE: bool = False
+    MINIO_POOL_MAXSIZE: int = 32  # urllib3 connections kept per host (raise for heavily concurrent workers)
+    MINIO_CONNECT_TIMEOUT: float = 5.0
+    MINIO_READ_TIMEOUT: float = 300.0
+
+    # Storage bootstrap: buckets are checked/created once per process on first use.
+    # Set to False when buckets are created at deploy time to skip the check entirely.
+    STORAGE_BUCKET_BOOTSTRAP: bool = True
 
     # GCS Configuration (for production, uses Application Default Credentials)
     GCS_PROJECT_ID: Optional[str] = None  # GCP Project ID (optional, for reference)
+    GCS_POOL_MAXSIZE: int = 32  # requests connection pool size of the GCS HTTP session
 
     # Qdrant Configuration
     QDRANT_HOST: str = "localhost"
@@ -5,6 +5,7 @@ This module provides the core validation logic for data quality rules,
 checking data against configured rules and generating violation reports.
 """
 
+import asyncio
 import json
 import os
 from datetime import datetime, timedelta
@@ -96,7 +97,7 @@ class DataQualityValidator:
             rules_key = f"ws/{workspace_id}/prod/{product_id}/dq/rules.yaml"
 
             # Try to get rules file
-            rules_data = await self.minio_client.get_object("primedata-config", rules_key)
+            rules_data = await asyncio.to_thread(self.minio_client.get_object, "primedata-config", rules_key)
             if not rules_data:
                 return None
 
@@ -115,17 +116,20 @@ class DataQualityValidator:
             chunks_key_prefix = f"ws/{workspace_id}/prod/{product_id}/v{version}/embed/"
 
             data_items = []
-            objects = await self.minio_client.list_objects("primedata-embed", chunks_key_prefix)
+            objects = await asyncio.to_thread(self.minio_client.list_objects, "primedata-embed", chunks_key_prefix)
 
-            for obj in objects:
+            # Download all chunks concurrently (off the event loop)
+            downloads = await asyncio.to_thread(
+                self.minio_client.get_many, [("primedata-embed", obj["name"]) for obj in objects]
+            )
+            for download in downloads:
+                if not download.ok:
+                    logger.warning(f"Failed to load chunk {download.key}: {download.error}")
+                    continue
                 try:
-                    # Get chunk data
-                    chunk_data = await self.minio_client.get_object("primedata-embed", obj.name)
-                    if chunk_data:
-                        chunk_info = json.loads(chunk_data)
-                        data_items.append(chunk_info)
+                    data_items.append(json.loads(download.data))
                 except Exception as e:
-                    logger.warning(f"Failed to load chunk {obj.name}: {e}")
+                    logger.warning(f"Failed to load chunk {download.key}: {e}")
 
             return data_items
 
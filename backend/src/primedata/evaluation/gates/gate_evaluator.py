@@ -4,11 +4,18 @@ Gate evaluator for CI/CD quality gates.
 Evaluates if metrics pass thresholds and can block promotion.
 """
 
+import re
 from typing import Dict, List, Optional
 
 from loguru import logger
-
 from primedata.evaluation.gates.thresholds import ThresholdManager
+from primedata.evaluation.metrics.retrieval import (
+    DEFAULT_K_VALUES,
+    compute_retrieval_metrics_batch,
+    retrieval_inputs_from_results,
+)
+
+RETRIEVAL_METRIC_PREFIX = "retrieval_"
 
 
 class GateEvaluator:
@@ -43,12 +50,29 @@ class GateEvaluator:
         gate_results = {}
         all_passed = True
 
+        # Retrieval metrics for all queries at once (with bootstrap confidence intervals)
+        retrieval_summary = self._evaluate_retrieval(per_query_results) if per_query_results else None
+        retrieval_metrics = retrieval_summary["metrics"] if retrieval_summary else {}
+
         # Check each metric
         for metric_name, threshold in self.thresholds.items():
             # Map threshold key to metric name
             metric_key = self._map_threshold_to_metric(metric_name)
-            
-            if metric_key in aggregate_metrics:
+            retrieval_key = metric_key[len(RETRIEVAL_METRIC_PREFIX):] if metric_key.startswith(RETRIEVAL_METRIC_PREFIX) else None
+
+            if retrieval_key in retrieval_metrics:
+                metric_data = retrieval_metrics[retrieval_key]
+                passed = metric_data["mean"] >= threshold
+                gate_results[metric_name] = {
+                    "threshold": threshold,
+                    "actual": metric_data["mean"],
+                    "ci_low": metric_data["ci_low"],
+                    "ci_high": metric_data["ci_high"],
+                    "passed": passed,
+                }
+                if not passed:
+                    all_passed = False
+            elif metric_key in aggregate_metrics:
                 metric_data = aggregate_metrics[metric_key]
                 mean_score = metric_data.get("mean", 0.0)
                 passed = mean_score >= threshold
@@ -98,11 +122,26 @@ class GateEvaluator:
                 if not passed:
                     all_passed = False
 
-        return {
+        result = {
             "all_passed": all_passed,
             "gates": gate_results,
             "blocking": not all_passed,
         }
+        if retrieval_summary and retrieval_summary["num_queries"]:
+            result["retrieval"] = retrieval_summary
+        return result
+
+    def _evaluate_retrieval(self, per_query_results: List[Dict]) -> Optional[Dict]:
+        """Batch retrieval metrics at the default cutoffs plus any cutoff used in the thresholds."""
+        ranked_ids, relevant_ids = retrieval_inputs_from_results(per_query_results)
+        if not ranked_ids:
+            return None
+        k_values = set(DEFAULT_K_VALUES)
+        for key in self.thresholds:
+            match = re.search(r"_at_(\d+)", key)
+            if match:
+                k_values.add(int(match.group(1)))
+        return compute_retrieval_metrics_batch(ranked_ids, relevant_ids, k_values=sorted(k_values))
 
     def _map_threshold_to_metric(self, threshold_key: str) -> str:
         """Map threshold key to metric name."""
@@ -3,15 +3,15 @@ Main evaluation harness that replays datasets through pipeline.
 """
 
 import re
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from uuid import UUID
 
 import numpy as np
 from loguru import logger
 from sqlalchemy.orm import Session
 
-from primedata.api.chat import build_rag_prompt, get_llm_client
 from primedata.db.models import (
     ArtifactStatus,
     EvalDataset,
@@ -23,9 +23,24 @@ from primedata.db.models import (
     Product,
     Workspace,
 )
+from primedata.evaluation.gates.gate_evaluator import RETRIEVAL_METRIC_PREFIX
 from primedata.evaluation.harness.evaluator import Evaluator
+from primedata.evaluation.metrics.retrieval import (
+    compute_retrieval_metrics_batch,
+    retrieval_inputs_from_results,
+    summarize_scores_batch,
+)
 from primedata.indexing.embeddings import EmbeddingGenerator
 from primedata.indexing.qdrant_client import QdrantClient
+from primedata.storage.paths import eval_prefix
+
+# Pipelined runner settings
+EMBED_BATCH_SIZE = 64  # Queries embedded per embed_batch call
+SEARCH_BATCH_SIZE = 32  # Queries per Qdrant batch search request
+DEFAULT_ANSWER_CONCURRENCY = 8  # Concurrent answer generation calls
+DEFAULT_METRIC_WORKERS = 4  # Concurrent metric evaluations
+DEFAULT_CHECKPOINT_EVERY = 25  # Per-query results per checkpoint part
+CHECKPOINT_BUCKET = "primedata-exports"
 
 
 class EvaluationRunner:
@@ -36,6 +51,9 @@ class EvaluationRunner:
         db: Session,
         embedding_generator: Optional[EmbeddingGenerator] = None,
         llm_client=None,
+        answer_concurrency: int = DEFAULT_ANSWER_CONCURRENCY,
+        metric_workers: int = DEFAULT_METRIC_WORKERS,
+        checkpoint_every: int = DEFAULT_CHECKPOINT_EVERY,
     ):
         """
         Initialize evaluation runner.
@@ -44,9 +62,15 @@ class EvaluationRunner:
             db: Database session
             embedding_generator: Embedding generator
             llm_client: LLM client
+            answer_concurrency: Maximum concurrent answer generation calls
+            metric_workers: Number of threads scoring metrics
+            checkpoint_every: Number of completed queries per checkpoint write
         """
         self.db = db
         self.evaluator = Evaluator(embedding_generator=embedding_generator, llm_client=llm_client)
+        self.answer_concurrency = max(1, answer_concurrency)
+        self.metric_workers = max(1, metric_workers)
+        self.checkpoint_every = max(1, checkpoint_every)
 
     def _convert_numpy_types(self, obj: Any) -> Any:
         """
@@ -181,6 +205,9 @@ class EvaluationRunner:
         llm_client = None
         use_llm = True
         try:
+            # Imported here: the API layer pulls in JWT auth, which the runner does not otherwise need
+            from primedata.api.chat import get_llm_client
+
             llm_client = get_llm_client(workspace)
             logger.info("LLM client initialized for answer generation and evaluation")
         except Exception as e:
@@ -194,127 +221,23 @@ class EvaluationRunner:
                 llm_client=llm_client,
             )
         
-        # Process each item
-        per_query_results = []
-        for i, item in enumerate(items):
-            try:
-                logger.info(f"[{i+1}/{len(items)}] Processing query: {item.query[:100]}...")
-                
-                # Generate query embedding
-                logger.debug(f"[{i+1}/{len(items)}] Generating query embedding...")
-                query_embedding = self.evaluator.metric_registry.embedding_generator.embed_batch([item.query])[0]
-                logger.debug(f"[{i+1}/{len(items)}] Query embedding generated (dimension: {len(query_embedding)})")
-                
-                # Search Qdrant for relevant chunks
-                logger.debug(f"[{i+1}/{len(items)}] Searching Qdrant collection: {collection_name}")
-                search_results = qdrant_client.search(
-                    collection_name=collection_name,
-                    query_vector=query_embedding.tolist(),
-                    limit=10,  # Top 10 chunks (increased from 5 for better context relevance)
-                )
-                logger.info(f"[{i+1}/{len(items)}] Retrieved {len(search_results)} chunks from Qdrant")
-                
-                # Prepare retrieved chunks
-                retrieved_chunks = []
-                chunk_ids = []
-                for result in search_results:
-                    # Handle both dict format (from search_points) and object format (from direct client.search)
-                    if isinstance(result, dict):
-                        payload = result.get("payload", {})
-                        chunk_data = {
-                            "id": payload.get("chunk_id") or str(result.get("id", "")),
-                            "text": payload.get("text", ""),
-                            "score": result.get("score", 0.0),
-                            "doc_path": payload.get("doc_path", ""),
-                            "source_file": payload.get("source_file", ""),
-                            "document_id": payload.get("document_id", ""),
-                        }
-                    else:
-                        # Object format (has attributes)
-                        payload = result.payload if hasattr(result, 'payload') else {}
-                        chunk_data = {
-                            "id": payload.get("chunk_id") if isinstance(payload, dict) else (getattr(payload, 'chunk_id', None) or str(getattr(result, 'id', ''))),
-                            "text": payload.get("text", "") if isinstance(payload, dict) else getattr(payload, 'text', ''),
-                            "score": getattr(result, 'score', 0.0),
-                            "doc_path": payload.get("doc_path", "") if isinstance(payload, dict) else getattr(payload, 'doc_path', ''),
-                            "source_file": payload.get("source_file", "") if isinstance(payload, dict) else getattr(payload, 'source_file', ''),
-                            "document_id": payload.get("document_id", "") if isinstance(payload, dict) else getattr(payload, 'document_id', ''),
-                        }
-                    
-                    retrieved_chunks.append(chunk_data)
-                    if chunk_data["id"]:
-                        chunk_ids.append(str(chunk_data["id"]))
-                
-                # Generate answer
-                logger.debug(f"[{i+1}/{len(items)}] Generating answer (LLM available: {use_llm and llm_client is not None})")
-                if use_llm and llm_client and retrieved_chunks:
-                    # Use LLM to generate answer
-                    prompt = build_rag_prompt(item.query, retrieved_chunks)
-                    try:
-                        llm_result = llm_client.generate(
-                            prompt=prompt,
-                            temperature=0.7,
-                            max_tokens=1000,
-                        )
-                        answer = llm_result["text"]
-                        citations = chunk_ids[:3]  # Top 3 chunks as citations
-                        logger.debug(f"[{i+1}/{len(items)}] Generated LLM answer (length: {len(answer)} chars)")
-                    except Exception as e:
-                        logger.warning(f"[{i+1}/{len(items)}] LLM generation failed: {e}, using template answer")
-                        answer = self._generate_template_answer(item.query, retrieved_chunks)
-                        citations = chunk_ids[:3]
-                elif retrieved_chunks:
-                    # Use template-based answer (no LLM)
-                    answer = self._generate_template_answer(item.query, retrieved_chunks)
-                    citations = chunk_ids[:3]
-                    logger.debug(f"[{i+1}/{len(items)}] Generated template answer (length: {len(answer)} chars)")
-                else:
-                    # No chunks retrieved
-                    answer = "I don't have enough information to answer this question."
-                    citations = []
-                    logger.warning(f"[{i+1}/{len(items)}] No chunks retrieved for query")
-                
-                # Get expected chunk IDs and doc IDs from dataset item
-                expected_chunk_ids = item.expected_chunks if item.expected_chunks else None
-                expected_docs = item.expected_docs if item.expected_docs else None
-                
-                # Evaluate
-                logger.info(f"[{i+1}/{len(items)}] Calculating metrics...")
-                metrics = self.evaluator.evaluate_query(
-                    query=item.query,
-                    answer=answer,
-                    retrieved_chunks=retrieved_chunks,
-                    citations=citations,
-                    expected_refusal=item.extra_metadata.get("expected_refusal", False) if item.extra_metadata else False,
-                    has_evidence=bool(item.expected_chunks or retrieved_chunks),
-                    expected_chunk_ids=expected_chunk_ids,
-                    expected_docs=expected_docs,
-                    thresholds=thresholds,
-                )
-                
-                # Log metric scores for visibility
-                metric_summary = ", ".join([
-                    f"{name}: {data.get('score', 0):.2f}" if isinstance(data, dict) else f"{name}: {data}"
-                    for name, data in metrics.items()
-                ])
-                logger.info(f"[{i+1}/{len(items)}] Metrics calculated: {metric_summary}")
-                
-                per_query_results.append({
-                    "item_id": str(item.id),
-                    "query": item.query,
-                    "answer": answer,
-                    "retrieved_chunks_count": len(retrieved_chunks),
-                    "retrieved_chunk_ids": chunk_ids,
-                    "answer_method": "llm" if (use_llm and llm_client) else "template",
-                    "metrics": metrics,
-                })
-            except Exception as e:
-                logger.error(f"[{i+1}/{len(items)}] ERROR processing item {item.id}: {e}", exc_info=True)
-                per_query_results.append({
-                    "item_id": str(item.id),
-                    "query": item.query,
-                    "error": str(e),
-                })
+        # Evaluate pending items, resuming from checkpointed results of a previous attempt of this run
+        checkpoint_prefix = self._checkpoint_prefix(dataset.workspace_id, product_id, version, eval_run.id)
+        per_query_results, resumed_items = self._evaluate_items(
+            items, qdrant_client, collection_name, llm_client if use_llm else None, thresholds, checkpoint_prefix
+        )
+
+        # LLM-as-judge call statistics (calls, cache hits, latency)
+        judge = self.evaluator.metric_registry.judge
+        judge_stats = None
+        if judge is not None:
+            judge_stats = judge.stats()
+            judge.close()
+            logger.info(
+                f"Judge calls: {judge_stats['judge_calls']}, cache hits: {judge_stats['cache_hits']}, "
+                f"failures: {judge_stats['failures']}, latency p50={judge_stats['latency_p50_sec']}s "
+                f"p95={judge_stats['latency_p95_sec']}s"
+            )
 
         # Calculate aggregate metrics
         logger.info("Calculating aggregate metrics across all queries...")
@@ -332,6 +255,8 @@ class EvaluationRunner:
                 "total_items": len(items),
                 "completed_at": datetime.utcnow().isoformat() + "Z",
                 "answer_method": "llm" if (use_llm and llm_client) else "template",
+                "judge_stats": judge_stats,
+                "resumed_items": resumed_items,
             }
         }
 
@@ -374,54 +299,320 @@ class EvaluationRunner:
         
         self.db.commit()
 
+        # Results are in the eval run now; the checkpoint is only needed to resume a failed attempt
+        self._delete_checkpoint(checkpoint_prefix)
+
         logger.info(f"Completed evaluation run {eval_run.id}")
         return eval_run
 
+    def _evaluate_items(
+        self,
+        items: List[EvalDatasetItem],
+        qdrant_client: QdrantClient,
+        collection_name: str,
+        llm_client,
+        thresholds: Optional[Dict[str, float]],
+        checkpoint_prefix: str,
+    ) -> Tuple[List[Dict], int]:
+        """
+        Retrieve, answer and score dataset items, checkpointing completed results.
+
+        Items already present in the checkpoint under ``checkpoint_prefix`` are not evaluated again.
+
+        Returns:
+            (per-query results in dataset order, number of items resumed from the checkpoint)
+        """
+        # Resume from checkpointed per-query results of a previous attempt of this run
+        completed, checkpoint_seq = self._load_checkpoint(checkpoint_prefix)
+        pending_items = [(i, item) for i, item in enumerate(items) if str(item.id) not in completed]
+        if completed:
+            logger.info(f"Resuming evaluation from {checkpoint_prefix}: {len(completed)}/{len(items)} items already evaluated")
+
+        # Stage 1+2: batch-embed all pending queries and retrieve chunks with batched Qdrant searches
+        retrieval = self._retrieve_all(qdrant_client, collection_name, pending_items)
+
+        # Stage 3+4: generate answers with bounded concurrency and score metrics in a worker pool
+        results_by_id: Dict[str, Dict] = dict(completed)
+        unsaved: List[Dict] = []
+        answer_method = "llm" if llm_client else "template"
+
+        with ThreadPoolExecutor(max_workers=self.answer_concurrency, thread_name_prefix="eval-answer") as answer_pool, \
+                ThreadPoolExecutor(max_workers=self.metric_workers, thread_name_prefix="eval-metrics") as metric_pool:
+            in_flight: Dict[Any, tuple] = {}
+            for i, item in pending_items:
+                retrieved = retrieval[i]
+                if isinstance(retrieved, Exception):
+                    logger.error(f"[{i+1}/{len(items)}] ERROR retrieving chunks for item {item.id}: {retrieved}")
+                    results_by_id[str(item.id)] = {"item_id": str(item.id), "query": item.query, "error": str(retrieved)}
+                    continue
+                retrieved_chunks, chunk_ids = retrieved
+                future = answer_pool.submit(self._generate_answer, i, len(items), item, retrieved_chunks, chunk_ids, llm_client)
+                in_flight[future] = ("answer", i, item, retrieved_chunks, chunk_ids)
+
+            while in_flight:
+                done, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+                for future in done:
+                    stage, i, item, retrieved_chunks, chunk_ids = in_flight.pop(future)
+                    try:
+                        outcome = future.result()
+                    except Exception as e:
+                        logger.error(f"[{i+1}/{len(items)}] ERROR processing item {item.id}: {e}", exc_info=True)
+                        results_by_id[str(item.id)] = {"item_id": str(item.id), "query": item.query, "error": str(e)}
+                        continue
+
+                    if stage == "answer":
+                        answer, citations = outcome
+                        metric_future = metric_pool.submit(
+                            self._score_item, i, len(items), item, answer, citations, retrieved_chunks, chunk_ids, thresholds
+                        )
+                        in_flight[metric_future] = ("metrics", i, item, retrieved_chunks, chunk_ids)
+                        continue
+
+                    result = {
+                        "item_id": str(item.id),
+                        "query": item.query,
+                        "answer": outcome["answer"],
+                        "retrieved_chunks_count": len(retrieved_chunks),
+                        "retrieved_chunk_ids": chunk_ids,
+                        "expected_chunk_ids": item.expected_chunks or [],
+                        "answer_method": answer_method,
+                        "metrics": outcome["metrics"],
+                    }
+                    results_by_id[str(item.id)] = result
+                    unsaved.append(result)
+                    if len(unsaved) >= self.checkpoint_every:
+                        self._write_checkpoint(checkpoint_prefix, checkpoint_seq, unsaved)
+                        checkpoint_seq += 1
+                        unsaved = []
+
+        if unsaved:
+            self._write_checkpoint(checkpoint_prefix, checkpoint_seq, unsaved)
+
+        # Keep dataset order in the results
+        per_query_results = [results_by_id[str(item.id)] for item in items if str(item.id) in results_by_id]
+        return per_query_results, len(completed)
+
+    def _retrieve_all(self, qdrant_client: QdrantClient, collection_name: str, indexed_items: List[Tuple[int, Any]]) -> Dict[int, Any]:
+        """
+        Embed all queries in batches and retrieve chunks with batched Qdrant searches.
+
+        Returns:
+            Mapping of item index to (retrieved_chunks, chunk_ids), or to the exception
+            raised while embedding/searching that item's batch
+        """
+        embedding_generator = self.evaluator.metric_registry.embedding_generator
+        retrieval: Dict[int, Any] = {}
+
+        for start in range(0, len(indexed_items), EMBED_BATCH_SIZE):
+            batch = indexed_items[start : start + EMBED_BATCH_SIZE]
+            try:
+                embeddings = embedding_generator.embed_batch([item.query for _, item in batch])
+                logger.info(f"Embedded queries {start + 1}-{start + len(batch)} of {len(indexed_items)}")
+            except Exception as e:
+                for i, _ in batch:
+                    retrieval[i] = e
+                continue
+
+            for search_start in range(0, len(batch), SEARCH_BATCH_SIZE):
+                search_batch = batch[search_start : search_start + SEARCH_BATCH_SIZE]
+                vectors = [
+                    embeddings[search_start + j].tolist() if hasattr(embeddings[search_start + j], "tolist")
+                    else list(embeddings[search_start + j])
+                    for j in range(len(search_batch))
+                ]
+                try:
+                    batch_results = qdrant_client.search_batch(
+                        collection_name=collection_name,
+                        query_vectors=vectors,
+                        limit=10,  # Top 10 chunks (increased from 5 for better context relevance)
+                        with_vectors=True,  # Stored vectors are reused by context relevance
+                    )
+                except Exception as e:
+                    for i, _ in search_batch:
+                        retrieval[i] = e
+                    continue
+
+                for (i, _), search_results in zip(search_batch, batch_results):
+                    retrieved_chunks = [self._to_chunk_data(result) for result in search_results]
+                    chunk_ids = [str(chunk["id"]) for chunk in retrieved_chunks if chunk["id"]]
+                    retrieval[i] = (retrieved_chunks, chunk_ids)
+
+        return retrieval
+
+    @staticmethod
+    def _to_chunk_data(result: Any) -> Dict[str, Any]:
+        """Convert a Qdrant search result into a retrieved chunk dict."""
+        # Handle both dict format (from search_points) and object format (from direct client.search)
+        if isinstance(result, dict):
+            payload = result.get("payload", {})
+            chunk_data = {
+                "id": payload.get("chunk_id") or str(result.get("id", "")),
+                "text": payload.get("text", ""),
+                "score": result.get("score", 0.0),
+                "doc_path": payload.get("doc_path", ""),
+                "source_file": payload.get("source_file", ""),
+                "document_id": payload.get("document_id", ""),
+            }
+            if result.get("vector") is not None:
+                chunk_data["embedding"] = result["vector"]
+            return chunk_data
+
+        # Object format (has attributes)
+        payload = result.payload if hasattr(result, 'payload') else {}
+        return {
+            "id": payload.get("chunk_id") if isinstance(payload, dict) else (getattr(payload, 'chunk_id', None) or str(getattr(result, 'id', ''))),
+            "text": payload.get("text", "") if isinstance(payload, dict) else getattr(payload, 'text', ''),
+            "score": getattr(result, 'score', 0.0),
+            "doc_path": payload.get("doc_path", "") if isinstance(payload, dict) else getattr(payload, 'doc_path', ''),
+            "source_file": payload.get("source_file", "") if isinstance(payload, dict) else getattr(payload, 'source_file', ''),
+            "document_id": payload.get("document_id", "") if isinstance(payload, dict) else getattr(payload, 'document_id', ''),
+        }
+
+    def _generate_answer(
+        self,
+        i: int,
+        total: int,
+        item: EvalDatasetItem,
+        retrieved_chunks: List[Dict],
+        chunk_ids: List[str],
+        llm_client=None,
+    ) -> Tuple[str, List[str]]:
+        """Generate the answer for one item (LLM if available, template otherwise)."""
+        logger.debug(f"[{i+1}/{total}] Generating answer (LLM available: {llm_client is not None})")
+        if llm_client and retrieved_chunks:
+            from primedata.api.chat import build_rag_prompt
+
+            # Use LLM to generate answer
+            prompt = build_rag_prompt(item.query, retrieved_chunks)
+            try:
+                llm_result = llm_client.generate(
+                    prompt=prompt,
+                    temperature=0.7,
+                    max_tokens=1000,
+                )
+                logger.debug(f"[{i+1}/{total}] Generated LLM answer (length: {len(llm_result['text'])} chars)")
+                return llm_result["text"], chunk_ids[:3]  # Top 3 chunks as citations
+            except Exception as e:
+                logger.warning(f"[{i+1}/{total}] LLM generation failed: {e}, using template answer")
+                return self._generate_template_answer(item.query, retrieved_chunks), chunk_ids[:3]
+        elif retrieved_chunks:
+            # Use template-based answer (no LLM)
+            answer = self._generate_template_answer(item.query, retrieved_chunks)
+            logger.debug(f"[{i+1}/{total}] Generated template answer (length: {len(answer)} chars)")
+            return answer, chunk_ids[:3]
+
+        # No chunks retrieved
+        logger.warning(f"[{i+1}/{total}] No chunks retrieved for query")
+        return "I don't have enough information to answer this question.", []
+
+    def _score_item(
+        self,
+        i: int,
+        total: int,
+        item: EvalDatasetItem,
+        answer: str,
+        citations: List[str],
+        retrieved_chunks: List[Dict],
+        chunk_ids: List[str],
+        thresholds: Optional[Dict[str, float]],
+    ) -> Dict[str, Any]:
+        """Evaluate metrics for one answered item."""
+        metrics = self.evaluator.evaluate_query(
+            query=item.query,
+            answer=answer,
+            retrieved_chunks=retrieved_chunks,
+            citations=citations,
+            expected_refusal=item.extra_metadata.get("expected_refusal", False) if item.extra_metadata else False,
+            has_evidence=bool(item.expected_chunks or retrieved_chunks),
+            expected_chunk_ids=item.expected_chunks if item.expected_chunks else None,
+            expected_docs=item.expected_docs if item.expected_docs else None,
+            thresholds=thresholds,
+        )
+
+        # Log metric scores for visibility
+        metric_summary = ", ".join([
+            f"{name}: {data.get('score', 0):.2f}" if isinstance(data, dict) else f"{name}: {data}"
+            for name, data in metrics.items()
+        ])
+        logger.info(f"[{i+1}/{total}] Metrics calculated: {metric_summary}")
+        return {"answer": answer, "metrics": metrics}
+
+    @staticmethod
+    def _checkpoint_prefix(workspace_id: Any, product_id: UUID, version: int, eval_run_id: UUID) -> str:
+        return f"{eval_prefix(workspace_id, product_id, version)}checkpoints/{eval_run_id}/"
+
+    def _load_checkpoint(self, prefix: str) -> Tuple[Dict[str, Dict], int]:
+        """Load checkpointed per-query results; returns (results by item id, number of parts)."""
+        try:
+            from primedata.storage.minio_client import minio_client
+
+            parts = sorted(obj["name"] for obj in minio_client.list_objects(CHECKPOINT_BUCKET, prefix))
+            completed: Dict[str, Dict] = {}
+            for key in parts:
+                for result in minio_client.get_json(CHECKPOINT_BUCKET, key) or []:
+                    completed[result["item_id"]] = result
+            return completed, len(parts)
+        except Exception as e:
+            logger.warning(f"Could not load evaluation checkpoint from {prefix}: {e}")
+            return {}, 0
+
+    def _write_checkpoint(self, prefix: str, seq: int, results: List[Dict]) -> None:
+        """Persist a part of completed per-query results so a failed run can resume."""
+        try:
+            from primedata.storage.minio_client import minio_client
+
+            minio_client.put_json(CHECKPOINT_BUCKET, f"{prefix}part-{seq:05d}.json", self._convert_numpy_types(results))
+            logger.info(f"Checkpointed {len(results)} per-query results (part {seq})")
+        except Exception as e:
+            logger.warning(f"Failed to write evaluation checkpoint part {seq}: {e}")
+
+    def _delete_checkpoint(self, prefix: str) -> None:
+        """Delete the checkpoint parts of a completed run."""
+        try:
+            from primedata.storage.minio_client import minio_client
+
+            parts = [(CHECKPOINT_BUCKET, obj["name"]) for obj in minio_client.list_objects(CHECKPOINT_BUCKET, prefix)]
+            if parts:
+                failed = [result for result in minio_client.delete_many(parts) if not result.ok]
+                if failed:
+                    logger.warning(f"Failed to delete {len(failed)} evaluation checkpoint parts under {prefix}")
+        except Exception as e:
+            logger.warning(f"Could not delete evaluation checkpoint {prefix}: {e}")
+
     def _calculate_aggregates(self, per_query_results: List[Dict]) -> Dict:
-        """Calculate aggregate metrics from per-query results."""
+        """Calculate aggregate metrics (with bootstrap confidence intervals) from per-query results."""
         if not per_query_results:
             return {}
 
-        # Collect all metric names dynamically
-        all_metric_names = set()
-        for result in per_query_results:
-            if "error" not in result:
-                metrics = result.get("metrics", {})
-                all_metric_names.update(metrics.keys())
-        
-        # Initialize metric scores dictionary
-        metric_scores = {name: [] for name in all_metric_names}
-
+        # Per-query scores as one column per metric (all metric names, collected dynamically)
+        metric_scores: Dict[str, List[float]] = {}
         for result in per_query_results:
             if "error" in result:
                 continue
-            metrics = result.get("metrics", {})
-            for metric_name, metric_data in metrics.items():
+            for metric_name, metric_data in result.get("metrics", {}).items():
+                scores = metric_scores.setdefault(metric_name, [])
                 if isinstance(metric_data, dict):
-                    score = metric_data.get("score", 0.0)
-                    metric_scores[metric_name].append(score)
-
-        aggregates = {}
-        for metric_name, scores in metric_scores.items():
-            if scores:
-                # Convert scores to native Python floats before calculations
-                native_scores = [float(score) if isinstance(score, (np.integer, np.floating)) else float(score) for score in scores]
-                aggregates[metric_name] = {
-                    "mean": float(sum(native_scores) / len(native_scores)),
-                    "min": float(min(native_scores)),
-                    "max": float(max(native_scores)),
-                    "count": len(native_scores),
-                }
-            else:
-                aggregates[metric_name] = {
-                    "mean": 0.0,
-                    "min": 0.0,
-                    "max": 0.0,
-                    "count": 0,
+                    scores.append(float(metric_data.get("score", 0.0)))
+
+        aggregates = summarize_scores_batch(metric_scores)
+
+        # Ranking metrics of all queries with expected chunks at once, as the quality gates compute them
+        ranked_ids, relevant_ids = retrieval_inputs_from_results(per_query_results)
+        if ranked_ids:
+            retrieval = compute_retrieval_metrics_batch(ranked_ids, relevant_ids, return_per_query=True)
+            for name, data in retrieval["metrics"].items():
+                per_query = retrieval["per_query"][name]
+                aggregates[f"{RETRIEVAL_METRIC_PREFIX}{name}"] = {
+                    "mean": data["mean"],
+                    "min": float(per_query.min()),
+                    "max": float(per_query.max()),
+                    "count": retrieval["num_queries"],
+                    "ci_low": data["ci_low"],
+                    "ci_high": data["ci_high"],
                 }
 
         return aggregates
-    
+
     def _generate_template_answer(self, query: str, retrieved_chunks: List[Dict]) -> str:
         """
         Generate answer from chunks without LLM using template-based extraction.
@@ -9,20 +9,26 @@ from typing import Dict, List, Optional
 
 from loguru import logger
 
+from ..metrics.judge import JudgeExecutor, JudgeRequest
 from ..metrics.scoring import MetricScore
 
+# Bump when the claim-support prompt changes so cached verdicts are not reused
+CLAIM_SUPPORT_TEMPLATE_VERSION = "groundedness:v1"
+
 
 class GroundednessMetric:
     """Groundedness metric evaluator."""
 
-    def __init__(self, llm_client=None):
+    def __init__(self, llm_client=None, judge: Optional[JudgeExecutor] = None):
         """
         Initialize groundedness metric.
         
         Args:
             llm_client: LLM client for evaluation (optional, can use simple heuristics if not provided)
+            judge: Shared judge executor (created from llm_client if not provided)
         """
         self.llm_client = llm_client
+        self.judge = judge if judge is not None else (JudgeExecutor(llm_client) if llm_client else None)
 
     def evaluate(
         self,
@@ -66,8 +72,14 @@ class GroundednessMetric:
         supported_claims = []
         unsupported_claims = []
         
-        for claim in claims:
-            if self._is_claim_supported(claim, retrieved_chunks):
+        if self.llm_client:
+            # Judge all claims of the answer concurrently
+            verdicts = self._are_claims_supported_llm(claims, retrieved_chunks)
+        else:
+            verdicts = [self._is_claim_supported_keyword(claim, retrieved_chunks) for claim in claims]
+
+        for claim, supported in zip(claims, verdicts):
+            if supported:
                 supported_claims.append(claim)
             else:
                 unsupported_claims.append(claim)
@@ -132,19 +144,51 @@ class GroundednessMetric:
         
         This provides more accurate semantic evaluation than keyword matching.
         """
+        return self._are_claims_supported_llm([claim], chunks)[0]
+
+    def _are_claims_supported_llm(self, claims: List[str], chunks: List[Dict]) -> List[bool]:
+        """
+        Judge several claims against the same chunks with one concurrent batch of judge calls.
+
+        Claims whose judge call fails fall back to keyword matching.
+        """
         if not chunks:
-            return False
-        
-        try:
-            # Build context from top chunks (limit to avoid token limits)
-            context_chunks = chunks[:3]  # Use top 3 chunks
-            context = "\n\n".join([
-                f"[Chunk {i+1}]: {chunk.get('text', '')[:500]}"  # Limit chunk size
-                for i, chunk in enumerate(context_chunks)
-            ])
-            
-            # Create structured prompt for LLM judge
-            prompt = f"""You are evaluating whether a claim is supported by the provided context.
+            return [False] * len(claims)
+
+        # Build context from top chunks (limit to avoid token limits)
+        context_chunks = chunks[:3]  # Use top 3 chunks
+        context = "\n\n".join([
+            f"[Chunk {i+1}]: {chunk.get('text', '')[:500]}"  # Limit chunk size
+            for i, chunk in enumerate(context_chunks)
+        ])
+
+        requests = [
+            JudgeRequest(
+                prompt=self._build_claim_prompt(claim, context),
+                template_version=CLAIM_SUPPORT_TEMPLATE_VERSION,
+                subject=claim,
+                context=context,
+                max_tokens=10,  # Just need yes/no
+            )
+            for claim in claims
+        ]
+        responses = self.judge.judge_many(requests)
+
+        verdicts = []
+        for claim, response in zip(claims, responses):
+            if response is None:
+                logger.warning("LLM-based groundedness check failed, falling back to keyword matching")
+                verdicts.append(self._is_claim_supported_keyword(claim, chunks))
+                continue
+            answer = response.strip().lower()
+            # Check for yes/no response
+            verdicts.append("yes" in answer and "no" not in answer[:10])  # Avoid "no" in "not supported"
+        return verdicts
+
+    @staticmethod
+    def _build_claim_prompt(claim: str, context: str) -> str:
+        """Create structured prompt for LLM judge."""
+        return f"""You are evaluating whether a claim is supported by the provided context.
 
 Context:
 {context}
@@ -157,25 +201,6 @@ Determine if the claim is directly supported by the context. The claim must be:
 3. Not requiring external knowledge beyond what's in the context
 
 Answer ONLY with "yes" or "no". Do not provide explanation."""
-            
-            # Call LLM with low temperature for consistent results
-            response = self.llm_client.generate(
-                prompt=prompt,
-                temperature=0.0,  # Deterministic
-                max_tokens=10,  # Just need yes/no
-            )
-            
-            answer = response.get("text", "").strip().lower()
-            
-            # Check for yes/no response
-            if "yes" in answer and "no" not in answer[:10]:  # Avoid "no" in "not supported"
-                return True
-            return False
-            
-        except Exception as e:
-            from loguru import logger
-            logger.warning(f"LLM-based groundedness check failed: {e}, falling back to keyword matching")
-            return self._is_claim_supported_keyword(claim, chunks)
     
     def _is_claim_supported_keyword(self, claim: str, chunks: List[Dict]) -> bool:
         """
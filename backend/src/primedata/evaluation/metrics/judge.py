@@ -0,0 +1,131 @@
+"""
+LLM-as-judge executor.
+
+Runs judge prompts (claim support, answer relevance) with bounded concurrency
+and memoizes verdicts in the persistent LLM cache, keyed by
+(judge model, prompt template version, subject, context hash), so unchanged
+items cost nothing on re-evaluation.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from loguru import logger
+from primedata.services.llm_cache import LLMResultCache, get_llm_cache, make_cache_key, text_hash
+
+CACHE_NAMESPACE = "judge"
+DEFAULT_MAX_CONCURRENCY = 8
+
+
+class JudgeRequest(NamedTuple):
+    """A single judge call."""
+
+    prompt: str
+    template_version: str  # Prompt template name + version, e.g. "groundedness:v1"
+    subject: str  # What is being judged (claim, query)
+    context: str  # What it is judged against (chunks, answer)
+    max_tokens: int = 10
+
+
+class JudgeExecutor:
+    """Runs judge requests concurrently against an LLM client, with caching and call statistics."""
+
+    def __init__(
+        self,
+        llm_client,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        cache: Optional[LLMResultCache] = None,
+    ):
+        """
+        Args:
+            llm_client: LLM client exposing generate(prompt, temperature, max_tokens)
+            max_concurrency: Maximum number of judge calls in flight
+            cache: Verdict cache (defaults to the process-wide LLM cache)
+        """
+        self.llm_client = llm_client
+        self.model = getattr(llm_client, "model", type(llm_client).__name__)
+        self.max_concurrency = max(1, max_concurrency)
+        self.cache = cache if cache is not None else get_llm_cache()
+        self._lock = threading.Lock()
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.calls = 0
+            self.cache_hits = 0
+            self.failures = 0
+            self._latencies: List[float] = []
+
+    def cache_key(self, request: JudgeRequest) -> str:
+        return make_cache_key(self.model, request.template_version, request.subject, text_hash(request.context))
+
+    def judge(self, request: JudgeRequest) -> Optional[str]:
+        """Run one judge request; returns the response text or None if the call failed."""
+        return self.judge_many([request])[0]
+
+    def judge_many(self, requests: List[JudgeRequest]) -> List[Optional[str]]:
+        """Run judge requests concurrently; returns response texts (None on failure) in input order."""
+        if not requests:
+            return []
+        if len(requests) == 1 or self.max_concurrency == 1:
+            return [self._judge_one(request) for request in requests]
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="judge")
+        return list(self._pool.map(self._judge_one, requests))
+
+    def _judge_one(self, request: JudgeRequest) -> Optional[str]:
+        key = self.cache_key(request)
+        cached = self.cache.get(CACHE_NAMESPACE, key)
+        if cached is not None:
+            with self._lock:
+                self.cache_hits += 1
+            return cached["text"]
+
+        started = time.perf_counter()
+        try:
+            response = self.llm_client.generate(prompt=request.prompt, temperature=0.0, max_tokens=request.max_tokens)
+            text = response.get("text") or ""
+        except Exception as e:
+            logger.warning(f"Judge call failed ({request.template_version}): {e}")
+            with self._lock:
+                self.calls += 1
+                self.failures += 1
+                self._latencies.append(time.perf_counter() - started)
+            return None
+
+        with self._lock:
+            self.calls += 1
+            self._latencies.append(time.perf_counter() - started)
+        self.cache.set(CACHE_NAMESPACE, key, {"text": text, "model": self.model, "template": request.template_version})
+        return text
+
+    def stats(self) -> Dict[str, Any]:
+        """Judge call counts, cache hits and latency percentiles."""
+        with self._lock:
+            latencies = sorted(self._latencies)
+            calls, cache_hits, failures = self.calls, self.cache_hits, self.failures
+
+        def _percentile(q: float) -> float:
+            if not latencies:
+                return 0.0
+            return round(latencies[min(len(latencies) - 1, int(round(q * (len(latencies) - 1))))], 3)
+
+        total = calls + cache_hits
+        return {
+            "model": self.model,
+            "judge_calls": calls,
+            "cache_hits": cache_hits,
+            "cache_hit_ratio": round(cache_hits / total, 4) if total else 0.0,
+            "failures": failures,
+            "latency_p50_sec": _percentile(0.5),
+            "latency_p95_sec": _percentile(0.95),
+            "total_latency_sec": round(sum(latencies), 3),
+        }
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
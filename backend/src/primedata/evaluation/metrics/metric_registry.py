@@ -6,6 +6,7 @@ from typing import Dict, List, Optional
 
 from .citation_coverage import CitationCoverageMetric
 from .groundedness import GroundednessMetric
+from .judge import JudgeExecutor
 from .refusal_correctness import RefusalCorrectnessMetric
 from .relevance import RelevanceMetric
 from .retrieval import RetrievalMetric
@@ -29,12 +30,15 @@ class MetricRegistry:
         """
         self.embedding_generator = embedding_generator
         self.llm_client = llm_client
+        # One judge executor (thread pool + verdict cache) shared by all LLM-as-judge metrics
+        self.judge = JudgeExecutor(llm_client) if llm_client else None
         
         # Initialize metric evaluators
-        self.groundedness = GroundednessMetric(llm_client=llm_client)
+        self.groundedness = GroundednessMetric(llm_client=llm_client, judge=self.judge)
         self.relevance = RelevanceMetric(
             embedding_generator=embedding_generator,
             llm_client=llm_client,
+            judge=self.judge,
         )
         self.citation_coverage = CitationCoverageMetric()
         self.refusal_correctness = RefusalCorrectnessMetric()
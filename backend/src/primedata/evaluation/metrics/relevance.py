@@ -6,27 +6,41 @@ Includes:
 - Answer relevance: How well does the answer address the query
 """
 
+import threading
+from collections import OrderedDict
 from typing import Dict, List, Optional
 
 import numpy as np
 from loguru import logger
 
+from ..metrics.judge import JudgeExecutor, JudgeRequest
 from ..metrics.scoring import MetricScore
 
+# Bump when the answer-relevance prompt changes so cached scores are not reused
+ANSWER_RELEVANCE_TEMPLATE_VERSION = "answer_relevance:v1"
+
+# Maximum number of re-embedded chunk vectors kept in memory
+EMBEDDING_CACHE_SIZE = 10000
+
 
 class RelevanceMetric:
     """Relevance metric evaluator."""
 
-    def __init__(self, embedding_generator=None, llm_client=None):
+    def __init__(self, embedding_generator=None, llm_client=None, judge: Optional[JudgeExecutor] = None):
         """
         Initialize relevance metric.
         
         Args:
             embedding_generator: Embedding generator for similarity calculation
             llm_client: LLM client for answer relevance (optional)
+            judge: Shared judge executor (created from llm_client if not provided)
         """
         self.embedding_generator = embedding_generator
         self.llm_client = llm_client
+        self.judge = judge if judge is not None else (JudgeExecutor(llm_client) if llm_client else None)
+        # Re-embedded chunk vectors (for chunks retrieved without stored vectors), LRU-bounded
+        self._embedding_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._embedding_cache_lock = threading.Lock()
 
     def evaluate_context_relevance(
         self,
@@ -56,30 +70,14 @@ class RelevanceMetric:
         if self.embedding_generator:
             # Use embedding similarity
             try:
-                query_embedding = self.embedding_generator.embed_batch([query])[0]
-                similarities = []
-                
-                for chunk in retrieved_chunks:
-                    chunk_text = chunk.get("text", "")
-                    if not chunk_text:
-                        continue
-                    
-                    # Get or generate chunk embedding
-                    if "embedding" in chunk:
-                        chunk_embedding = chunk["embedding"]
-                    else:
-                        chunk_embeddings = self.embedding_generator.embed_batch([chunk_text])
-                        chunk_embedding = chunk_embeddings[0] if chunk_embeddings else None
-                    
-                    if chunk_embedding is not None:
-                        # Cosine similarity
-                        similarity = np.dot(query_embedding, chunk_embedding) / (
-                            np.linalg.norm(query_embedding) * np.linalg.norm(chunk_embedding)
-                        )
-                        similarities.append(similarity)
-                
-                if similarities:
-                    avg_similarity = np.mean(similarities)
+                query_embedding = np.asarray(self.embedding_generator.embed_batch([query])[0], dtype=np.float32)
+                chunk_matrix = self._chunk_embedding_matrix(retrieved_chunks, len(query_embedding))
+
+                if chunk_matrix is not None:
+                    # Cosine similarity of all chunks in one matrix-vector product
+                    norms = np.linalg.norm(chunk_matrix, axis=1) * np.linalg.norm(query_embedding)
+                    similarities = (chunk_matrix @ query_embedding) / norms
+                    avg_similarity = float(np.mean(similarities))
                     score = max(0.0, min(1.0, avg_similarity))  # Clamp to [0, 1]
                 else:
                     score = 0.0
@@ -114,6 +112,49 @@ class RelevanceMetric:
             details=details,
         )
 
+    def _chunk_embedding_matrix(self, chunks: List[Dict], dimension: int) -> Optional[np.ndarray]:
+        """
+        Stack chunk embeddings into a (n_chunks, dimension) matrix.
+
+        Uses the vector stored with each chunk ("embedding", as returned by retrieval
+        with vectors) or the embedding cache; chunks without a usable vector are
+        re-embedded in a single batch. Chunks without text are skipped.
+        """
+        texts = [chunk.get("text", "") for chunk in chunks if chunk.get("text", "")]
+        if not texts:
+            return None
+
+        vectors: List[Optional[np.ndarray]] = []
+        missing: List[int] = []
+        for chunk in chunks:
+            if not chunk.get("text", ""):
+                continue
+            vector = chunk.get("embedding")
+            if vector is None or len(vector) != dimension:
+                with self._embedding_cache_lock:
+                    vector = self._embedding_cache.get(chunk["text"])
+            if vector is not None and len(vector) == dimension:
+                vectors.append(np.asarray(vector, dtype=np.float32))
+            else:
+                vectors.append(None)
+                missing.append(len(vectors) - 1)
+
+        if missing:
+            embedded = self.embedding_generator.embed_batch([texts[i] for i in missing])
+            for i, vector in zip(missing, embedded):
+                vectors[i] = np.asarray(vector, dtype=np.float32)
+                self._cache_embedding(texts[i], vectors[i])
+
+        vectors = [v for v in vectors if v is not None]
+        return np.vstack(vectors) if vectors else None
+
+    def _cache_embedding(self, text: str, vector: np.ndarray) -> None:
+        with self._embedding_cache_lock:
+            self._embedding_cache[text] = vector
+            self._embedding_cache.move_to_end(text)
+            if len(self._embedding_cache) > EMBEDDING_CACHE_SIZE:
+                self._embedding_cache.popitem(last=False)
+
     def evaluate_answer_relevance(
         self,
         query: str,
@@ -166,8 +207,7 @@ class RelevanceMetric:
         
         Returns a score from 0.0 to 1.0 indicating how well the answer addresses the query.
         """
-        try:
-            prompt = f"""You are evaluating how well an answer addresses a question.
+        prompt = f"""You are evaluating how well an answer addresses a question.
 
 Question: {query}
 
@@ -180,31 +220,32 @@ Rate how well the answer addresses the question on a scale of 0.0 to 1.0, where:
 - 0.0-0.3 = The answer does not address the question or is irrelevant
 
 Respond with ONLY a number between 0.0 and 1.0 (e.g., "0.85"). Do not provide explanation."""
-            
-            response = self.llm_client.generate(
+
+        answer_text = self.judge.judge(
+            JudgeRequest(
                 prompt=prompt,
-                temperature=0.0,  # Deterministic
+                template_version=ANSWER_RELEVANCE_TEMPLATE_VERSION,
+                subject=query,
+                context=answer,
                 max_tokens=10,  # Just need a number
             )
-            
-            answer_text = response.get("text", "").strip()
-            
-            # Extract numeric score
-            import re
-            match = re.search(r'0?\.?\d+', answer_text)
-            if match:
-                score = float(match.group())
-                # Clamp to [0, 1]
-                return max(0.0, min(1.0, score))
-            
-            # If parsing fails, return moderate score
-            logger.warning(f"Failed to parse LLM relevance score from: {answer_text}")
-            return 0.5
-            
-        except Exception as e:
-            logger.warning(f"LLM-based answer relevance check failed: {e}, falling back to keyword matching")
+        )
+        if answer_text is None:
+            logger.warning("LLM-based answer relevance check failed, falling back to keyword matching")
             return self._simple_answer_relevance(query, answer)
 
+        # Extract numeric score
+        import re
+        match = re.search(r'0?\.?\d+', answer_text.strip())
+        if match:
+            score = float(match.group())
+            # Clamp to [0, 1]
+            return max(0.0, min(1.0, score))
+
+        # If parsing fails, return moderate score
+        logger.warning(f"Failed to parse LLM relevance score from: {answer_text}")
+        return 0.5
+
     def _simple_answer_relevance(self, query: str, answer: str) -> float:
         """Simple keyword-based answer relevance."""
         query_words = set(query.lower().split())
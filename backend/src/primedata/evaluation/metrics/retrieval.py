@@ -9,7 +9,7 @@ Includes industry-standard retrieval metrics:
 - Precision@K
 """
 
-from typing import Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 import numpy as np
 from loguru import logger
@@ -256,3 +256,213 @@ class RetrievalMetric:
         
         return results
 
+
+
+# Default cutoffs for batch retrieval metrics
+DEFAULT_K_VALUES = (5, 10, 20)
+
+# Upper bound on (bootstrap samples x queries) resampled at once, to bound memory
+_BOOTSTRAP_BLOCK_CELLS = 2_000_000
+
+
+def build_hit_matrix(
+    ranked_ids: Sequence[Sequence[str]],
+    relevant_ids: Sequence[Iterable[str]],
+    depth: Optional[int] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Build a boolean hit matrix from ranked result ids and relevance sets.
+
+    Args:
+        ranked_ids: Retrieved ids per query, best first
+        relevant_ids: Relevant (expected) ids per query
+        depth: Number of ranks to keep (defaults to the longest ranking)
+
+    Returns:
+        (hits, n_relevant): hits[q, r] is True if the id at rank r+1 of query q is relevant;
+        n_relevant[q] is the size of the relevance set of query q
+    """
+    if len(ranked_ids) != len(relevant_ids):
+        raise ValueError("ranked_ids and relevant_ids must have the same number of queries")
+
+    depth = depth if depth is not None else max((len(ids) for ids in ranked_ids), default=0)
+    hits = np.zeros((len(ranked_ids), depth), dtype=bool)
+    n_relevant = np.zeros(len(ranked_ids), dtype=np.int64)
+    for q, (ranking, relevant) in enumerate(zip(ranked_ids, relevant_ids)):
+        relevant = list(relevant or ())
+        relevant_set = set(relevant)
+        n_relevant[q] = len(relevant)  # As in the per-query metrics, duplicates count
+        if relevant_set:
+            row = [cid in relevant_set for cid in ranking[:depth]]
+            hits[q, : len(row)] = row
+    return hits, n_relevant
+
+
+def _per_query_scores(hits: np.ndarray, n_relevant: np.ndarray, k_values: Sequence[int]) -> Dict[str, np.ndarray]:
+    """Per-query MRR, recall, precision, hit rate and nDCG at each k (one column-wise pass)."""
+    n_queries, depth = hits.shape
+    scores: Dict[str, np.ndarray] = {}
+
+    cumulative = np.cumsum(hits, axis=1, dtype=np.int64) if depth else np.zeros((n_queries, 0), dtype=np.int64)
+    discounts = 1.0 / np.log2(np.arange(2, max(depth, max(k_values, default=0)) + 2))
+    discounted = hits * discounts[:depth] if depth else np.zeros((n_queries, 0))
+    cumulative_dcg = np.cumsum(discounted, axis=1)
+    ideal_dcg = np.concatenate([[0.0], np.cumsum(discounts)])
+
+    for k in k_values:
+        if depth:
+            hits_at_k = cumulative[:, min(k, depth) - 1]
+            dcg = cumulative_dcg[:, min(k, depth) - 1]
+        else:
+            hits_at_k = np.zeros(n_queries, dtype=np.int64)
+            dcg = np.zeros(n_queries)
+        idcg = ideal_dcg[np.minimum(n_relevant, k)]
+
+        scores[f"recall_at_{k}"] = hits_at_k / np.maximum(n_relevant, 1)
+        scores[f"precision_at_{k}"] = hits_at_k / float(k)
+        scores[f"hit_rate_at_{k}"] = (hits_at_k > 0).astype(np.float64)
+        scores[f"ndcg_at_{k}"] = np.divide(dcg, idcg, out=np.zeros(n_queries), where=idcg > 0)
+
+    if depth:
+        any_hit = hits.any(axis=1)
+        first_rank = hits.argmax(axis=1) + 1
+        scores["mrr"] = np.where(any_hit, 1.0 / first_rank, 0.0)
+    else:
+        scores["mrr"] = np.zeros(n_queries)
+    return scores
+
+
+def _bootstrap_intervals(
+    matrix: np.ndarray, n_bootstrap: int, confidence: float, seed: Optional[int]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Percentile bootstrap CIs of the column means of a (queries x metrics) matrix."""
+    n_queries = matrix.shape[0]
+    rng = np.random.default_rng(seed)
+    block = max(1, _BOOTSTRAP_BLOCK_CELLS // max(n_queries, 1))
+    sample_means = []
+    for start in range(0, n_bootstrap, block):
+        size = min(block, n_bootstrap - start)
+        # Resampling counts per query, via one bincount over all samples of the block
+        idx = rng.integers(0, n_queries, size=(size, n_queries)) + (np.arange(size)[:, None] * n_queries)
+        counts = np.bincount(idx.ravel(), minlength=size * n_queries).reshape(size, n_queries)
+        sample_means.append(counts @ matrix / n_queries)
+    means = np.vstack(sample_means)
+    alpha = (1.0 - confidence) / 2.0
+    return np.quantile(means, alpha, axis=0), np.quantile(means, 1.0 - alpha, axis=0)
+
+
+def compute_retrieval_metrics_batch(
+    ranked_ids: Sequence[Sequence[str]],
+    relevant_ids: Sequence[Iterable[str]],
+    k_values: Sequence[int] = DEFAULT_K_VALUES,
+    n_bootstrap: int = 1000,
+    confidence: float = 0.95,
+    seed: Optional[int] = 0,
+    return_per_query: bool = False,
+) -> Dict[str, Any]:
+    """
+    Compute retrieval metrics for many queries at once.
+
+    Same definitions as the per-query RetrievalMetric methods (binary relevance,
+    precision divides by k, MRR over the full ranking). Queries without relevant
+    ids are excluded, as they are from the per-query retrieval metrics.
+
+    Args:
+        ranked_ids: Retrieved ids per query, best first
+        relevant_ids: Relevant (expected) ids per query
+        k_values: Cutoffs to evaluate
+        n_bootstrap: Number of bootstrap resamples for confidence intervals (0 disables them)
+        confidence: Confidence level of the intervals
+        seed: Random seed for the bootstrap (None for non-deterministic)
+        return_per_query: Also return per-query score arrays
+
+    Returns:
+        {"num_queries": int, "metrics": {name: {"mean", "ci_low", "ci_high"}}, "per_query": {...}}
+    """
+    hits, n_relevant = build_hit_matrix(ranked_ids, relevant_ids)
+    evaluated = n_relevant > 0
+    hits, n_relevant = hits[evaluated], n_relevant[evaluated]
+
+    result: Dict[str, Any] = {"num_queries": int(evaluated.sum()), "metrics": {}}
+    if not result["num_queries"]:
+        return result
+
+    scores = _per_query_scores(hits, n_relevant, sorted(set(k_values)))
+    names = list(scores)
+    matrix = np.column_stack([scores[name] for name in names])
+    means = matrix.mean(axis=0)
+    if n_bootstrap > 0:
+        ci_low, ci_high = _bootstrap_intervals(matrix, n_bootstrap, confidence, seed)
+    else:
+        ci_low = ci_high = means
+
+    for i, name in enumerate(names):
+        result["metrics"][name] = {
+            "mean": float(means[i]),
+            "ci_low": float(ci_low[i]),
+            "ci_high": float(ci_high[i]),
+        }
+    if return_per_query:
+        result["per_query"] = scores
+    return result
+
+
+def summarize_scores_batch(
+    scores: Dict[str, Sequence[float]],
+    n_bootstrap: int = 1000,
+    confidence: float = 0.95,
+    seed: Optional[int] = 0,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Mean, min, max and bootstrap confidence interval of per-query score columns.
+
+    Columns may have different lengths (queries without a score for a metric are left
+    out of it); columns of the same length are resampled in one pass.
+
+    Args:
+        scores: Per-query scores by metric name
+        n_bootstrap: Number of bootstrap resamples for confidence intervals (0 disables them)
+        confidence: Confidence level of the intervals
+        seed: Random seed for the bootstrap (None for non-deterministic)
+
+    Returns:
+        {name: {"mean", "min", "max", "count", "ci_low", "ci_high"}} (all zero for empty columns)
+    """
+    summary: Dict[str, Dict[str, Any]] = {}
+    by_length: Dict[int, List[str]] = {}
+    for name, column in scores.items():
+        by_length.setdefault(len(column), []).append(name)
+
+    for length, names in by_length.items():
+        if not length:
+            for name in names:
+                summary[name] = {"mean": 0.0, "min": 0.0, "max": 0.0, "count": 0, "ci_low": 0.0, "ci_high": 0.0}
+            continue
+        matrix = np.column_stack([np.asarray(scores[name], dtype=np.float64) for name in names])
+        means = matrix.mean(axis=0)
+        if n_bootstrap > 0:
+            ci_low, ci_high = _bootstrap_intervals(matrix, n_bootstrap, confidence, seed)
+        else:
+            ci_low = ci_high = means
+        mins, maxs = matrix.min(axis=0), matrix.max(axis=0)
+        for i, name in enumerate(names):
+            summary[name] = {
+                "mean": float(means[i]),
+                "min": float(mins[i]),
+                "max": float(maxs[i]),
+                "count": length,
+                "ci_low": float(ci_low[i]),
+                "ci_high": float(ci_high[i]),
+            }
+    return {name: summary[name] for name in scores}
+
+
+def retrieval_inputs_from_results(per_query_results: List[Dict]) -> Tuple[List[List[str]], List[List[str]]]:
+    """Extract (ranked ids, expected ids) from stored per-query evaluation results."""
+    ranked_ids, relevant_ids = [], []
+    for result in per_query_results:
+        if "error" in result or not result.get("expected_chunk_ids"):
+            continue
+        ranked_ids.append([str(cid) for cid in result.get("retrieved_chunk_ids") or []])
+        relevant_ids.append([str(cid) for cid in result["expected_chunk_ids"]])
+    return ranked_ids, relevant_ids
@@ -7,6 +7,7 @@ using various embedding models, with MiniLM as the default.
 
 import hashlib
 import logging
+import time
 from pathlib import Path
 from typing import List, Optional, Union
 from uuid import UUID
@@ -15,6 +16,7 @@ import numpy as np
 from sqlalchemy.orm import Session
 
 from ..core.embedding_config import EmbeddingModelRegistry, get_embedding_model_config
+from ..core.metrics import EMBEDDER_LOAD_DURATION, EMBEDDER_LOADS, timed_dependency
 from ..core.settings import get_settings
 
 logger = logging.getLogger(__name__)
@@ -54,7 +56,19 @@ class EmbeddingGenerator:
         self.db = db
 
         # Initialize the model
+        load_started = time.perf_counter()
         self._load_model()
+        backend = self._backend_name()
+        EMBEDDER_LOADS.inc(model=model_name, backend=backend)
+        EMBEDDER_LOAD_DURATION.observe(time.perf_counter() - load_started, backend=backend)
+
+    def _backend_name(self) -> str:
+        """Backend actually serving embeddings: sentence_transformers, openai or hash (fallback)."""
+        if self.model is None:
+            return "hash"
+        if self.model == "openai":
+            return "openai"
+        return "sentence_transformers"
 
     def _load_model(self):
         """Load the embedding model using centralized configuration."""
@@ -140,6 +154,7 @@ class EmbeddingGenerator:
             logger.warning("Falling back to hash-based embeddings")
             self.model = None
 
+    @timed_dependency("embedding")
     def embed(self, text: str) -> np.ndarray:
         """
         Generate embedding for a single text.
@@ -176,6 +191,7 @@ class EmbeddingGenerator:
         # Fallback to hash-based embedding
         return self._hash_embedding(text)
 
+    @timed_dependency("embedding")
     def embed_batch(self, texts: List[str], batch_size: Optional[int] = None) -> List[np.ndarray]:
         """
         Generate embeddings for a batch of texts.
@@ -0,0 +1,210 @@
+"""
+Migrate per-version Qdrant collections into tenant-partitioned shared collections.
+
+Each per-version collection (``ws_{workspace}__{name}__v_{version}``) is copied
+into the shared collection of its embedding model and dimension with the tenant
+payload fields set, the copy is verified by an exact count, and only then is the
+collection name registered as a tenant (so reads switch over atomically) and its
+production alias moved to the tenant registry. Source collections are kept unless
+--delete-source is given, so a migration can be verified before cleaning up.
+
+Usage:
+    QDRANT_COLLECTION_LAYOUT=shared python -m primedata.indexing.migrate_collections --dry-run
+    QDRANT_COLLECTION_LAYOUT=shared python -m primedata.indexing.migrate_collections --delete-source
+"""
+
+import argparse
+import json
+import re
+import time
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+from primedata.indexing.qdrant_client import (
+    COLLECTION_LAYOUT_SHARED,
+    REGISTRY_COLLECTION,
+    SHARED_COLLECTION_PREFIX,
+    QdrantClient,
+)
+
+PER_VERSION_COLLECTION = re.compile(r"^ws_(?P<workspace_id>[0-9a-fA-F-]+)__(?P<name>.+)__v_(?P<version>\d+)$")
+COPY_PAGE_SIZE = 256
+DEFAULT_EMBEDDING_MODEL = "minilm"
+
+
+def find_per_version_collections(client: QdrantClient) -> List[Dict[str, Any]]:
+    """Per-version collections in Qdrant with the workspace, name and version parsed from their names."""
+    found = []
+    for collection in client.client.get_collections().collections:
+        name = collection.name
+        if name == REGISTRY_COLLECTION or name.startswith(SHARED_COLLECTION_PREFIX):
+            continue
+        match = PER_VERSION_COLLECTION.match(name)
+        if match:
+            found.append({"collection": name, **match.groupdict(), "version": int(match.group("version"))})
+    return found
+
+
+def _collection_product_id(client: QdrantClient, source: Dict[str, Any]) -> Optional[str]:
+    """Product ID of a collection from its points, or from a "prod_{id}" collection name."""
+    points, _ = client.client.scroll(source["collection"], limit=1, with_payload=["product_id"])
+    if points and (points[0].payload or {}).get("product_id"):
+        return str(points[0].payload["product_id"])
+    if source["name"].startswith("prod_"):
+        return source["name"][len("prod_") :]
+    return None
+
+
+def _embedding_models(product_ids: List[str]) -> Dict[str, str]:
+    """Embedding model per product ID from the products table (best effort)."""
+    try:
+        from primedata.db.database import get_db
+        from primedata.db.models import Product
+
+        db = next(get_db())
+        try:
+            products = db.query(Product).filter(Product.id.in_(product_ids)).all()
+            return {str(p.id): (p.embedding_config or {}).get("embedder_name", DEFAULT_EMBEDDING_MODEL) for p in products}
+        finally:
+            db.close()
+    except Exception as e:
+        logger.warning(f"Could not load embedding models from the database, using {DEFAULT_EMBEDDING_MODEL}: {e}")
+        return {}
+
+
+def _move_aliases(client: QdrantClient, collection_name: str, dry_run: bool) -> List[str]:
+    """Replace Qdrant aliases of a migrated collection with tenant registry aliases."""
+    from qdrant_client.http import models
+
+    moved = []
+    for alias in client.client.get_collection_aliases(collection_name).aliases:
+        moved.append(alias.alias_name)
+        if dry_run:
+            continue
+        client._registry_put(alias.alias_name, {"kind": "alias", "collection": collection_name, "created_at": time.time()})
+        client.client.update_collection_aliases(
+            change_aliases_operations=[
+                models.DeleteAliasOperation(delete_alias=models.DeleteAlias(alias_name=alias.alias_name))
+            ]
+        )
+    return moved
+
+
+def migrate_collection(
+    client: QdrantClient,
+    source: Dict[str, Any],
+    product_id: str,
+    embedding_model: str,
+    dry_run: bool = False,
+    delete_source: bool = False,
+) -> Dict[str, Any]:
+    """
+    Copy one per-version collection into its shared collection and register it as a tenant.
+
+    Args:
+        client: QdrantClient with the shared layout
+        source: Entry from find_per_version_collections()
+        product_id: Product ID of the collection
+        embedding_model: Embedding model of the product (selects the shared collection)
+        dry_run: Only report what would be done
+        delete_source: Delete the per-version collection after a verified copy
+
+    Returns:
+        Migration result for the collection
+    """
+    from qdrant_client.http import models
+
+    name = source["collection"]
+    params = client.client.get_collection(name).config.params.vectors
+    distance = str(params.distance).split(".")[-1].capitalize()
+    physical_name = client.shared_collection_name(embedding_model, params.size)
+    tenant = client._tenant(name, {"workspace_id": source["workspace_id"], "product_id": product_id})
+    source_count = client.client.count(name, exact=True).count
+    result = {"collection": name, "shared_collection": physical_name, "points": source_count}
+
+    if dry_run:
+        result["aliases"] = _move_aliases(client, name, dry_run=True)
+        result["status"] = "dry_run"
+        return result
+
+    client._ensure_shared_collection(physical_name, params.size, distance)
+    # A previous, interrupted attempt may have left partial tenant points behind
+    client._delete_tenant_points(physical_name, tenant)
+
+    offset = None
+    while True:
+        points, offset = client.client.scroll(name, limit=COPY_PAGE_SIZE, offset=offset, with_payload=True, with_vectors=True)
+        if points:
+            client.client.upsert(
+                collection_name=physical_name,
+                points=[
+                    models.PointStruct(id=point.id, vector=point.vector, payload={**(point.payload or {}), **tenant})
+                    for point in points
+                ],
+                wait=True,
+            )
+        if offset is None:
+            break
+
+    copied = client.client.count(physical_name, count_filter=client._build_filter(tenant), exact=True).count
+    if copied != source_count:
+        raise RuntimeError(f"Copied {copied} of {source_count} points of {name} into {physical_name}")
+
+    client._register_tenant_collection(name, physical_name, tenant, params.size, distance, embedding_model)
+    result["aliases"] = _move_aliases(client, name, dry_run=False)
+    if delete_source:
+        client.client.delete_collection(name)
+        result["source_deleted"] = True
+    result["status"] = "migrated"
+    logger.info(f"Migrated {name} ({source_count} points) into {physical_name}")
+    return result
+
+
+def migrate_all(client: QdrantClient, dry_run: bool = False, delete_source: bool = False) -> List[Dict[str, Any]]:
+    """Migrate every per-version collection that is not registered as a tenant yet."""
+    sources = [s for s in find_per_version_collections(client) if client._resolve(s["collection"])[1] is None]
+    product_ids = {s["collection"]: _collection_product_id(client, s) for s in sources}
+    models_by_product = _embedding_models([pid for pid in product_ids.values() if pid])
+
+    results = []
+    for source in sources:
+        product_id = product_ids[source["collection"]]
+        if not product_id:
+            results.append({"collection": source["collection"], "status": "skipped", "error": "unknown product_id"})
+            continue
+        try:
+            results.append(
+                migrate_collection(
+                    client,
+                    source,
+                    product_id,
+                    models_by_product.get(product_id, DEFAULT_EMBEDDING_MODEL),
+                    dry_run=dry_run,
+                    delete_source=delete_source,
+                )
+            )
+        except Exception as e:
+            logger.error(f"Failed to migrate {source['collection']}: {e}")
+            results.append({"collection": source["collection"], "status": "failed", "error": str(e)})
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Migrate per-version Qdrant collections into shared collections.")
+    parser.add_argument("--dry-run", action="store_true", help="Only list what would be migrated")
+    parser.add_argument("--delete-source", action="store_true", help="Delete per-version collections after copying")
+    args = parser.parse_args()
+
+    client = QdrantClient()
+    if not client.is_connected():
+        raise SystemExit("Qdrant client not connected")
+    client.layout = COLLECTION_LAYOUT_SHARED
+
+    results = migrate_all(client, dry_run=args.dry_run, delete_source=args.delete_source)
+    print(json.dumps(results, indent=2))
+    if any(r["status"] == "failed" for r in results):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
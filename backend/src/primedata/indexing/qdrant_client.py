@@ -7,10 +7,15 @@ for storing and retrieving embeddings.
 
 import logging
 import os
+import threading
 import time
-from typing import Any, Dict, List, Optional, Union
+import uuid
+from typing import Any, Dict, List, Optional, Tuple, Union
 from uuid import UUID
 
+from primedata.core.metrics import timed_dependency
+from primedata.services.query_cache import invalidate_query_cache
+
 logger = logging.getLogger(__name__)
 
 # Version detection for API compatibility
@@ -23,10 +28,39 @@ except Exception:
     logger.warning("Could not detect qdrant-client version, using default API")
 
 
+# Collection layouts (QDRANT_COLLECTION_LAYOUT):
+# - "per_version": one Qdrant collection per workspace/product/version (default)
+# - "shared": one collection per (embedding model, dimension); product versions are tenants
+#   isolated by indexed payload fields, and collection/alias names are logical names kept
+#   in a registry collection. Unregistered names still resolve to per-version collections.
+COLLECTION_LAYOUT_PER_VERSION = "per_version"
+COLLECTION_LAYOUT_SHARED = "shared"
+REGISTRY_COLLECTION = "primedata_tenant_registry"
+SHARED_COLLECTION_PREFIX = "primedata_shared"
+# Registry lookups are cached per process; entries changed by another process (re-registration
+# after an embedding model change, deletion) are picked up once the cached entry expires
+REGISTRY_POSITIVE_TTL_SECONDS = 60.0
+REGISTRY_NEGATIVE_TTL_SECONDS = 30.0
+
+
+def _registry_point_id(name: str) -> str:
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, f"primedata:{name}"))
+
+
 class QdrantClient:
     """Client for interacting with Qdrant vector database."""
 
-    def __init__(self, host: Optional[str] = None, port: Optional[int] = None, grpc_port: Optional[int] = None):
+    # Logical collection name -> (cached_at, registry entry or None), shared by all instances
+    _registry_cache: Dict[str, Tuple[float, Optional[Dict[str, Any]]]] = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(
+        self,
+        host: Optional[str] = None,
+        port: Optional[int] = None,
+        grpc_port: Optional[int] = None,
+        location: Optional[str] = None,
+    ):
         """
         Initialize Qdrant client.
 
@@ -34,10 +68,16 @@ class QdrantClient:
             host: Qdrant host (defaults to environment variable or localhost)
             port: Qdrant HTTP port (defaults to environment variable or 6333)
             grpc_port: Qdrant gRPC port (defaults to environment variable or 6334)
+            location: Run qdrant-client in local mode instead of connecting to a server:
+                ":memory:" or a storage directory. Local storage belongs to this one client
+                (each ":memory:" client is empty, a directory is locked), so it is only for
+                harnesses that share a single client, not an application setting
         """
         self.host = host or os.getenv("QDRANT_HOST", "localhost")
         self.port = port or int(os.getenv("QDRANT_PORT", "6333"))
         self.grpc_port = grpc_port or int(os.getenv("QDRANT_GRPC_PORT", "6334"))
+        self.location = location or None
+        self.layout = os.getenv("QDRANT_COLLECTION_LAYOUT", COLLECTION_LAYOUT_PER_VERSION).strip().lower()
 
         self.client = None
         self._initialize_client()
@@ -48,6 +88,17 @@ class QdrantClient:
             from qdrant_client import QdrantClient as QdrantClientLib
             from qdrant_client.http import models
 
+            if self.location:
+                # Local mode: in-process storage, no server (local profiling and CI)
+                if self.location == ":memory:":
+                    self.client = QdrantClientLib(location=":memory:")
+                else:
+                    self.client = QdrantClientLib(path=self.location)
+                collections = self.client.get_collections()
+                logger.info(f"Using local Qdrant storage at {self.location}")
+                logger.info(f"Found {len(collections.collections)} existing collections")
+                return
+
             # Increase timeout for large batch operations (default is 30s, increase to 5 minutes)
             timeout = int(os.getenv("QDRANT_TIMEOUT", "300"))  # 5 minutes default
 
@@ -76,14 +127,215 @@ class QdrantClient:
         """Check if client is connected to Qdrant."""
         return self.client is not None
 
-    def ensure_collection(self, collection_name: str, vector_size: int, distance: str = "Cosine") -> bool:
+    # ---- Shared collection layout ----
+
+    @property
+    def shared_layout(self) -> bool:
+        """Whether new product versions are stored as tenants of shared collections."""
+        return self.layout == COLLECTION_LAYOUT_SHARED
+
+    def shared_collection_name(self, embedding_model: Optional[str], vector_size: int) -> str:
+        """Physical shared collection for an (embedding model, dimension) pair."""
+        model = self._sanitize_collection_name(embedding_model or "default").lower()
+        return f"{SHARED_COLLECTION_PREFIX}__{model}__d{vector_size}"
+
+    def _registry_get(self, name: str) -> Optional[Dict[str, Any]]:
+        """Registry entry of a logical collection/alias name (cached), or None if not registered."""
+        now = time.time()
+        with self._registry_lock:
+            cached = self._registry_cache.get(name)
+        if cached is not None:
+            ttl = REGISTRY_POSITIVE_TTL_SECONDS if cached[1] is not None else REGISTRY_NEGATIVE_TTL_SECONDS
+            if now - cached[0] < ttl:
+                return cached[1]
+
+        entry = None
+        try:
+            points = self.client.retrieve(REGISTRY_COLLECTION, ids=[_registry_point_id(name)], with_payload=True)
+            entry = dict(points[0].payload) if points else None
+        except Exception as e:
+            # No registry collection yet means nothing is registered
+            logger.debug(f"Tenant registry lookup for {name} failed: {e}")
+        with self._registry_lock:
+            self._registry_cache[name] = (now, entry)
+        return entry
+
+    def _registry_put(self, name: str, entry: Dict[str, Any]) -> None:
+        from qdrant_client.http import models
+
+        if not self.client.collection_exists(REGISTRY_COLLECTION):
+            self.client.create_collection(
+                collection_name=REGISTRY_COLLECTION,
+                vectors_config=models.VectorParams(size=1, distance=models.Distance.DOT),
+            )
+            self.client.create_payload_index(REGISTRY_COLLECTION, "kind", models.PayloadSchemaType.KEYWORD)
+        entry = {**entry, "name": name}
+        self.client.upsert(
+            collection_name=REGISTRY_COLLECTION,
+            points=[models.PointStruct(id=_registry_point_id(name), vector=[1.0], payload=entry)],
+            wait=True,
+        )
+        with self._registry_lock:
+            self._registry_cache[name] = (time.time(), entry)
+
+    def _registry_delete(self, name: str) -> None:
+        from qdrant_client.http import models
+
+        self.client.delete(
+            collection_name=REGISTRY_COLLECTION,
+            points_selector=models.PointIdsList(points=[_registry_point_id(name)]),
+            wait=True,
+        )
+        with self._registry_lock:
+            self._registry_cache.pop(name, None)
+
+    def _registry_list(self, kind: str) -> List[Dict[str, Any]]:
+        """All registry entries of a kind ("collection" or "alias")."""
+        entries, offset = [], None
+        try:
+            while True:
+                points, offset = self.client.scroll(
+                    collection_name=REGISTRY_COLLECTION,
+                    scroll_filter=self._build_filter({"kind": kind}),
+                    limit=1000,
+                    offset=offset,
+                    with_payload=True,
+                )
+                entries.extend(dict(point.payload) for point in points)
+                if offset is None:
+                    return entries
+        except Exception as e:
+            logger.debug(f"Tenant registry scroll failed: {e}")
+            return entries
+
+    def _resolve(self, collection_name: str) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """
+        Resolve a collection name to (physical collection, tenant payload) for Qdrant calls.
+
+        Per-version collections resolve to themselves with no tenant.
+        """
+        if not self.shared_layout or collection_name.startswith(SHARED_COLLECTION_PREFIX):
+            return collection_name, None
+        entry = self._registry_get(collection_name)
+        if entry and entry.get("kind") == "collection":
+            return entry["physical"], entry["tenant"]
+        return collection_name, None
+
+    @staticmethod
+    def _with_tenant(filter_conditions: Optional[Dict], tenant: Optional[Dict[str, Any]]) -> Optional[Dict]:
+        """Add the tenant fields to filter conditions (the tenant always wins)."""
+        if not tenant:
+            return filter_conditions
+        return {**(filter_conditions or {}), **tenant}
+
+    def _ensure_shared_collection(self, physical_name: str, vector_size: int, distance: str) -> None:
+        """Create a shared collection with tenant payload indexes if it does not exist."""
+        from qdrant_client.http import models
+
+        if self.client.collection_exists(physical_name):
+            return
+        # payload_m builds per-tenant HNSW graphs; with m=0 no global graph is built since every
+        # query on a shared collection is filtered to a single tenant
+        self.client.create_collection(
+            collection_name=physical_name,
+            vectors_config=models.VectorParams(size=vector_size, distance=getattr(models.Distance, distance.upper())),
+            hnsw_config=models.HnswConfigDiff(payload_m=16, m=0),
+        )
+        try:
+            product_schema = models.KeywordIndexParams(type="keyword", is_tenant=True)
+        except (AttributeError, TypeError):
+            product_schema = models.PayloadSchemaType.KEYWORD  # Older clients: no tenant-aware index
+        self.client.create_payload_index(physical_name, "product_id", product_schema)
+        self.client.create_payload_index(physical_name, "workspace_id", models.PayloadSchemaType.KEYWORD)
+        self.client.create_payload_index(physical_name, "collection_id", models.PayloadSchemaType.KEYWORD)
+        self.client.create_payload_index(physical_name, "version", models.PayloadSchemaType.INTEGER)
+        logger.info(f"Created shared collection {physical_name} with vector size {vector_size}")
+
+    def _delete_tenant_points(self, physical_name: str, tenant: Dict[str, Any]) -> None:
+        from qdrant_client.http import models
+
+        self.client.delete(
+            collection_name=physical_name,
+            points_selector=models.FilterSelector(filter=self._build_filter(tenant)),
+            wait=True,
+        )
+
+    def _tenant(self, collection_name: str, tenant: Dict[str, Any]) -> Dict[str, Any]:
+        """Tenant payload fields of a logical collection."""
+        return {
+            "workspace_id": str(tenant["workspace_id"]),
+            "product_id": str(tenant["product_id"]),
+            "collection_id": collection_name,
+        }
+
+    def _register_tenant_collection(
+        self,
+        collection_name: str,
+        physical_name: str,
+        tenant: Dict[str, Any],
+        vector_size: int,
+        distance: str,
+        embedding_model: Optional[str],
+    ) -> None:
+        self._registry_put(
+            collection_name,
+            {
+                "kind": "collection",
+                "physical": physical_name,
+                "tenant": self._tenant(collection_name, tenant),
+                "vector_size": vector_size,
+                "distance": distance,
+                "embedding_model": embedding_model,
+                "created_at": time.time(),
+            },
+        )
+        logger.info(f"Registered tenant collection {collection_name} in {physical_name}")
+
+    def _ensure_tenant_collection(
+        self,
+        collection_name: str,
+        vector_size: int,
+        distance: str,
+        tenant: Dict[str, Any],
+        embedding_model: Optional[str],
+    ) -> bool:
+        """Register a logical collection as a tenant of the shared collection for its model and dimension."""
+        physical_name = self.shared_collection_name(embedding_model, vector_size)
+        existing = self._registry_get(collection_name)
+        if existing and existing.get("kind") == "collection":
+            if existing["physical"] == physical_name:
+                logger.info(f"Tenant collection {collection_name} already exists in {physical_name}")
+                return True
+            # Model or dimension changed: drop the old vectors like a per-version collection is recreated
+            logger.warning(f"Tenant collection {collection_name} moves from {existing['physical']} to {physical_name}")
+            self._delete_tenant_points(existing["physical"], existing["tenant"])
+            invalidate_query_cache(collection_name=collection_name)
+
+        self._ensure_shared_collection(physical_name, vector_size, distance)
+        self._register_tenant_collection(collection_name, physical_name, tenant, vector_size, distance, embedding_model)
+        return True
+
+    @timed_dependency("qdrant")
+    def ensure_collection(
+        self,
+        collection_name: str,
+        vector_size: int,
+        distance: str = "Cosine",
+        tenant: Optional[Dict[str, Any]] = None,
+        embedding_model: Optional[str] = None,
+    ) -> bool:
         """
         Ensure a collection exists with the specified configuration.
 
+        With the shared layout and a tenant, the collection is a logical name for the
+        tenant's points in the shared collection of its embedding model and dimension.
+
         Args:
             collection_name: Name of the collection
             vector_size: Size of the vectors
             distance: Distance metric (Cosine, Dot, Euclid)
+            tenant: Optional {"workspace_id", "product_id"} of the product version
+            embedding_model: Embedding model name (selects the shared collection)
 
         Returns:
             True if collection exists or was created successfully
@@ -95,6 +347,11 @@ class QdrantClient:
         try:
             from qdrant_client.http import models
 
+            if self.shared_layout:
+                if tenant:
+                    return self._ensure_tenant_collection(collection_name, vector_size, distance, tenant, embedding_model)
+                logger.warning(f"No tenant given for {collection_name}, creating a per-version collection")
+
             # Check if collection exists and verify dimension
             try:
                 collection_info = self.client.get_collection(collection_name)
@@ -109,6 +366,7 @@ class QdrantClient:
                     # Delete the collection so it can be recreated with correct dimension
                     self.client.delete_collection(collection_name)
                     logger.info(f"Deleted collection {collection_name} to recreate with correct dimension")
+                    invalidate_query_cache(collection_name=collection_name)
                 else:
                     logger.info(f"Collection {collection_name} already exists with correct dimension {vector_size}")
                     return True
@@ -138,6 +396,7 @@ class QdrantClient:
                 logger.error(f"Failed to ensure collection {collection_name}: {e}")
             return False
 
+    @timed_dependency("qdrant")
     def upsert_points(self, collection_name: str, points: List[Dict[str, Any]], batch_size: int = 50) -> bool:
         """
         Upsert points to a collection in batches to avoid timeouts.
@@ -161,6 +420,7 @@ class QdrantClient:
         try:
             from qdrant_client.http import models
 
+            physical_name, tenant = self._resolve(collection_name)
             total_points = len(points)
             logger.info(f"Upserting {total_points} points to collection {collection_name} in batches of {batch_size}")
 
@@ -173,7 +433,8 @@ class QdrantClient:
                 # Convert batch points to Qdrant format
                 qdrant_points = []
                 for point in batch:
-                    qdrant_points.append(models.PointStruct(id=point["id"], vector=point["vector"], payload=point["payload"]))
+                    payload = {**point["payload"], **tenant} if tenant else point["payload"]
+                    qdrant_points.append(models.PointStruct(id=point["id"], vector=point["vector"], payload=payload))
 
                 # Upsert batch with retry logic
                 max_retries = 3
@@ -181,7 +442,7 @@ class QdrantClient:
                 for retry in range(max_retries):
                     try:
                         self.client.upsert(
-                            collection_name=collection_name, points=qdrant_points, wait=True  # Wait for confirmation
+                            collection_name=physical_name, points=qdrant_points, wait=True  # Wait for confirmation
                         )
                         logger.info(
                             f"Upserted batch {batch_num}/{total_batches} ({len(batch)} points) to collection {collection_name}"
@@ -205,12 +466,15 @@ class QdrantClient:
                     return False
 
             logger.info(f"Successfully upserted all {total_points} points to collection {collection_name}")
+            # Re-indexing changes search results, drop cached retrievals for this collection
+            invalidate_query_cache(collection_name=collection_name)
             return True
 
         except Exception as e:
             logger.error(f"Failed to upsert points to collection {collection_name}: {e}")
             return False
 
+    @timed_dependency("qdrant")
     def search_points(
         self,
         collection_name: str,
@@ -218,6 +482,7 @@ class QdrantClient:
         limit: int = 10,
         score_threshold: Optional[float] = None,
         filter_conditions: Optional[Dict] = None,
+        with_vectors: bool = False,
     ) -> List[Dict]:
         """
         Search for similar points in a collection.
@@ -228,6 +493,7 @@ class QdrantClient:
             limit: Maximum number of results to return
             score_threshold: Minimum similarity score threshold
             filter_conditions: Optional filter conditions
+            with_vectors: Also return the stored vector of each point (under 'vector')
 
         Returns:
             List of search results
@@ -241,6 +507,9 @@ class QdrantClient:
         try:
             from qdrant_client.http import models
 
+            physical_name, tenant = self._resolve(collection_name)
+            filter_conditions = self._with_tenant(filter_conditions, tenant)
+
             # Build query filter if needed
             query_filter = None
             if filter_conditions:
@@ -267,24 +536,18 @@ class QdrantClient:
                 # Use query_points API (stable in 1.16.2+)
                 try:
                     results = self.client.query_points(
-                        collection_name=collection_name,
+                        collection_name=physical_name,
                         query=query_vector,  # Direct vector list
                         limit=limit,
                         query_filter=query_filter,
                         with_payload=True,
-                        with_vectors=False,
+                        with_vectors=with_vectors,
                         score_threshold=score_threshold,
                     )
 
                     # Convert QueryResponse to list of dicts
-                    search_results = []
                     # query_points returns a QueryResponse object with points attribute
-                    for point in results.points:
-                        search_results.append({
-                            "id": point.id,
-                            "score": point.score,
-                            "payload": point.payload if hasattr(point, 'payload') else {}
-                        })
+                    search_results = [self._point_to_result(point, with_vectors) for point in results.points]
 
                     logger.info(f"Found {len(search_results)} results for search in collection {collection_name}")
                     return search_results
@@ -298,21 +561,16 @@ class QdrantClient:
             if not use_query_points:
                 try:
                     results = self.client.search(
-                        collection_name=collection_name,
+                        collection_name=physical_name,
                         query_vector=query_vector,
                         limit=limit,
                         score_threshold=score_threshold,
                         query_filter=query_filter,
+                        with_vectors=with_vectors,
                     )
 
                     # Convert results to list of dicts
-                    search_results = []
-                    for result in results:
-                        search_results.append({
-                            "id": result.id,
-                            "score": result.score,
-                            "payload": result.payload if hasattr(result, 'payload') else {}
-                        })
+                    search_results = [self._point_to_result(result, with_vectors) for result in results]
 
                     logger.info(f"Found {len(search_results)} results for search in collection {collection_name}")
                     return search_results
@@ -331,6 +589,7 @@ class QdrantClient:
             logger.error(f"Failed to search points in collection {collection_name}: {e}", exc_info=True)
             raise RuntimeError(f"Search failed for collection {collection_name}: {str(e)}") from e
 
+    @timed_dependency("qdrant")
     def search(
         self,
         collection_name: str,
@@ -338,6 +597,7 @@ class QdrantClient:
         limit: int = 10,
         score_threshold: Optional[float] = None,
         filter_conditions: Optional[Dict] = None,
+        with_vectors: bool = False,
     ) -> List[Dict]:
         """
         Search for similar points in a collection (alias for search_points for compatibility).
@@ -348,6 +608,7 @@ class QdrantClient:
             limit: Maximum number of results to return
             score_threshold: Minimum similarity score threshold
             filter_conditions: Optional filter conditions
+            with_vectors: Also return the stored vector of each point (under 'vector')
             
         Returns:
             List of search results with 'id', 'score', and 'payload' keys
@@ -358,8 +619,115 @@ class QdrantClient:
             limit=limit,
             score_threshold=score_threshold,
             filter_conditions=filter_conditions,
+            with_vectors=with_vectors,
         )
 
+    @staticmethod
+    def _point_to_result(point: Any, with_vectors: bool = False) -> Dict[str, Any]:
+        """Convert a scored point into a search result dict."""
+        result = {
+            "id": point.id,
+            "score": point.score,
+            "payload": point.payload if hasattr(point, "payload") else {},
+        }
+        if with_vectors:
+            vector = getattr(point, "vector", None)
+            # Collections with a single named vector return {name: vector}
+            if isinstance(vector, dict) and len(vector) == 1:
+                vector = next(iter(vector.values()))
+            result["vector"] = vector
+        return result
+
+    @timed_dependency("qdrant")
+    def search_batch(
+        self,
+        collection_name: str,
+        query_vectors: List[List[float]],
+        limit: int = 10,
+        score_threshold: Optional[float] = None,
+        filter_conditions: Optional[Dict] = None,
+        with_vectors: bool = False,
+    ) -> List[List[Dict]]:
+        """
+        Search for several query vectors in one request.
+
+        Uses query_batch_points (or search_batch on older clients) so N queries cost one
+        round trip instead of N; falls back to one search_points call per vector.
+
+        Args:
+            collection_name: Name of the collection
+            query_vectors: Query vectors
+            limit: Maximum number of results per query
+            score_threshold: Minimum similarity score threshold
+            filter_conditions: Optional filter conditions (applied to every query)
+            with_vectors: Also return the stored vector of each point (under 'vector')
+
+        Returns:
+            One list of results (with 'id', 'score', and 'payload' keys) per query vector
+        """
+        if not query_vectors:
+            return []
+        if not self.is_connected():
+            raise ConnectionError("Qdrant client not connected")
+
+        try:
+            from qdrant_client.http import models
+
+            physical_name, tenant = self._resolve(collection_name)
+            batch_filter = self._with_tenant(filter_conditions, tenant)
+            query_filter = self._build_filter(batch_filter) if batch_filter else None
+
+            if hasattr(self.client, "query_batch_points"):
+                requests = [
+                    models.QueryRequest(
+                        query=vector,
+                        limit=limit,
+                        filter=query_filter,
+                        with_payload=True,
+                        with_vector=with_vectors,
+                        score_threshold=score_threshold,
+                    )
+                    for vector in query_vectors
+                ]
+                responses = self.client.query_batch_points(collection_name=physical_name, requests=requests)
+                batches = [response.points for response in responses]
+            elif hasattr(self.client, "search_batch"):
+                requests = [
+                    models.SearchRequest(
+                        vector=vector,
+                        limit=limit,
+                        filter=query_filter,
+                        with_payload=True,
+                        with_vector=with_vectors,
+                        score_threshold=score_threshold,
+                    )
+                    for vector in query_vectors
+                ]
+                batches = self.client.search_batch(collection_name=physical_name, requests=requests)
+            else:
+                batches = None
+        except Exception as e:
+            logger.warning(f"Batch search failed for collection {collection_name}, searching one query at a time: {e}")
+            batches = None
+
+        if batches is None:
+            return [
+                self.search_points(
+                    collection_name=collection_name,
+                    query_vector=vector,
+                    limit=limit,
+                    score_threshold=score_threshold,
+                    filter_conditions=filter_conditions,
+                    with_vectors=with_vectors,
+                )
+                for vector in query_vectors
+            ]
+
+        results = [[self._point_to_result(point, with_vectors) for point in points] for points in batches]
+        logger.info(f"Batch search of {len(query_vectors)} queries in collection {collection_name}")
+        return results
+
+    @timed_dependency("qdrant")
     def get_collection_info(self, collection_name: str) -> Optional[Dict[str, Any]]:
         """
         Get information about a collection.
@@ -374,6 +742,10 @@ class QdrantClient:
             logger.error("Qdrant client not connected")
             return None
 
+        physical_name, tenant = self._resolve(collection_name)
+        if tenant:
+            return self._get_tenant_collection_info(collection_name, physical_name, tenant)
+
         try:
             collection_info = self.client.get_collection(collection_name)
             
@@ -446,6 +818,31 @@ class QdrantClient:
             # Try fallback method
             return self._get_collection_info_fallback(collection_name)
 
+    def _get_tenant_collection_info(
+        self, collection_name: str, physical_name: str, tenant: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """Collection info of a logical collection: the tenant's exact point count and the shared configuration."""
+        try:
+            points_count = self.client.count(
+                collection_name=physical_name, count_filter=self._build_filter(tenant), exact=True
+            ).count
+            entry = self._registry_get(collection_name) or {}
+            return {
+                "name": collection_name,
+                "physical_collection": physical_name,
+                "vectors_count": points_count,
+                "indexed_vectors_count": points_count,
+                "points_count": points_count,
+                "segments_count": 0,
+                "config": {
+                    "vector_size": entry.get("vector_size"),
+                    "distance": entry.get("distance", "Cosine"),
+                },
+            }
+        except Exception as e:
+            logger.error(f"Failed to get collection info for {collection_name} in {physical_name}: {e}")
+            return None
+
     def _get_collection_info_fallback(self, collection_name: str) -> Optional[Dict[str, Any]]:
         """
         Fallback method to get collection info using direct HTTP API call.
@@ -484,6 +881,7 @@ class QdrantClient:
             logger.error(f"Fallback method failed for {collection_name}: {e}")
             return None
 
+    @timed_dependency("qdrant")
     def delete_collection(self, collection_name: str) -> bool:
         """
         Delete a collection.
@@ -499,18 +897,30 @@ class QdrantClient:
             return False
 
         try:
-            self.client.delete_collection(collection_name)
-            logger.info(f"Deleted collection {collection_name}")
+            physical_name, tenant = self._resolve(collection_name)
+            if tenant:
+                # Shared collection: delete only the tenant's points, then forget the logical name
+                self._delete_tenant_points(physical_name, tenant)
+                self._registry_delete(collection_name)
+                logger.info(f"Deleted tenant collection {collection_name} from {physical_name}")
+            else:
+                self.client.delete_collection(collection_name)
+                logger.info(f"Deleted collection {collection_name}")
+            invalidate_query_cache(collection_name=collection_name)
             return True
 
         except Exception as e:
             logger.error(f"Failed to delete collection {collection_name}: {e}")
             return False
 
+    @timed_dependency("qdrant")
     def list_collections(self) -> List[str]:
         """
         List all collections.
 
+        With the shared layout, shared collections are listed by the logical names of their
+        tenants instead.
+
         Returns:
             List of collection names
         """
@@ -520,7 +930,13 @@ class QdrantClient:
 
         try:
             collections = self.client.get_collections()
-            return [collection.name for collection in collections.collections]
+            names = [collection.name for collection in collections.collections]
+            if not self.shared_layout or REGISTRY_COLLECTION not in names:
+                return names
+            names = [
+                name for name in names if name != REGISTRY_COLLECTION and not name.startswith(SHARED_COLLECTION_PREFIX)
+            ]
+            return names + [entry["name"] for entry in self._registry_list("collection")]
 
         except Exception as e:
             logger.error(f"Failed to list collections: {e}")
@@ -711,13 +1127,17 @@ class QdrantClient:
                 alias_name = f"prod_ws_{workspace_id}__prod_{product_id}"
 
             # Check if the target collection exists
-            collections = self.client.get_collections()
-            collection_exists = any(col.name == collection_name for col in collections.collections)
-
-            if not collection_exists:
+            if collection_name not in self.list_collections():
                 logger.error(f"Collection {collection_name} does not exist")
                 return False
 
+            if self._resolve(collection_name)[1]:
+                # Tenant of a shared collection: the alias is a registry entry, promotion is a single upsert
+                self._registry_put(alias_name, {"kind": "alias", "collection": collection_name, "created_at": time.time()})
+                logger.info(f"Created production alias '{alias_name}' -> '{collection_name}' (tenant registry)")
+                invalidate_query_cache(product_id=product_id)
+                return True
+
             # Create or update the alias using direct HTTP API
             import requests
 
@@ -750,6 +1170,8 @@ class QdrantClient:
 
             if response.status_code == 200:
                 logger.info(f"Created production alias '{alias_name}' -> '{collection_name}'")
+                # Queries against the prod alias now resolve to a different collection
+                invalidate_query_cache(product_id=product_id)
             else:
                 raise Exception(f"Failed to create alias: {response.status_code} - {response.text}")
 
@@ -782,6 +1204,15 @@ class QdrantClient:
             # Also check product_id for backward compatibility
             alias_names.append(f"prod_ws_{workspace_id}__prod_{product_id}")
 
+            if self.shared_layout:
+                # Registry aliases (tenants of shared collections) take precedence over Qdrant aliases
+                for alias_name in alias_names:
+                    with self._registry_lock:
+                        self._registry_cache.pop(alias_name, None)  # Promotions may come from another process
+                    entry = self._registry_get(alias_name)
+                    if entry and entry.get("kind") == "alias":
+                        return entry["collection"]
+
             # Get all aliases using direct HTTP API
             import requests
 
@@ -800,6 +1231,7 @@ class QdrantClient:
             logger.error(f"Failed to get production alias: {e}")
             return None
 
+    @timed_dependency("qdrant")
     def scroll_points(
         self,
         collection_name: str,
@@ -830,6 +1262,9 @@ class QdrantClient:
         try:
             from qdrant_client.http import models
 
+            physical_name, tenant = self._resolve(collection_name)
+            filter_conditions = self._with_tenant(filter_conditions, tenant)
+
             # Build scroll request
             scroll_filter = None
             if filter_conditions:
@@ -837,7 +1272,7 @@ class QdrantClient:
 
             # Perform scroll
             result = self.client.scroll(
-                collection_name=collection_name,
+                collection_name=physical_name,
                 scroll_filter=scroll_filter,
                 limit=limit,
                 offset=offset,
@@ -868,6 +1303,7 @@ class QdrantClient:
             logger.error(f"Failed to scroll points in collection {collection_name}: {e}")
             return {"points": [], "next_page_offset": None}
 
+    @timed_dependency("qdrant")
     def get_point_by_chunk_id(
         self,
         collection_name: str,
@@ -901,11 +1337,12 @@ class QdrantClient:
             if version is not None:
                 filter_conditions["version"] = version
 
-            scroll_filter = self._build_filter(filter_conditions)
+            physical_name, tenant = self._resolve(collection_name)
+            scroll_filter = self._build_filter(self._with_tenant(filter_conditions, tenant))
 
             # Scroll with limit 1 to get the matching point
             result = self.client.scroll(
-                collection_name=collection_name,
+                collection_name=physical_name,
                 scroll_filter=scroll_filter,
                 limit=1,
                 with_payload=True,
@@ -7,9 +7,10 @@ into PrimeData's Airflow-based ingestion pipeline.
 
 from .base import AirdStage, StageResult, StageStatus
 from .config import AirdConfig, get_aird_config
-from .logging import get_aird_logger, setup_aird_logging
+from .logging import PipelineLogger, get_aird_logger, setup_aird_logging
 from .storage import AirdStorageAdapter
-from .tracking import StageTracker, track_stage_execution
+from .tracing import StageTracer, trace_span
+from .tracking import StageTracker, track_stage_execution, track_stage_profile
 
 __all__ = [
     "AirdStage",
@@ -18,8 +19,12 @@ __all__ = [
     "AirdConfig",
     "get_aird_config",
     "get_aird_logger",
+    "PipelineLogger",
     "setup_aird_logging",
     "AirdStorageAdapter",
+    "StageTracer",
+    "trace_span",
     "StageTracker",
     "track_stage_execution",
+    "track_stage_profile",
 ]
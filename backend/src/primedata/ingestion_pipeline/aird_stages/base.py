@@ -4,6 +4,7 @@ Base stage class for AIRD pipeline stages.
 Provides common interface and utilities for all AIRD stages integrated into PrimeData.
 """
 
+import logging as std_logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
@@ -12,6 +13,8 @@ from typing import Any, Dict, Optional
 from uuid import UUID
 
 from loguru import logger
+from primedata.ingestion_pipeline.aird_stages.logging import PipelineLogger
+from primedata.ingestion_pipeline.aird_stages.tracing import StageTracer, round_profile
 
 
 class StageStatus(str, Enum):
@@ -37,6 +40,7 @@ class StageResult:
     started_at: Optional[datetime] = None
     finished_at: Optional[datetime] = None
     artifacts: Optional[Dict[str, str]] = None  # Map of artifact name to MinIO path
+    profile: Optional[Dict[str, Any]] = None  # Aggregated tracing spans (see StageTracer)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -50,6 +54,7 @@ class StageResult:
             "started_at": self.started_at.isoformat() if self.started_at else None,
             "finished_at": self.finished_at.isoformat() if self.finished_at else None,
             "artifacts": self.artifacts,
+            "profile": self.profile,
         }
 
 
@@ -85,6 +90,10 @@ class AirdStage(ABC):
             version=version,
             workspace_id=str(workspace_id),
         )
+        # Level-gated, sampled logging for per-file and per-chunk messages
+        self.log = PipelineLogger(self.stage_name, self.logger, std_logging.getLogger(type(self).__module__))
+        # Nested timing spans, collected into StageResult.profile
+        self.tracer = StageTracer(self.stage_name)
 
     @property
     @abstractmethod
@@ -145,6 +154,12 @@ class AirdStage(ABC):
         Returns:
             StageResult instance
         """
+        started_at = started_at or datetime.utcnow()
+        finished_at = finished_at or datetime.utcnow()
+        profile = self.tracer.collect()
+        if profile is not None:
+            profile = round_profile(profile)
+            profile["duration_s"] = round((finished_at - started_at).total_seconds(), 3)
         return StageResult(
             status=status,
             stage_name=self.stage_name,
@@ -153,6 +168,7 @@ class AirdStage(ABC):
             metrics=metrics,
             error=error,
             artifacts=artifacts,
-            started_at=started_at or datetime.utcnow(),
-            finished_at=finished_at or datetime.utcnow(),
+            started_at=started_at,
+            finished_at=finished_at,
+            profile=profile,
         )
@@ -27,6 +27,7 @@ class AirdConfig(BaseModel):
     # Scoring settings
     scoring_weights_path: Optional[str] = Field(default=None, description="Path to scoring weights JSON")
     default_scoring_threshold: float = Field(default=70.0, description="Default AI Trust Score threshold")
+    scoring_workers: int = Field(default=0, description="Scoring worker processes (0 = one per CPU, 1 = in-process)")
 
     # Policy settings
     policy_min_trust_score: float = Field(default=50.0, description="Minimum trust score for policy")
@@ -86,6 +87,7 @@ def get_aird_config() -> AirdConfig:
         _aird_config = AirdConfig(
             playbook_dir=playbook_dir,
             scoring_weights_path=scoring_weights_path,
+            scoring_workers=int(os.getenv("AIRD_SCORING_WORKERS", "0")),
         )
 
     return _aird_config
@@ -11,7 +11,8 @@ from uuid import UUID
 
 from loguru import logger
 from primedata.ingestion_pipeline.aird_stages.base import AirdStage, StageResult, StageStatus
-from primedata.services.fingerprint import generate_fingerprint
+from primedata.services.fingerprint import generate_fingerprint, generate_fingerprint_breakdown
+from primedata.services.metrics_aggregation import HAS_PANDAS, MetricsFrame
 
 
 class FingerprintStage(AirdStage):
@@ -73,6 +74,10 @@ class FingerprintStage(AirdStage):
                 elif hasattr(storage, 'get_preprocessing_stats'):
                     preprocessing_stats = storage.get_preprocessing_stats()
 
+            # Load metrics into a columnar frame once; fingerprint and breakdown share it
+            if HAS_PANDAS:
+                metrics = MetricsFrame(metrics)
+
             # Generate fingerprint with AI-Ready metrics
             fingerprint = generate_fingerprint(metrics, preprocessing_stats)
 
@@ -84,10 +89,13 @@ class FingerprintStage(AirdStage):
                     started_at=started_at,
                 )
 
+            # Per-file / per-section means and percentiles
+            breakdown = generate_fingerprint_breakdown(metrics)
+
             # Store fingerprint
             fingerprint_path = storage.put_artifact(
                 f"fingerprint.json",
-                json.dumps({"fingerprint": fingerprint}, indent=2),
+                json.dumps({"fingerprint": fingerprint, "breakdown": breakdown}, indent=2),
                 content_type="application/json",
             )
 
@@ -222,7 +222,12 @@ class IndexingStage(AirdStage):
                     started_at=started_at,
                 )
 
-            collection_created = qdrant_client.ensure_collection(collection_name, actual_dimension)
+            collection_created = qdrant_client.ensure_collection(
+                collection_name,
+                actual_dimension,
+                tenant={"workspace_id": self.workspace_id, "product_id": self.product_id},
+                embedding_model=model_name,
+            )
             if not collection_created:
                 if close_db:
                     db.close()
@@ -245,7 +250,9 @@ class IndexingStage(AirdStage):
             for file_stem in processed_files:
                 try:
                     # Load processed JSONL
-                    records = storage.get_processed_jsonl(file_stem)
+                    with self.tracer.span("fetch") as span:
+                        records = storage.get_processed_jsonl(file_stem)
+                        span.add(records=len(records) if records else 0)
                     if not records:
                         self.logger.warning(f"Processed JSONL not found for {file_stem}, skipping")
                         continue
@@ -366,29 +373,31 @@ class IndexingStage(AirdStage):
                     f"progress: {i}/{len(all_records_data)} chunks, "
                     f"elapsed: {elapsed:.1f}s, est. remaining: {estimated_remaining:.1f}s)..."
                 )
-                try:
-                    # Use smaller internal batch size for sentence transformers to manage memory better
-                    batch_embeddings = embedder.embed_batch(batch_texts, batch_size=embedding_batch_size)
-                    all_embeddings.extend(batch_embeddings)
-                    batch_time = time.time() - batch_start_time
-                    self.logger.info(
-                        f"✅ Generated {len(batch_embeddings)} embeddings for batch {batch_num}/{total_batches} "
-                        f"in {batch_time:.1f}s ({batch_time/len(batch_texts):.2f}s per chunk)"
-                    )
-                except Exception as e:
-                    self.logger.error(
-                        f"Failed to generate embeddings for batch {batch_num}/{total_batches}: {e}", exc_info=True
-                    )
-                    # Fallback to individual embeddings for this batch
-                    self.logger.warning(f"Falling back to individual embedding generation for batch {batch_num}")
-                    for record_data in batch_records:
-                        try:
-                            embedding = embedder.embed(record_data["text"])
-                            all_embeddings.append(embedding)
-                        except Exception as emb_error:
-                            self.logger.error(f"Failed to embed chunk {record_data['chunk_id']}: {emb_error}")
-                            # Add None as placeholder - will skip this record
-                            all_embeddings.append(None)
+                with self.tracer.span("embed_batch") as span:
+                    span.add(bytes=sum(len(text) for text in batch_texts), records=len(batch_texts))
+                    try:
+                        # Use smaller internal batch size for sentence transformers to manage memory better
+                        batch_embeddings = embedder.embed_batch(batch_texts, batch_size=embedding_batch_size)
+                        all_embeddings.extend(batch_embeddings)
+                        batch_time = time.time() - batch_start_time
+                        self.logger.info(
+                            f"✅ Generated {len(batch_embeddings)} embeddings for batch {batch_num}/{total_batches} "
+                            f"in {batch_time:.1f}s ({batch_time/len(batch_texts):.2f}s per chunk)"
+                        )
+                    except Exception as e:
+                        self.logger.error(
+                            f"Failed to generate embeddings for batch {batch_num}/{total_batches}: {e}", exc_info=True
+                        )
+                        # Fallback to individual embeddings for this batch
+                        self.logger.warning(f"Falling back to individual embedding generation for batch {batch_num}")
+                        for record_data in batch_records:
+                            try:
+                                embedding = embedder.embed(record_data["text"])
+                                all_embeddings.append(embedding)
+                            except Exception as emb_error:
+                                self.logger.error(f"Failed to embed chunk {record_data['chunk_id']}: {emb_error}")
+                                # Add None as placeholder - will skip this record
+                                all_embeddings.append(None)
 
             # Second pass: Build points with embeddings
             all_points = []
@@ -455,7 +464,9 @@ class IndexingStage(AirdStage):
                 )
 
             # Upsert to Qdrant
-            success = qdrant_client.upsert_points(collection_name, all_points)
+            with self.tracer.span("qdrant_upsert") as span:
+                success = qdrant_client.upsert_points(collection_name, all_points)
+                span.add(records=len(all_points))
             if not success:
                 return self._create_result(
                     status=StageStatus.FAILED,
@@ -1,14 +1,34 @@
 """
 Structured logging for AIRD pipeline stages.
 
-Provides logging utilities that integrate with PrimeData's loguru-based logging.
+Provides logging utilities that integrate with PrimeData's loguru-based logging,
+and PipelineLogger, the logging facade used on pipeline hot paths.
 """
 
+import json
+import logging as std_logging
+import os
+from collections import Counter
 from typing import Any, Dict, Optional
 from uuid import UUID
 
 from loguru import logger
 
+# Level names shared by loguru and the facade, with their standard logging numbers
+LEVELS = {
+    "TRACE": 5,
+    "DEBUG": std_logging.DEBUG,
+    "INFO": std_logging.INFO,
+    "SUCCESS": 25,
+    "WARNING": std_logging.WARNING,
+    "ERROR": std_logging.ERROR,
+    "CRITICAL": std_logging.CRITICAL,
+}
+DEFAULT_PIPELINE_LOG_LEVEL = "INFO"
+# Repetitive messages: the first SAMPLE_FIRST occurrences are logged, then every SAMPLE_EVERY-th
+DEFAULT_SAMPLE_FIRST = 5
+DEFAULT_SAMPLE_EVERY = 100
+
 
 def get_aird_logger(
     stage_name: str,
@@ -38,6 +58,146 @@ def get_aird_logger(
     return logger.bind(**context)
 
 
+def pipeline_log_level(stage_name: str) -> int:
+    """Log level of a stage: PRIMEDATA_PIPELINE_LOG_LEVEL_<STAGE>, else PRIMEDATA_PIPELINE_LOG_LEVEL, else INFO."""
+    value = os.getenv(f"PRIMEDATA_PIPELINE_LOG_LEVEL_{stage_name.upper()}") or os.getenv(
+        "PRIMEDATA_PIPELINE_LOG_LEVEL", DEFAULT_PIPELINE_LOG_LEVEL
+    )
+    return LEVELS.get(value.strip().upper(), LEVELS[DEFAULT_PIPELINE_LOG_LEVEL])
+
+
+def pipeline_log_sinks() -> tuple:
+    """
+    Sinks pipeline records are written to: PRIMEDATA_PIPELINE_LOG_SINKS ("loguru", "std" or "loguru,std").
+
+    Defaults to standard logging inside an Airflow task (which captures it in the
+    task log) and to loguru elsewhere, so each record is written once.
+    """
+    value = os.getenv("PRIMEDATA_PIPELINE_LOG_SINKS", "")
+    sinks = tuple(sink.strip() for sink in value.split(",") if sink.strip() in ("loguru", "std"))
+    if sinks:
+        return sinks
+    return ("std",) if os.getenv("AIRFLOW_CTX_DAG_ID") else ("loguru",)
+
+
+class PipelineLogger:
+    """Logging facade for pipeline hot paths.
+
+    - Messages are str.format templates; they are only formatted when the
+      level is enabled for the stage (see pipeline_log_level).
+    - Each record is written once, to loguru and/or standard logging
+      (see pipeline_log_sinks), instead of once per logging library.
+    - sampled() rate-limits messages that repeat per file or per chunk.
+    - file_summary() writes one structured record per processed file.
+
+    Example:
+        log = PipelineLogger("preprocess", logger.bind(stage="preprocess"), std_logger)
+        log.debug("Loaded {} ({} chars)", file_stem, len(text))
+    """
+
+    def __init__(
+        self,
+        stage_name: str,
+        bound_logger: Any = None,
+        std_logger: Optional[std_logging.Logger] = None,
+        level: Optional[int] = None,
+        sinks: Optional[tuple] = None,
+        sample_first: int = DEFAULT_SAMPLE_FIRST,
+        sample_every: int = DEFAULT_SAMPLE_EVERY,
+    ):
+        """
+        Args:
+            stage_name: Stage name (log prefix and per-stage level variable)
+            bound_logger: loguru logger with bound context (defaults to logger bound with the stage)
+            std_logger: Standard logger for Airflow (defaults to primedata.pipeline.<stage>)
+            level: Minimum level number (defaults to pipeline_log_level(stage_name))
+            sinks: "loguru" and/or "std" (defaults to pipeline_log_sinks())
+            sample_first: Occurrences of a sampled message that are always logged
+            sample_every: After that, every Nth occurrence is logged
+        """
+        self.stage_name = stage_name
+        self._logger = bound_logger if bound_logger is not None else logger.bind(stage=stage_name)
+        self._std_logger = std_logger or std_logging.getLogger(f"primedata.pipeline.{stage_name}")
+        self.level = pipeline_log_level(stage_name) if level is None else level
+        sinks = sinks if sinks is not None else pipeline_log_sinks()
+        self._to_loguru = "loguru" in sinks
+        self._to_std = "std" in sinks
+        self.sample_first = max(0, sample_first)
+        self.sample_every = max(1, sample_every)
+        self._occurrences: Counter = Counter()
+        self.suppressed: Counter = Counter()
+
+    def enabled(self, level: str) -> bool:
+        """Whether records of this level are written (guard for expensive log arguments)."""
+        return LEVELS[level] >= self.level
+
+    def log(self, level: str, message: str, *args: Any, exc_info: bool = False, **fields: Any) -> None:
+        """Write a record if the level is enabled; fields are bound as structured context."""
+        self._emit(level, message, args, exc_info, fields)
+
+    def debug(self, message: str, *args: Any, **fields: Any) -> None:
+        self._emit("DEBUG", message, args, False, fields)
+
+    def info(self, message: str, *args: Any, **fields: Any) -> None:
+        self._emit("INFO", message, args, False, fields)
+
+    def warning(self, message: str, *args: Any, **fields: Any) -> None:
+        self._emit("WARNING", message, args, False, fields)
+
+    def error(self, message: str, *args: Any, exc_info: bool = False, **fields: Any) -> None:
+        self._emit("ERROR", message, args, exc_info, fields)
+
+    def exception(self, message: str, *args: Any, **fields: Any) -> None:
+        """Error record with the current exception's traceback."""
+        self._emit("ERROR", message, args, True, fields)
+
+    def sampled(self, key: str, level: str, message: str, *args: Any, **fields: Any) -> None:
+        """
+        Write a repetitive message, rate-limited per key.
+
+        The first sample_first occurrences are written, then every sample_every-th
+        (with the number of occurrences so far); the others are only counted.
+        """
+        if not self.enabled(level):
+            return
+        self._occurrences[key] += 1
+        count = self._occurrences[key]
+        if count <= self.sample_first:
+            self._emit(level, message, args, False, fields)
+        elif count % self.sample_every == 0:
+            self._emit(level, message + " ({} occurrences so far)", args + (count,), False, fields)
+        else:
+            self.suppressed[key] += 1
+
+    def file_summary(self, file_stem: str, status: str, level: str = "INFO", **fields: Any) -> None:
+        """One structured record for a processed file (fields: chars, chunks, duration_s, ...)."""
+        if not self.enabled(level):
+            return
+        summary = {"file_stem": file_stem, "status": status, **fields}
+        record = json.dumps(summary, default=str)
+        self._emit(level, "[{}] file {}", (self.stage_name, record), False, {"file_summary": summary})
+
+    def flush_suppressed(self) -> None:
+        """Write how many sampled messages were suppressed, per key, and reset the counters."""
+        for key, count in sorted(self.suppressed.items()):
+            self._emit("INFO", "[{}] {} '{}' messages suppressed by sampling", (self.stage_name, count, key), False, {})
+        self.suppressed.clear()
+        self._occurrences.clear()
+
+    def _emit(self, level: str, message: str, args: tuple, exc_info: bool, fields: Dict[str, Any]) -> None:
+        levelno = LEVELS[level]
+        if levelno < self.level:
+            return
+        text = message.format(*args) if args else message
+        if self._to_loguru:
+            bound = self._logger.bind(**fields) if fields else self._logger
+            # depth=2: attribute the record to the caller of the level method
+            bound.opt(depth=2, exception=exc_info or None).log(level, text)
+        if self._to_std:
+            std_level = {"TRACE": std_logging.DEBUG, "SUCCESS": std_logging.INFO}.get(level, levelno)
+            self._std_logger.log(std_level, text, exc_info=exc_info)
+
+
 def setup_aird_logging():
     """Setup AIRD-specific logging configuration.
 
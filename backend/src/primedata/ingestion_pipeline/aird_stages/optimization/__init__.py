@@ -4,10 +4,11 @@ Optimization modules for text enhancement.
 Supports pattern-based, LLM-based, and hybrid optimization approaches.
 """
 
+from .executor import ChunkOptimizationExecutor
 from .hybrid import HybridOptimizer
 from .pattern_based import PatternBasedOptimizer
 
-__all__ = ["PatternBasedOptimizer", "HybridOptimizer"]
+__all__ = ["PatternBasedOptimizer", "HybridOptimizer", "ChunkOptimizationExecutor"]
 
 
 
@@ -0,0 +1,204 @@
+"""
+Concurrent executor for per-chunk LLM optimization.
+
+Chunks that fail the quality gate are collected during preprocessing and
+optimized together: requests run with bounded concurrency on a single shared
+client, are throttled to a tokens-per-minute budget, and results are cached by
+(model, prompt version, text hash) so re-runs over unchanged chunks are free.
+"""
+
+import asyncio
+import logging as std_logging  # For Airflow compatibility
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
+
+from loguru import logger
+
+# Use Python logging for Airflow compatibility
+std_logger = std_logging.getLogger(__name__)
+
+from primedata.services.llm_cache import LLMResultCache, get_llm_cache, make_cache_key, text_hash
+
+CACHE_NAMESPACE = "chunk_optimization"
+DEFAULT_MAX_CONCURRENCY = 8
+
+
+def _estimate_tokens(text: str) -> int:
+    # Rough estimate: 1 token ≈ 4 characters
+    return max(1, len(text) // 4)
+
+
+class TokenRateLimiter:
+    """Async token bucket limiting the number of tokens sent per minute."""
+
+    def __init__(self, tokens_per_minute: int):
+        self.capacity = float(tokens_per_minute)
+        self.rate = tokens_per_minute / 60.0  # tokens per second
+        self._available = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, tokens: int) -> None:
+        """Wait until ``tokens`` can be spent (requests larger than the budget wait for a full bucket)."""
+        tokens = min(float(tokens), self.capacity)
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._available = min(self.capacity, self._available + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._available >= tokens:
+                    self._available -= tokens
+                    return
+                await asyncio.sleep((tokens - self._available) / self.rate)
+
+
+@dataclass
+class OptimizationRunStats:
+    """Cost and latency of one optimization run."""
+
+    candidates: int = 0
+    cache_hits: int = 0
+    llm_calls: int = 0
+    failed: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    total_cost: float = 0.0
+    wall_time_sec: float = 0.0
+    latencies_sec: List[float] = field(default_factory=list)
+
+    def _latency_percentile(self, q: float) -> float:
+        if not self.latencies_sec:
+            return 0.0
+        ordered = sorted(self.latencies_sec)
+        return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "candidates": self.candidates,
+            "cache_hits": self.cache_hits,
+            "llm_calls": self.llm_calls,
+            "failed": self.failed,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "total_cost": round(self.total_cost, 6),
+            "wall_time_sec": round(self.wall_time_sec, 3),
+            "latency_p50_sec": round(self._latency_percentile(0.5), 3),
+            "latency_p95_sec": round(self._latency_percentile(0.95), 3),
+        }
+
+
+class ChunkOptimizationExecutor:
+    """Optimizes many chunks with one LLM client, bounded concurrency and a result cache."""
+
+    def __init__(
+        self,
+        llm_config: Dict[str, Any],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        tokens_per_minute: Optional[int] = None,
+        cache: Optional[LLMResultCache] = None,
+    ):
+        """
+        Args:
+            llm_config: LLM configuration dict (api_key, model, base_url)
+            max_concurrency: Maximum number of requests in flight
+            tokens_per_minute: Optional token budget per minute (prompt + expected output)
+            cache: Result cache (defaults to the process-wide LLM cache)
+        """
+        from primedata.services.llm_optimization import PROMPT_VERSION, LLMOptimizationService
+
+        self.service = LLMOptimizationService(
+            api_key=llm_config.get("api_key"),
+            model=llm_config.get("model", "gpt-4-turbo-preview"),
+            base_url=llm_config.get("base_url"),
+        )
+        self.prompt_version = PROMPT_VERSION
+        self.max_concurrency = max(1, int(max_concurrency or DEFAULT_MAX_CONCURRENCY))
+        self.tokens_per_minute = int(tokens_per_minute) if tokens_per_minute else None
+        self.cache = cache if cache is not None else get_llm_cache()
+        self.stats = OptimizationRunStats()
+
+    def cache_key(self, text: str) -> str:
+        return make_cache_key(self.service.model, self.prompt_version, text_hash(text))
+
+    def optimize_many(self, texts: Sequence[str]) -> List[Dict[str, Any]]:
+        """
+        Optimize texts concurrently.
+
+        Returns:
+            One result per input text, in input order, with:
+                - optimized_text: LLM output (or the original text on failure)
+                - optimized: True if the LLM result was used
+                - cached: True if the result came from the cache
+                - cost: Cost of the call (0.0 for cache hits)
+                - error: Error message if the call failed
+        """
+        started = time.perf_counter()
+        self.stats.candidates += len(texts)
+        try:
+            results = _run_coroutine(self._optimize_all(list(texts)))
+        finally:
+            self.stats.wall_time_sec += time.perf_counter() - started
+        return results
+
+    async def _optimize_all(self, texts: List[str]) -> List[Dict[str, Any]]:
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        limiter = TokenRateLimiter(self.tokens_per_minute) if self.tokens_per_minute else None
+        try:
+            return await asyncio.gather(*(self._optimize_one(text, semaphore, limiter) for text in texts))
+        finally:
+            await self.service.aclose()
+
+    async def _optimize_one(
+        self, text: str, semaphore: asyncio.Semaphore, limiter: Optional[TokenRateLimiter]
+    ) -> Dict[str, Any]:
+        key = self.cache_key(text)
+        cached = self.cache.get(CACHE_NAMESPACE, key)
+        if cached is not None:
+            self.stats.cache_hits += 1
+            return {"optimized_text": cached["enhanced_text"], "optimized": True, "cached": True, "cost": 0.0}
+
+        async with semaphore:
+            if limiter is not None:
+                # Prompt plus an output of roughly the same size
+                await limiter.acquire(2 * _estimate_tokens(text) + 100)
+            call_started = time.perf_counter()
+            llm_result = await self.service.enhance_text_async(text)
+            self.stats.latencies_sec.append(time.perf_counter() - call_started)
+
+        self.stats.llm_calls += 1
+        if "error" in llm_result:
+            self.stats.failed += 1
+            return {"optimized_text": text, "optimized": False, "cached": False, "cost": 0.0, "error": llm_result["error"]}
+
+        self.stats.input_tokens += llm_result.get("input_tokens", 0)
+        self.stats.output_tokens += llm_result.get("output_tokens", 0)
+        self.stats.total_cost += llm_result.get("cost_estimate", 0.0)
+        self.cache.set(
+            CACHE_NAMESPACE,
+            key,
+            {
+                "enhanced_text": llm_result["enhanced_text"],
+                "model": self.service.model,
+                "prompt_version": self.prompt_version,
+                "input_tokens": llm_result.get("input_tokens", 0),
+                "output_tokens": llm_result.get("output_tokens", 0),
+            },
+        )
+        return {
+            "optimized_text": llm_result["enhanced_text"],
+            "optimized": True,
+            "cached": False,
+            "cost": llm_result.get("cost_estimate", 0.0),
+        }
+
+
+def _run_coroutine(coro: Any) -> Any:
+    """Run a coroutine from sync code, even if an event loop is already running in this thread."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coro).result()
@@ -5,24 +5,22 @@ Ports AIRD preprocessing logic with playbook support, adapted for MinIO storage.
 """
 
 import json
-import logging as std_logging  # For Airflow compatibility
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from uuid import UUID
 
 import regex as re
-from loguru import logger
-
-# Use Python logging for Airflow compatibility (Airflow captures standard logging)
-std_logger = std_logging.getLogger(__name__)
 
 from primedata.ingestion_pipeline.aird_stages.base import AirdStage, StageResult, StageStatus
+from primedata.ingestion_pipeline.aird_stages.optimization.pattern_based import PatternBasedOptimizer
 from primedata.ingestion_pipeline.aird_stages.playbooks import load_playbook_yaml, route_playbook
 from primedata.ingestion_pipeline.aird_stages.utils.chunking import (
-    char_chunk,
-    paragraph_chunk,
-    sentence_chunk,
+    Chunk,
+    char_chunk_spans,
+    paragraph_chunk_spans,
+    sentence_chunk_spans,
     tokens_estimate,
 )
 from primedata.ingestion_pipeline.aird_stages.utils.text_processing import (
@@ -67,6 +65,18 @@ def _audience_for(text: str, section: str = "", default: str = "general") -> str
     return default
 
 
+def _apply_audience_rules(audience: str, playbook: Dict[str, Any], title_raw: str, text: str) -> str:
+    """Override the detected audience with the first matching playbook audience rule."""
+    for rule in playbook.get("audience_rules", []) or []:
+        try:
+            pat = rule.get("pattern")
+            if pat and (re.search(pat, title_raw, flags=re.IGNORECASE) or re.search(pat, text, flags=re.IGNORECASE)):
+                return rule.get("audience", audience)
+        except re.error:
+            pass
+    return audience
+
+
 def _build_record(
     stem: str,
     filename: str,
@@ -79,8 +89,14 @@ def _build_record(
     chunk_of: int,
     product_id: UUID,
     domain_type: Optional[str] = None,
+    char_span: Optional[Tuple[int, int]] = None,
 ) -> Dict[str, Any]:
-    """Build a chunk record with PrimeData metadata structure."""
+    """Build a chunk record with PrimeData metadata structure.
+
+    With char_span, the record points into the normalized document buffer (char_start/char_end,
+    the span the chunk was cut from) and its "text" stays None until materialized by
+    ChunkedDocument.iter_records(), which also adds its exact "char_runs".
+    """
     record = {
         "chunk_id": f"{stem}_p{page}_s{canon_section}_c{chunk_idx}",
         "document_id": document_id,
@@ -89,7 +105,7 @@ def _build_record(
         "section_raw": title_raw,
         "section": canon_section,
         "field_name": canon_section,
-        "text": text,
+        "text": text if char_span is None else None,
         "token_est": tokens_estimate(text),
         "chunk_index": chunk_idx,
         "chunk_of": chunk_of,
@@ -107,10 +123,49 @@ def _build_record(
     # Add domain_type if provided (for domain-adaptive scoring)
     if domain_type:
         record["domain_type"] = domain_type
-    
+
+    if char_span is not None:
+        record["char_start"], record["char_end"] = char_span
+
     return record
 
 
+# Separator of section bodies in the normalized document buffer
+SECTION_SEPARATOR = "\n\n"
+
+
+class ChunkedDocument:
+    """Chunk records of a document with their spans in its normalized document buffer.
+
+    Records keep "text" None unless it was replaced (LLM optimization, which sets
+    "llm_optimized"); iter_records() yields them with the text materialized from the buffer,
+    one record at a time, and with "char_runs": [[start, end, prefix], ...] such that
+    text_from_runs(document, char_runs) is the chunk text (the text before any rewrite).
+    The buffer is stored next to the JSONL (AirdStorageAdapter.put_normalized_document).
+    """
+
+    def __init__(
+        self,
+        document: str = "",
+        records: Optional[List[Dict[str, Any]]] = None,
+        chunks: Optional[List[Chunk]] = None,
+    ):
+        self.document = document
+        self.records = records if records is not None else []
+        self.chunks = chunks if chunks is not None else []
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
+        """Records with their chunk text and runs (records themselves are left unchanged)."""
+        for rec, chunk in zip(self.records, self.chunks):
+            rec = {**rec, "char_runs": [list(run) for run in chunk.runs(self.document)]}
+            if rec["text"] is None:
+                rec["text"] = chunk.text(self.document)
+            yield rec
+
+
 class PreprocessStage(AirdStage):
     """Preprocessing stage that normalizes, chunks, and sections documents."""
 
@@ -180,7 +235,7 @@ class PreprocessStage(AirdStage):
             )
 
         if not raw_files:
-            self.logger.warning("No raw files to process")
+            self.log.warning("No raw files to process")
             return self._create_result(
                 status=StageStatus.SKIPPED,
                 metrics={"reason": "no_raw_files"},
@@ -189,12 +244,14 @@ class PreprocessStage(AirdStage):
 
         # Initialize playbook_id for logging (will be reassigned per file in loop)
         playbook_id = initial_playbook_id
-        self.logger.info(f"Starting preprocessing for {len(raw_files)} files, playbook={playbook_id}")
+        log = self.log
+        log.info("[PreprocessStage] Starting preprocessing for {} files, playbook={}", len(raw_files), playbook_id)
 
         # Get file_stem to storage_key mapping if provided (for accurate file retrieval)
         file_stem_to_storage_key = context.get("file_stem_to_storage_key", {})
+        log.debug("[PreprocessStage] Storage key map has {} entries", len(file_stem_to_storage_key))
 
-        all_records: List[Dict[str, Any]] = []
+        total_chunks = 0
         total_sections = 0
         total_mid_sentence_ends = 0
         processed_files = []
@@ -203,12 +260,14 @@ class PreprocessStage(AirdStage):
         file_chunk_counts: Dict[str, int] = {}
         file_sections_counts: Dict[str, int] = {}
         chunking_config_used: Optional[Dict[str, Any]] = None
+        llm_optimization_totals: Dict[str, float] = {}
 
         for file_stem in raw_files:
             file_start_time = datetime.utcnow()
-            # Use both loguru and std logging for Airflow visibility
-            self.logger.info(f"[PreprocessStage] ====== Processing file: {file_stem} ======")
-            std_logger.info(f"[PreprocessStage] ====== Processing file: {file_stem} ======")
+            # Fields of this file's summary record (written once in the finally block)
+            file_summary: Dict[str, Any] = {"status": "failed"}
+            file_span = self.tracer.span("file")
+            log.debug("[PreprocessStage] Processing file: {}", file_stem)
             try:
                 # Load raw text - use exact storage_key if available
                 file_info = file_stem_to_storage_key.get(file_stem, {})
@@ -216,15 +275,13 @@ class PreprocessStage(AirdStage):
                 storage_bucket = file_info.get("storage_bucket")
                 filename = file_info.get("filename", f"{file_stem}.txt")
 
-                file_info_msg = f"[PreprocessStage] File info for {file_stem}: storage_key={storage_key}, storage_bucket={storage_bucket}, filename={filename}"
-                self.logger.info(file_info_msg)
-                std_logger.info(file_info_msg)
-
-                keys_msg = (
-                    f"[PreprocessStage] Available file_stem_to_storage_key keys: {list(file_stem_to_storage_key.keys())}"
+                log.debug(
+                    "[PreprocessStage] File info for {}: storage_key={}, storage_bucket={}, filename={}",
+                    file_stem,
+                    storage_key,
+                    storage_bucket,
+                    filename,
                 )
-                self.logger.info(keys_msg)
-                std_logger.info(keys_msg)
 
                 # OPTIMIZATION: Route playbook BEFORE loading full file (for performance)
                 # Route playbook if not provided
@@ -245,7 +302,12 @@ class PreprocessStage(AirdStage):
                                 storage, file_stem, storage_key, storage_bucket, max_chars=2000
                             )
                     except Exception as e:
-                        self.logger.warning(f"Failed to get sample for playbook routing: {e}, will use filename only")
+                        log.sampled(
+                            "routing_sample_failed",
+                            "WARNING",
+                            "Failed to get sample for playbook routing: {}, will use filename only",
+                            e,
+                        )
                         sample_for_playbook = None
                     
                     # Use sample if available, otherwise use filename only
@@ -261,7 +323,7 @@ class PreprocessStage(AirdStage):
                             playbook_selection_metadata["playbook_id"] = chosen_id
                             playbook_selection_metadata["reason"] = reason
                             playbook_selection_metadata["detected_at"] = datetime.utcnow().isoformat() + "Z"
-                        self.logger.info(f"Auto-routed to playbook {file_playbook_id} ({reason}) using sample text")
+                        log.debug("Auto-routed to playbook {} ({}) using sample text", file_playbook_id, reason)
                     else:
                         # Fallback: use filename only for routing
                         chosen_id, reason = route_playbook(sample_text=None, filename=file_stem)
@@ -271,7 +333,7 @@ class PreprocessStage(AirdStage):
                             playbook_selection_metadata["playbook_id"] = chosen_id
                             playbook_selection_metadata["reason"] = reason
                             playbook_selection_metadata["detected_at"] = datetime.utcnow().isoformat() + "Z"
-                        self.logger.info(f"Auto-routed to playbook {file_playbook_id} ({reason}) using filename only")
+                        log.debug("Auto-routed to playbook {} ({}) using filename only", file_playbook_id, reason)
                 else:
                     # Playbook was provided, mark as manual (only on first file)
                     if playbook_selection_metadata.get("method") is None:
@@ -280,47 +342,40 @@ class PreprocessStage(AirdStage):
 
                 # NOW load full file for actual processing
                 if storage_key:
-                    load_msg = f"[PreprocessStage] Loading raw file {file_stem} from exact MinIO key: {storage_key} (bucket: {storage_bucket or 'primedata-raw'})"
-                    self.logger.info(load_msg)
-                    std_logger.info(load_msg)
+                    log.debug(
+                        "[PreprocessStage] Loading raw file {} from exact MinIO key: {} (bucket: {})",
+                        file_stem,
+                        storage_key,
+                        storage_bucket or "primedata-raw",
+                    )
                     try:
-                        self.logger.info(
-                            f"[PreprocessStage] About to call storage.get_raw_text(file_stem={file_stem}, minio_key={storage_key}, minio_bucket={storage_bucket})"
-                        )
-                        std_logger.info(
-                            f"[PreprocessStage] About to call storage.get_raw_text(file_stem={file_stem}, minio_key={storage_key}, minio_bucket={storage_bucket})"
-                        )
-                        raw_text = storage.get_raw_text(file_stem, minio_key=storage_key, minio_bucket=storage_bucket)
-                        self.logger.info(
-                            f"[PreprocessStage] storage.get_raw_text() returned: {'None' if raw_text is None else f'{len(raw_text)} characters'}"
-                        )
-                        std_logger.info(
-                            f"[PreprocessStage] storage.get_raw_text() returned: {'None' if raw_text is None else f'{len(raw_text)} characters'}"
-                        )
+                        with self.tracer.span("fetch"):
+                            raw_text = storage.get_raw_text(file_stem, minio_key=storage_key, minio_bucket=storage_bucket)
                     except Exception as e:
-                        self.logger.error(
-                            f"[PreprocessStage] Exception while calling storage.get_raw_text() for {file_stem}: {type(e).__name__}: {str(e)}",
-                            exc_info=True,
+                        log.exception(
+                            "[PreprocessStage] Exception while calling storage.get_raw_text() for {}: {}: {}",
+                            file_stem,
+                            type(e).__name__,
+                            e,
                         )
-                        import traceback
-
-                        self.logger.error(f"[PreprocessStage] get_raw_text() traceback:\n{traceback.format_exc()}")
                         raw_text = None
                 else:
-                    self.logger.warning(
-                        f"[PreprocessStage] No storage_key found for {file_stem} in file_stem_to_storage_key map. Using constructed path (.txt extension)"
+                    log.sampled(
+                        "no_storage_key",
+                        "WARNING",
+                        "[PreprocessStage] No storage_key found for {} in file_stem_to_storage_key map. "
+                        "Using constructed path (.txt extension)",
+                        file_stem,
                     )
                     try:
-                        raw_text = storage.get_raw_text(file_stem)
+                        with self.tracer.span("fetch"):
+                            raw_text = storage.get_raw_text(file_stem)
                     except Exception as e:
-                        self.logger.error(
-                            f"[PreprocessStage] Exception while calling storage.get_raw_text() (constructed path) for {file_stem}: {type(e).__name__}: {str(e)}",
-                            exc_info=True,
-                        )
-                        import traceback
-
-                        self.logger.error(
-                            f"[PreprocessStage] get_raw_text() (constructed) traceback:\n{traceback.format_exc()}"
+                        log.exception(
+                            "[PreprocessStage] Exception while calling storage.get_raw_text() (constructed path) for {}: {}: {}",
+                            file_stem,
+                            type(e).__name__,
+                            e,
                         )
                         raw_text = None
 
@@ -330,49 +385,47 @@ class PreprocessStage(AirdStage):
                         (".jpg", ".jpeg", ".png", ".gif", ".bmp", ".tiff", ".webp", ".svg")
                     )
                     if is_image_file:
-                        warn_msg = (
-                            f"[PreprocessStage] ⚠️ Skipping image file {file_stem} (filename: {filename}). "
-                            f"Image files cannot be extracted as text. "
-                            f"Only PDF, text, and HTML files are supported for text extraction."
+                        log.sampled(
+                            "image_file_skipped",
+                            "WARNING",
+                            "[PreprocessStage] ⚠️ Skipping image file {} (filename: {}). "
+                            "Image files cannot be extracted as text. "
+                            "Only PDF, text, and HTML files are supported for text extraction.",
+                            file_stem,
+                            filename,
                         )
-                        self.logger.warning(warn_msg)
-                        std_logger.warning(warn_msg)
+                        file_summary["status"] = "skipped_image"
                         failed_files.append(file_stem)
                         continue
                     else:
-                        error_msg = (
-                            f"[PreprocessStage] ❌ Raw text extraction FAILED for {file_stem}. "
-                            f"MinIO key: {storage_key if storage_key else 'constructed path'}, "
-                            f"Bucket: {storage_bucket or 'primedata-raw'}, "
-                            f"Filename: {filename}. "
-                            f"File may be missing from MinIO, corrupted, or in unsupported format. "
-                            f"Supported formats: PDF, TXT, HTML, JSON, CSV"
+                        log.error(
+                            "[PreprocessStage] ❌ Raw text extraction FAILED for {}. "
+                            "MinIO key: {}, Bucket: {}, Filename: {}. "
+                            "File may be missing from MinIO, corrupted, or in unsupported format. "
+                            "Supported formats: PDF, TXT, HTML, JSON, CSV",
+                            file_stem,
+                            storage_key if storage_key else "constructed path",
+                            storage_bucket or "primedata-raw",
+                            filename,
                         )
-                        # Use both loguru and std logging for Airflow visibility
-                        self.logger.error(error_msg)
-                        std_logger.error(error_msg)
+                        file_summary["error"] = "raw_text_extraction_failed"
                         failed_files.append(file_stem)
                         continue
 
-                self.logger.info(
-                    f"[PreprocessStage] ✓ Successfully loaded raw text for {file_stem}: {len(raw_text)} characters"
-                )
-                std_logger.info(
-                    f"[PreprocessStage] ✓ Successfully loaded raw text for {file_stem}: {len(raw_text)} characters"
-                )
+                file_summary["chars"] = len(raw_text)
+                log.debug("[PreprocessStage] ✓ Successfully loaded raw text for {}: {} characters", file_stem, len(raw_text))
                 
                 # Validate raw_text has content
                 if not raw_text or len(raw_text.strip()) == 0:
-                    error_msg = f"[PreprocessStage] ❌ Raw text is empty for {file_stem} after extraction"
-                    self.logger.error(error_msg)
-                    std_logger.error(error_msg)
+                    log.error("[PreprocessStage] ❌ Raw text is empty for {} after extraction", file_stem)
+                    file_summary["error"] = "empty_raw_text"
                     failed_files.append(file_stem)
                     continue
                 
                 # Log preview of raw text
-                preview = raw_text[:200].replace('\n', '\\n')
-                self.logger.debug(f"[PreprocessStage] Raw text preview for {file_stem}: {preview}...")
-                std_logger.debug(f"[PreprocessStage] Raw text preview for {file_stem}: {preview[:100]}...")
+                if log.enabled("DEBUG"):
+                    preview = raw_text[:200].replace('\n', '\\n')
+                    log.debug("[PreprocessStage] Raw text preview for {}: {}...", file_stem, preview)
 
                 # Route playbook if not provided
                 file_playbook_id = initial_playbook_id  # Use initial playbook_id for this file
@@ -386,7 +439,7 @@ class PreprocessStage(AirdStage):
                         playbook_selection_metadata["playbook_id"] = chosen_id
                         playbook_selection_metadata["reason"] = reason
                         playbook_selection_metadata["detected_at"] = datetime.utcnow().isoformat() + "Z"
-                    self.logger.info(f"Auto-routed to playbook {file_playbook_id} ({reason})")
+                    log.debug("Auto-routed to playbook {} ({})", file_playbook_id, reason)
                 else:
                     # Playbook was provided, mark as manual (only on first file)
                     if playbook_selection_metadata.get("method") is None:
@@ -395,86 +448,97 @@ class PreprocessStage(AirdStage):
 
                 # Use file_playbook_id for this file's processing
                 playbook_id = file_playbook_id
+                file_summary["playbook_id"] = playbook_id
 
                 # Load playbook (support custom playbooks from database)
                 try:
                     workspace_id = context.get("workspace_id")
                     db_session = context.get("db")
-                    playbook = load_playbook_yaml(
-                        playbook_id, workspace_id=str(workspace_id) if workspace_id else None, db_session=db_session
-                    )
+                    with self.tracer.span("playbook_load"):
+                        playbook = load_playbook_yaml(
+                            playbook_id, workspace_id=str(workspace_id) if workspace_id else None, db_session=db_session
+                        )
                 except Exception as e:
-                    self.logger.error(f"Failed to load playbook {playbook_id}: {e}, using empty config")
+                    log.error("Failed to load playbook {}: {}, using empty config", playbook_id, e)
                     playbook = {}
 
                 # Process document
-                self.logger.info(
-                    f"[PreprocessStage] About to process document {file_stem}: "
-                    f"text_length={len(raw_text)}, playbook_id={playbook_id}, "
-                    f"chunking_config_mode={chunking_config.get('mode') if chunking_config else 'None'}, "
-                    f"has_resolved_settings={'resolved_settings' in (chunking_config or {})}"
-                )
-                std_logger.info(
-                    f"[PreprocessStage] Processing document {file_stem}: "
-                    f"text_length={len(raw_text)}, playbook_id={playbook_id}"
+                log.debug(
+                    "[PreprocessStage] About to process document {}: text_length={}, playbook_id={}, "
+                    "chunking_config_mode={}, has_resolved_settings={}",
+                    file_stem,
+                    len(raw_text),
+                    playbook_id,
+                    chunking_config.get("mode") if chunking_config else "None",
+                    "resolved_settings" in (chunking_config or {}),
                 )
                 
-                records, stats = self._process_document(
-                    raw_text=raw_text,
-                    file_stem=file_stem,
-                    filename=f"{file_stem}.txt",
-                    playbook=playbook,
-                    playbook_id=playbook_id,
-                    chunking_config=chunking_config,  # Pass product chunking config
-                )
-                
-                self.logger.info(
-                    f"[PreprocessStage] Document processing completed for {file_stem}: "
-                    f"records={len(records)}, sections={stats.get('sections', 0)}, "
-                    f"chunks={stats.get('chunks', 0)}"
-                )
-                std_logger.info(
-                    f"[PreprocessStage] Document processing completed: "
-                    f"records={len(records)}, sections={stats.get('sections', 0)}"
-                )
+                with self.tracer.span("process") as span:
+                    document, stats = self._process_document(
+                        raw_text=raw_text,
+                        file_stem=file_stem,
+                        filename=f"{file_stem}.txt",
+                        playbook=playbook,
+                        playbook_id=playbook_id,
+                        chunking_config=chunking_config,  # Pass product chunking config
+                    )
+                    span.add(bytes=len(raw_text), records=len(document))
 
-                all_records.extend(records)
+                total_chunks += len(document)
                 file_chunk_counts[file_stem] = stats.get("chunks", 0)
                 file_sections_counts[file_stem] = stats.get("sections", 0)
                 total_sections += stats.get("sections", 0)
                 total_mid_sentence_ends += stats.get("mid_sentence_ends", 0)
                 if not chunking_config_used and stats.get("chunking_config_used"):
                     chunking_config_used = stats.get("chunking_config_used")
+                for key, value in (stats.get("llm_optimization") or {}).items():
+                    if not key.startswith("latency_"):
+                        llm_optimization_totals[key] = llm_optimization_totals.get(key, 0) + value
                 processed_files.append(file_stem)
+                file_summary.update(
+                    status="succeeded",
+                    records=len(document),
+                    sections=stats.get("sections", 0),
+                    chunks=stats.get("chunks", 0),
+                )
 
-                # Store processed JSONL for this file
-                storage.put_processed_jsonl(file_stem, records)
-
-                # Store manifest
-                manifest = {
-                    "filename": f"{file_stem}.txt",
-                    "stem": file_stem,
-                    "created_at": datetime.utcnow().isoformat(timespec="seconds") + "Z",
-                    "playbook_id": playbook_id,
-                    "stats": stats,
-                }
-                storage.put_manifest(file_stem, manifest)
+                with self.tracer.span("store") as span:
+                    # Store processed JSONL for this file (chunk text is materialized record by record)
+                    jsonl_key = storage.put_processed_jsonl(file_stem, document.iter_records())
+                    span.add(
+                        bytes=(storage.get_written_info("primedata-clean", jsonl_key) or {}).get("size") or 0,
+                        records=len(document),
+                    )
+                    # Records' char_runs point into the normalized buffer, so it is stored with them
+                    normalized_key = storage.put_normalized_document(file_stem, document.document)
+                    del document
+
+                    # Store manifest
+                    manifest = {
+                        "filename": f"{file_stem}.txt",
+                        "stem": file_stem,
+                        "created_at": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+                        "playbook_id": playbook_id,
+                        "normalized_document": {"bucket": "primedata-clean", "key": normalized_key},
+                        "stats": stats,
+                    }
+                    storage.put_manifest(file_stem, manifest)
 
             except Exception as e:
                 error_msg = f"[PreprocessStage] ❌ EXCEPTION while processing {file_stem}: {type(e).__name__}: {str(e)}"
-                self.logger.exception(f"Preprocess failed for file_stem={file_stem}")
-                self.logger.error(error_msg, exc_info=True)
-                import traceback
-
-                self.logger.error(f"[PreprocessStage] Full traceback for {file_stem}:\n{traceback.format_exc()}")
-                self.logger.error(f"[PreprocessStage] Exception details for {file_stem}: {repr(e)}")
+                log.exception("{}", error_msg)
                 last_exception = error_msg
+                file_summary["status"] = "failed"
+                file_summary["error"] = f"{type(e).__name__}: {e}"
                 failed_files.append(file_stem)
             finally:
+                file_span.add(bytes=file_summary.get("chars", 0), records=file_summary.get("records", 0))
+                file_span.end()
                 file_duration = (datetime.utcnow() - file_start_time).total_seconds()
-                self.logger.info(f"[PreprocessStage] ====== Finished processing {file_stem} in {file_duration:.2f}s ======")
+                log.file_summary(file_stem, duration_s=round(file_duration, 3), **file_summary)
+        log.flush_suppressed()
 
-        if not all_records:
+        if not total_chunks:
             failure_reason = "No records produced from preprocessing"
             if last_exception:
                 failure_reason = f"{failure_reason}. Last error: {last_exception}"
@@ -505,7 +569,6 @@ class PreprocessStage(AirdStage):
             )
 
         # Calculate aggregate metrics
-        total_chunks = len(all_records)
         mid_sentence_rate = round(total_mid_sentence_ends / max(total_chunks, 1), 4)
 
         # Ensure playbook_id is set from selection metadata if available
@@ -544,6 +607,8 @@ class PreprocessStage(AirdStage):
             "file_chunk_counts": file_chunk_counts,
             "chunking_config_used": chunking_config_used,
         }
+        if llm_optimization_totals:
+            metrics["llm_optimization"] = llm_optimization_totals
 
         return self._create_result(
             status=StageStatus.SUCCEEDED,
@@ -561,15 +626,16 @@ class PreprocessStage(AirdStage):
         playbook: Dict[str, Any],
         playbook_id: str,
         chunking_config: Optional[Dict[str, Any]] = None,
-    ) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    ) -> Tuple[ChunkedDocument, Dict[str, Any]]:
         """Process a single document through the preprocessing pipeline.
 
         Args:
             chunking_config: Optional product-level chunking configuration that overrides playbook settings
 
         Returns:
-            Tuple of (records_list, stats_dict)
+            Tuple of (chunked document, stats_dict)
         """
+        phase_start = time.perf_counter()
         # 1) Basic normalization (unwrap + PII redaction) - but NOT line-joining normalizers yet
         # We need to preserve page markers for page splitting
         unwrapped = normalize_wrapped_lines(raw_text)
@@ -578,17 +644,18 @@ class PreprocessStage(AirdStage):
         # 2) Split into pages FIRST (before applying normalizers that join lines)
         # This preserves page markers which are needed for correct page detection
         pages = split_pages_by_config(redacted, playbook.get("page_fences", []))
+        # Drop intermediate copies of the document as soon as they are consumed
+        del unwrapped, redacted
 
         # Log page splitting results
         if len(pages) > 1:
-            self.logger.info(f"✅ Split text into {len(pages)} pages (page numbers: {[p['page'] for p in pages]})")
-            std_logger.info(f"✅ Split text into {len(pages)} pages (page numbers: {[p['page'] for p in pages]})")
+            self.log.debug("✅ Split text into {} pages (page numbers: {})", len(pages), [p['page'] for p in pages])
         else:
-            self.logger.warning(
-                f"⚠️ Page splitting found only {len(pages)} page(s). Page markers may be missing or not matching patterns."
-            )
-            std_logger.warning(
-                f"⚠️ Page splitting found only {len(pages)} page(s). Page markers may be missing or not matching patterns."
+            self.log.sampled(
+                "single_page",
+                "WARNING",
+                "⚠️ Page splitting found only {} page(s). Page markers may be missing or not matching patterns.",
+                len(pages),
             )
 
         # 3) Now apply normalizers to each page separately (after page markers have been used)
@@ -606,8 +673,10 @@ class PreprocessStage(AirdStage):
             if isinstance(pattern, list):
                 pattern = "[" + "".join(str(c) for c in pattern) + "]"
             if not isinstance(pattern, str):
-                self.logger.warning(
-                    f"Normalizer pattern must be string or list, got {type(pattern)}: {pattern}, skipping"
+                self.log.warning(
+                    "Normalizer pattern must be string or list, got {}: {}, skipping",
+                    type(pattern),
+                    pattern,
                 )
                 continue
             # Check if this normalizer joins lines (could affect page markers)
@@ -643,11 +712,12 @@ class PreprocessStage(AirdStage):
                 sample = page_text[:1000]
                 space_ratio = sample.count(" ") / len(sample) if len(sample) > 0 else 0
                 if space_ratio > 0.3:  # More than 30% spaces suggests corruption
-                    self.logger.warning(
-                        f"Detected PDF extraction corruption on page {page_num} (space ratio: {space_ratio:.2%}), attempting to fix..."
-                    )
-                    std_logger.warning(
-                        f"Detected PDF extraction corruption on page {page_num} (space ratio: {space_ratio:.2%}), attempting to fix..."
+                    self.log.sampled(
+                        "pdf_spacing_corruption",
+                        "WARNING",
+                        "Detected PDF extraction corruption on page {} (space ratio: {:.2%}), attempting to fix...",
+                        page_num,
+                        space_ratio,
                     )
                     # Remove spaces between alphanumeric characters that are part of words
                     # Pattern: space between single alphanumeric characters -> remove space
@@ -659,22 +729,20 @@ class PreprocessStage(AirdStage):
                         page_text = re.sub(r"([A-Za-z0-9]) ([A-Za-z0-9])", r"\1\2", page_text)
                         if page_text == old_page_text:
                             break
-                    self.logger.info(f"Applied fix for PDF extraction corruption on page {page_num}")
-                    std_logger.info(f"Applied fix for PDF extraction corruption on page {page_num}")
+                    self.log.debug("Applied fix for PDF extraction corruption on page {}", page_num)
 
             cleaned_pages.append({"page": page_num, "text": page_text})
+        del normalized_pages
 
         # Log cleaned pages summary
         total_cleaned_chars = sum(len(p.get("text", "")) for p in cleaned_pages)
         pages_with_content = [p for p in cleaned_pages if p.get("text", "").strip()]
-        self.logger.info(
-            f"✅ Text cleaning completed for {file_stem}: "
-            f"{len(cleaned_pages)} total pages, {len(pages_with_content)} pages with content, "
-            f"{total_cleaned_chars:,} total characters"
-        )
-        std_logger.info(
-            f"✅ Text cleaning completed: {len(cleaned_pages)} pages, "
-            f"{len(pages_with_content)} with content, {total_cleaned_chars:,} chars"
+        self.log.debug(
+            "✅ Text cleaning completed for {}: {} total pages, {} pages with content, {:,} total characters",
+            file_stem,
+            len(cleaned_pages),
+            len(pages_with_content),
+            total_cleaned_chars,
         )
         
         if len(pages_with_content) == 0:
@@ -689,15 +757,13 @@ class PreprocessStage(AirdStage):
                     + "Please OCR the document (e.g., OCRmyPDF/Tesseract/Textract) and re-upload a searchable PDF. "
                     + "Marking file as OCR_REQUIRED."
                 )
-                self.logger.error(error_msg)
-                std_logger.error(error_msg)
+                self.log.error(error_msg)
                 # Raise a specific exception so the caller can treat this as a soft failure (needs OCR)
                 raise RuntimeError("OCR required: scanned or image-only PDF")
             else:
                 error_msg = msg_base + "Text may have been removed by cleaning or PDF structure is incompatible."
-                self.logger.error(error_msg)
-                std_logger.error(error_msg)
-                return [], {"sections": 0, "chunks": 0, "mid_sentence_ends": 0, "chunking_config_used": {}}
+                self.log.error(error_msg)
+                return ChunkedDocument(), {"sections": 0, "chunks": 0, "mid_sentence_ends": 0, "chunking_config_used": {}}
 
         # Combine pages back into single text for optimization (which works at document level)
         # Add page markers back so they can be detected during re-splitting after optimization
@@ -711,6 +777,7 @@ class PreprocessStage(AirdStage):
         for p in cleaned_pages:
             self._page_boundaries.append({"page": p["page"], "start": offset, "end": offset + len(p["text"])})
             offset += len(p["text"]) + 2  # +2 for "\n\n" separator
+        del cleaned_pages, pages_with_content
 
         # Apply pattern-based optimization at document level (fast, free)
         # LLM/hybrid optimization will be applied per-chunk after chunking
@@ -753,15 +820,12 @@ class PreprocessStage(AirdStage):
                         if workspace and workspace.settings:
                             llm_api_key = workspace.settings.get("openai_api_key")
                             if llm_api_key:
-                                self.logger.info(
-                                    f"✅ Using OpenAI API key from workspace settings for {optimization_mode} optimization (per-chunk)"
-                                )
-                                std_logger.info(
-                                    f"✅ Using OpenAI API key from workspace settings for {optimization_mode} optimization (per-chunk)"
+                                self.log.info(
+                                    "✅ Using OpenAI API key from workspace settings for {} optimization (per-chunk)",
+                                    optimization_mode,
                                 )
                     except Exception as e:
-                        self.logger.warning(f"Failed to fetch API key from workspace settings: {e}")
-                        std_logger.warning(f"Failed to fetch API key from workspace settings: {e}")
+                        self.log.warning("Failed to fetch API key from workspace settings: {}", e)
 
                 # Fallback to environment variable if not found in workspace settings
                 if not llm_api_key:
@@ -769,11 +833,9 @@ class PreprocessStage(AirdStage):
 
                     llm_api_key = os.getenv("OPENAI_API_KEY")
                     if llm_api_key:
-                        self.logger.info(
-                            f"✅ Using OPENAI_API_KEY from environment variable for {optimization_mode} optimization (per-chunk)"
-                        )
-                        std_logger.info(
-                            f"✅ Using OPENAI_API_KEY from environment variable for {optimization_mode} optimization (per-chunk)"
+                        self.log.info(
+                            "✅ Using OPENAI_API_KEY from environment variable for {} optimization (per-chunk)",
+                            optimization_mode,
                         )
 
                 if llm_api_key:
@@ -783,13 +845,9 @@ class PreprocessStage(AirdStage):
                         "base_url": preprocessing_flags.get("llm_base_url"),  # Optional
                     }
                 else:
-                    self.logger.warning(
-                        f"⚠️ Optimization mode is '{optimization_mode}' but OPENAI_API_KEY not found in workspace settings or environment. "
-                        "Falling back to pattern-based optimization."
-                    )
-                    std_logger.warning(
-                        f"⚠️ Optimization mode is '{optimization_mode}' but OPENAI_API_KEY not found in workspace settings or environment. "
-                        "Falling back to pattern-based optimization."
+                    self.log.warning(
+                        "⚠️ Optimization mode is '{}' but OPENAI_API_KEY not found in workspace settings or environment. Falling back to pattern-based optimization.",
+                        optimization_mode,
                     )
                     optimization_mode = "pattern"  # Fallback to pattern-based
 
@@ -802,29 +860,24 @@ class PreprocessStage(AirdStage):
                 pattern_optimizer = PatternBasedOptimizer()
                 cleaned = pattern_optimizer.optimize(cleaned, preprocessing_flags)
 
-                self.logger.info(f"✅ Pattern-based optimization applied at document level")
-                std_logger.info(f"✅ Pattern-based optimization applied at document level")
+                self.log.debug("✅ Pattern-based optimization applied at document level")
 
             except ImportError as e:
-                self.logger.warning(f"Pattern optimizer not available ({e}). Using legacy pattern-based optimization.")
-                std_logger.warning(f"Pattern optimizer not available ({e}). Using legacy pattern-based optimization.")
+                self.log.warning("Pattern optimizer not available ({}). Using legacy pattern-based optimization.", e)
                 # Fallback to legacy pattern-based optimization
                 if preprocessing_flags.get("enhanced_normalization"):
                     from primedata.ingestion_pipeline.aird_stages.utils.text_processing import apply_enhanced_normalization
 
-                    self.logger.info("Applying enhanced normalization (legacy method)")
-                    std_logger.info("Applying enhanced normalization (legacy method)")
+                    self.log.debug("Applying enhanced normalization (legacy method)")
                     cleaned = apply_enhanced_normalization(cleaned)
 
                 if preprocessing_flags.get("error_correction"):
                     from primedata.ingestion_pipeline.aird_stages.utils.text_processing import apply_error_correction
 
-                    self.logger.info("Applying error correction (legacy method)")
-                    std_logger.info("Applying error correction (legacy method)")
+                    self.log.debug("Applying error correction (legacy method)")
                     cleaned = apply_error_correction(cleaned)
             except Exception as e:
-                self.logger.error(f"Pattern-based optimization failed: {e}. Using original text.", exc_info=True)
-                std_logger.error(f"Pattern-based optimization failed: {e}. Using original text.", exc_info=True)
+                self.log.error("Pattern-based optimization failed: {}. Using original text.", e, exc_info=True)
                 # Continue with original cleaned text
 
         # Store optimization config for per-chunk LLM optimization (if needed)
@@ -858,20 +911,19 @@ class PreprocessStage(AirdStage):
             pages = split_pages_by_config(cleaned, playbook.get("page_fences", []))
         
         # Log re-split results
-        self.logger.info(
-            f"✅ Re-split after optimization for {file_stem}: "
-            f"{len(pages)} pages found, {len(cleaned):,} total characters"
-        )
-        std_logger.info(
-            f"✅ Re-split after optimization: {len(pages)} pages, {len(cleaned):,} chars"
+        self.log.debug(
+            "✅ Re-split after optimization for {}: {} pages found, {:,} total characters",
+            file_stem,
+            len(pages),
+            len(cleaned),
         )
+        self.tracer.record("normalize", time.perf_counter() - phase_start, bytes=len(raw_text), records=len(pages))
 
         # Validate that we have pages with content
         if not pages:
             error_msg = f"No pages found after optimization and re-splitting for {file_stem}. Original text length: {len(raw_text)}, Cleaned text length: {len(cleaned)}"
-            self.logger.error(error_msg)
-            std_logger.error(error_msg)
-            return [], {
+            self.log.error(error_msg)
+            return ChunkedDocument(), {
                 "error": "No pages after processing",
                 "sections": 0,
                 "chunks": 0,
@@ -888,9 +940,8 @@ class PreprocessStage(AirdStage):
                 f"Original text length: {len(raw_text)}, Cleaned text length: {len(cleaned)}. "
                 f"Total pages: {len(pages)}"
             )
-            self.logger.error(error_msg)
-            std_logger.error(error_msg)
-            return [], {
+            self.log.error(error_msg)
+            return ChunkedDocument(), {
                 "error": "All pages empty after processing",
                 "sections": 0,
                 "chunks": 0,
@@ -901,28 +952,26 @@ class PreprocessStage(AirdStage):
         
         # Use pages with content
         if len(pages_with_content) < len(pages):
-            self.logger.warning(
-                f"After processing: {len(pages_with_content)} pages with content (out of {len(pages)} total). "
-                f"Some pages were empty and will be skipped."
-            )
-            std_logger.warning(
-                f"After processing: {len(pages_with_content)} pages with content (out of {len(pages)} total)"
+            self.log.sampled(
+                "empty_pages_dropped",
+                "WARNING",
+                "After processing: {} pages with content (out of {} total). Some pages were empty and will be skipped.",
+                len(pages_with_content),
+                len(pages),
             )
         pages = pages_with_content
-        self.logger.info(f"Processing {len(pages)} pages with content for {file_stem}")
-        std_logger.info(f"Processing {len(pages)} pages with content for {file_stem}")
+        self.log.debug("Processing {} pages with content for {}", len(pages), file_stem)
         
         # Log page content summary for debugging
         if pages:
             total_chars = sum(len(p.get("text", "")) for p in pages)
             avg_chars_per_page = total_chars // len(pages) if pages else 0
-            self.logger.info(
-                f"📄 Page summary for {file_stem}: "
-                f"{len(pages)} pages, {total_chars:,} total chars, "
-                f"{avg_chars_per_page:,} avg chars/page"
-            )
-            std_logger.info(
-                f"📄 Page summary: {len(pages)} pages, {total_chars:,} chars"
+            self.log.debug(
+                "📄 Page summary for {}: {} pages, {:,} total chars, {:,} avg chars/page",
+                file_stem,
+                len(pages),
+                total_chars,
+                avg_chars_per_page,
             )
             
             # Log first few pages' content preview
@@ -930,12 +979,11 @@ class PreprocessStage(AirdStage):
                 page_text = page_data.get("text", "")
                 page_num = page_data.get("page", i+1)
                 preview = page_text[:150].replace('\n', '\\n')
-                self.logger.debug(f"Page {page_num} preview: {preview}...")
+                self.log.debug("Page {} preview: {}...", page_num, preview)
         else:
             error_msg = f"❌ No pages with content after re-splitting for {file_stem}. Optimization may have removed all content."
-            self.logger.error(error_msg)
-            std_logger.error(error_msg)
-            return [], {"sections": 0, "chunks": 0, "mid_sentence_ends": 0, "chunking_config_used": resolved_chunking_config}
+            self.log.error(error_msg)
+            return ChunkedDocument(), {"sections": 0, "chunks": 0, "mid_sentence_ends": 0, "chunking_config_used": resolved_chunking_config}
 
         # Check for enhanced metadata extraction flag from chunking_config
         preprocessing_flags = {}
@@ -947,8 +995,11 @@ class PreprocessStage(AirdStage):
 
         # Ensure chunking_config is a valid dict (fix for None or invalid values)
         if not chunking_config or not isinstance(chunking_config, dict):
-            self.logger.warning(
-                f"chunking_config is {type(chunking_config).__name__}, initializing with defaults"
+            self.log.sampled(
+                "default_chunking_config",
+                "WARNING",
+                "chunking_config is {}, initializing with defaults",
+                type(chunking_config).__name__,
             )
             chunking_config = {
                 "mode": "auto",
@@ -1050,8 +1101,7 @@ class PreprocessStage(AirdStage):
                 # Fallback to defaults if manual_settings is missing or invalid
                 manual_settings = default_manual_settings.copy()
                 chunking_config["manual_settings"] = manual_settings
-                self.logger.info(f"✅ Initialized missing manual_settings with defaults: {manual_settings}")
-                std_logger.info(f"✅ Initialized missing manual_settings with defaults")
+                self.log.debug("✅ Initialized missing manual_settings with defaults: {}", manual_settings)
                 manual_settings_provided = False
             
             if resolved_settings and isinstance(resolved_settings, dict):
@@ -1068,14 +1118,12 @@ class PreprocessStage(AirdStage):
                     or (analysis_confidence is not None and analysis_confidence < confidence_threshold)
                 )
                 if low_confidence:
-                    self.logger.warning(
-                        "Low confidence chunking detection; falling back to default/general chunking settings "
-                        "(confidence=%.2f, analysis_confidence=%s, threshold=%.2f).",
+                    self.log.warning(
+                        "Low confidence chunking detection; falling back to default/general chunking settings (confidence={:.2f}, analysis_confidence={}, threshold={:.2f}).",
                         resolved_confidence if resolved_confidence is not None else -1.0,
                         analysis_confidence,
                         confidence_threshold,
                     )
-                    std_logger.warning("Low confidence chunking detection; falling back to defaults.")
                     resolved_settings = {
                         "chunk_size": resolved_settings.get("chunk_size", 1000),
                         "chunk_overlap": resolved_settings.get("chunk_overlap", 200),
@@ -1090,14 +1138,11 @@ class PreprocessStage(AirdStage):
 
             if resolved_settings and isinstance(resolved_settings, dict):
                 # Use existing resolved_settings from task_preprocess auto-detection
-                self.logger.info(
-                    f"✅ Using existing resolved_settings from auto-detection: "
-                    f"content_type={resolved_settings.get('content_type')}, "
-                    f"chunk_size={resolved_settings.get('chunk_size')}, "
-                    f"chunking_strategy={resolved_settings.get('chunking_strategy')}"
-                )
-                std_logger.info(
-                    f"✅ Using existing resolved_settings from auto-detection"
+                self.log.debug(
+                    "✅ Using existing resolved_settings from auto-detection: content_type={}, chunk_size={}, chunking_strategy={}",
+                    resolved_settings.get('content_type'),
+                    resolved_settings.get('chunk_size'),
+                    resolved_settings.get('chunking_strategy'),
                 )
                 
                 # Extract values from resolved_settings with validation
@@ -1113,59 +1158,52 @@ class PreprocessStage(AirdStage):
                 
                 # Validate extracted values
                 if not chunk_size or chunk_size <= 0:
-                    self.logger.error(f"Invalid chunk_size from resolved_settings: {chunk_size}. Using default 1000.")
-                    std_logger.error(f"Invalid chunk_size from resolved_settings: {chunk_size}. Using default 1000.")
+                    self.log.error("Invalid chunk_size from resolved_settings: {}. Using default 1000.", chunk_size)
                     chunk_size = 1000
                 if chunk_overlap is None or chunk_overlap < 0:
-                    self.logger.error(f"Invalid chunk_overlap from resolved_settings: {chunk_overlap}. Using default 200.")
-                    std_logger.error(f"Invalid chunk_overlap from resolved_settings: {chunk_overlap}. Using default 200.")
+                    self.log.error(
+                        "Invalid chunk_overlap from resolved_settings: {}. Using default 200.",
+                        chunk_overlap,
+                    )
                     chunk_overlap = 200
                 if not strategy:
-                    self.logger.error(f"Invalid strategy from resolved_settings: {strategy}. Using default 'fixed_size'.")
-                    std_logger.error(f"Invalid strategy from resolved_settings: {strategy}. Using default 'fixed_size'.")
+                    self.log.error("Invalid strategy from resolved_settings: {}. Using default 'fixed_size'.", strategy)
                     strategy = "fixed_size"
                 
                 # Allow manual_settings to override only if explicitly provided (not defaults)
                 if manual_settings_provided:
                     if "chunk_size" in manual_settings and manual_settings.get("chunk_size"):
                         chunk_size = manual_settings["chunk_size"]
-                        self.logger.info(f"Overriding chunk_size with manual_settings: {chunk_size}")
-                        std_logger.info(f"Overriding chunk_size with manual_settings: {chunk_size}")
+                        self.log.debug("Overriding chunk_size with manual_settings: {}", chunk_size)
                     if "chunk_overlap" in manual_settings and manual_settings.get("chunk_overlap") is not None:
                         chunk_overlap = manual_settings["chunk_overlap"]
-                        self.logger.info(f"Overriding chunk_overlap with manual_settings: {chunk_overlap}")
+                        self.log.debug("Overriding chunk_overlap with manual_settings: {}", chunk_overlap)
                     if "min_chunk_size" in manual_settings and manual_settings.get("min_chunk_size"):
                         min_chunk_size = manual_settings["min_chunk_size"]
                     if "max_chunk_size" in manual_settings and manual_settings.get("max_chunk_size"):
                         max_chunk_size = manual_settings["max_chunk_size"]
                     if "chunking_strategy" in manual_settings and manual_settings.get("chunking_strategy"):
                         strategy = manual_settings["chunking_strategy"]
-                        self.logger.info(f"Overriding chunking_strategy with manual_settings: {strategy}")
-                        std_logger.info(f"Overriding chunking_strategy with manual_settings: {strategy}")
+                        self.log.debug("Overriding chunking_strategy with manual_settings: {}", strategy)
 
                 if chunk_size <= 0:
-                    self.logger.warning(f"chunk_size {chunk_size} is invalid; using default 1000.")
-                    std_logger.warning(f"chunk_size {chunk_size} is invalid; using default 1000.")
+                    self.log.warning("chunk_size {} is invalid; using default 1000.", chunk_size)
                     chunk_size = 1000
                 if chunk_overlap is None or chunk_overlap < 0:
-                    self.logger.warning(f"chunk_overlap {chunk_overlap} is invalid; using default 200.")
-                    std_logger.warning(f"chunk_overlap {chunk_overlap} is invalid; using default 200.")
+                    self.log.warning("chunk_overlap {} is invalid; using default 200.", chunk_overlap)
                     chunk_overlap = 200
                 if chunk_overlap >= chunk_size:
                     adjusted_overlap = max(chunk_size - 1, 0)
-                    self.logger.warning(
-                        f"chunk_overlap {chunk_overlap} must be less than chunk_size {chunk_size}; "
-                        f"using {adjusted_overlap}."
-                    )
-                    std_logger.warning(
-                        f"chunk_overlap {chunk_overlap} must be less than chunk_size {chunk_size}; "
-                        f"using {adjusted_overlap}."
+                    self.log.warning(
+                        "chunk_overlap {} must be less than chunk_size {}; using {}.",
+                        chunk_overlap,
+                        chunk_size,
+                        adjusted_overlap,
                     )
                     chunk_overlap = adjusted_overlap
             else:
                 # No resolved_settings, analyze content now (should only happen if auto-detection was skipped)
-                self.logger.info("No resolved_settings found, running content analysis in preprocessing stage")
-                std_logger.info("No resolved_settings found, running content analysis")
+                self.log.debug("No resolved_settings found, running content analysis in preprocessing stage")
                 
                 # Sample cleaned text for analysis (use up to 20k chars for good detection)
                 sample_text = cleaned[:20000] if len(cleaned) > 20000 else cleaned
@@ -1199,13 +1237,13 @@ class PreprocessStage(AirdStage):
                     reasoning = detected_config.reasoning
                     evidence = detected_config.evidence
                     
-                    self.logger.info(
-                        f"✅ Content analysis detected: {content_type} (confidence: {confidence:.2f}, strategy: {strategy}, "
-                        f"chunk_size: {chunk_size}, overlap: {chunk_overlap})"
-                    )
-                    std_logger.info(
-                        f"✅ Content analysis detected: {content_type} (confidence: {confidence:.2f}, strategy: {strategy}, "
-                        f"chunk_size: {chunk_size}, overlap: {chunk_overlap})"
+                    self.log.info(
+                        "✅ Content analysis detected: {} (confidence: {:.2f}, strategy: {}, chunk_size: {}, overlap: {})",
+                        content_type,
+                        confidence,
+                        strategy,
+                        chunk_size,
+                        chunk_overlap,
                     )
                     
                     # Allow manual_settings to override only if explicitly provided
@@ -1223,8 +1261,12 @@ class PreprocessStage(AirdStage):
                         
                 except Exception as e:
                     # Fallback to default if analysis fails
-                    self.logger.warning(f"Content analysis failed: {e}. Falling back to default configuration.", exc_info=True)
-                    std_logger.warning(f"Content analysis failed: {e}. Falling back to default configuration.")
+                    self.log.log(
+                        "WARNING",
+                        "Content analysis failed: {}. Falling back to default configuration.",
+                        e,
+                        exc_info=True,
+                    )
                     
                     # Fallback to general config
                     chunk_size = 1000
@@ -1259,12 +1301,10 @@ class PreprocessStage(AirdStage):
             
             # Validate max_tokens is reasonable (must be > 0 and < 10000)
             if max_tokens <= 0:
-                self.logger.error(f"Invalid max_tokens: {max_tokens} (chunk_size: {chunk_size}). Using default 900.")
-                std_logger.error(f"Invalid max_tokens: {max_tokens}. Using default 900.")
+                self.log.error("Invalid max_tokens: {} (chunk_size: {}). Using default 900.", max_tokens, chunk_size)
                 max_tokens = 900
             elif max_tokens > 10000:
-                self.logger.warning(f"max_tokens {max_tokens} is very large. Capping at 4000.")
-                std_logger.warning(f"max_tokens {max_tokens} is very large. Capping at 4000.")
+                self.log.warning("max_tokens {} is very large. Capping at 4000.", max_tokens)
                 max_tokens = 4000
             
             # Estimate: 1 sentence ≈ 20 tokens, so overlap_sentences = chunk_overlap / 20
@@ -1275,8 +1315,7 @@ class PreprocessStage(AirdStage):
             # Validate hard_overlap is reasonable
             if hard_overlap <= 0:
                 hard_overlap = 300
-                self.logger.warning(f"Invalid hard_overlap calculated: {hard_overlap}. Using default 300.")
-                std_logger.warning(f"Invalid hard_overlap. Using default 300.")
+                self.log.warning("Invalid hard_overlap calculated: {}. Using default 300.", hard_overlap)
 
             # Store resolved config with detection evidence
             resolved_chunking_config.update(
@@ -1323,77 +1362,107 @@ class PreprocessStage(AirdStage):
                 detected_domain_type = resolved.get("content_type")
 
         # Log final chunking settings being used for processing
-        self.logger.info(
-            f"🔧 Final chunking settings for {file_stem}: "
-            f"mode={chunking_config.get('mode', 'auto') if chunking_config else 'auto'}, "
-            f"strategy={strategy}, chunk_size={chunk_size}, chunk_overlap={chunk_overlap}, "
-            f"confidence={confidence}, confidence_threshold={confidence_threshold}, confidence_met={confidence_met}"
-        )
-        std_logger.info(
-            f"🔧 Final chunking settings: mode={chunking_config.get('mode', 'auto') if chunking_config else 'auto'}, "
-            f"strategy={strategy}, chunk_size={chunk_size}, chunk_overlap={chunk_overlap}"
+        self.log.debug(
+            "🔧 Final chunking settings for {}: mode={}, strategy={}, chunk_size={}, chunk_overlap={}, confidence={}, confidence_threshold={}, confidence_met={}",
+            file_stem,
+            chunking_config.get('mode', 'auto') if chunking_config else 'auto',
+            strategy,
+            chunk_size,
+            chunk_overlap,
+            confidence,
+            confidence_threshold,
+            confidence_met,
         )
 
         # 4) Process pages and sections
         records: List[Dict[str, Any]] = []
-        sections_detected = 0
         mid_sentence_ends = 0
         chunks_before_rules = 0
 
         # Log chunking configuration being used
-        self.logger.info(
-            f"📊 Chunking configuration for {file_stem}: "
-            f"strategy={strategy}, max_tokens={max_tokens}, "
-            f"overlap_sents={overlap_sents}, hard_overlap={hard_overlap}"
-        )
-        std_logger.info(
-            f"📊 Chunking config: strategy={strategy}, max_tokens={max_tokens}"
+        self.log.debug(
+            "📊 Chunking configuration for {}: strategy={}, max_tokens={}, overlap_sents={}, hard_overlap={}",
+            file_stem,
+            strategy,
+            max_tokens,
+            overlap_sents,
+            hard_overlap,
         )
         
         # Validate configuration before processing
         if max_tokens <= 0:
             error_msg = f"Invalid chunking configuration: max_tokens={max_tokens}. Falling back to 900."
-            self.logger.error(error_msg)
-            std_logger.error(error_msg)
+            self.log.error(error_msg)
             max_tokens = 900
             chunk_size = max_tokens
         
-        # First, estimate total chunks for progress tracking
+        # Detect sections once and lay their bodies out in one normalized document buffer.
+        # Chunks are spans into it (computed once, also for the progress estimate), records
+        # carry their offsets and chunk text is materialized only where it is needed.
+        phase_start = time.perf_counter()
+        document, page_sections, sections_detected = self._build_document_buffer(pages, playbook, file_stem)
+        self.tracer.record("section", time.perf_counter() - phase_start, bytes=len(document), records=sections_detected)
+        phase_start = time.perf_counter()
+        page_count = len(pages)
+        sample_page = pages[0]["text"][:500]
+        del pages, cleaned
+
+        section_chunks: List[Tuple[int, List[Tuple[str, str, List[Chunk]]]]] = []
         estimated_chunks = 0
         total_text_length = 0
-        for page_data in pages:
-            page_text = page_data["text"]
-            total_text_length += len(page_text)
-            try:
-                sections = detect_sections_configured(
-                    page_text,
-                    playbook.get("headers", []),
-                    playbook.get("section_aliases", {}),
-                )
-                for title_raw, canon_section, body_text in sections:
-                    if strategy == "paragraph":
-                        para_overlap = max(1, int(overlap_sents / 2))
-                        chunks = paragraph_chunk(body_text, max_tokens, para_overlap, hard_overlap)
-                    elif strategy == "sentence":
-                        chunks = sentence_chunk(body_text, max_tokens, overlap_sents, hard_overlap)
-                    elif strategy == "char":
-                        chunks = char_chunk(body_text, max_tokens, hard_overlap)
-                    else:
-                        chunks = sentence_chunk(body_text, max_tokens, overlap_sents, hard_overlap)
-                    estimated_chunks += len(chunks)
-            except Exception as e:
-                self.logger.warning(f"Error estimating chunks for page {page_data.get('page', '?')}: {e}", exc_info=True)
-                # Continue with estimation
+        for page_num, sections in page_sections:
+            chunked_sections = []
+            for title_raw, canon_section, start, end in sections:
+                total_text_length += end - start
+                # Chunk the section based on strategy
+                if strategy == "paragraph":
+                    # Use paragraph overlap (approximately 1 paragraph for overlap)
+                    para_overlap = max(1, int(overlap_sents / 2))  # Convert sentence overlap to paragraph overlap
+                    chunks = paragraph_chunk_spans(document, max_tokens, para_overlap, hard_overlap, start, end)
+                elif strategy == "char":
+                    # Use character-based chunking for fixed_size strategy
+                    chunks = char_chunk_spans(document, max_tokens, hard_overlap, start, end)
+                else:
+                    # Sentence chunking (also the default for unknown strategies)
+                    chunks = sentence_chunk_spans(document, max_tokens, overlap_sents, hard_overlap, start, end)
+
+                # Log if chunks are empty
+                if not chunks:
+                    self.log.error(
+                        "❌ No chunks created for section '{}' on page {} for {}. Body text length: {}, Strategy: {}, Max tokens: {}, Overlap sentences: {}, Hard overlap: {}",
+                        canon_section,
+                        page_num,
+                        file_stem,
+                        end - start,
+                        strategy,
+                        max_tokens,
+                        overlap_sents,
+                        hard_overlap,
+                    )
+                    preview = document[start : min(end, start + 200)].replace('\n', '\\n')
+                    self.log.debug("First 200 chars of body_text for section '{}': {}", canon_section, preview)
+                    self.log.sampled(
+                        "single_chunk_fallback",
+                        "WARNING",
+                        "Falling back to single chunk for section '{}' on page {}.",
+                        canon_section,
+                        page_num,
+                    )
+                    chunks = [Chunk(start, end, ((start, end, None),))]
+
+                estimated_chunks += len(chunks)
+                chunked_sections.append((title_raw, canon_section, chunks))
+            section_chunks.append((page_num, chunked_sections))
 
         # Log initial progress info
         opt_config = getattr(self, "_optimization_config", None)
         opt_mode = opt_config.get("mode", "pattern") if opt_config else "pattern"
         if opt_mode in ["llm", "hybrid"]:
-            self.logger.info(
-                f"📊 Starting chunk processing: ~{estimated_chunks} chunks, ~{total_text_length:,} characters, mode={opt_mode}"
-            )
-            std_logger.info(
-                f"📊 Starting chunk processing: ~{estimated_chunks} chunks, ~{total_text_length:,} characters, mode={opt_mode}"
+            self.log.info(
+                "📊 Starting chunk processing: ~{} chunks, ~{:,} characters, mode={}",
+                estimated_chunks,
+                total_text_length,
+                opt_mode,
             )
 
         # Track progress for periodic logging
@@ -1402,112 +1471,28 @@ class PreprocessStage(AirdStage):
         last_progress_log_time = datetime.utcnow()
         PROGRESS_LOG_INTERVAL = 20  # Log progress every N chunks
 
-        for page_data in pages:
-            page_text = page_data["text"]
-            page_num = page_data["page"]
-
-            # Validate page has content
-            if not page_text.strip():
-                self.logger.warning(f"Skipping empty page {page_num} for {file_stem}")
-                std_logger.warning(f"Skipping empty page {page_num} for {file_stem}")
-                continue
-
-            # Detect sections
-            try:
-                sections = detect_sections_configured(
-                    page_text,
-                    playbook.get("headers", []),
-                    playbook.get("section_aliases", {}),
-                )
-                sections_detected += len(sections)
-                
-                # Log if no sections detected
-                if not sections:
-                    self.logger.warning(
-                        f"No sections detected on page {page_num} for {file_stem}. "
-                        f"Page text length: {len(page_text)}, Preview: {page_text[:100]}..."
-                    )
-                    std_logger.warning(
-                        f"No sections detected on page {page_num} for {file_stem}. "
-                        f"Text length: {len(page_text)}"
-                    )
-                    # Log first few lines of page text to help diagnose
-                    if page_text:
-                        first_lines = "\n".join(page_text.split("\n")[:3])
-                        self.logger.debug(f"First 3 lines of page {page_num}: {first_lines}")
-                    sections = [(f"Page {page_num}", "full_page", page_text)]
-                    sections_detected += 1
-            except Exception as e:
-                self.logger.error(
-                    f"Error detecting sections on page {page_num} for {file_stem}: {e}",
-                    exc_info=True
-                )
-                std_logger.error(
-                    f"Error detecting sections on page {page_num}: {e}"
-                )
-                continue
-
-            # Process each section
-            for title_raw, canon_section, body_text in sections:
-                # Validate section has content
-                if not body_text.strip():
-                    self.logger.warning(
-                        f"Skipping empty section '{canon_section}' on page {page_num} for {file_stem}"
-                    )
-                    std_logger.warning(
-                        f"Skipping empty section '{canon_section}' on page {page_num} for {file_stem}"
-                    )
-                    continue
-                # Chunk the section based on strategy
-                if strategy == "paragraph":
-                    # Use paragraph overlap (approximately 1 paragraph for overlap)
-                    para_overlap = max(1, int(overlap_sents / 2))  # Convert sentence overlap to paragraph overlap
-                    chunks = paragraph_chunk(body_text, max_tokens, para_overlap, hard_overlap)
-                elif strategy == "sentence":
-                    chunks = sentence_chunk(body_text, max_tokens, overlap_sents, hard_overlap)
-                elif strategy == "char":
-                    # Use character-based chunking for fixed_size strategy
-                    chunks = char_chunk(body_text, max_tokens, hard_overlap)
-                else:
-                    # Default to sentence chunking for unknown strategies
-                    chunks = sentence_chunk(body_text, max_tokens, overlap_sents, hard_overlap)
-
-                # Log if chunks are empty
-                if not chunks:
-                    self.logger.error(
-                        f"❌ No chunks created for section '{canon_section}' on page {page_num} for {file_stem}. "
-                        f"Body text length: {len(body_text)}, Strategy: {strategy}, Max tokens: {max_tokens}, "
-                        f"Overlap sentences: {overlap_sents}, Hard overlap: {hard_overlap}"
-                    )
-                    std_logger.error(
-                        f"❌ No chunks created for section '{canon_section}' on page {page_num} for {file_stem}. "
-                        f"Text length: {len(body_text)}, Strategy: {strategy}, Max tokens: {max_tokens}"
-                    )
-                    if body_text:
-                        preview = body_text[:200].replace('\n', '\\n')
-                        self.logger.debug(f"First 200 chars of body_text for section '{canon_section}': {preview}")
-                    self.logger.warning(
-                        f"Falling back to single chunk for section '{canon_section}' on page {page_num}."
-                    )
-                    std_logger.warning(
-                        f"Falling back to single chunk for section '{canon_section}' on page {page_num}."
-                    )
-                    chunks = [body_text]
+        # Chunks below the quality threshold: (record index, original text, title_raw, canon_section)
+        pending_optimizations: List[Tuple[int, str, str, str]] = []
+        quality_estimator = PatternBasedOptimizer()
 
+        record_chunks: List[Chunk] = []
+        for page_num, chunked_sections in section_chunks:
+            for title_raw, canon_section, chunks in chunked_sections:
                 chunks_before_rules += len(chunks)
                 
                 # Log first few chunks for debugging
                 if chunks_processed == 0:
-                    self.logger.info(
-                        f"First chunk created: section='{canon_section}', page={page_num}, "
-                        f"chunk_length={len(chunks[0])}, total_chunks_in_section={len(chunks)}"
-                    )
-                    std_logger.info(
-                        f"First chunk created: section='{canon_section}', page={page_num}"
+                    self.log.debug(
+                        "First chunk created: section='{}', page={}, chunk_length={}, total_chunks_in_section={}",
+                        canon_section,
+                        page_num,
+                        chunks[0].end - chunks[0].start,
+                        len(chunks),
                     )
 
                 # Build records for each chunk
-                for idx, chunk_text in enumerate(chunks):
+                for idx, chunk in enumerate(chunks):
+                    chunk_text = chunk.text(document)
                     # Check for mid-sentence boundary (improved regex)
                     # Look for sentence-ending punctuation followed by optional quotes/parentheses and whitespace/newline
                     # Also check if chunk ends with a complete word (not mid-word)
@@ -1526,18 +1511,26 @@ class PreprocessStage(AirdStage):
                         mid_sentence_ends += 1
                         # Diagnostic logging for mid-sentence breaks
                         if chunks_processed < 10 or mid_sentence_ends <= 5:  # Log first few for diagnostics
-                            self.logger.warning(
-                                f"⚠️ Mid-sentence break detected in chunk {chunks_processed + 1} "
-                                f"(section: {canon_section}, page: {page_num}, tokens: {chunk_tokens}): "
-                                f"'{chunk_stripped[-50:]}...'"
+                            self.log.sampled(
+                                "mid_sentence_break",
+                                "WARNING",
+                                "⚠️ Mid-sentence break detected in chunk {} (section: {}, page: {}, tokens: {}): '{}...'",
+                                chunks_processed + 1,
+                                canon_section,
+                                page_num,
+                                chunk_tokens,
+                                chunk_stripped[-50:],
                             )
                     
                     # Diagnostic logging: log chunk statistics periodically
                     if chunks_processed < 5 or (chunks_processed % 50 == 0):
-                        self.logger.info(
-                            f"📊 Chunk {chunks_processed + 1}: tokens={chunk_tokens}, "
-                            f"chars={len(chunk_text)}, ends_with_punct={ends_with_punctuation}, "
-                            f"mid_sentence={is_mid_sentence}"
+                        self.log.debug(
+                            "📊 Chunk {}: tokens={}, chars={}, ends_with_punct={}, mid_sentence={}",
+                            chunks_processed + 1,
+                            chunk_tokens,
+                            len(chunk_text),
+                            ends_with_punctuation,
+                            is_mid_sentence,
                         )
 
                     # Track progress
@@ -1558,18 +1551,17 @@ class PreprocessStage(AirdStage):
                             f"{chars_processed:,}/{total_text_length:,} chars ({chars_processed*100//max(total_text_length, 1)}%), "
                             f"~{estimated_remaining_min:.1f} min remaining"
                         )
-                        self.logger.info(progress_msg)
-                        std_logger.info(progress_msg)
+                        self.log.info(progress_msg)
                         last_progress_log_time = datetime.utcnow()
 
-                    # Apply per-chunk LLM/hybrid optimization if needed
-                    optimized_chunk_text = chunk_text
+                    # Collect chunks for LLM/hybrid optimization; they are optimized together
+                    # (concurrently, with caching) once all chunks of the document are built
+                    needs_llm_optimization = False
                     if hasattr(self, "_optimization_config"):
                         opt_config = self._optimization_config
                         opt_mode = opt_config.get("mode", "pattern")
 
-                        # Apply LLM/hybrid optimization per-chunk if mode is llm or hybrid
-                        # BUT: Only optimize chunks that need it (quality threshold) and limit total chunks
+                        # Only optimize chunks that need it (quality threshold)
                         if opt_mode in ["llm", "hybrid"] and opt_config.get("llm_config"):
                             # Initialize stats if not already done
                             if not hasattr(self, "_chunk_optimization_stats"):
@@ -1588,76 +1580,21 @@ class PreprocessStage(AirdStage):
                             # This avoids unnecessary API calls
                             quality_threshold = opt_config.get("quality_threshold", 75)
                             try:
-                                from primedata.ingestion_pipeline.aird_stages.optimization.pattern_based import (
-                                    PatternBasedOptimizer,
-                                )
-
-                                quick_quality_check = PatternBasedOptimizer()
-                                current_quality = quick_quality_check.estimate_quality(chunk_text)
-
-                                # Skip LLM optimization if quality is already above threshold
-                                # This significantly speeds up processing for good-quality chunks
+                                current_quality = quality_estimator.estimate_quality(chunk_text)
                                 if current_quality >= quality_threshold:
                                     self._chunk_optimization_stats["skipped_high_quality"] += 1
-                                    optimized_chunk_text = chunk_text  # Use as-is
                                 else:
-                                    # Only optimize chunks that need improvement
-                                    try:
-                                        from primedata.ingestion_pipeline.aird_stages.optimization.hybrid import (
-                                            HybridOptimizer,
-                                        )
-
-                                        optimizer = HybridOptimizer()
-                                        # Note: pattern_flags is empty because pattern-based optimization
-                                        # was already applied at document level. We only need LLM optimization here.
-                                        chunk_result = optimizer.optimize(
-                                            text=chunk_text,
-                                            mode=opt_mode,
-                                            pattern_flags={},  # Pattern-based already applied at document level
-                                            llm_config=opt_config.get("llm_config"),
-                                            quality_threshold=quality_threshold,
-                                        )
-
-                                        optimized_chunk_text = chunk_result["optimized_text"]
-
-                                        if chunk_result["method_used"] in ["llm", "hybrid"]:
-                                            self._chunk_optimization_stats["llm_optimized"] += 1
-                                            self._chunk_optimization_stats["total_cost"] += chunk_result.get("cost", 0.0)
-                                        else:
-                                            self._chunk_optimization_stats["pattern_only"] += 1
-
-                                    except Exception as e:
-                                        self._chunk_optimization_stats["failed"] += 1
-                                        self.logger.warning(f"Per-chunk LLM optimization failed for chunk {idx}: {e}")
-                                        std_logger.warning(f"Per-chunk LLM optimization failed for chunk {idx}: {e}")
-                                        # Use original chunk text on error
-                                        optimized_chunk_text = chunk_text
+                                    needs_llm_optimization = True
                             except Exception as e:
                                 # If quality check fails, try optimization anyway but log warning
-                                self.logger.warning(f"Quality check failed for chunk {idx}, attempting optimization: {e}")
-                                try:
-                                    from primedata.ingestion_pipeline.aird_stages.optimization.hybrid import HybridOptimizer
-
-                                    optimizer = HybridOptimizer()
-                                    chunk_result = optimizer.optimize(
-                                        text=chunk_text,
-                                        mode=opt_mode,
-                                        pattern_flags={},
-                                        llm_config=opt_config.get("llm_config"),
-                                        quality_threshold=quality_threshold,
-                                    )
-                                    optimized_chunk_text = chunk_result["optimized_text"]
-                                    if chunk_result["method_used"] in ["llm", "hybrid"]:
-                                        self._chunk_optimization_stats["llm_optimized"] += 1
-                                        self._chunk_optimization_stats["total_cost"] += chunk_result.get("cost", 0.0)
-                                    else:
-                                        self._chunk_optimization_stats["pattern_only"] += 1
-                                except Exception as opt_error:
-                                    self._chunk_optimization_stats["failed"] += 1
-                                    self.logger.warning(f"Per-chunk LLM optimization failed for chunk {idx}: {opt_error}")
-                                    optimized_chunk_text = chunk_text
-
-                    # Build record with optimized chunk text
+                                self.log.warning(
+                                    "Quality check failed for chunk {}, attempting optimization: {}",
+                                    idx,
+                                    e,
+                                )
+                                needs_llm_optimization = True
+
+                    # Build record (text is replaced after LLM optimization, if any)
                     rec = _build_record(
                         stem=file_stem,
                         filename=filename,
@@ -1665,21 +1602,25 @@ class PreprocessStage(AirdStage):
                         page=page_num,
                         canon_section=canon_section,
                         title_raw=title_raw,
-                        text=optimized_chunk_text,
+                        text=chunk_text,
                         chunk_idx=idx,
                         chunk_of=len(chunks),
                         product_id=self.product_id,
                         domain_type=detected_domain_type,  # Pass domain_type for domain-adaptive scoring
+                        char_span=(chunk.start, chunk.end),
                     )
                     
                     # Log domain_type for verification (only log first chunk to avoid spam)
                     if idx == 0:
                         if detected_domain_type:
-                            self.logger.info(f"✅ Record {rec['chunk_id']} has domain_type: {detected_domain_type}")
-                            std_logger.info(f"✅ Record {rec['chunk_id']} has domain_type: {detected_domain_type}")
+                            self.log.debug("✅ Record {} has domain_type: {}", rec['chunk_id'], detected_domain_type)
                         else:
-                            self.logger.warning(f"⚠️ Record {rec['chunk_id']} missing domain_type (detected_domain_type was None)")
-                            std_logger.warning(f"⚠️ Record {rec['chunk_id']} missing domain_type")
+                            self.log.sampled(
+                                "missing_domain_type",
+                                "WARNING",
+                                "⚠️ Record {} missing domain_type (detected_domain_type was None)",
+                                rec['chunk_id'],
+                            )
 
                     # Enhanced metadata extraction if flag is set
                     if preprocessing_flags.get("force_metadata_extraction") or preprocessing_flags.get(
@@ -1735,21 +1676,18 @@ class PreprocessStage(AirdStage):
                                     rec["tags"] = f"versions:{','.join(versions)}"
 
                     # Apply audience rules from playbook
-                    aud = rec["audience"]
-                    for rule in playbook.get("audience_rules", []) or []:
-                        try:
-                            pat = rule.get("pattern")
-                            if pat and (
-                                re.search(pat, title_raw, flags=re.IGNORECASE)
-                                or re.search(pat, chunk_text, flags=re.IGNORECASE)
-                            ):
-                                aud = rule.get("audience", aud)
-                                break
-                        except re.error:
-                            pass
-                    rec["audience"] = aud
+                    rec["audience"] = _apply_audience_rules(rec["audience"], playbook, title_raw, chunk_text)
 
+                    if needs_llm_optimization:
+                        pending_optimizations.append((len(records), chunk_text, title_raw, canon_section))
                     records.append(rec)
+                    record_chunks.append(chunk)
+        self.tracer.record("chunk", time.perf_counter() - phase_start, records=len(records))
+
+        if pending_optimizations:
+            with self.tracer.span("llm_optimize") as span:
+                span.add(records=len(pending_optimizations))
+                self._optimize_chunk_records(records, pending_optimizations, playbook)
 
         # Log final progress
         if opt_mode in ["llm", "hybrid"]:
@@ -1757,10 +1695,10 @@ class PreprocessStage(AirdStage):
                 f"✅ Chunk processing complete: {chunks_processed} chunks processed, "
                 f"{chars_processed:,} characters processed"
             )
-            self.logger.info(final_progress_msg)
-            std_logger.info(final_progress_msg)
+            self.log.info(final_progress_msg)
 
         # Log per-chunk optimization summary if LLM/hybrid mode was used
+        llm_optimization_stats = None
         if hasattr(self, "_chunk_optimization_stats"):
             stats_data = self._chunk_optimization_stats
             opt_config = self._optimization_config
@@ -1775,8 +1713,15 @@ class PreprocessStage(AirdStage):
                     f"{stats_data['failed']} failed, "
                     f"total cost=${stats_data['total_cost']:.4f}"
                 )
-                self.logger.info(summary_msg)
-                std_logger.info(summary_msg)
+                run_stats = stats_data.get("run")
+                if run_stats:
+                    summary_msg += (
+                        f", llm_calls={run_stats['llm_calls']}, cache_hits={run_stats['cache_hits']}, "
+                        f"latency p50={run_stats['latency_p50_sec']:.2f}s p95={run_stats['latency_p95_sec']:.2f}s, "
+                        f"wall_time={run_stats['wall_time_sec']:.1f}s"
+                    )
+                self.log.debug(summary_msg)
+            llm_optimization_stats = stats_data.get("run")
 
             # Reset stats for next document
             delattr(self, "_chunk_optimization_stats")
@@ -1786,52 +1731,38 @@ class PreprocessStage(AirdStage):
         mid_sentence_rate = round(mid_sentence_ends / max(total_chunks, 1), 4)
 
         # Log comprehensive summary
-        self.logger.info(
-            f"📊 Processing summary for {file_stem}: "
-            f"pages={len(pages)}, sections_detected={sections_detected}, "
-            f"total_chunks={total_chunks}, mid_sentence_rate={mid_sentence_rate:.4f}"
-        )
-        std_logger.info(
-            f"📊 Summary for {file_stem}: pages={len(pages)}, sections={sections_detected}, chunks={total_chunks}"
+        self.log.debug(
+            "📊 Processing summary for {}: pages={}, sections_detected={}, total_chunks={}, mid_sentence_rate={:.4f}",
+            file_stem,
+            page_count,
+            sections_detected,
+            total_chunks,
+            mid_sentence_rate,
         )
 
-        self.logger.info(
-            f"📊 Chunking diagnostics for {file_stem}: "
-            f"pages_with_content={len(pages)}, "
-            f"chunks_before_rules={chunks_before_rules}, "
-            f"chunks_after_rules={total_chunks}, "
-            f"records_written_to_db={len(records)}"
-        )
-        std_logger.info(
-            f"📊 Chunking diagnostics: pages_with_content={len(pages)}, "
-            f"chunks_before_rules={chunks_before_rules}, "
-            f"chunks_after_rules={total_chunks}, "
-            f"records_written_to_db={len(records)}"
-            f"chunks_after_rules={total_chunks}"
-        )
-        std_logger.info(
-            f"📊 Chunking diagnostics: pages_with_content={len(pages)}, "
-            f"chunks_before_rules={chunks_before_rules}, chunks_after_rules={total_chunks}"
+        self.log.debug(
+            "📊 Chunking diagnostics for {}: pages_with_content={}, chunks_before_rules={}, chunks_after_rules={}, records_written_to_db={}",
+            file_stem,
+            page_count,
+            chunks_before_rules,
+            total_chunks,
+            len(records),
         )
         
         # If no records were created, provide detailed diagnostic info
         if total_chunks == 0:
-            self.logger.error(
-                f"❌ No records created for {file_stem}! "
-                f"Pages processed: {len(pages)}, Sections detected: {sections_detected}, "
-                f"Strategy: {strategy}, Max tokens: {max_tokens}, "
-                f"chunk_size={chunk_size}, chunk_overlap={chunk_overlap}"
-            )
-            std_logger.error(
-                f"❌ No records created for {file_stem}! "
-                f"Pages: {len(pages)}, Sections: {sections_detected}"
+            self.log.error(
+                "❌ No records created for {}! Pages processed: {}, Sections detected: {}, Strategy: {}, Max tokens: {}, chunk_size={}, chunk_overlap={}",
+                file_stem,
+                page_count,
+                sections_detected,
+                strategy,
+                max_tokens,
+                chunk_size,
+                chunk_overlap,
             )
             # Log sample page text to help diagnose
-            if pages and pages[0].get("text"):
-                sample_page = pages[0]["text"]
-                self.logger.error(
-                    f"Sample page text (first 500 chars): {sample_page[:500]}"
-                )
+            self.log.error("Sample page text (first 500 chars): {}", sample_page)
 
         stats = {
             "playbook_id": playbook_id,
@@ -1841,8 +1772,164 @@ class PreprocessStage(AirdStage):
             "mid_sentence_ends": mid_sentence_ends,
             "chunking_config_used": resolved_chunking_config,
         }
+        if llm_optimization_stats:
+            stats["llm_optimization"] = llm_optimization_stats
+
+        return ChunkedDocument(document, records, record_chunks), stats
+
+    def _build_document_buffer(
+        self,
+        pages: List[Dict[str, Any]],
+        playbook: Dict[str, Any],
+        file_stem: str,
+    ) -> Tuple[str, List[Tuple[int, List[Tuple[str, str, int, int]]]], int]:
+        """Detect the sections of each page and lay out their bodies in one normalized document buffer.
+
+        Args:
+            pages: Pages with content ({"page", "text"})
+            playbook: Playbook (headers and section aliases)
+            file_stem: File stem (for logging)
+
+        Returns:
+            Tuple of (document buffer, per page (page number, [(title_raw, canon_section, start, end)])
+            with the span of each non-empty section body in the buffer, number of sections detected)
+        """
+        parts: List[str] = []
+        page_sections: List[Tuple[int, List[Tuple[str, str, int, int]]]] = []
+        sections_detected = 0
+        offset = 0
+        for page_data in pages:
+            page_text = page_data["text"]
+            page_num = page_data["page"]
+
+            # Validate page has content
+            if not page_text.strip():
+                self.log.sampled("empty_page", "WARNING", "Skipping empty page {} for {}", page_num, file_stem)
+                continue
+
+            # Detect sections
+            try:
+                sections = detect_sections_configured(
+                    page_text,
+                    playbook.get("headers", []),
+                    playbook.get("section_aliases", {}),
+                )
+                sections_detected += len(sections)
+
+                # Log if no sections detected
+                if not sections:
+                    self.log.sampled(
+                        "no_sections_detected",
+                        "WARNING",
+                        "No sections detected on page {} for {}. Page text length: {}, Preview: {}...",
+                        page_num,
+                        file_stem,
+                        len(page_text),
+                        page_text[:100],
+                    )
+                    # Log first few lines of page text to help diagnose
+                    if self.log.enabled("DEBUG"):
+                        first_lines = "\n".join(page_text.split("\n", 3)[:3])
+                        self.log.debug("First 3 lines of page {}: {}", page_num, first_lines)
+                    sections = [(f"Page {page_num}", "full_page", page_text)]
+                    sections_detected += 1
+            except Exception as e:
+                self.log.error(
+                    "Error detecting sections on page {} for {}: {}", page_num, file_stem, e, exc_info=True
+                )
+                continue
+
+            spans = []
+            for title_raw, canon_section, body_text in sections:
+                # Validate section has content
+                if not body_text.strip():
+                    self.log.sampled(
+                        "empty_section",
+                        "WARNING",
+                        "Skipping empty section '{}' on page {} for {}",
+                        canon_section,
+                        page_num,
+                        file_stem,
+                    )
+                    continue
+                if parts:
+                    offset += len(SECTION_SEPARATOR)
+                spans.append((title_raw, canon_section, offset, offset + len(body_text)))
+                parts.append(body_text)
+                offset += len(body_text)
+            page_sections.append((page_num, spans))
+
+        return SECTION_SEPARATOR.join(parts), page_sections, sections_detected
+
+    def _optimize_chunk_records(
+        self,
+        records: List[Dict[str, Any]],
+        pending: List[Tuple[int, str, str, str]],
+        playbook: Dict[str, Any],
+    ) -> None:
+        """Run LLM optimization for the collected chunks and update their records in place.
+
+        Args:
+            records: Records of the document
+            pending: (record index, original chunk text, title_raw, canon_section) per chunk to optimize
+            playbook: Playbook (for audience rules on the optimized text)
+        """
+        from primedata.ingestion_pipeline.aird_stages.optimization.executor import ChunkOptimizationExecutor
+
+        opt_config = self._optimization_config
+        preprocessing_flags = opt_config.get("preprocessing_flags") or {}
+        stats_data = self._chunk_optimization_stats
+
+        try:
+            executor = ChunkOptimizationExecutor(
+                llm_config=opt_config["llm_config"],
+                max_concurrency=preprocessing_flags.get("llm_max_concurrency", 8),
+                tokens_per_minute=preprocessing_flags.get("llm_tokens_per_minute"),
+            )
+        except Exception as e:
+            stats_data["failed"] += len(pending)
+            self.log.warning("Per-chunk LLM optimization unavailable, keeping original chunks: {}", e)
+            return
+
+        self.log.info(
+            "Optimizing {} chunks with {} (concurrency={}, tokens_per_minute={})",
+            len(pending),
+            executor.service.model,
+            executor.max_concurrency,
+            executor.tokens_per_minute or "unlimited",
+        )
+
+        try:
+            results = executor.optimize_many([chunk_text for _, chunk_text, _, _ in pending])
+        except Exception as e:
+            stats_data["failed"] += len(pending)
+            self.log.warning("Per-chunk LLM optimization failed, keeping original chunks: {}", e)
+            return
+
+        for (record_idx, chunk_text, title_raw, canon_section), result in zip(pending, results):
+            if not result["optimized"]:
+                stats_data["failed"] += 1
+                self.log.sampled(
+                    "chunk_optimization_failed",
+                    "WARNING",
+                    "Per-chunk LLM optimization failed for chunk {}: {}",
+                    records[record_idx]["chunk_id"],
+                    result.get("error"),
+                )
+                continue
+
+            optimized_text = result["optimized_text"]
+            rec = records[record_idx]
+            rec["text"] = optimized_text
+            # The buffer offsets keep pointing at the text that was rewritten
+            rec["llm_optimized"] = True
+            rec["token_est"] = tokens_estimate(optimized_text)
+            audience = _audience_for(optimized_text, section=title_raw or canon_section, default="general")
+            rec["audience"] = _apply_audience_rules(audience, playbook, title_raw, chunk_text)
+            stats_data["llm_optimized"] += 1
+            stats_data["total_cost"] += result.get("cost", 0.0)
 
-        return records, stats
+        stats_data["run"] = executor.stats.to_dict()
 
     def _get_pdf_sample_for_routing(
         self, 
@@ -1910,7 +1997,7 @@ class PreprocessStage(AirdStage):
                 except Exception:
                     return None
         except Exception as e:
-            self.logger.warning(f"Failed to extract PDF sample for routing: {e}")
+            self.log.sampled("routing_sample_failed", "WARNING", "Failed to extract PDF sample for routing: {}", e)
             return None
 
     def _get_text_sample_for_routing(
@@ -1953,5 +2040,5 @@ class PreprocessStage(AirdStage):
             except Exception:
                 return None
         except Exception as e:
-            self.logger.warning(f"Failed to read text sample for routing: {e}")
+            self.log.sampled("routing_sample_failed", "WARNING", "Failed to read text sample for routing: {}", e)
             return None
@@ -11,10 +11,10 @@ from uuid import UUID
 
 from loguru import logger
 from primedata.ingestion_pipeline.aird_stages.base import AirdStage, StageResult, StageStatus
+from primedata.ingestion_pipeline.aird_stages.config import get_aird_config
+from primedata.services.batch_scoring import iter_scored_batches, resolve_scoring_workers
 from primedata.services.trust_scoring import (
     get_scoring_weights,
-    score_record,
-    score_record_with_ai_ready_metrics,
     aggregate_metrics_with_ai_ready,
 )
 
@@ -96,59 +96,91 @@ class ScoringStage(AirdStage):
         else:
             self.logger.warning(f"Playbook {playbook_id} not available or empty, skipping AI-Ready metrics")
 
-        for file_stem in processed_files:
-            try:
-                # Load processed JSONL
-                records = storage.get_processed_jsonl(file_stem)
+        # Files are scored in a process pool; results come back in processed_files order
+        workers = resolve_scoring_workers(context.get("scoring_workers") or get_aird_config().scoring_workers)
+        self.logger.info(f"Scoring with {workers} worker process(es)")
+
+        def _load_file_batches():
+            for file_stem in processed_files:
+                try:
+                    # Load processed JSONL
+                    with self.tracer.span("fetch") as span:
+                        records = storage.get_processed_jsonl(file_stem)
+                        span.add(records=len(records) if records else 0)
+                except Exception as e:
+                    self.logger.error(f"Failed to load {file_stem}: {e}", exc_info=True)
+                    failed_files.append(file_stem)
+                    continue
                 if not records:
                     self.logger.warning(f"Processed JSONL not found for {file_stem}, skipping")
                     failed_files.append(file_stem)
                     continue
+                yield file_stem, records
+
+        # Seconds per scoring sub-metric group, summed over files (also from worker processes)
+        score_timings: Dict[str, float] = {}
+        scored_batches = iter_scored_batches(
+            _load_file_batches(),
+            weights=weights,
+            playbook=playbook if has_playbook else None,
+            # Use AI-Ready metrics scorer if playbook is available
+            ai_ready=bool(has_playbook),
+            max_workers=workers,
+            timings=score_timings,
+        )
 
-                # Score each record
+        score_span = self.tracer.span("score")
+        for file_stem, records, scored_records, error in scored_batches:
+            if error is not None:
+                self.logger.error(f"Failed to score {file_stem}: {error}")
+                failed_files.append(file_stem)
+                continue
+
+            try:
                 file_metrics = []
                 file_tag = f"{file_stem}.jsonl"
 
-                for record in records:
-                    try:
-                        # Use AI-Ready metrics scorer if playbook is available
-                        if has_playbook:
-                            scored = score_record_with_ai_ready_metrics(record, weights, playbook)
-                        else:
-                            scored = score_record(record, weights)
-                        
-                        # Add file tag and metadata
-                        scored["file"] = file_tag
-                        scored["section"] = record.get("section", "unknown")
-                        if record.get("chunk_id"):
-                            scored["chunk_id"] = record["chunk_id"]
-                        if record.get("document_id"):
-                            scored["document_id"] = record["document_id"]
-                        if record.get("page") is not None:
-                            scored["page"] = record["page"]
-
-                        file_metrics.append(scored)
-                        total_chunks += 1
-                    except Exception as e:
-                        self.logger.error(f"Failed to score chunk in {file_stem}: {e}")
+                for record, scored in zip(records, scored_records):
+                    if scored is None:
+                        # Per-chunk failure already logged by the batch scorer
                         continue
 
+                    # Add file tag and metadata
+                    scored["file"] = file_tag
+                    scored["section"] = record.get("section", "unknown")
+                    if record.get("chunk_id"):
+                        scored["chunk_id"] = record["chunk_id"]
+                    if record.get("document_id"):
+                        scored["document_id"] = record["document_id"]
+                    if record.get("page") is not None:
+                        scored["page"] = record["page"]
+
+                    file_metrics.append(scored)
+                    total_chunks += 1
+
                 if file_metrics:
                     all_metrics.extend(file_metrics)
                     scored_files.append(file_stem)
 
                     # Store per-file metrics
-                    storage.put_artifact(
-                        f"{file_stem}.score.metrics.json",
-                        json.dumps(file_metrics, indent=2),
-                        content_type="application/json",
-                    )
+                    with self.tracer.span("store") as span:
+                        metrics_json = json.dumps(file_metrics, indent=2)
+                        storage.put_artifact(
+                            f"{file_stem}.score.metrics.json",
+                            metrics_json,
+                            content_type="application/json",
+                        )
+                        span.add(bytes=len(metrics_json), records=len(file_metrics))
                 else:
                     failed_files.append(file_stem)
 
             except Exception as e:
                 self.logger.error(f"Failed to score {file_stem}: {e}", exc_info=True)
                 failed_files.append(file_stem)
+        for name, seconds in score_timings.items():
+            self.tracer.record(name, seconds, records=total_chunks)
+        score_span.add(records=total_chunks)
+        score_span.end()
 
         if not all_metrics:
             return self._create_result(
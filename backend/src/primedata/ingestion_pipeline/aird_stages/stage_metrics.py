@@ -0,0 +1,163 @@
+"""
+Prometheus metrics for AIRD pipeline stages run by Airflow.
+
+Airflow tasks are short-lived processes that nothing scrapes, so every recorded
+stage result is exported as "last run" gauges (status, duration, records, bytes
+read, records/s and peak RSS of the latest run of that stage):
+
+- written to ``aird_stage_<stage>.prom`` in PRIMEDATA_METRICS_TEXTFILE_DIR for the
+  node_exporter textfile collector (written atomically), and/or
+- pushed to a Prometheus pushgateway at PRIMEDATA_METRICS_PUSHGATEWAY_URL
+  (job "aird_pipeline", grouped by stage).
+
+Export failures are logged and never fail the stage.
+"""
+
+import os
+import urllib.request
+from datetime import timezone
+from pathlib import Path
+from typing import Dict, Optional, Union
+from urllib.parse import quote
+
+from loguru import logger
+from primedata.core.metrics import MetricsRegistry
+
+from .base import StageResult, StageStatus
+
+PUSHGATEWAY_JOB = "aird_pipeline"
+PUSHGATEWAY_TIMEOUT_SECONDS = 5
+
+# Stage metrics holding the number of records (chunks, points) the stage produced
+RECORD_METRIC_KEYS = ("total_chunks", "points_indexed")
+# Span names whose byte counts are data read from storage
+READ_SPAN_NAMES = ("fetch", "download")
+
+
+def stage_counters(result: StageResult) -> Dict[str, float]:
+    """Duration, records, bytes read and throughput of a stage run.
+
+    Args:
+        result: StageResult (its profile provides the bytes read from storage)
+
+    Returns:
+        Dict with duration_s, records, bytes_read, records_per_second and peak_rss_mb
+    """
+    if result.started_at and result.finished_at:
+        duration = max(0.0, (result.finished_at - result.started_at).total_seconds())
+    else:
+        duration = float((result.profile or {}).get("duration_s") or 0.0)
+
+    records = 0
+    for key in RECORD_METRIC_KEYS:
+        value = (result.metrics or {}).get(key)
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            records = value
+            break
+
+    # Count each read once: skip read spans nested under a read span that already has bytes
+    spans = (result.profile or {}).get("spans") or {}
+    counted = set()
+    bytes_read = 0
+    for path in sorted(spans, key=lambda p: p.count("/")):
+        segments = path.split("/")
+        if segments[-1] not in READ_SPAN_NAMES:
+            continue
+        if any("/".join(segments[:i]) in counted for i in range(1, len(segments))):
+            continue
+        span_bytes = spans[path].get("bytes") or 0
+        if span_bytes:
+            counted.add(path)
+            bytes_read += span_bytes
+
+    return {
+        "duration_s": duration,
+        "records": float(records),
+        "bytes_read": float(bytes_read),
+        "records_per_second": records / duration if duration > 0 else 0.0,
+        "peak_rss_mb": float((result.profile or {}).get("peak_rss_mb") or 0.0),
+    }
+
+
+def build_stage_registry(result: StageResult) -> MetricsRegistry:
+    """Registry with the last-run gauges of one stage result."""
+    registry = MetricsRegistry()
+    counters = stage_counters(result)
+    stage = result.stage_name
+
+    status = registry.gauge("aird_stage_last_run_status", "1 for the status of the last run of the stage", ("stage", "status"))
+    for value in StageStatus:
+        status.set(1 if result.status == value else 0, stage=stage, status=value.value)
+    finished_at = result.finished_at
+    if finished_at is not None and finished_at.tzinfo is None:
+        finished_at = finished_at.replace(tzinfo=timezone.utc)  # stages record naive UTC times
+    registry.gauge("aird_stage_last_run_timestamp_seconds", "Finish time of the last run", ("stage",)).set(
+        finished_at.timestamp() if finished_at else 0, stage=stage
+    )
+    for name, key, documentation in (
+        ("aird_stage_last_run_duration_seconds", "duration_s", "Duration of the last run"),
+        ("aird_stage_last_run_records", "records", "Chunks or points produced by the last run"),
+        ("aird_stage_last_run_bytes_read", "bytes_read", "Bytes read from storage by the last run"),
+        ("aird_stage_last_run_records_per_second", "records_per_second", "Chunks or points per second in the last run"),
+        ("aird_stage_last_run_peak_rss_megabytes", "peak_rss_mb", "Peak RSS of the task process in the last run"),
+    ):
+        registry.gauge(name, documentation, ("stage",)).set(counters[key], stage=stage)
+    return registry
+
+
+def write_textfile(registry: MetricsRegistry, path: Union[str, Path]) -> None:
+    """Write a registry in text format for the node_exporter textfile collector (atomically)."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_text(registry.render(), encoding="utf-8")
+        os.replace(tmp, path)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+
+def push_to_gateway(registry: MetricsRegistry, url: str, grouping: Dict[str, str]) -> None:
+    """Replace the metrics of a pushgateway group (PUT /metrics/job/<job>/<label>/<value>...)."""
+    group_path = "/".join(f"{quote(label, safe='')}/{quote(value, safe='')}" for label, value in grouping.items())
+    request = urllib.request.Request(
+        f"{url.rstrip('/')}/metrics/job/{quote(PUSHGATEWAY_JOB, safe='')}/{group_path}",
+        data=registry.render().encode("utf-8"),
+        method="PUT",
+        headers={"Content-Type": "text/plain; version=0.0.4"},
+    )
+    with urllib.request.urlopen(request, timeout=PUSHGATEWAY_TIMEOUT_SECONDS) as response:
+        response.read()
+
+
+def export_stage_metrics(
+    result: StageResult, textfile_dir: Optional[str] = None, pushgateway_url: Optional[str] = None
+) -> Optional[MetricsRegistry]:
+    """Export a stage result to the textfile directory and/or pushgateway, if configured.
+
+    Args:
+        result: StageResult to export
+        textfile_dir: Directory for .prom files (default: PRIMEDATA_METRICS_TEXTFILE_DIR)
+        pushgateway_url: Pushgateway base URL (default: PRIMEDATA_METRICS_PUSHGATEWAY_URL)
+
+    Returns:
+        The exported registry, or None if no target is configured
+    """
+    textfile_dir = textfile_dir if textfile_dir is not None else os.getenv("PRIMEDATA_METRICS_TEXTFILE_DIR", "")
+    pushgateway_url = pushgateway_url if pushgateway_url is not None else os.getenv("PRIMEDATA_METRICS_PUSHGATEWAY_URL", "")
+    if not textfile_dir and not pushgateway_url:
+        return None
+
+    registry = build_stage_registry(result)
+    if textfile_dir:
+        try:
+            write_textfile(registry, Path(textfile_dir) / f"aird_stage_{result.stage_name}.prom")
+        except Exception as e:
+            logger.warning(f"Failed to write metrics textfile for stage {result.stage_name}: {e}")
+    if pushgateway_url:
+        try:
+            push_to_gateway(registry, pushgateway_url, {"stage": result.stage_name})
+        except Exception as e:
+            logger.warning(f"Failed to push metrics for stage {result.stage_name} to {pushgateway_url}: {e}")
+    return registry
@@ -9,7 +9,7 @@ import json
 import logging as std_logging  # For Airflow compatibility
 from io import BytesIO
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 from uuid import UUID
 
 from loguru import logger
@@ -17,7 +17,9 @@ from loguru import logger
 # Use Python logging for Airflow compatibility (Airflow captures standard logging)
 std_logger = std_logging.getLogger(__name__)
 
-from primedata.storage.minio_client import MinIOClient
+from primedata.ingestion_pipeline.aird_stages.logging import PipelineLogger
+from primedata.ingestion_pipeline.aird_stages.tracing import trace_span
+from primedata.storage.minio_client import MinIOClient, get_storage_client
 from primedata.storage.paths import (
     chunk_prefix,
     clean_prefix,
@@ -25,6 +27,9 @@ from primedata.storage.paths import (
     safe_filename,
 )
 
+# Records serialized per write to the processed JSONL upload stream
+JSONL_WRITE_BATCH = 256
+
 
 class AirdStorageAdapter:
     """Adapter that provides AIRD-compatible file operations using MinIO.
@@ -53,12 +58,42 @@ class AirdStorageAdapter:
         self.workspace_id = workspace_id
         self.product_id = product_id
         self.version = version
-        self.minio_client = minio_client or MinIOClient()
+        self.minio_client = minio_client or get_storage_client()
         self.logger = logger.bind(
             workspace_id=str(workspace_id),
             product_id=str(product_id),
             version=version,
         )
+        self.log = PipelineLogger("storage", self.logger, std_logger)
+        # (bucket, key) -> {"size", "sha256", "etag"} of every object written through this adapter,
+        # so artifact registration does not have to re-download objects to checksum them
+        self.written_objects: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+    def _put_bytes(self, bucket: str, key: str, data: bytes, content_type: str) -> bool:
+        info = self.minio_client.put_bytes_with_info(bucket=bucket, key=key, data=data, content_type=content_type)
+        if info is None:
+            return False
+        self.written_objects[(bucket, key)] = info
+        return True
+
+    def _put_json(self, bucket: str, key: str, obj: Any) -> bool:
+        info = self.minio_client.put_json_with_info(bucket=bucket, key=key, obj=obj)
+        if info is None:
+            return False
+        self.written_objects[(bucket, key)] = info
+        return True
+
+    def get_written_info(self, bucket: str, key: str) -> Optional[Dict[str, Any]]:
+        """Size, SHA-256 and ETag of an object written through this adapter.
+
+        Args:
+            bucket: Bucket name
+            key: Object key
+
+        Returns:
+            Dictionary with 'size', 'sha256' and 'etag', or None if not written by this adapter
+        """
+        return self.written_objects.get((bucket, key))
 
     def _get_raw_prefix(self) -> str:
         """Get MinIO prefix for raw data."""
@@ -83,7 +118,7 @@ class AirdStorageAdapter:
             MinIO object key
         """
         key = f"{self._get_raw_prefix()}{safe_filename(stem)}.txt"
-        success = self.minio_client.put_bytes(
+        success = self._put_bytes(
             bucket="primedata-raw",
             key=key,
             data=text.encode("utf-8"),
@@ -91,7 +126,7 @@ class AirdStorageAdapter:
         )
         if not success:
             raise RuntimeError(f"Failed to store raw text: {key}")
-        self.logger.info(f"Stored raw text: {key}")
+        self.log.debug("Stored raw text: {}", key)
         return key
 
     def put_manifest(self, stem: str, manifest: Dict[str, Any]) -> str:
@@ -105,38 +140,80 @@ class AirdStorageAdapter:
             MinIO object key
         """
         key = f"{self._get_raw_prefix()}{safe_filename(stem)}.manifest.json"
-        success = self.minio_client.put_json(
+        success = self._put_json(
             bucket="primedata-raw",
             key=key,
             obj=manifest,
         )
         if not success:
             raise RuntimeError(f"Failed to store manifest: {key}")
-        self.logger.info(f"Stored manifest: {key}")
+        self.log.debug("Stored manifest: {}", key)
         return key
 
-    def put_processed_jsonl(self, stem: str, records: List[Dict[str, Any]]) -> str:
+    def put_processed_jsonl(self, stem: str, records: Iterable[Dict[str, Any]]) -> str:
         """Store processed JSONL file (equivalent to data/processed/{stem}.jsonl).
 
+        Records are serialized and uploaded as they are produced, so the JSONL is never
+        held in memory as a whole (records may be a generator materializing chunk text).
+
         Args:
             stem: File stem
-            records: List of record dictionaries
+            records: Record dictionaries (any iterable)
 
         Returns:
             MinIO object key
         """
         key = f"{self._get_processed_prefix()}{safe_filename(stem)}.jsonl"
-        # Convert records to JSONL format (one JSON object per line)
-        jsonl_content = "\n".join(json.dumps(rec, ensure_ascii=False) for rec in records)
-        success = self.minio_client.put_bytes(
+        count = 0
+
+        def _produce(sink) -> None:
+            nonlocal count
+            lines: List[str] = []
+            for rec in records:
+                lines.append(json.dumps(rec, ensure_ascii=False))
+                if len(lines) == JSONL_WRITE_BATCH:
+                    # One object per line, no trailing newline
+                    sink.write((("\n" if count else "") + "\n".join(lines)).encode("utf-8"))
+                    count += len(lines)
+                    lines = []
+            if lines:
+                sink.write((("\n" if count else "") + "\n".join(lines)).encode("utf-8"))
+                count += len(lines)
+
+        info = self.minio_client.put_stream(
             bucket="primedata-clean",
             key=key,
-            data=jsonl_content.encode("utf-8"),
+            produce=_produce,
             content_type="application/x-ndjson",
         )
-        if not success:
+        if info is None:
             raise RuntimeError(f"Failed to store processed JSONL: {key}")
-        self.logger.info(f"Stored processed JSONL: {key} ({len(records)} records)")
+        self.written_objects[("primedata-clean", key)] = info
+        self.log.debug("Stored processed JSONL: {} ({} records)", key, count)
+        return key
+
+    def put_normalized_document(self, stem: str, text: str) -> str:
+        """Store the normalized document buffer the processed records point into.
+
+        Records' char_runs (and char_start/char_end) are offsets into this text.
+
+        Args:
+            stem: File stem
+            text: Normalized document buffer
+
+        Returns:
+            MinIO object key
+        """
+        key = f"{self._get_processed_prefix()}{safe_filename(stem)}.normalized.txt"
+        success = self._put_bytes(
+            bucket="primedata-clean",
+            key=key,
+            data=text.encode("utf-8"),
+            content_type="text/plain",
+        )
+        if not success:
+            raise RuntimeError(f"Failed to store normalized document: {key}")
+        self.log.debug("Stored normalized document: {}", key)
         return key
 
     def put_metrics_json(self, metrics: List[Dict[str, Any]]) -> str:
@@ -149,7 +226,7 @@ class AirdStorageAdapter:
             MinIO object key
         """
         key = f"{self._get_processed_prefix()}metrics.json"
-        success = self.minio_client.put_json(
+        success = self._put_json(
             bucket="primedata-clean",
             key=key,
             obj=metrics,
@@ -175,54 +252,39 @@ class AirdStorageAdapter:
         # If exact minio_key provided (from database), use it directly
         if minio_key:
             bucket = minio_bucket or "primedata-raw"
-            # Use both loguru and std logging for Airflow visibility
-            self.logger.info(f"[get_raw_text] Attempting to fetch from MinIO: bucket={bucket}, key={minio_key}")
-            std_logger.info(f"[get_raw_text] Attempting to fetch from MinIO: bucket={bucket}, key={minio_key}")
+            log = self.log
             try:
-                # Log before calling get_bytes
-                self.logger.info(f"[get_raw_text] Calling minio_client.get_bytes(bucket={bucket}, key={minio_key})")
-                std_logger.info(f"[get_raw_text] Calling minio_client.get_bytes(bucket={bucket}, key={minio_key})")
-                data = self.minio_client.get_bytes(bucket, minio_key)
-                self.logger.info(
-                    f"[get_raw_text] get_bytes() returned: type={type(data)}, value={'None' if data is None else f'{len(data)} bytes'}"
-                )
-                std_logger.info(
-                    f"[get_raw_text] get_bytes() returned: type={type(data)}, value={'None' if data is None else f'{len(data)} bytes'}"
-                )
-
+                with trace_span("download") as span:
+                    data = self.minio_client.get_bytes(bucket, minio_key)
+                    span.add(bytes=len(data) if data else 0)
                 if data is None:
-                    error_msg = f"[get_raw_text] Failed to retrieve file from MinIO: bucket={bucket}, key={minio_key} - file does not exist or access denied"
-                    self.logger.error(error_msg)
-                    std_logger.error(error_msg)
+                    log.error(
+                        "[get_raw_text] Failed to retrieve file from MinIO: bucket={}, key={} - file does not exist or access denied",
+                        bucket,
+                        minio_key,
+                    )
                     return None
-
-                success_msg = f"[get_raw_text] Successfully retrieved {len(data)} bytes from MinIO: {minio_key}"
-                self.logger.info(success_msg)
-                std_logger.info(success_msg)
+                log.debug("[get_raw_text] Retrieved {} bytes from MinIO: bucket={}, key={}", len(data), bucket, minio_key)
 
                 # Try to decode as text first
                 try:
-                    decoded_text = data.decode("utf-8")
-                    decode_success_msg = f"[get_raw_text] Successfully decoded as UTF-8 text ({len(decoded_text)} characters)"
-                    self.logger.info(decode_success_msg)
-                    std_logger.info(decode_success_msg)
-                    return decoded_text
-                except UnicodeDecodeError as e:
-                    self.logger.info(f"[get_raw_text] File is not UTF-8 text (binary detected). Attempting PDF extraction...")
+                    return data.decode("utf-8")
+                except UnicodeDecodeError:
                     # Binary file detected - try PDF extraction
                     if minio_key.lower().endswith(".pdf"):
                         try:
-                            # Use both loguru and std logging for Airflow visibility
-                            log_msg = (
-                                f"[get_raw_text] Attempting to extract text from PDF: {minio_key} (size: {len(data)} bytes)"
+                            log.debug(
+                                "[get_raw_text] Attempting to extract text from PDF: {} (size: {} bytes)", minio_key, len(data)
                             )
-                            self.logger.info(log_msg)
-                            std_logger.info(log_msg)
-                            extracted_text = self._extract_pdf_text(data)
+                            with trace_span("pdf_extract") as span:
+                                extracted_text = self._extract_pdf_text(data)
+                                span.add(bytes=len(data), records=extracted_text.count("=== PAGE") if extracted_text else 0)
                             if extracted_text and extracted_text.strip():
-                                success_msg = f"[get_raw_text] Successfully extracted {len(extracted_text)} characters from PDF: {minio_key}"
-                                self.logger.info(success_msg)
-                                std_logger.info(success_msg)
+                                log.debug(
+                                    "[get_raw_text] Successfully extracted {} characters from PDF: {}",
+                                    len(extracted_text),
+                                    minio_key,
+                                )
 
                                 # Heuristic: if text is suspiciously small, likely scanned → placeholder for OCR
                                 actual_content = extracted_text.replace("=== PAGE", "").replace("===", "").strip()
@@ -230,47 +292,48 @@ class AirdStorageAdapter:
                                 page_count = extracted_text.count("=== PAGE") or 1
                                 chars_per_page = actual_len / page_count if page_count else actual_len
                                 if actual_len < 500 or chars_per_page < 50:
-                                    warn_msg = (
-                                        f"[get_raw_text] Low-text PDF detected ({actual_len} chars, "
-                                        f"{chars_per_page:.1f} chars/page). Likely scanned/image-only; "
-                                        f"OCR is recommended. No OCR fallback is configured here."
+                                    log.sampled(
+                                        "low_text_pdf",
+                                        "WARNING",
+                                        "[get_raw_text] Low-text PDF detected ({} chars, {:.1f} chars/page): {}. "
+                                        "Likely scanned/image-only; OCR is recommended. No OCR fallback is configured here.",
+                                        actual_len,
+                                        chars_per_page,
+                                        minio_key,
                                     )
-                                    self.logger.warning(warn_msg)
-                                    std_logger.warning(warn_msg)
                                     # If/when OCR is added, invoke it here and return OCR text on success.
 
                                 return extracted_text
                             else:
-                                warn_msg = f"[get_raw_text] PDF extraction returned empty text for {minio_key} - PDF may be image-based, encrypted, or corrupted"
-                                self.logger.warning(warn_msg)
-                                std_logger.warning(warn_msg)
+                                log.sampled(
+                                    "empty_pdf_text",
+                                    "WARNING",
+                                    "[get_raw_text] PDF extraction returned empty text for {} - PDF may be image-based, encrypted, or corrupted",
+                                    minio_key,
+                                )
                                 return None
                         except Exception as e:
-                            error_msg = (
-                                f"[get_raw_text] Exception during PDF extraction for {minio_key}: {type(e).__name__}: {str(e)}"
+                            log.exception(
+                                "[get_raw_text] Exception during PDF extraction for {}: {}: {}", minio_key, type(e).__name__, e
                             )
-                            self.logger.error(error_msg, exc_info=True)
-                            std_logger.error(error_msg, exc_info=True)
-                            import traceback
-
-                            tb = traceback.format_exc()
-                            self.logger.error(f"[get_raw_text] PDF extraction traceback:\n{tb}")
-                            std_logger.error(f"[get_raw_text] PDF extraction traceback:\n{tb}")
                             return None
                     else:
-                        warn_msg = f"[get_raw_text] Failed to decode file {minio_key} as UTF-8 and it's not a PDF file (extension: {minio_key.split('.')[-1] if '.' in minio_key else 'none'})"
-                        self.logger.warning(warn_msg)
-                        std_logger.warning(warn_msg)
+                        log.sampled(
+                            "undecodable_file",
+                            "WARNING",
+                            "[get_raw_text] Failed to decode file {} as UTF-8 and it's not a PDF file (extension: {})",
+                            minio_key,
+                            minio_key.split(".")[-1] if "." in minio_key else "none",
+                        )
                         return None
             except Exception as e:
-                error_msg = f"[get_raw_text] Unexpected exception while fetching from MinIO (bucket={bucket}, key={minio_key}): {type(e).__name__}: {str(e)}"
-                self.logger.error(error_msg, exc_info=True)
-                std_logger.error(error_msg, exc_info=True)
-                import traceback
-
-                tb = traceback.format_exc()
-                self.logger.error(f"[get_raw_text] MinIO fetch traceback:\n{tb}")
-                std_logger.error(f"[get_raw_text] MinIO fetch traceback:\n{tb}")
+                log.exception(
+                    "[get_raw_text] Unexpected exception while fetching from MinIO (bucket={}, key={}): {}: {}",
+                    bucket,
+                    minio_key,
+                    type(e).__name__,
+                    e,
+                )
                 return None
 
         # Fallback: Try to construct path with .txt extension (original behavior)
@@ -291,30 +354,20 @@ class AirdStorageAdapter:
         """
         from io import BytesIO
 
-        self.logger.info(f"[_extract_pdf_text] Starting PDF text extraction for {len(pdf_data)} bytes")
+        log = self.log
+        log.debug("[_extract_pdf_text] Starting PDF text extraction for {} bytes", len(pdf_data))
 
         try:
             # Try pypdf (modern, actively maintained)
             try:
                 from pypdf import PdfReader
 
-                self.logger.info(f"[_extract_pdf_text] Using pypdf library for extraction")
-
                 pdf_file = BytesIO(pdf_data)
-                self.logger.info(f"[_extract_pdf_text] Created BytesIO object, attempting to read PDF...")
-
                 try:
                     reader = PdfReader(pdf_file)
-                    self.logger.info(
-                        f"[_extract_pdf_text] PdfReader created successfully. Number of pages: {len(reader.pages)}"
-                    )
+                    log.debug("[_extract_pdf_text] PdfReader created (pypdf). Number of pages: {}", len(reader.pages))
                 except Exception as e:
-                    self.logger.error(
-                        f"[_extract_pdf_text] Failed to create PdfReader: {type(e).__name__}: {str(e)}", exc_info=True
-                    )
-                    import traceback
-
-                    self.logger.error(f"[_extract_pdf_text] PdfReader creation traceback:\n{traceback.format_exc()}")
+                    log.exception("[_extract_pdf_text] Failed to create PdfReader: {}: {}", type(e).__name__, e)
                     raise
 
                 text_parts = []
@@ -325,35 +378,40 @@ class AirdStorageAdapter:
                         # Format: "=== PAGE N ===" to match page_fences pattern
                         page_marker = f"\n=== PAGE {i+1} ===\n"
                         text_parts.append(page_marker + page_text)
-                        self.logger.debug(f"[_extract_pdf_text] Extracted {len(page_text)} characters from page {i+1}")
+                        log.debug("[_extract_pdf_text] Extracted {} characters from page {}", len(page_text), i + 1)
                     except Exception as e:
-                        self.logger.warning(
-                            f"[_extract_pdf_text] Failed to extract text from page {i+1}: {type(e).__name__}: {str(e)}"
+                        log.sampled(
+                            "pdf_page_extraction_failed",
+                            "WARNING",
+                            "[_extract_pdf_text] Failed to extract text from page {}: {}: {}",
+                            i + 1,
+                            type(e).__name__,
+                            e,
                         )
                         # Still add page marker even for empty pages
                         page_marker = f"\n=== PAGE {i+1} ===\n"
                         text_parts.append(page_marker)
 
                 extracted_text = "\n".join(text_parts)
-                total_msg = f"[_extract_pdf_text] Total extracted text length: {len(extracted_text)} characters"
-                self.logger.info(total_msg)
-                std_logger.info(total_msg)
-
                 if not extracted_text.strip():
-                    warn_msg = "[_extract_pdf_text] PDF extraction returned empty text - PDF may be image-based, encrypted, or contain no text content"
-                    self.logger.warning(warn_msg)
-                    std_logger.warning(warn_msg)
+                    log.sampled(
+                        "empty_pdf_text",
+                        "WARNING",
+                        "[_extract_pdf_text] PDF extraction returned empty text - PDF may be image-based, encrypted, "
+                        "or contain no text content",
+                    )
                 else:
-                    # Show preview of extracted text (skip page markers in preview)
-                    preview_text = extracted_text[:200].replace("=== PAGE", "[PAGE").replace("===\n", "]")
                     # Count total pages extracted
                     page_count = extracted_text.count("=== PAGE")
-                    success_msg = (
-                        f"[_extract_pdf_text] Successfully extracted text ({page_count} pages, "
-                        f"{len(extracted_text)} chars). Preview: {preview_text}..."
-                    )
-                    self.logger.info(success_msg)
-                    std_logger.info(success_msg)
+                    if log.enabled("DEBUG"):
+                        # Show preview of extracted text (skip page markers in preview)
+                        preview_text = extracted_text[:200].replace("=== PAGE", "[PAGE").replace("===\n", "]")
+                        log.debug(
+                            "[_extract_pdf_text] Successfully extracted text ({} pages, {} chars). Preview: {}...",
+                            page_count,
+                            len(extracted_text),
+                            preview_text,
+                        )
 
                     # Heuristic: detect likely scanned/image-only PDFs (large file, tiny text)
                     pdf_size_mb = len(pdf_data) / (1024 * 1024)
@@ -363,13 +421,15 @@ class AirdStorageAdapter:
                     chars_per_page = actual_content_length / pages if pages else actual_content_length
 
                     if (pdf_size_mb > 1.0 and actual_content_length < 1000) or chars_per_page < 50:
-                        warn_msg = (
-                            f"[_extract_pdf_text] ⚠️ PDF is {pdf_size_mb:.2f} MB but has very little text "
-                            f"({actual_content_length} chars, {chars_per_page:.1f} chars/page). "
-                            f"Likely scanned/image-only; OCR is recommended."
+                        log.sampled(
+                            "scanned_pdf",
+                            "WARNING",
+                            "[_extract_pdf_text] ⚠️ PDF is {:.2f} MB but has very little text "
+                            "({} chars, {:.1f} chars/page). Likely scanned/image-only; OCR is recommended.",
+                            pdf_size_mb,
+                            actual_content_length,
+                            chars_per_page,
                         )
-                        self.logger.warning(warn_msg)
-                        std_logger.warning(warn_msg)
 
                 return extracted_text
             except ImportError:
@@ -386,13 +446,17 @@ class AirdStorageAdapter:
 
                     extracted_text = "\n\n".join(text_parts)
                     if not extracted_text.strip():
-                        self.logger.warning("PDF extraction returned empty text - PDF may be image-based or encrypted")
+                        self.log.sampled(
+                            "empty_pdf_text",
+                            "WARNING",
+                            "PDF extraction returned empty text - PDF may be image-based or encrypted",
+                        )
                     return extracted_text
                 except ImportError:
-                    self.logger.error("pypdf/PyPDF2 not installed, cannot extract PDF text")
+                    self.log.error("pypdf/PyPDF2 not installed, cannot extract PDF text")
                     raise ImportError("PDF parsing library (pypdf or PyPDF2) is required for PDF files")
         except Exception as e:
-            self.logger.error(f"Error extracting PDF text: {e}", exc_info=True)
+            self.log.error("Error extracting PDF text: {}", e, exc_info=True)
             raise
 
     def get_manifest(self, stem: str) -> Optional[Dict[str, Any]]:
@@ -429,6 +493,19 @@ class AirdStorageAdapter:
                 records.append(json.loads(line))
         return records
 
+    def get_normalized_document(self, stem: str) -> Optional[str]:
+        """Retrieve the normalized document buffer.
+
+        Args:
+            stem: File stem
+
+        Returns:
+            Normalized document text, or None if not found
+        """
+        key = f"{self._get_processed_prefix()}{safe_filename(stem)}.normalized.txt"
+        data = self.minio_client.get_bytes("primedata-clean", key)
+        return data.decode("utf-8") if data is not None else None
+
     def get_metrics_json(self) -> Optional[List[Dict[str, Any]]]:
         """Retrieve metrics JSON.
 
@@ -465,7 +542,7 @@ class AirdStorageAdapter:
         else:
             data = content
 
-        success = self.minio_client.put_bytes(
+        success = self._put_bytes(
             bucket="primedata-exports",
             key=key,
             data=data,
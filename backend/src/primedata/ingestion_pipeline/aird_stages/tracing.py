@@ -0,0 +1,280 @@
+"""
+Lightweight tracing for AIRD pipeline stages.
+
+StageTracer records nested spans (fetch, pdf_extract, normalize, section, chunk,
+embed_batch, qdrant_upsert, ...) and aggregates them per span path into a profile:
+count, total and max duration, byte and record counts, and peak RSS. The profile
+is attached to the StageResult and persisted into PipelineRun metrics by the
+StageTracker.
+
+Spans can optionally be exported to a local OpenTelemetry collector over OTLP/HTTP
+(PRIMEDATA_PIPELINE_OTLP_ENDPOINT, e.g. http://localhost:4318/v1/traces) when the
+opentelemetry SDK is installed.
+"""
+
+import os
+import sys
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+
+try:
+    import resource
+
+    HAS_RESOURCE = True
+except ImportError:  # Windows
+    HAS_RESOURCE = False
+
+try:
+    from opentelemetry import trace as otel_trace
+    from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor
+
+    HAS_OTEL = True
+except ImportError:
+    HAS_OTEL = False
+
+# Tracer of the stage running in this context (set while one of its spans is open)
+_current_tracer: ContextVar[Optional["StageTracer"]] = ContextVar("aird_stage_tracer", default=None)
+
+_otel_tracer: Any = None
+_otel_initialized = False
+
+
+def tracing_enabled() -> bool:
+    """Whether stage tracing is on (PRIMEDATA_PIPELINE_TRACE, default on)."""
+    return os.getenv("PRIMEDATA_PIPELINE_TRACE", "1").strip().lower() not in ("0", "false", "no", "off")
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process in MiB (None where unavailable)."""
+    if not HAS_RESOURCE:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in KiB elsewhere
+    return round(peak / (2**20 if sys.platform == "darwin" else 2**10), 1)
+
+
+def _get_otel_tracer() -> Any:
+    """OpenTelemetry tracer exporting to PRIMEDATA_PIPELINE_OTLP_ENDPOINT, or None."""
+    global _otel_tracer, _otel_initialized
+    if _otel_initialized:
+        return _otel_tracer
+    _otel_initialized = True
+    endpoint = os.getenv("PRIMEDATA_PIPELINE_OTLP_ENDPOINT")
+    if not endpoint:
+        return None
+    if not HAS_OTEL:
+        logger.warning("PRIMEDATA_PIPELINE_OTLP_ENDPOINT is set but opentelemetry-sdk is not installed, OTLP export disabled")
+        return None
+    try:
+        provider = TracerProvider(resource=Resource.create({"service.name": "primedata-pipeline"}))
+        provider.add_span_processor(BatchSpanProcessor(OTLPSpanExporter(endpoint=endpoint)))
+        _otel_tracer = provider.get_tracer("primedata.ingestion_pipeline")
+        logger.info(f"Exporting pipeline spans over OTLP to {endpoint}")
+    except Exception as e:
+        logger.warning(f"Could not set up OTLP span export ({e}), continuing without it")
+    return _otel_tracer
+
+
+class Span:
+    """An open span; use as a context manager or call end()."""
+
+    __slots__ = ("tracer", "name", "path", "start", "bytes", "records", "attributes", "ended", "_otel_span")
+
+    def __init__(self, tracer: "StageTracer", name: str, path: str, attributes: Dict[str, Any]):
+        self.tracer = tracer
+        self.name = name
+        self.path = path
+        self.start = time.perf_counter()
+        self.bytes = 0
+        self.records = 0
+        self.attributes = attributes
+        self.ended = False
+        self._otel_span = None
+
+    def add(self, bytes: int = 0, records: int = 0) -> None:
+        """Add to the byte and record counts of the span."""
+        self.bytes += bytes
+        self.records += records
+
+    def end(self) -> None:
+        """End the span (and any child span still open); ending twice is a no-op."""
+        self.tracer._end(self)
+
+    def __enter__(self) -> "Span":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None:
+            self.attributes["error"] = exc_type.__name__
+        self.end()
+
+
+class _NoopSpan:
+    """Span returned when no tracer is active or tracing is disabled."""
+
+    __slots__ = ()
+
+    def add(self, bytes: int = 0, records: int = 0) -> None:
+        pass
+
+    def end(self) -> None:
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class StageTracer:
+    """Records nested spans of one stage and aggregates them per span path.
+
+    Example:
+        with self.tracer.span("fetch") as span:
+            text = storage.get_raw_text(file_stem)
+            span.add(bytes=len(text))
+
+    Code below the stage (storage adapter, scorers) uses trace_span(), which nests
+    under the span that is open in the current context.
+    """
+
+    def __init__(self, stage_name: str, enabled: Optional[bool] = None):
+        """
+        Args:
+            stage_name: Stage name (root of exported span names)
+            enabled: Record spans (defaults to tracing_enabled())
+        """
+        self.stage_name = stage_name
+        self.enabled = tracing_enabled() if enabled is None else enabled
+        self._stack: List[Span] = []
+        self._spans: Dict[str, Dict[str, Any]] = {}
+        self._context_token = None
+
+    def span(self, name: str, **attributes: Any) -> Any:
+        """Start a span nested under the innermost open span."""
+        if not self.enabled:
+            return NOOP_SPAN
+        parent = self._stack[-1] if self._stack else None
+        span = Span(self, name, f"{parent.path}/{name}" if parent else name, attributes)
+        otel_tracer = _get_otel_tracer()
+        if otel_tracer is not None:
+            parent_span = parent._otel_span if parent is not None else None
+            context = otel_trace.set_span_in_context(parent_span) if parent_span is not None else None
+            span._otel_span = otel_tracer.start_span(f"{self.stage_name}.{name}", context=context)
+        if not self._stack:
+            self._context_token = _current_tracer.set(self)
+        self._stack.append(span)
+        return span
+
+    def record(self, name: str, duration_s: float, bytes: int = 0, records: int = 0, count: int = 1) -> None:
+        """Add pre-measured time under the innermost open span (for loops too tight for a span each)."""
+        if not self.enabled:
+            return
+        path = f"{self._stack[-1].path}/{name}" if self._stack else name
+        self._aggregate(path, duration_s, bytes, records, count)
+
+    def profile(self) -> Dict[str, Any]:
+        """Aggregated spans so far: {"peak_rss_mb": ..., "spans": {path: stats}}."""
+        return {
+            "peak_rss_mb": peak_rss_mb(),
+            "spans": {path: dict(stats) for path, stats in self._spans.items()},
+        }
+
+    def collect(self) -> Optional[Dict[str, Any]]:
+        """Profile of the spans recorded so far, resetting the tracer (None when disabled)."""
+        if not self.enabled:
+            return None
+        while self._stack:
+            self._stack[-1].end()
+        profile = self.profile()
+        self._spans = {}
+        return profile
+
+    def _end(self, span: Span) -> None:
+        if span.ended:
+            return
+        # Children left open (e.g. by an early return) end with their parent
+        while self._stack and self._stack[-1] is not span:
+            self._stack[-1].end()
+        span.ended = True
+        duration = time.perf_counter() - span.start
+        if self._stack:
+            self._stack.pop()
+        if not self._stack and self._context_token is not None:
+            try:
+                _current_tracer.reset(self._context_token)
+            except ValueError:  # Ended from another context than it was started in
+                _current_tracer.set(None)
+            self._context_token = None
+        self._aggregate(span.path, duration, span.bytes, span.records, 1)
+        if span._otel_span is not None:
+            span._otel_span.set_attributes(
+                {"bytes": span.bytes, "records": span.records, **{k: str(v) for k, v in span.attributes.items()}}
+            )
+            span._otel_span.end()
+
+    def _aggregate(self, path: str, duration: float, bytes: int, records: int, count: int) -> None:
+        stats = self._spans.get(path)
+        if stats is None:
+            stats = self._spans[path] = {"count": 0, "total_s": 0.0, "max_s": 0.0, "bytes": 0, "records": 0}
+        stats["count"] += count
+        stats["total_s"] += duration
+        if duration / max(count, 1) > stats["max_s"]:
+            stats["max_s"] = duration / max(count, 1)
+        stats["bytes"] += bytes
+        stats["records"] += records
+
+
+def current_tracer() -> Optional[StageTracer]:
+    """Tracer of the stage running in this context, if any."""
+    return _current_tracer.get()
+
+
+def trace_span(name: str, **attributes: Any) -> Any:
+    """Span under the stage span open in this context (no-op outside a traced stage)."""
+    tracer = _current_tracer.get()
+    if tracer is None:
+        return NOOP_SPAN
+    return tracer.span(name, **attributes)
+
+
+def merge_profiles(target: Dict[str, Any], profile: Dict[str, Any]) -> Dict[str, Any]:
+    """Merge the spans of ``profile`` into ``target`` (counts and totals add up, maxima are kept).
+
+    Args:
+        target: Profile to update in place ({"peak_rss_mb": ..., "spans": {...}})
+        profile: Profile to merge in
+
+    Returns:
+        The updated target
+    """
+    spans = target.setdefault("spans", {})
+    for path, stats in (profile.get("spans") or {}).items():
+        existing = spans.get(path)
+        if existing is None:
+            spans[path] = dict(stats)
+            continue
+        for key in ("count", "total_s", "bytes", "records"):
+            existing[key] = existing.get(key, 0) + stats.get(key, 0)
+        existing["max_s"] = max(existing.get("max_s", 0.0), stats.get("max_s", 0.0))
+    peaks = [value for value in (target.get("peak_rss_mb"), profile.get("peak_rss_mb")) if value is not None]
+    target["peak_rss_mb"] = max(peaks) if peaks else None
+    return target
+
+
+def round_profile(profile: Dict[str, Any]) -> Dict[str, Any]:
+    """Profile with durations rounded to milliseconds, for storing in metrics."""
+    spans = {}
+    for path, stats in (profile.get("spans") or {}).items():
+        spans[path] = {**stats, "total_s": round(stats["total_s"], 3), "max_s": round(stats["max_s"], 3)}
+    return {**profile, "spans": spans}
@@ -13,6 +13,8 @@ from primedata.db.models import PipelineRun
 from sqlalchemy.orm import Session
 
 from .base import StageResult, StageStatus
+from .stage_metrics import export_stage_metrics
+from .tracing import merge_profiles, round_profile
 
 
 class StageTracker:
@@ -39,9 +41,7 @@ class StageTracker:
         Args:
             result: StageResult from stage execution
         """
-        from primedata.services.s3_content_storage import get_pipeline_run_metrics_path
         from primedata.services.s3_json_storage import save_json_to_s3
-        from primedata.storage.minio_client import MinIOClient
         
         # Load current metrics from S3 or DB
         from primedata.services.lazy_json_loader import load_pipeline_run_metrics
@@ -54,9 +54,13 @@ class StageTracker:
         if "aird_stages" not in metrics:
             metrics["aird_stages"] = {}
 
-        # Store stage result
+        # Store stage result (its tracing profile goes into the run profile)
         stage_data = result.to_dict()
+        profile = stage_data.pop("profile", None)
         metrics["aird_stages"][result.stage_name] = stage_data
+        if profile:
+            metrics.setdefault("profile", {}).setdefault("stages", {})[result.stage_name] = profile
+            self._update_run_profile(metrics)
 
         # Update aird_stages_completed list
         if "aird_stages_completed" not in metrics:
@@ -70,7 +74,52 @@ class StageTracker:
             if result.stage_name in metrics["aird_stages_completed"]:
                 metrics["aird_stages_completed"].remove(result.stage_name)
 
-        # Save metrics to S3
+        self._save_metrics(metrics)
+
+        # Update overall pipeline run status based on stage results
+        self._update_pipeline_status()
+
+        # Commit changes
+        self.db.commit()
+
+        # Last-run gauges for the textfile collector / pushgateway (if configured)
+        export_stage_metrics(result)
+
+        self.logger.info(
+            f"Recorded stage result: {result.stage_name} = {result.status.value}",
+            metrics=result.metrics,
+        )
+
+    def record_stage_profile(self, stage_name: str, profile: Dict[str, Any]) -> None:
+        """Merge spans measured outside a stage (e.g. artifact registration) into its profile.
+
+        Args:
+            stage_name: Name of the stage
+            profile: Profile from a StageTracer ({"peak_rss_mb": ..., "spans": {...}})
+        """
+        from primedata.services.lazy_json_loader import load_pipeline_run_metrics
+
+        metrics = load_pipeline_run_metrics(self.pipeline_run) or {}
+        stages = metrics.setdefault("profile", {}).setdefault("stages", {})
+        merge_profiles(stages.setdefault(stage_name, {}), round_profile(profile))
+        self._update_run_profile(metrics)
+        self._save_metrics(metrics)
+        self.db.commit()
+
+    @staticmethod
+    def _update_run_profile(metrics: Dict[str, Any]) -> None:
+        """Set the run-level peak RSS and total stage time from the stage profiles."""
+        run_profile = metrics["profile"]
+        stages = run_profile.get("stages", {})
+        peaks = [stage.get("peak_rss_mb") for stage in stages.values() if stage.get("peak_rss_mb") is not None]
+        run_profile["peak_rss_mb"] = max(peaks) if peaks else None
+        run_profile["duration_s"] = round(sum(stage.get("duration_s") or 0.0 for stage in stages.values()), 3)
+
+    def _save_metrics(self, metrics: Dict[str, Any]) -> None:
+        """Save the full metrics to S3, keeping a small summary in the DB."""
+        from primedata.services.s3_content_storage import get_pipeline_run_metrics_path
+        from primedata.storage.minio_client import get_storage_client
+
         if not self.pipeline_run.metrics_path:
             self.pipeline_run.metrics_path = get_pipeline_run_metrics_path(
                 self.pipeline_run.workspace_id,
@@ -79,7 +128,7 @@ class StageTracker:
                 self.pipeline_run.id,
             )
         
-        minio_client = MinIOClient()
+        minio_client = get_storage_client()
         if minio_client.put_json("primedata-exports", self.pipeline_run.metrics_path, metrics):
             # Store small summary in DB
             self.pipeline_run.metrics = {
@@ -91,17 +140,6 @@ class StageTracker:
             # Fallback: store in DB (shouldn't happen but be safe)
             self.pipeline_run.metrics = metrics
 
-        # Update overall pipeline run status based on stage results
-        self._update_pipeline_status()
-
-        # Commit changes
-        self.db.commit()
-
-        self.logger.info(
-            f"Recorded stage result: {result.stage_name} = {result.status.value}",
-            metrics=result.metrics,
-        )
-
     def _update_pipeline_status(self) -> None:
         """Update pipeline run status based on stage results."""
         from primedata.services.lazy_json_loader import load_pipeline_run_metrics
@@ -169,3 +207,25 @@ def track_stage_execution(
 
     tracker = StageTracker(db, pipeline_run)
     tracker.record_stage_result(result)
+
+
+def track_stage_profile(
+    db: Session,
+    pipeline_run_id: UUID,
+    stage_name: str,
+    profile: Dict[str, Any],
+) -> None:
+    """Convenience function to merge extra spans into a stage's profile.
+
+    Args:
+        db: Database session
+        pipeline_run_id: Pipeline run UUID
+        stage_name: Name of the stage
+        profile: Profile from a StageTracer
+    """
+    pipeline_run = db.query(PipelineRun).filter(PipelineRun.id == pipeline_run_id).first()
+    if not pipeline_run:
+        logger.error(f"Pipeline run {pipeline_run_id} not found")
+        return
+
+    StageTracker(db, pipeline_run).record_stage_profile(stage_name, profile)
@@ -2,14 +2,97 @@
 Chunking utilities for AIRD preprocessing.
 
 Ports sentence and character-based chunking from AIRD.
+
+The *_spans chunkers work on a region of a source text (e.g. one section of the
+normalized document buffer) and return Chunk spans over it; chunk text is only
+built when asked for. char_chunk/sentence_chunk/paragraph_chunk return the
+chunk texts of a whole string.
 """
 
-from typing import List
+import bisect
+from itertools import accumulate
+from typing import Any, List, NamedTuple, Optional, Sequence, Tuple
 
 import regex as re
 
 # Sentence splitting regex
 SENT_SPLIT_RE = re.compile(r"(?<!\b[A-Z])[.!?。۔؟]+(?=\s+[A-Z0-9\"'])")
+# Paragraph break regex (blank line)
+PARA_SPLIT_RE = re.compile(r"\n\s*\n+")
+
+# A piece of a chunk: (start, end, text). start/end is its span in the source text; text is
+# None when the piece is exactly source[start:end], otherwise the piece text (words or lines
+# of the span re-joined, or a chunk of such a text).
+Piece = Tuple[int, int, Optional[str]]
+# A run of chunk text copied from the source: (start, end, prefix). The chunk text is the
+# concatenation of prefix + source[start:end] over its runs (see text_from_runs).
+Run = Tuple[int, int, str]
+
+WORD_RE = re.compile(r"\S+")
+
+
+class Chunk(NamedTuple):
+    """A chunk as a span over its source text, with the text built on demand."""
+
+    start: int
+    end: int
+    pieces: Tuple[Piece, ...]
+    separator: str = " "
+
+    def text(self, source: str) -> str:
+        """Chunk text (identical to what the string chunkers return)."""
+        if len(self.pieces) == 1:
+            return _piece_text(source, self.pieces[0])
+        return self.separator.join(_piece_text(source, piece) for piece in self.pieces)
+
+    def runs(self, source: str) -> List[Run]:
+        """Exact provenance of the chunk text: text_from_runs(source, runs) == text(source)."""
+        runs: List[Run] = []
+        for i, piece in enumerate(self.pieces):
+            _piece_runs(source, piece, self.separator if i else "", runs)
+        return runs
+
+
+def _piece_text(source: str, piece: Piece) -> str:
+    start, end, text = piece
+    return source[start:end] if text is None else text
+
+
+def _piece_runs(source: str, piece: Piece, prefix: str, runs: List[Run]) -> None:
+    """Append the runs of a piece to runs; prefix is the text joining it to the previous piece."""
+    start, end, text = piece
+    if text is None:
+        runs.append((start, end, prefix))
+        return
+    # The words of a re-joined piece are copied from the source in order: locate each one
+    # and extend the previous run while the whitespace between them matches the source
+    pos, text_pos, first = start, 0, len(runs)
+    for match in WORD_RE.finditer(text):
+        gap = prefix + text[text_pos : match.start()]
+        word_start = source.find(match.group(), pos)
+        if word_start == -1:
+            # Not a source word (never expected): keep it verbatim in the next prefix
+            prefix = gap + match.group()
+        else:
+            word_end = word_start + len(match.group())
+            if len(runs) > first and gap == source[runs[-1][1] : word_start]:
+                runs[-1] = (runs[-1][0], word_end, runs[-1][2])
+            else:
+                runs.append((word_start, word_end, gap))
+            prefix, pos = "", word_end
+        text_pos = match.end()
+    gap = prefix + text[text_pos:]
+    if gap:
+        runs.append((pos, pos, gap))
+
+
+def text_from_runs(source: str, runs: Sequence[Sequence[Any]]) -> str:
+    """Chunk text from its runs (as returned by Chunk.runs, or their JSON lists)."""
+    return "".join(prefix + source[start:end] for start, end, prefix in runs)
+
+
+def _text_chunk(start: int, end: int, text: Optional[str]) -> Chunk:
+    return Chunk(start, end, ((start, end, text),))
 
 
 def tokens_estimate(s: str) -> int:
@@ -17,125 +100,344 @@ def tokens_estimate(s: str) -> int:
     return max(len(s) // 4, len(s.split()))
 
 
+def _strip_span(text: str, start: int, end: int) -> Tuple[int, int]:
+    """Span of text[start:end].strip() without slicing."""
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return start, end
+
+
+def _segment_spans(text: str, separator: Any, start: int, end: int) -> List[Tuple[int, int]]:
+    """Spans of [s.strip() for s in separator.split(text[start:end]) if s.strip()], without copying."""
+    spans, pos = [], start
+    for match in separator.finditer(text, start, end):
+        span = _strip_span(text, pos, match.start())
+        if span[0] < span[1]:
+            spans.append(span)
+        pos = match.end()
+    span = _strip_span(text, pos, end)
+    if span[0] < span[1]:
+        spans.append(span)
+    return spans
+
+
+class _WordLocator:
+    """
+    Source spans of the words of pieces, by word index.
+
+    Words of a piece separated by single whitespace characters (the common case) are
+    located from prefix sums of their lengths; other pieces fall back to finding each word.
+    """
+
+    def __init__(self, source: str, pieces: Sequence[Piece]):
+        self.firsts: List[int] = []  # Index of the first word of each piece
+        self.piece_starts: List[int] = []
+        # (prefix sums of word lengths, word starts if not single-spaced) per piece
+        self.layouts: List[Tuple[List[int], Optional[List[int]]]] = []
+        count = 0
+        for start, end, _ in pieces:
+            words = source[start:end].split()
+            prefix = list(accumulate(map(len, words), initial=0))
+            starts = None
+            if prefix[-1] + len(words) - 1 != end - start:
+                starts, pos = [], start
+                for word in words:
+                    # Only whitespace separates pos from the word, so this is the word itself
+                    pos = source.find(word, pos)
+                    starts.append(pos)
+                    pos += len(word)
+            self.firsts.append(count)
+            self.piece_starts.append(start)
+            self.layouts.append((prefix, starts))
+            count += len(words)
+
+    def start(self, word: int) -> int:
+        piece = bisect.bisect_right(self.firsts, word) - 1
+        prefix, starts = self.layouts[piece]
+        k = word - self.firsts[piece]
+        return starts[k] if starts is not None else self.piece_starts[piece] + prefix[k] + k
+
+    def end(self, word: int) -> int:
+        piece = bisect.bisect_right(self.firsts, word) - 1
+        prefix, _ = self.layouts[piece]
+        k = word - self.firsts[piece]
+        return self.start(word) + prefix[k + 1] - prefix[k]
+
+    def index(self, pos: int) -> int:
+        """Index of the word containing pos (pos must not be whitespace)."""
+        piece = bisect.bisect_right(self.piece_starts, pos) - 1
+        prefix, starts = self.layouts[piece]
+        if starts is None:
+            offset = pos - self.piece_starts[piece]
+            k = bisect.bisect_right(range(len(prefix) - 1), offset, key=lambda i: prefix[i] + i) - 1
+        else:
+            k = bisect.bisect_right(starts, pos) - 1
+        return self.firsts[piece] + k
+
+
+def _remap_chunks(chunks: List[Chunk], local_text: str, source: str, pieces: Sequence[Piece]) -> List[Chunk]:
+    """
+    Map chunks of a materialized text back to the source.
+
+    local_text has the same words as the pieces, and chunks start and end inside words,
+    so offsets are mapped through the word they fall in.
+    """
+    local = _WordLocator(local_text, ((0, len(local_text), None),))
+    words = _WordLocator(source, pieces)
+
+    def to_source(pos: int) -> int:
+        word = local.index(pos)
+        return words.start(word) + pos - local.start(word)
+
+    return [_text_chunk(to_source(c.start), to_source(c.end - 1) + 1, c.text(local_text)) for c in chunks]
+
+
+class _ChunkBuffer:
+    """
+    Pieces of the chunk being built with running char and word counts.
+
+    tokens_estimate of the joined pieces follows from the counts (pieces are stripped
+    and the separator is whitespace, so words add up), so candidates are never joined.
+    """
+
+    def __init__(self, separator: str):
+        self.separator = separator
+        self.pieces: List[Tuple[Piece, int, int]] = []  # (piece, chars, words)
+        self.chars = 0
+        self.words = 0
+
+    def __bool__(self) -> bool:
+        return bool(self.pieces)
+
+    def tokens_with(self, chars: int, words: int) -> int:
+        """tokens_estimate of the chunk if a piece with these counts was appended."""
+        total_chars = self.chars + chars + (len(self.separator) if self.pieces else 0)
+        return max(total_chars // 4, self.words + words)
+
+    def append(self, piece: Piece, chars: int, words: int) -> None:
+        if self.pieces:
+            self.chars += len(self.separator)
+        self.pieces.append((piece, chars, words))
+        self.chars += chars
+        self.words += words
+
+    def keep_last(self, count: int) -> None:
+        """Keep the last count pieces (overlap into the next chunk)."""
+        kept = self.pieces[-count:] if count > 0 else []
+        self.pieces, self.chars, self.words = [], 0, 0
+        for piece in kept:
+            self.append(*piece)
+
+    def take(self) -> Tuple[Chunk, int]:
+        """The buffered chunk and its token estimate; the buffer is left unchanged."""
+        pieces = tuple(piece for piece, _, _ in self.pieces)
+        return Chunk(pieces[0][0], pieces[-1][1], pieces, self.separator), max(self.chars // 4, self.words)
+
+    def flush(self) -> Tuple[Chunk, int]:
+        chunk = self.take()
+        self.keep_last(0)
+        return chunk
+
+
+def char_chunk_spans(
+    source: str, max_tokens: int, overlap_chars: int, start: int = 0, end: Optional[int] = None
+) -> List[Chunk]:
+    """Character-based chunking with overlap of source[start:end]."""
+    end = len(source) if end is None else end
+    out, max_chars = [], max_tokens * 4
+    pos = start
+    while pos < end:
+        window_end = min(end, pos + max_chars)
+        piece_start, piece_end = _strip_span(source, pos, window_end)
+        if piece_start < piece_end:
+            out.append(_text_chunk(piece_start, piece_end, None))
+        if window_end >= end:
+            break
+        pos = max(window_end - overlap_chars, pos + 1)
+    return out
+
+
 def char_chunk(text: str, max_tokens: int, overlap_chars: int) -> List[str]:
     """Character-based chunking with overlap."""
-    out, start, max_chars = [], 0, max_tokens * 4
-    L = len(text)
-    while start < L:
-        end = min(L, start + max_chars)
-        piece = text[start:end].strip()
-        if piece:
-            out.append(piece)
-        if end >= L:
+    return [chunk.text(text) for chunk in char_chunk_spans(text, max_tokens, overlap_chars)]
+
+
+def _word_ranges(words: List[str], max_chars: int, overlap_chars: int) -> List[Tuple[int, int]]:
+    """[start, end) word index ranges of at most max_chars, each overlapping the previous by up to overlap_chars."""
+    # lengths[k]: length of words[:k] with a space after each word, so a range's length is a difference
+    lengths = [length + k for k, length in enumerate(accumulate(map(len, words), initial=0))]
+    ranges = []
+    first, last = 0, 0  # Start of the current range and its last word added without a length check
+    while True:
+        # First word after last that does not fit into the range any more
+        i = max(last + 1, bisect.bisect_right(lengths, lengths[first] + max_chars) - 1)
+        if i >= len(words):
             break
-        start = max(end - overlap_chars, start + 1)
-    return out
+        ranges.append((first, i))
+        # Start new range with overlap: keep the last words of up to overlap_chars
+        first, last = bisect.bisect_left(lengths, lengths[i] - overlap_chars, first, i), i
+    ranges.append((first, len(words)))
+    return ranges
 
 
-def sentence_chunk(body: str, max_tokens: int, overlap_sents: int, hard_overlap_chars: int) -> List[str]:
+def _split_long_sentence_at_words(text: str, max_tokens: int, overlap_chars: int) -> List[str]:
+    """Split a long sentence at word boundaries to avoid mid-word breaks.
+
+    This is used when a single sentence exceeds max_tokens. It splits at word
+    boundaries (spaces) rather than arbitrary character positions.
+    """
+    words = text.split()
+    if not words:
+        return [text]
+    return [" ".join(words[a:b]) for a, b in _word_ranges(words, max_tokens * 4, overlap_chars)]
+
+
+def _split_words_chunks(
+    source: str, pieces: Sequence[Piece], text: str, max_tokens: int, overlap_chars: int
+) -> List[Chunk]:
+    """_split_long_sentence_at_words of a chunk's text, as chunks over the source."""
+    words = text.split()
+    if not words:
+        return [_text_chunk(pieces[0][0], pieces[-1][1], text)]
+    locator = _WordLocator(source, pieces)
+    return [
+        _text_chunk(locator.start(a), locator.end(b - 1), " ".join(words[a:b]))
+        for a, b in _word_ranges(words, max_tokens * 4, overlap_chars)
+    ]
+
+
+def sentence_chunk_spans(
+    source: str,
+    max_tokens: int,
+    overlap_sents: int,
+    hard_overlap_chars: int,
+    start: int = 0,
+    end: Optional[int] = None,
+) -> List[Chunk]:
     """Sentence-based chunking with overlap, with improved handling of long sentences.
 
     This preserves semantic boundaries better than character-based chunking by respecting
     sentence boundaries and maintaining context within chunks. For sentences that exceed
     max_tokens, it attempts to split at word boundaries rather than mid-sentence.
+
+    Sentences are tracked as spans of source[start:end] with running char/word counts,
+    so chunking is linear in the size of the region.
     """
-    sents = re.split(SENT_SPLIT_RE, body)
-    sents = [s.strip() for s in sents if s and s.strip()]
-    if not sents:
-        return char_chunk(body, max_tokens, hard_overlap_chars)
+    end = len(source) if end is None else end
+    spans = _segment_spans(source, SENT_SPLIT_RE, start, end)
+    if not spans:
+        return char_chunk_spans(source, max_tokens, hard_overlap_chars, start, end)
 
-    chunks, buf = [], []
-    for s in sents:
+    chunks: List[Tuple[Chunk, int]] = []
+    buf = _ChunkBuffer(" ")
+    for sent_start, sent_end in spans:
+        sentence = source[sent_start:sent_end]
+        chars, words = len(sentence), len(sentence.split())
         # Check if single sentence exceeds max_tokens
-        sent_tokens = tokens_estimate(s)
-        if sent_tokens > max_tokens:
+        if max(chars // 4, words) > max_tokens:
             # Flush buffer first if it exists
             if buf:
-                chunks.append(" ".join(buf))
-                buf = []
-            
+                chunks.append(buf.flush())
+
             # For very long sentences, split at word boundaries (not mid-word)
             # This is better than char_chunk which can break mid-word
-            long_sentence_chunks = _split_long_sentence_at_words(s, max_tokens, hard_overlap_chars)
-            chunks.extend(long_sentence_chunks)
+            long_sentence_chunks = _split_words_chunks(
+                source, ((sent_start, sent_end, None),), sentence, max_tokens, hard_overlap_chars
+            )
+            chunks.extend((c, tokens_estimate(c.pieces[0][2])) for c in long_sentence_chunks)
             # For overlap, keep the last chunk
             if long_sentence_chunks and overlap_sents > 0:
-                buf = [long_sentence_chunks[-1]]
-            else:
-                buf = []
+                last = long_sentence_chunks[-1].pieces[0]
+                buf.append(last, len(last[2]), len(last[2].split()))
+        elif buf.tokens_with(chars, words) <= max_tokens:
+            buf.append((sent_start, sent_end, None), chars, words)
         else:
-            cand = " ".join(buf + [s])
-            if tokens_estimate(cand) <= max_tokens:
-                buf.append(s)
-            else:
-                if buf:
-                    chunks.append(" ".join(buf))
-                # Keep last N sentences for overlap (preserve context)
-                buf = buf[-overlap_sents:] if overlap_sents > 0 else []
-                buf.append(s)
-    
+            if buf:
+                chunks.append(buf.take())
+            # Keep last N sentences for overlap (preserve context)
+            buf.keep_last(overlap_sents)
+            buf.append((sent_start, sent_end, None), chars, words)
+
     if buf:
-        chunks.append(" ".join(buf))
+        chunks.append(buf.take())
 
     # Final validation: ensure no chunk exceeds max_tokens
     # If any do, split at word boundaries (not mid-sentence)
-    out: List[str] = []
-    for c in chunks:
-        if tokens_estimate(c) > max_tokens:
-            # Split at word boundaries to avoid mid-sentence breaks
-            out.extend(_split_long_sentence_at_words(c, max_tokens, hard_overlap_chars))
+    out: List[Chunk] = []
+    for chunk, tokens in chunks:
+        if tokens > max_tokens:
+            out.extend(_split_words_chunks(source, chunk.pieces, chunk.text(source), max_tokens, hard_overlap_chars))
         else:
-            out.append(c)
+            out.append(chunk)
     return out
 
 
-def _split_long_sentence_at_words(text: str, max_tokens: int, overlap_chars: int) -> List[str]:
-    """Split a long sentence at word boundaries to avoid mid-word breaks.
-    
-    This is used when a single sentence exceeds max_tokens. It splits at word
-    boundaries (spaces) rather than arbitrary character positions.
-    """
-    words = text.split()
-    if not words:
-        return [text]
-    
-    max_chars = max_tokens * 4  # Approximate chars per token
-    chunks = []
-    current_chunk = []
-    current_length = 0
-    
-    for word in words:
-        word_length = len(word) + 1  # +1 for space
-        if current_length + word_length > max_chars and current_chunk:
-            # Flush current chunk
-            chunks.append(" ".join(current_chunk))
-            # Start new chunk with overlap
-            if overlap_chars > 0 and current_chunk:
-                # Keep last few words for overlap
-                overlap_words = []
-                overlap_length = 0
-                for w in reversed(current_chunk):
-                    if overlap_length + len(w) + 1 <= overlap_chars:
-                        overlap_words.insert(0, w)
-                        overlap_length += len(w) + 1
-                    else:
-                        break
-                current_chunk = overlap_words
-                current_length = overlap_length
-            else:
-                current_chunk = []
-                current_length = 0
-        
-        current_chunk.append(word)
-        current_length += word_length
-    
-    if current_chunk:
-        chunks.append(" ".join(current_chunk))
-    
-    return chunks if chunks else [text]
+def sentence_chunk(body: str, max_tokens: int, overlap_sents: int, hard_overlap_chars: int) -> List[str]:
+    """Sentence-based chunking with overlap (see sentence_chunk_spans)."""
+    return [chunk.text(body) for chunk in sentence_chunk_spans(body, max_tokens, overlap_sents, hard_overlap_chars)]
 
 
-def paragraph_chunk(body: str, max_tokens: int, overlap_paras: int, hard_overlap_chars: int) -> List[str]:
+def _sentence_chunk_text(
+    source: str, pieces: Sequence[Piece], text: str, max_tokens: int, overlap_sents: int, hard_overlap_chars: int
+) -> List[Chunk]:
+    """sentence_chunk of a materialized chunk or paragraph, as chunks over the source."""
+    start, end = pieces[0][0], pieces[-1][1]
+    if end - start == len(text) and source.startswith(text, start):
+        # The text is the source slice itself
+        return sentence_chunk_spans(source, max_tokens, overlap_sents, hard_overlap_chars, start, end)
+    chunks = sentence_chunk_spans(text, max_tokens, overlap_sents, hard_overlap_chars)
+    return _remap_chunks(chunks, text, source, pieces)
+
+
+def _indented_paragraphs(source: str, start: int, end: int) -> List[Piece]:
+    """Paragraphs of source[start:end] from blank lines and indentation changes (lines re-joined stripped)."""
+    groups: List[Piece] = []
+    current: List[Tuple[int, int]] = []
+    prev_indent = None
+
+    def flush() -> None:
+        if len(current) == 1:
+            groups.append((current[0][0], current[0][1], None))
+        else:
+            text = "\n".join(source[line_start:line_end] for line_start, line_end in current)
+            groups.append((current[0][0], current[-1][1], text))
+        current.clear()
+
+    pos = start
+    while True:
+        newline = source.find("\n", pos, end)
+        line_end = end if newline == -1 else newline
+        stripped_start, stripped_end = _strip_span(source, pos, line_end)
+        if stripped_start == stripped_end:
+            if current:
+                flush()
+        else:
+            # Detect indentation (leading spaces)
+            indent = stripped_start - pos
+            # If indentation changes significantly, start new paragraph
+            if prev_indent is not None and abs(indent - prev_indent) > 2 and current:
+                flush()
+            current.append((stripped_start, stripped_end))
+            prev_indent = indent
+        if newline == -1:
+            break
+        pos = newline + 1
+
+    if current:
+        flush()
+    return groups
+
+
+def paragraph_chunk_spans(
+    source: str,
+    max_tokens: int,
+    overlap_paras: int,
+    hard_overlap_chars: int,
+    start: int = 0,
+    end: Optional[int] = None,
+) -> List[Chunk]:
     """Paragraph-based chunking with multi-heuristic detection for PDFs.
 
     Uses multiple strategies to detect paragraph boundaries:
@@ -146,91 +448,77 @@ def paragraph_chunk(body: str, max_tokens: int, overlap_paras: int, hard_overlap
 
     This is critical for PDFs which often lack clear paragraph boundaries.
     """
-    if not body or not body.strip():
+    end = len(source) if end is None else end
+    body_start, body_end = _strip_span(source, start, end)
+    if body_start >= body_end:
         return []
-    
+    sentence_overlap = max(1, overlap_paras * 2)
+
     # Strategy 1: Split on double newlines (standard paragraph breaks)
-    paras = re.split(r"\n\s*\n+", body)
-    paras = [p.strip() for p in paras if p and p.strip()]
-    
+    paras: List[Piece] = [(s, e, None) for s, e in _segment_spans(source, PARA_SPLIT_RE, start, end)]
+
     # Strategy 2: If no clear paragraphs found, try indentation-based detection
-    if len(paras) <= 1 or all(len(p) < 50 for p in paras):
-        # Try to detect paragraphs by indentation changes
-        lines = body.split("\n")
-        para_groups = []
-        current_para = []
-        prev_indent = None
-        
-        for line in lines:
-            stripped = line.strip()
-            if not stripped:
-                if current_para:
-                    para_groups.append("\n".join(current_para))
-                    current_para = []
-                continue
-            
-            # Detect indentation (leading spaces)
-            indent = len(line) - len(line.lstrip())
-            
-            # If indentation changes significantly, start new paragraph
-            if prev_indent is not None and abs(indent - prev_indent) > 2:
-                if current_para:
-                    para_groups.append("\n".join(current_para))
-                    current_para = [stripped]
-                else:
-                    current_para.append(stripped)
-            else:
-                current_para.append(stripped)
-            
-            prev_indent = indent
-        
-        if current_para:
-            para_groups.append("\n".join(current_para))
-        
+    if len(paras) <= 1 or all(e - s < 50 for s, e, _ in paras):
+        para_groups = _indented_paragraphs(source, start, end)
         # Use indentation-based paragraphs if we found more than double-newline method
         if len(para_groups) > len(paras):
-            paras = [p.strip() for p in para_groups if p and p.strip()]
-    
+            paras = para_groups
+
     # Strategy 3: If still no good paragraphs, fall back to sentence chunking
-    if not paras or (len(paras) == 1 and tokens_estimate(paras[0]) > max_tokens * 2):
+    if not paras or (len(paras) == 1 and tokens_estimate(_piece_text(source, paras[0])) > max_tokens * 2):
         # No clear paragraph structure, use sentence chunking
-        return sentence_chunk(body, max_tokens, max(1, overlap_paras * 2), hard_overlap_chars)
+        return sentence_chunk_spans(source, max_tokens, sentence_overlap, hard_overlap_chars, start, end)
 
-    chunks, buf = [], []
+    chunks: List[Tuple[Chunk, int]] = []
+    buf = _ChunkBuffer("\n\n")
     for para in paras:
-        cand = "\n\n".join(buf + [para]) if buf else para
-        para_tokens = tokens_estimate(para)
-        cand_tokens = tokens_estimate(cand)
+        para_text = _piece_text(source, para)
+        chars, words = len(para_text), len(para_text.split())
 
         # If single paragraph exceeds max_tokens, use sentence chunking on it
-        if para_tokens > max_tokens:
+        if max(chars // 4, words) > max_tokens:
             # Flush buffer first if it exists
             if buf:
-                chunks.append("\n\n".join(buf))
-                buf = []
+                chunks.append(buf.flush())
             # Use sentence chunking on this large paragraph to preserve sentence boundaries
-            para_chunks = sentence_chunk(para, max_tokens, max(1, overlap_paras * 2), hard_overlap_chars)
-            chunks.extend(para_chunks)
-        elif cand_tokens <= max_tokens:
+            if para[2] is None:
+                para_chunks = sentence_chunk_spans(
+                    source, max_tokens, sentence_overlap, hard_overlap_chars, para[0], para[1]
+                )
+            else:
+                para_chunks = _sentence_chunk_text(
+                    source, (para,), para_text, max_tokens, sentence_overlap, hard_overlap_chars
+                )
+            chunks.extend((c, tokens_estimate(c.text(source))) for c in para_chunks)
+        elif buf.tokens_with(chars, words) <= max_tokens:
             # Can add to buffer
-            buf.append(para)
+            buf.append(para, chars, words)
         else:
             # Buffer + new para exceeds max, flush buffer
             if buf:
-                chunks.append("\n\n".join(buf))
+                chunks.append(buf.take())
             # Keep last N paragraphs for overlap
-            buf = buf[-overlap_paras:] if overlap_paras > 0 else []
-            buf.append(para)
+            buf.keep_last(overlap_paras)
+            buf.append(para, chars, words)
 
     if buf:
-        chunks.append("\n\n".join(buf))
+        chunks.append(buf.take())
 
     # Final pass: ensure no chunk exceeds max_tokens (safety check)
-    out: List[str] = []
-    for c in chunks:
-        if tokens_estimate(c) > max_tokens:
+    out: List[Chunk] = []
+    for chunk, tokens in chunks:
+        if tokens > max_tokens:
             # Use sentence chunking for oversized chunks to preserve sentence boundaries
-            out.extend(sentence_chunk(c, max_tokens, max(1, overlap_paras * 2), hard_overlap_chars))
+            out.extend(
+                _sentence_chunk_text(
+                    source, chunk.pieces, chunk.text(source), max_tokens, sentence_overlap, hard_overlap_chars
+                )
+            )
         else:
-            out.append(c)
+            out.append(chunk)
     return out
+
+
+def paragraph_chunk(body: str, max_tokens: int, overlap_paras: int, hard_overlap_chars: int) -> List[str]:
+    """Paragraph-based chunking with multi-heuristic detection (see paragraph_chunk_spans)."""
+    return [chunk.text(body) for chunk in paragraph_chunk_spans(body, max_tokens, overlap_paras, hard_overlap_chars)]
@@ -12,6 +12,7 @@ Phases:
 """
 
 import hashlib
+import uuid
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Union
 from uuid import UUID
@@ -148,6 +149,89 @@ def register_artifact(
     return artifact
 
 
+def register_artifacts(db: Session, artifacts: List[Dict[str, Any]]) -> List[PipelineArtifact]:
+    """
+    Register several pipeline artifacts in a single transaction.
+
+    Equivalent to calling register_artifact() for each entry, but input-artifact
+    lineage is fetched with one query, each pipeline run's status is read once and
+    all rows are inserted with a single commit (instead of one round trip and commit
+    per artifact).
+
+    Args:
+        db: Database session
+        artifacts: List of dictionaries with the keyword arguments of register_artifact()
+            (without ``db``)
+
+    Returns:
+        Created PipelineArtifact instances, in input order
+    """
+    if not artifacts:
+        return []
+
+    # Phase 2: lineage for all inputs in one query
+    all_input_ids = {input_id for spec in artifacts for input_id in spec.get("input_artifact_ids") or []}
+    inputs_by_id: Dict[Any, Dict[str, Any]] = {}
+    if all_input_ids:
+        for input_artifact in db.query(PipelineArtifact).filter(PipelineArtifact.id.in_(all_input_ids)).all():
+            inputs_by_id[input_artifact.id] = {
+                "artifact_id": str(input_artifact.id),
+                "stage": input_artifact.stage_name,
+                "artifact_name": input_artifact.artifact_name,
+                "storage_key": input_artifact.storage_key,
+            }
+
+    # Phase 3: failed runs keep their artifacts longer
+    failed_runs = set()
+    run_ids = {spec["pipeline_run_id"] for spec in artifacts}
+    for pipeline_run in db.query(PipelineRun).filter(PipelineRun.id.in_(run_ids)).all():
+        if pipeline_run.status == PipelineRunStatus.FAILED:
+            failed_runs.add(pipeline_run.id)
+
+    created = []
+    for spec in artifacts:
+        retention_policy = spec.get("retention_policy", RetentionPolicy.DAYS_90)
+        if retention_policy == RetentionPolicy.DAYS_90 and spec["pipeline_run_id"] in failed_runs:
+            retention_policy = RetentionPolicy.ON_FAILURE_KEEP_90
+
+        input_artifacts_data = [
+            inputs_by_id[input_id] for input_id in spec.get("input_artifact_ids") or [] if input_id in inputs_by_id
+        ]
+        created.append(
+            PipelineArtifact(
+                id=uuid.uuid4(),
+                pipeline_run_id=spec["pipeline_run_id"],
+                workspace_id=spec["workspace_id"],
+                product_id=spec["product_id"],
+                version=spec["version"],
+                stage_name=spec["stage_name"],
+                artifact_type=spec["artifact_type"],
+                artifact_name=spec["artifact_name"],
+                storage_bucket=spec["storage_bucket"],
+                storage_key=spec["storage_key"],
+                file_size=spec["file_size"],
+                checksum=spec.get("checksum"),
+                storage_etag=spec.get("storage_etag"),
+                input_artifacts=input_artifacts_data,
+                artifact_metadata=spec.get("artifact_metadata") or {},
+                retention_policy=retention_policy,
+                status=ArtifactStatus.ACTIVE,
+                created_by=spec.get("created_by"),
+            )
+        )
+
+    db.add_all(created)
+    db.commit()
+
+    logger.info(
+        f"Registered {len(created)} artifacts "
+        f"({', '.join(sorted({a.stage_name for a in created}))}), "
+        f"total size={sum(a.file_size for a in created)} bytes"
+    )
+
+    return created
+
+
 def get_artifacts_by_stage(
     db: Session,
     pipeline_run_id: UUID,
@@ -44,7 +44,7 @@ from primedata.ingestion_pipeline.artifact_registry import (
     calculate_checksum,
     get_artifact_summary_for_run,
     get_artifacts_by_stage,
-    register_artifact,
+    register_artifacts,
 )
 from primedata.storage.minio_client import minio_client
 from primedata.storage.paths import raw_prefix
@@ -135,299 +135,241 @@ def register_stage_artifacts(
     if result.status != StageStatus.SUCCEEDED:
         return []  # Don't register artifacts for failed stages
 
-    registered_ids = []
-
-    # Get artifacts from stage result
-    artifacts = result.artifacts or {}
-    if not artifacts:
-        # Try to infer artifacts from stage result metrics
-        # Each stage stores artifacts differently, so we need stage-specific logic
-        pass
-
-    # Stage-specific artifact registration
-    if stage_name == "preprocess":
-        # Preprocess generates processed JSONL files
-        processed_files = result.metrics.get("processed_file_list", [])
-        for file_stem in processed_files:
-            # Construct MinIO key for processed JSONL
-            storage_key = f"ws/{workspace_id}/prod/{product_id}/v/{version}/clean/{file_stem}.jsonl"
+    from primedata.ingestion_pipeline.aird_stages.tracing import StageTracer
+
+    # Registration time is added to the stage's profile in the pipeline run metrics
+    tracer = StageTracer(stage_name)
+    with tracer.span("artifact_register") as register_span:
+        # File-backed artifacts of this stage: (bucket, key, artifact_type, artifact_name, metadata, retention_policy)
+        file_artifacts = []
+
+        # Stage-specific artifact registration
+        if stage_name == "preprocess":
+            # Preprocess generates processed JSONL files
+            processed_files = result.metrics.get("processed_file_list", [])
+            for file_stem in processed_files:
+                file_artifacts.append(
+                    (
+                        "primedata-clean",
+                        f"ws/{workspace_id}/prod/{product_id}/v/{version}/clean/{file_stem}.jsonl",
+                        ArtifactType.JSONL,
+                        f"processed_chunks_{file_stem}",
+                        {
+                            "file_stem": file_stem,
+                            "chunks_count": result.metrics.get("file_chunk_counts", {}).get(
+                                file_stem, result.metrics.get("total_chunks", 0)
+                            ),
+                            "playbook_id": result.metrics.get("playbook_id"),
+                        },
+                        RetentionPolicy.DAYS_90,  # Inputs would be raw file artifact IDs
+                    )
+                )
 
-            # Get file info using unified stat_object method
-            try:
-                from primedata.storage.minio_client import minio_client
+        elif stage_name == "scoring":
+            # Scoring generates metrics JSON
+            # Use clean_prefix to match where storage.put_metrics_json() stores it
+            from primedata.storage.paths import clean_prefix
+
+            file_artifacts.append(
+                (
+                    "primedata-clean",
+                    f"{clean_prefix(workspace_id, product_id, version)}metrics.json",
+                    ArtifactType.JSON,
+                    "metrics",
+                    {
+                        "total_chunks": result.metrics.get("total_chunks", 0),
+                        "avg_trust_score": result.metrics.get("avg_trust_score", 0.0),
+                    },
+                    RetentionPolicy.DAYS_90,
+                )
+            )
 
-                stat_info = minio_client.stat_object("primedata-clean", storage_key)
-                if not stat_info:
-                    logger.warning(f"Could not get file info for {storage_key}")
-                    continue
+        elif stage_name == "fingerprint":
+            # Fingerprint is stored via storage.put_artifact() in primedata-exports under artifacts/
+            # Path format: ws/{workspace_id}/prod/{product_id}/v/{version}/artifacts/fingerprint.json
+            file_artifacts.append(
+                (
+                    "primedata-exports",
+                    f"ws/{workspace_id}/prod/{product_id}/v/{version}/artifacts/fingerprint.json",
+                    ArtifactType.JSON,
+                    "fingerprint",
+                    result.metrics.get("fingerprint", {}),
+                    RetentionPolicy.KEEP_FOREVER,  # Fingerprints are important
+                )
+            )
 
-                file_size = stat_info["size"]
-                storage_etag = stat_info["etag"]
+        elif stage_name == "validation":
+            # Validation generates CSV summary via storage.put_artifact -> primedata-exports ws/.../artifacts/ai_validation_summary.csv
+            csv_key = (result.artifacts.get("validation_summary_csv") if result.artifacts else None) or result.metrics.get(
+                "validation_summary_path"
+            )
+            if csv_key:
+                file_artifacts.append(
+                    (
+                        "primedata-exports",
+                        csv_key,
+                        ArtifactType.CSV,
+                        "validation_summary",
+                        {"threshold": result.metrics.get("threshold", 70.0)},
+                        RetentionPolicy.DAYS_90,
+                    )
+                )
 
-                # Calculate checksum from file content
-                file_data = minio_client.get_bytes("primedata-clean", storage_key)
-                if not file_data:
-                    logger.warning(f"Could not download file for checksum calculation: {storage_key}")
-                    continue
+        elif stage_name == "reporting":
+            # Reporting stores PDF via storage.put_artifact -> primedata-exports ws/.../artifacts/ai_trust_report.pdf
+            pdf_key = (result.artifacts.get("trust_report_pdf") if result.artifacts else None) or result.metrics.get(
+                "trust_report_path"
+            )
+            if pdf_key:
+                file_artifacts.append(
+                    (
+                        "primedata-exports",
+                        pdf_key,
+                        ArtifactType.PDF,
+                        "trust_report",
+                        {
+                            "threshold": result.metrics.get("threshold", 70.0),
+                            "pdf_size_bytes": result.metrics.get("pdf_size_bytes"),
+                        },
+                        RetentionPolicy.KEEP_FOREVER,  # Reports are important
+                    )
+                )
 
-                checksum = calculate_checksum(file_data, algorithm="sha256")
-            except Exception as e:
-                logger.warning(f"Could not get file info for {storage_key}: {e}")
+        artifact_specs = []
+        object_infos = _resolve_artifact_object_info(storage, [(bucket, key) for bucket, key, *_ in file_artifacts])
+        for (bucket, key, artifact_type, artifact_name, artifact_metadata, retention_policy), info in zip(
+            file_artifacts, object_infos
+        ):
+            if info is None:
                 continue
+            artifact_specs.append(
+                {
+                    "pipeline_run_id": pipeline_run_id,
+                    "workspace_id": workspace_id,
+                    "product_id": product_id,
+                    "version": version,
+                    "stage_name": stage_name,
+                    "artifact_type": artifact_type,
+                    "artifact_name": artifact_name,
+                    "storage_bucket": bucket,
+                    "storage_key": key,
+                    "file_size": info["size"],
+                    "checksum": info["sha256"],
+                    "storage_etag": info["etag"],
+                    "input_artifact_ids": input_artifact_ids,
+                    "artifact_metadata": artifact_metadata,
+                    "retention_policy": retention_policy,
+                }
+            )
 
-            artifact_id = register_artifact(
-                db=db,
-                pipeline_run_id=pipeline_run_id,
-                workspace_id=workspace_id,
-                product_id=product_id,
-                version=version,
-                stage_name=stage_name,
-                artifact_type=ArtifactType.JSONL,
-                artifact_name=f"processed_chunks_{file_stem}",
-                storage_bucket="primedata-clean",
-                storage_key=storage_key,
-                file_size=file_size,
-                checksum=checksum,
-                storage_etag=storage_etag,
-                input_artifact_ids=input_artifact_ids,  # Would be raw file artifact IDs
-                artifact_metadata={
-                    "file_stem": file_stem,
-                    "chunks_count": result.metrics.get("file_chunk_counts", {}).get(
-                        file_stem, result.metrics.get("total_chunks", 0)
-                    ),
-                    "playbook_id": result.metrics.get("playbook_id"),
-                },
-                retention_policy=RetentionPolicy.DAYS_90,
-            ).id
-            registered_ids.append(artifact_id)
-
-    elif stage_name == "scoring":
-        # Scoring generates metrics JSON
-        # Use clean_prefix to match where storage.put_metrics_json() stores it
-        from primedata.storage.paths import clean_prefix
+        if stage_name == "indexing":
+            # Indexing creates vectors in Qdrant (not stored in MinIO, but we track it)
+            # Prepare artifact metadata
+            artifact_metadata_dict = {
+                "vectors_indexed": result.metrics.get("points_indexed", 0),  # Indexing stage uses 'points_indexed'
+                "collection_name": result.metrics.get("collection_name"),
+                "embedding_model": result.metrics.get("embedding_model"),
+            }
 
-        metrics_key = f"{clean_prefix(workspace_id, product_id, version)}metrics.json"
-        try:
-            from primedata.storage.minio_client import minio_client
+            # Calculate checksum from metadata JSON (since vectors are in Qdrant, not MinIO)
+            metadata_json = json.dumps(artifact_metadata_dict, sort_keys=True)
+            metadata_bytes = metadata_json.encode("utf-8")
+            metadata_checksum = calculate_checksum(metadata_bytes, algorithm="sha256")
 
-            stat_info = minio_client.stat_object("primedata-clean", metrics_key)
-            if not stat_info:
-                logger.warning(f"Could not get metrics.json info")
-            else:
-                file_size = stat_info["size"]
-                storage_etag = stat_info["etag"]
+            artifact_specs.append(
+                {
+                    "pipeline_run_id": pipeline_run_id,
+                    "workspace_id": workspace_id,
+                    "product_id": product_id,
+                    "version": version,
+                    "stage_name": stage_name,
+                    "artifact_type": ArtifactType.VECTOR,
+                    "artifact_name": "qdrant_vectors",
+                    "storage_bucket": "qdrant",  # Special bucket name for Qdrant
+                    "storage_key": f"collection_ws_{workspace_id}_prod_{product_id}_v_{version}",
+                    "file_size": 0,  # Vectors are in Qdrant, not MinIO
+                    "checksum": metadata_checksum,  # Calculate checksum from metadata JSON
+                    "storage_etag": metadata_checksum,  # Use checksum as ETag since there's no file
+                    "input_artifact_ids": input_artifact_ids,
+                    "artifact_metadata": artifact_metadata_dict,
+                    "retention_policy": RetentionPolicy.KEEP_FOREVER,  # Vectors are critical
+                }
+            )
 
-                # Calculate checksum from file content
-                file_data = minio_client.get_bytes("primedata-clean", metrics_key)
-                if not file_data:
-                    logger.warning(f"Could not download metrics.json for checksum calculation")
-                else:
-                    checksum = calculate_checksum(file_data, algorithm="sha256")
+        # One transaction for all artifacts of the stage
+        registered_ids = [artifact.id for artifact in register_artifacts(db, artifact_specs)]
+        register_span.add(records=len(registered_ids))
 
-                    artifact_id = register_artifact(
-                        db=db,
-                        pipeline_run_id=pipeline_run_id,
-                        workspace_id=workspace_id,
-                        product_id=product_id,
-                        version=version,
-                        stage_name=stage_name,
-                        artifact_type=ArtifactType.JSON,
-                        artifact_name="metrics",
-                        storage_bucket="primedata-clean",
-                        storage_key=metrics_key,
-                        file_size=file_size,
-                        checksum=checksum,
-                        storage_etag=storage_etag,
-                        input_artifact_ids=input_artifact_ids,  # Would be preprocess artifact IDs
-                        artifact_metadata={
-                            "total_chunks": result.metrics.get("total_chunks", 0),
-                            "avg_trust_score": result.metrics.get("avg_trust_score", 0.0),
-                        },
-                        retention_policy=RetentionPolicy.DAYS_90,
-                    ).id
-                    registered_ids.append(artifact_id)
-        except Exception as e:
-            logger.warning(f"Could not get metrics.json info: {e}")
+    logger.info(f"Registered {len(registered_ids)} artifacts for stage {stage_name}")
+    profile = tracer.collect()
+    if profile:
+        from primedata.ingestion_pipeline.aird_stages.tracking import track_stage_profile
 
-    elif stage_name == "fingerprint":
-        # Fingerprint is stored via storage.put_artifact() in primedata-exports under artifacts/
-        # Path format: ws/{workspace_id}/prod/{product_id}/v/{version}/artifacts/fingerprint.json
-        fingerprint_key = f"ws/{workspace_id}/prod/{product_id}/v/{version}/artifacts/fingerprint.json"
         try:
-            from primedata.storage.minio_client import minio_client
-
-            stat_info = minio_client.stat_object("primedata-exports", fingerprint_key)
-            if not stat_info:
-                logger.warning(f"Could not get fingerprint.json info")
-            else:
-                file_size = stat_info["size"]
-                storage_etag = stat_info["etag"]
-
-                # Calculate checksum from file content
-                file_data = minio_client.get_bytes("primedata-exports", fingerprint_key)
-                if not file_data:
-                    logger.warning(f"Could not download fingerprint.json for checksum calculation")
-                else:
-                    checksum = calculate_checksum(file_data, algorithm="sha256")
-
-                    artifact_id = register_artifact(
-                        db=db,
-                        pipeline_run_id=pipeline_run_id,
-                        workspace_id=workspace_id,
-                        product_id=product_id,
-                        version=version,
-                        stage_name=stage_name,
-                        artifact_type=ArtifactType.JSON,
-                        artifact_name="fingerprint",
-                        storage_bucket="primedata-exports",
-                        storage_key=fingerprint_key,
-                        file_size=file_size,
-                        checksum=checksum,
-                        storage_etag=storage_etag,
-                        input_artifact_ids=input_artifact_ids,  # scoring artifacts
-                        artifact_metadata=result.metrics.get("fingerprint", {}),
-                        retention_policy=RetentionPolicy.KEEP_FOREVER,  # Fingerprints are important
-                    ).id
-                    registered_ids.append(artifact_id)
+            track_stage_profile(db, pipeline_run_id, stage_name, profile)
         except Exception as e:
-            logger.warning(f"Could not get fingerprint.json info: {e}")
-
-    elif stage_name == "validation":
-        # Validation generates CSV summary via storage.put_artifact -> primedata-exports ws/.../artifacts/ai_validation_summary.csv
-        csv_key = (result.artifacts.get("validation_summary_csv") if result.artifacts else None) or result.metrics.get(
-            "validation_summary_path"
-        )
-        if csv_key:
-            bucket = "primedata-exports"
-            key = csv_key
-            try:
-                from primedata.storage.minio_client import minio_client
-
-                stat_info = minio_client.stat_object(bucket, key)
-                if not stat_info:
-                    logger.warning(f"Could not get validation CSV info")
-                else:
-                    file_size = stat_info["size"]
-                    storage_etag = stat_info["etag"]
-
-                    # Calculate checksum from file content
-                    file_data = minio_client.get_bytes(bucket, key)
-                    if not file_data:
-                        logger.warning(f"Could not download validation CSV for checksum calculation")
-                    else:
-                        checksum = calculate_checksum(file_data, algorithm="sha256")
-
-                        artifact_id = register_artifact(
-                            db=db,
-                            pipeline_run_id=pipeline_run_id,
-                            workspace_id=workspace_id,
-                            product_id=product_id,
-                            version=version,
-                            stage_name=stage_name,
-                            artifact_type=ArtifactType.CSV,
-                            artifact_name="validation_summary",
-                            storage_bucket=bucket,
-                            storage_key=key,
-                            file_size=file_size,
-                            checksum=checksum,
-                            storage_etag=storage_etag,
-                            input_artifact_ids=input_artifact_ids,
-                            artifact_metadata={
-                                "threshold": result.metrics.get("threshold", 70.0),
-                            },
-                            retention_policy=RetentionPolicy.DAYS_90,
-                        ).id
-                        registered_ids.append(artifact_id)
-            except Exception as e:
-                logger.warning(f"Could not get validation CSV info: {e}")
-
-    elif stage_name == "reporting":
-        # Reporting stores PDF via storage.put_artifact -> primedata-exports ws/.../artifacts/ai_trust_report.pdf
-        pdf_key = (result.artifacts.get("trust_report_pdf") if result.artifacts else None) or result.metrics.get(
-            "trust_report_path"
-        )
-        if pdf_key:
-            bucket = "primedata-exports"
-            key = pdf_key
+            logger.warning(f"Failed to record artifact registration profile for stage {stage_name}: {e}")
+    return registered_ids
 
-            try:
-                from primedata.storage.minio_client import minio_client
 
-                stat_info = minio_client.stat_object(bucket, key)
-                if not stat_info:
-                    logger.warning(f"Could not get trust report PDF info")
-                else:
-                    file_size = stat_info["size"]
-                    storage_etag = stat_info["etag"]
+def _resolve_artifact_object_info(storage: Any, objects: List[tuple]) -> List[Optional[Dict[str, Any]]]:
+    """
+    Size, SHA-256 checksum and ETag of stored artifact objects, without re-downloading them.
 
-                    # Calculate checksum from file content
-                    file_data = minio_client.get_bytes(bucket, key)
-                    if not file_data:
-                        logger.warning(f"Could not download trust report PDF for checksum calculation")
-                    else:
-                        checksum = calculate_checksum(file_data, algorithm="sha256")
-
-                        artifact_id = register_artifact(
-                            db=db,
-                            pipeline_run_id=pipeline_run_id,
-                            workspace_id=workspace_id,
-                            product_id=product_id,
-                            version=version,
-                            stage_name=stage_name,
-                            artifact_type=ArtifactType.PDF,
-                            artifact_name="trust_report",
-                            storage_bucket=bucket,
-                            storage_key=key,
-                            file_size=file_size,
-                            checksum=checksum,
-                            storage_etag=storage_etag,
-                            input_artifact_ids=input_artifact_ids,
-                            artifact_metadata={
-                                "threshold": result.metrics.get("threshold", 70.0),
-                                "pdf_size_bytes": result.metrics.get("pdf_size_bytes"),
-                            },
-                            retention_policy=RetentionPolicy.KEEP_FOREVER,  # Reports are important
-                        ).id
-                        registered_ids.append(artifact_id)
-            except Exception as e:
-                logger.warning(f"Could not get trust report PDF info: {e}")
+    Objects written through the stage's AirdStorageAdapter are answered from what was
+    recorded at write time. Otherwise the SHA-256 stored as object metadata on write is
+    read with a HEAD request; only legacy objects written without checksum metadata are
+    downloaded and hashed.
 
-    elif stage_name == "indexing":
-        # Indexing creates vectors in Qdrant (not stored in MinIO, but we track it)
-        # Prepare artifact metadata
-        artifact_metadata_dict = {
-            "vectors_indexed": result.metrics.get("points_indexed", 0),  # Indexing stage uses 'points_indexed'
-            "collection_name": result.metrics.get("collection_name"),
-            "embedding_model": result.metrics.get("embedding_model"),
-        }
+    Args:
+        storage: AirdStorageAdapter used by the stage (may be None)
+        objects: (bucket, key) tuples
 
-        # Calculate checksum from metadata JSON (since vectors are in Qdrant, not MinIO)
-        metadata_json = json.dumps(artifact_metadata_dict, sort_keys=True)
-        metadata_bytes = metadata_json.encode("utf-8")
-        metadata_checksum = calculate_checksum(metadata_bytes, algorithm="sha256")
+    Returns:
+        {"size", "sha256", "etag"} per object in input order, or None if the object is unavailable
+    """
+    infos: List[Optional[Dict[str, Any]]] = [None] * len(objects)
+    pending = []
+    get_written_info = getattr(storage, "get_written_info", None)
+    for i, (bucket, key) in enumerate(objects):
+        written = get_written_info(bucket, key) if callable(get_written_info) else None
+        if isinstance(written, dict) and written.get("sha256"):
+            infos[i] = written
+        else:
+            pending.append(i)
+    if not pending:
+        return infos
 
-        artifact_id = register_artifact(
-            db=db,
-            pipeline_run_id=pipeline_run_id,
-            workspace_id=workspace_id,
-            product_id=product_id,
-            version=version,
-            stage_name=stage_name,
-            artifact_type=ArtifactType.VECTOR,
-            artifact_name="qdrant_vectors",
-            storage_bucket="qdrant",  # Special bucket name for Qdrant
-            storage_key=f"collection_ws_{workspace_id}_prod_{product_id}_v_{version}",
-            file_size=0,  # Vectors are in Qdrant, not MinIO
-            checksum=metadata_checksum,  # Calculate checksum from metadata JSON
-            storage_etag=metadata_checksum,  # Use checksum as ETag since there's no file
-            input_artifact_ids=input_artifact_ids,
-            artifact_metadata=artifact_metadata_dict,
-            retention_policy=RetentionPolicy.KEEP_FOREVER,  # Vectors are critical
-        ).id
-        registered_ids.append(artifact_id)
+    try:
+        from primedata.storage.minio_client import minio_client
 
-    logger.info(f"Registered {len(registered_ids)} artifacts for stage {stage_name}")
-    return registered_ids
+        stats = minio_client.stat_many([objects[i] for i in pending])
+        legacy = []
+        for i, stat_result in zip(pending, stats):
+            if not stat_result.ok:
+                logger.warning(f"Could not get file info for {objects[i][1]}: {stat_result.error}")
+                continue
+            infos[i] = {
+                "size": stat_result.info["size"],
+                "sha256": stat_result.info.get("sha256"),
+                "etag": stat_result.info["etag"],
+            }
+            if not infos[i]["sha256"]:
+                legacy.append(i)
+
+        # Legacy objects without checksum metadata: download and hash
+        if legacy:
+            downloads = minio_client.get_many([objects[i] for i in legacy])
+            for i, download in zip(legacy, downloads):
+                if not download.ok or not download.data:
+                    logger.warning(f"Could not download file for checksum calculation: {objects[i][1]}")
+                    infos[i] = None
+                    continue
+                infos[i]["sha256"] = calculate_checksum(download.data, algorithm="sha256")
+    except Exception as e:
+        logger.warning(f"Could not get artifact file info: {e}")
+        return [info if i not in pending else None for i, info in enumerate(infos)]
+    return infos
 
 
 def raise_if_stage_failed(result, stage_name: str, context_msg: str = ""):
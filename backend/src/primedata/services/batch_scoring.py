@@ -0,0 +1,129 @@
+"""
+Parallel batch scoring for PrimeData.
+
+Distributes per-file record batches across a process pool and yields results in
+submission order, so scoring output is deterministic regardless of worker count.
+"""
+
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from loguru import logger
+from primedata.services.trust_scoring import score_records_batch
+
+# (key, records) pairs fed to the scorer, e.g. (file_stem, records)
+RecordBatch = Tuple[Any, List[Dict[str, Any]]]
+
+# (key, records, scored or None, error or None) yielded back in submission order
+ScoredBatch = Tuple[Any, List[Dict[str, Any]], Optional[List[Optional[Dict[str, Any]]]], Optional[str]]
+
+
+def resolve_scoring_workers(requested: Optional[int] = None) -> int:
+    """Resolve the worker count: None/0 means one worker per CPU."""
+    if requested and requested > 0:
+        return requested
+    return os.cpu_count() or 1
+
+
+def _score_batch_safe(
+    records: List[Dict[str, Any]],
+    weights: Optional[Dict[str, float]],
+    playbook: Optional[Dict[str, Any]],
+    ai_ready: bool,
+) -> Tuple[Optional[List[Optional[Dict[str, Any]]]], Optional[str], Dict[str, float]]:
+    """Score one batch, returning (results, error, sub-metric timings) instead of raising (runs in worker processes)."""
+    timings: Dict[str, float] = {}
+    try:
+        return score_records_batch(records, weights, playbook, ai_ready, timings=timings), None, timings
+    except Exception as e:
+        return None, str(e), timings
+
+
+def _add_timings(total: Optional[Dict[str, float]], timings: Dict[str, float]) -> None:
+    if total is not None:
+        for name, seconds in timings.items():
+            total[name] = total.get(name, 0.0) + seconds
+
+
+def _iter_sequential(
+    batches: Iterable[RecordBatch],
+    weights: Optional[Dict[str, float]],
+    playbook: Optional[Dict[str, Any]],
+    ai_ready: bool,
+    timings: Optional[Dict[str, float]] = None,
+) -> Iterator[ScoredBatch]:
+    for key, records in batches:
+        scored, error, batch_timings = _score_batch_safe(records, weights, playbook, ai_ready)
+        _add_timings(timings, batch_timings)
+        yield key, records, scored, error
+
+
+def iter_scored_batches(
+    batches: Iterable[RecordBatch],
+    weights: Optional[Dict[str, float]] = None,
+    playbook: Optional[Dict[str, Any]] = None,
+    ai_ready: bool = True,
+    max_workers: Optional[int] = None,
+    max_in_flight: Optional[int] = None,
+    timings: Optional[Dict[str, float]] = None,
+) -> Iterator[ScoredBatch]:
+    """
+    Score record batches in a process pool, yielding results in input order.
+
+    Batches are pulled lazily from ``batches`` and at most ``max_in_flight`` of them
+    (default: 2 per worker) are pending at once, so memory stays bounded on large
+    versions. With a single worker, or when a pool cannot be started (e.g. inside a
+    daemonic Airflow worker process), batches are scored in-process.
+
+    Args:
+        batches: Iterable of (key, records) pairs
+        weights: Scoring weights (loaded once by the caller and shipped to workers)
+        playbook: Optional playbook for AI-Ready metrics
+        ai_ready: Include AI-Ready metrics
+        max_workers: Number of worker processes (None/0 = CPU count)
+        max_in_flight: Maximum number of batches submitted but not yet yielded
+        timings: Optional dict the scoring seconds per sub-metric group are summed into
+            (see score_records_batch; includes batches scored in worker processes)
+
+    Yields:
+        (key, records, scored, error) tuples; ``scored`` is aligned with ``records``
+    """
+    workers = resolve_scoring_workers(max_workers)
+    if workers > 1 and multiprocessing.current_process().daemon:
+        # Daemonic processes (e.g. Celery/Airflow forked workers) cannot have children
+        logger.info("Running inside a daemonic process, scoring in-process")
+        workers = 1
+
+    if workers <= 1:
+        yield from _iter_sequential(batches, weights, playbook, ai_ready, timings)
+        return
+
+    try:
+        executor = ProcessPoolExecutor(max_workers=workers)
+    except Exception as e:
+        logger.warning(f"Could not start scoring process pool ({e}), scoring in-process")
+        yield from _iter_sequential(batches, weights, playbook, ai_ready, timings)
+        return
+
+    in_flight_limit = max_in_flight or workers * 2
+    pending: Deque[Tuple[Any, List[Dict[str, Any]], Future]] = deque()
+
+    def _drain_one() -> ScoredBatch:
+        key, records, future = pending.popleft()
+        try:
+            scored, error, batch_timings = future.result()
+            _add_timings(timings, batch_timings)
+        except Exception as e:  # Worker crashed or results could not be unpickled
+            scored, error = None, str(e)
+        return key, records, scored, error
+
+    with executor:
+        for key, records in batches:
+            pending.append((key, records, executor.submit(_score_batch_safe, records, weights, playbook, ai_ready)))
+            if len(pending) >= in_flight_limit:
+                yield _drain_one()
+        while pending:
+            yield _drain_one()
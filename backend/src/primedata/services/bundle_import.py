@@ -0,0 +1,461 @@
+"""
+Bulk vector import from export bundles.
+
+Loads an export bundle (see services/export_bundles.py) into a new Qdrant
+collection without re-running the pipeline or re-embedding: disaster recovery,
+environment cloning and moving products between workspaces.
+
+Vectors are memory-mapped straight out of the bundle zip (parts are stored
+uncompressed) and upserted in parallel batches. Before anything is written the
+bundle's per-part row counts and SHA-256 checksums are verified against its
+manifest, and after the upsert the collection's point count must match. The
+import is registered like an indexing run: a PipelineRun for the new version
+with its collection name, a vector artifact, and the product's current version.
+
+Usage:
+    python -m primedata.services.bundle_import bundle.zip --product-id <uuid> [--version N] [--workers 8]
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import os
+import struct
+import tempfile
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from uuid import UUID
+
+import numpy as np
+from loguru import logger
+from primedata.db.models import (
+    ArtifactType,
+    PipelineRun,
+    PipelineRunStatus,
+    Product,
+    ProductStatus,
+    RetentionPolicy,
+)
+from primedata.services.export_bundles import BUNDLE_FORMAT, EXPORTS_BUCKET
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+IMPORT_BATCH_SIZE = 256
+IMPORT_MAX_WORKERS = 4
+_HASH_BLOCK_SIZE = 1024 * 1024
+_ZIP_LOCAL_HEADER = struct.Struct(zipfile.structFileHeader)
+
+
+class BundleVerificationError(ValueError):
+    """Raised when a bundle does not match its manifest or the imported collection does not match the bundle."""
+
+
+def read_manifest(zip_file: zipfile.ZipFile) -> Dict[str, Any]:
+    """Read and check the manifest of an export bundle."""
+    try:
+        manifest = json.loads(zip_file.read("manifest.json"))
+    except KeyError:
+        raise BundleVerificationError("Bundle has no manifest.json (bundles created before format 2 cannot be imported)")
+    if manifest.get("format") != BUNDLE_FORMAT:
+        raise BundleVerificationError(f"Unsupported bundle format: {manifest.get('format')}")
+    return manifest
+
+
+def _entry_sha256(zip_file: zipfile.ZipFile, name: str) -> str:
+    digest = hashlib.sha256()
+    with zip_file.open(name) as handle:
+        for block in iter(lambda: handle.read(_HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def verify_bundle(zip_file: zipfile.ZipFile, manifest: Dict[str, Any]) -> None:
+    """
+    Verify part checksums and row counts against the manifest.
+
+    Args:
+        zip_file: Open bundle
+        manifest: Bundle manifest from read_manifest()
+
+    Raises:
+        BundleVerificationError: If a part is missing, corrupted or has the wrong number of rows
+    """
+    total = 0
+    for part in manifest["parts"]:
+        for entry, checksum in ((part["chunks"], part["chunks_sha256"]), (part["vectors"], part["vectors_sha256"])):
+            try:
+                actual = _entry_sha256(zip_file, entry)
+            except KeyError:
+                raise BundleVerificationError(f"Bundle is missing {entry}")
+            if actual != checksum:
+                raise BundleVerificationError(f"Checksum mismatch for {entry}")
+        total += part["rows"]
+    if total != manifest["total_points"]:
+        raise BundleVerificationError(f"Manifest parts hold {total} rows, expected {manifest['total_points']}")
+
+
+def open_part_vectors(
+    bundle_path: str, zip_file: zipfile.ZipFile, part: Dict[str, Any], extract_dir: Optional[str] = None
+) -> np.ndarray:
+    """
+    Memory-map the vectors of a bundle part.
+
+    Parts are stored uncompressed, so the .npy data is mapped directly from the zip
+    file; compressed entries (bundles repacked by other tools) are extracted to
+    extract_dir first, or read into memory without one.
+
+    Args:
+        bundle_path: Path of the bundle zip on disk
+        zip_file: The same bundle, opened
+        part: Part entry of the manifest
+        extract_dir: Directory for extracted compressed entries (owned and cleaned up by the caller)
+
+    Returns:
+        Read-only float32 array of shape [rows, vector_size]
+    """
+    info = zip_file.getinfo(part["vectors"])
+    if info.compress_type != zipfile.ZIP_STORED:
+        if extract_dir is None:
+            vectors = np.load(io.BytesIO(zip_file.read(info)))
+        else:
+            vectors = np.load(zip_file.extract(info, extract_dir), mmap_mode="r")
+        if vectors.shape[0] != part["rows"]:
+            raise BundleVerificationError(f"{part['vectors']} has {vectors.shape[0]} rows, expected {part['rows']}")
+        return vectors
+
+    with open(bundle_path, "rb") as f:
+        f.seek(info.header_offset)
+        header = _ZIP_LOCAL_HEADER.unpack(f.read(_ZIP_LOCAL_HEADER.size))
+        name_length, extra_length = header[-2], header[-1]
+        f.seek(name_length + extra_length, os.SEEK_CUR)
+        major, minor = np.lib.format.read_magic(f)
+        if (major, minor) == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+        offset = f.tell()
+
+    order = "F" if fortran_order else "C"
+    vectors = np.memmap(bundle_path, dtype=dtype, mode="r", offset=offset, shape=shape, order=order)
+    if vectors.shape[0] != part["rows"]:
+        raise BundleVerificationError(f"{part['vectors']} has {vectors.shape[0]} rows, expected {part['rows']}")
+    return vectors
+
+
+def _point_id(product_id: Any, chunk_id: str, version: int) -> int:
+    # Same derivation as the indexing stage, so re-indexing the imported version updates these points
+    point_id_str = f"{product_id}_{chunk_id}_{version}"
+    return int(hashlib.md5(point_id_str.encode()).hexdigest()[:15], 16)
+
+
+def iter_bundle_points(
+    bundle_path: str,
+    zip_file: zipfile.ZipFile,
+    manifest: Dict[str, Any],
+    product_id: Any,
+    version: int,
+    collection_name: str,
+    batch_size: int = IMPORT_BATCH_SIZE,
+) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Yield batches of Qdrant points for the target product version.
+
+    Payload fields that identify the product, version and collection are rewritten
+    for the target, and point IDs are derived the way the indexing stage does.
+    """
+    with tempfile.TemporaryDirectory(prefix="bundle-import-") as extract_dir:
+        for part in manifest["parts"]:
+            vectors = open_part_vectors(bundle_path, zip_file, part, extract_dir)
+            with zip_file.open(part["chunks"]) as handle:
+                batch = []
+                for row, line in enumerate(handle):
+                    record = json.loads(line)
+                    payload = dict(record["payload"])
+                    payload.update(
+                        {
+                            "product_id": str(product_id),
+                            "version": version,
+                            "collection_id": collection_name,
+                            "index_scope": str(product_id),
+                        }
+                    )
+                    chunk_id = record.get("chunk_id") or payload.get("chunk_id") or str(record["point_id"])
+                    batch.append(
+                        {"id": _point_id(product_id, chunk_id, version), "vector": vectors[row].tolist(), "payload": payload}
+                    )
+                    if len(batch) >= batch_size:
+                        yield batch
+                        batch = []
+                if batch:
+                    yield batch
+            del vectors  # Unmap the part before moving on
+
+
+def _upsert_parallel(
+    qdrant_client: Any, collection_name: str, batches: Iterator[List[Dict[str, Any]]], max_workers: int
+) -> int:
+    """Upsert batches with bounded parallelism (at most 2 * max_workers batches in memory)."""
+    upserted = 0
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bundle-import") as pool:
+        in_flight = set()
+
+        def _collect(done) -> None:
+            nonlocal upserted
+            for future in done:
+                ok, count = future.result()
+                if not ok:
+                    raise RuntimeError(f"Failed to upsert a batch into {collection_name}")
+                upserted += count
+
+        def _upsert(batch: List[Dict[str, Any]]) -> Tuple[bool, int]:
+            return qdrant_client.upsert_points(collection_name, batch, batch_size=len(batch)), len(batch)
+
+        for batch in batches:
+            if len(in_flight) >= 2 * max_workers:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                _collect(done)
+            in_flight.add(pool.submit(_upsert, batch))
+        _collect(wait(in_flight)[0])
+    return upserted
+
+
+def create_import_run(db: Session, product: Product, version: Optional[int], source: str) -> PipelineRun:
+    """
+    Create the PipelineRun an import is registered under.
+
+    Args:
+        db: Database session
+        product: Target product
+        version: Target version (None: next version after the product's latest run)
+        source: Description of the bundle being imported (kept in the run metrics)
+
+    Returns:
+        The running PipelineRun
+    """
+    from primedata.services.s3_content_storage import get_pipeline_run_metrics_path
+
+    if version is None:
+        latest_run_version = db.query(func.max(PipelineRun.version)).filter(PipelineRun.product_id == product.id).scalar() or 0
+        version = max(latest_run_version, product.current_version or 0) + 1
+
+    pipeline_run = PipelineRun(
+        workspace_id=product.workspace_id,
+        product_id=product.id,
+        version=version,
+        status=PipelineRunStatus.RUNNING,
+        started_at=datetime.now(timezone.utc),
+        dag_run_id=f"bundle-import-{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}",
+        metrics={"bundle_import": {"source": source}},
+        metrics_path="",  # Set after the ID is known
+    )
+    db.add(pipeline_run)
+    db.flush()
+    pipeline_run.metrics_path = get_pipeline_run_metrics_path(product.workspace_id, product.id, version, pipeline_run.id)
+    db.commit()
+    db.refresh(pipeline_run)
+    return pipeline_run
+
+
+def _finish_import_run(pipeline_run: PipelineRun, status: PipelineRunStatus, stats: Dict[str, Any]) -> None:
+    metrics = dict(pipeline_run.metrics or {})
+    metrics["bundle_import"] = {**metrics.get("bundle_import", {}), **stats}
+    pipeline_run.metrics = metrics  # Assign a new dict so SQLAlchemy sees the JSON change
+    pipeline_run.status = status
+    pipeline_run.finished_at = datetime.now(timezone.utc)
+
+
+def import_bundle_file(
+    db: Session,
+    bundle_path: str,
+    pipeline_run: PipelineRun,
+    qdrant_client: Any = None,
+    max_workers: int = IMPORT_MAX_WORKERS,
+    batch_size: int = IMPORT_BATCH_SIZE,
+) -> Dict[str, Any]:
+    """
+    Import a bundle on disk into a new collection for the pipeline run's product version.
+
+    The pipeline run is marked succeeded (with import statistics in its metrics) or failed.
+
+    Args:
+        db: Database session
+        bundle_path: Path of the bundle zip
+        pipeline_run: Run from create_import_run()
+        qdrant_client: QdrantClient wrapper (a new one by default)
+        max_workers: Parallel upsert batches
+        batch_size: Points per upsert batch
+
+    Returns:
+        Import statistics
+    """
+    from primedata.indexing.qdrant_client import QdrantClient
+    from primedata.ingestion_pipeline.artifact_registry import calculate_checksum, register_artifacts
+
+    product = db.query(Product).filter(Product.id == pipeline_run.product_id).first()
+    version = pipeline_run.version
+    started = datetime.utcnow()
+    qdrant_client = qdrant_client or QdrantClient()
+    created_collection = None
+
+    try:
+        with zipfile.ZipFile(bundle_path) as zip_file:
+            manifest = read_manifest(zip_file)
+            verify_bundle(zip_file, manifest)
+
+            collection_name = qdrant_client.get_collection_name(
+                str(product.workspace_id), str(product.id), version, product.name
+            )
+            if collection_name in qdrant_client.list_collections():
+                raise RuntimeError(f"Collection {collection_name} already exists, import into a new version")
+            created_collection = collection_name  # Anything under this name from here on is ours to roll back
+            distance = str(manifest.get("distance") or "Cosine").split(".")[-1]
+            tenant = {"workspace_id": str(product.workspace_id), "product_id": str(product.id)}
+            embedding_model = (product.embedding_config or {}).get("embedder_name", "minilm")
+            if not qdrant_client.ensure_collection(
+                collection_name, manifest["vector_size"], distance, tenant=tenant, embedding_model=embedding_model
+            ):
+                raise RuntimeError(f"Failed to create collection {collection_name}")
+
+            batches = iter_bundle_points(
+                bundle_path, zip_file, manifest, product.id, version, collection_name, batch_size=batch_size
+            )
+            upserted = _upsert_parallel(qdrant_client, collection_name, batches, max_workers)
+
+        points_count = (qdrant_client.get_collection_info(collection_name) or {}).get("points_count")
+        if upserted != manifest["total_points"] or points_count != manifest["total_points"]:
+            raise BundleVerificationError(
+                f"Imported {upserted} points, collection holds {points_count}, bundle has {manifest['total_points']}"
+            )
+
+        elapsed = (datetime.utcnow() - started).total_seconds()
+        stats = {
+            "source_collection": manifest.get("collection_name"),
+            "collection_name": collection_name,
+            "points_indexed": upserted,
+            "vector_size": manifest["vector_size"],
+            "parts": len(manifest["parts"]),
+            "duration_seconds": round(elapsed, 1),
+            "points_per_second": round(upserted / elapsed, 1) if elapsed else None,
+        }
+
+        # Register like an indexing run: collection, vector artifact, product version
+        artifact_metadata = {
+            "vectors_indexed": upserted,
+            "collection_name": collection_name,
+            "embedding_model": manifest.get("embedding_model"),
+        }
+        metadata_checksum = calculate_checksum(json.dumps(artifact_metadata, sort_keys=True).encode("utf-8"))
+        register_artifacts(
+            db,
+            [
+                {
+                    "pipeline_run_id": pipeline_run.id,
+                    "workspace_id": product.workspace_id,
+                    "product_id": product.id,
+                    "version": version,
+                    "stage_name": "indexing",
+                    "artifact_type": ArtifactType.VECTOR,
+                    "artifact_name": "qdrant_vectors",
+                    "storage_bucket": "qdrant",
+                    "storage_key": collection_name,
+                    "file_size": 0,
+                    "checksum": metadata_checksum,
+                    "storage_etag": metadata_checksum,
+                    "artifact_metadata": {**artifact_metadata, "imported_from": manifest.get("collection_name")},
+                    "retention_policy": RetentionPolicy.KEEP_FOREVER,
+                }
+            ],
+        )
+        pipeline_run.collection_name = collection_name
+        _finish_import_run(pipeline_run, PipelineRunStatus.SUCCEEDED, stats)
+        product.current_version = version
+        product.status = ProductStatus.READY
+        logger.info(f"Imported bundle into {collection_name}: {upserted} points in {elapsed:.1f}s")
+    except Exception as e:
+        logger.error(f"Bundle import for product {pipeline_run.product_id} v{version} failed: {e}")
+        db.rollback()  # Drop registrations of the failed import that were not committed
+        if created_collection is not None:
+            # Remove the partial collection (or tenant) so the version can be imported again
+            if not qdrant_client.delete_collection(created_collection):
+                logger.warning(f"Could not remove partially imported collection {created_collection}")
+        stats = {"error": str(e)}
+        _finish_import_run(pipeline_run, PipelineRunStatus.FAILED, stats)
+
+    db.commit()
+    return stats
+
+
+def run_import_job(bucket: str, key: str, pipeline_run_id: UUID, max_workers: int = IMPORT_MAX_WORKERS) -> Dict[str, Any]:
+    """
+    Download a bundle from object storage and import it (runs as a background job).
+
+    Args:
+        bucket: Bucket of the bundle
+        key: Object key of the bundle
+        pipeline_run_id: Run from create_import_run()
+        max_workers: Parallel upsert batches
+
+    Returns:
+        Import statistics
+    """
+    from primedata.db.database import get_db
+    from primedata.storage.minio_client import get_storage_client
+
+    db = next(get_db())
+    try:
+        pipeline_run = db.query(PipelineRun).filter(PipelineRun.id == pipeline_run_id).first()
+        with tempfile.TemporaryDirectory(prefix="bundle-import-") as temp_dir:
+            bundle_path = os.path.join(temp_dir, "bundle.zip")
+            with open(bundle_path, "wb") as f:
+                download = get_storage_client().get_many([(bucket, key, f)])[0]
+            if not download.ok:
+                stats = {"error": f"Could not download {bucket}/{key}: {download.error}"}
+                _finish_import_run(pipeline_run, PipelineRunStatus.FAILED, stats)
+                db.commit()
+                return stats
+            return import_bundle_file(db, bundle_path, pipeline_run, max_workers=max_workers)
+    finally:
+        db.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Import an export bundle into a new product version.")
+    parser.add_argument("bundle", help=f"Local bundle path, or object key in {EXPORTS_BUCKET} with --from-storage")
+    parser.add_argument("--product-id", required=True, help="Target product ID")
+    parser.add_argument("--version", type=int, default=None, help="Target version (default: next version)")
+    parser.add_argument("--from-storage", action="store_true", help="Read the bundle from object storage")
+    parser.add_argument("--workers", type=int, default=IMPORT_MAX_WORKERS)
+    parser.add_argument("--batch-size", type=int, default=IMPORT_BATCH_SIZE)
+    args = parser.parse_args()
+
+    from primedata.db.database import get_db
+
+    db = next(get_db())
+    try:
+        product = db.query(Product).filter(Product.id == UUID(args.product_id)).first()
+        if not product:
+            raise SystemExit(f"Product {args.product_id} not found")
+        pipeline_run = create_import_run(db, product, args.version, source=args.bundle)
+        run_id = pipeline_run.id
+    finally:
+        db.close()
+
+    if args.from_storage:
+        stats = run_import_job(EXPORTS_BUCKET, args.bundle, run_id, max_workers=args.workers)
+    else:
+        db = next(get_db())
+        try:
+            pipeline_run = db.query(PipelineRun).filter(PipelineRun.id == run_id).first()
+            stats = import_bundle_file(db, args.bundle, pipeline_run, max_workers=args.workers, batch_size=args.batch_size)
+        finally:
+            db.close()
+    print(json.dumps(stats, indent=2))
+    if "error" in stats:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
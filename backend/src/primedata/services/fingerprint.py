@@ -4,27 +4,28 @@ Fingerprint service for PrimeData.
 Generates readiness fingerprints by aggregating chunk-level metrics.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from loguru import logger
+from primedata.services.metrics_aggregation import HAS_PANDAS, MetricsFrame, aggregate_metrics_by_group
 from primedata.services.trust_scoring import aggregate_metrics, aggregate_metrics_with_ai_ready
 
 
 def generate_fingerprint(
-    metrics: List[Dict[str, Any]], 
+    metrics: Union[List[Dict[str, Any]], MetricsFrame], 
     preprocessing_stats: Optional[Dict[str, Any]] = None
 ) -> Dict[str, float]:
     """
     Generate a readiness fingerprint from chunk-level metrics.
 
     Args:
-        metrics: List of metric dictionaries (one per chunk)
+        metrics: List of metric dictionaries (one per chunk), or a prebuilt MetricsFrame
         preprocessing_stats: Optional preprocessing statistics for Chunk Boundary Quality
 
     Returns:
         Readiness fingerprint dictionary with aggregated metrics
     """
-    if not metrics:
+    if metrics is None or len(metrics) == 0:
         logger.warning("No metrics provided for fingerprint generation")
         return {}
 
@@ -38,6 +39,22 @@ def generate_fingerprint(
     return fingerprint
 
 
+def generate_fingerprint_breakdown(metrics: Union[List[Dict[str, Any]], MetricsFrame]) -> Dict[str, Any]:
+    """
+    Generate per-file and per-section breakdowns (means and percentiles) of chunk-level metrics.
+
+    Args:
+        metrics: List of metric dictionaries (one per chunk), or a prebuilt MetricsFrame
+
+    Returns:
+        Breakdown dictionary with global percentiles, "by_file" and "by_section" entries,
+        or an empty dict if metrics are empty or pandas is unavailable
+    """
+    if not HAS_PANDAS or metrics is None or len(metrics) == 0:
+        return {}
+    return MetricsFrame.from_metrics(metrics).summary()
+
+
 def aggregate_metrics_by_file(
     metrics: List[Dict[str, Any]],
     file_tag: str,
@@ -45,6 +62,9 @@ def aggregate_metrics_by_file(
     """
     Aggregate metrics for a specific file tag.
 
+    Callers that need every file should use aggregate_metrics_by_group(metrics, "file")
+    instead, which aggregates all files in a single pass.
+
     Args:
         metrics: List of all metrics
         file_tag: File identifier (e.g., "MyDoc.jsonl")
@@ -52,8 +72,9 @@ def aggregate_metrics_by_file(
     Returns:
         Aggregated metrics for the file, or None if no metrics found
     """
-    from primedata.services.trust_scoring import aggregate_metrics
-    
+    if HAS_PANDAS:
+        return aggregate_metrics_by_group(metrics, "file").get(file_tag)
+
     file_metrics = [m for m in metrics if m.get("file") == file_tag]
     if not file_metrics:
         return None
@@ -0,0 +1,142 @@
+"""
+Persistent cache for LLM call results.
+
+Results are stored in a small SQLite file keyed by a hash of everything that
+determines the response (model, prompt version, input text, ...), so re-running
+a pipeline or an evaluation over unchanged inputs does not pay for the same
+calls twice.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from loguru import logger
+from primedata.core.metrics import record_cache_lookup
+
+# Default cache location; override with PRIMEDATA_LLM_CACHE_PATH ("" or "off" disables persistence)
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "primedata" / "llm_cache.sqlite"
+# Recently used entries kept in memory in front of SQLite (least recently used are evicted)
+MEMORY_CACHE_MAX_ENTRIES = 10000
+
+
+def make_cache_key(*parts: Any) -> str:
+    """Build a stable cache key from the parts that determine an LLM response."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(str(part).encode("utf-8"))
+        digest.update(b"\x1f")  # Separator so ("ab", "c") != ("a", "bc")
+    return digest.hexdigest()
+
+
+def text_hash(text: str) -> str:
+    """SHA-256 of a text, used to keep cache keys short for long inputs."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class LLMResultCache:
+    """Key/value cache for LLM results, persisted to SQLite.
+
+    Each namespace (e.g. "chunk_optimization", "judge") lives in the same table so
+    one file can serve several callers. The most recently used entries are also kept
+    in a bounded in-memory LRU; when ``path`` is None that LRU is the whole cache.
+    The cache is safe to share between threads.
+    """
+
+    def __init__(self, path: Optional[str] = None, max_memory_entries: int = MEMORY_CACHE_MAX_ENTRIES):
+        self.path = str(path) if path else None
+        self.max_memory_entries = max(1, max_memory_entries)
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._conn: Optional[sqlite3.Connection] = None
+
+        if self.path:
+            try:
+                Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+                self._conn = sqlite3.connect(self.path, check_same_thread=False)
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS llm_cache ("
+                    "namespace TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, "
+                    "PRIMARY KEY (namespace, key))"
+                )
+                self._conn.commit()
+            except Exception as e:
+                logger.warning(f"Could not open LLM cache at {self.path} ({e}), using in-memory cache")
+                self._conn = None
+
+    def get(self, namespace: str, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached value for key, or None."""
+        value = self._lookup(namespace, key)
+        record_cache_lookup("llm", value is not None)
+        return value
+
+    def _lookup(self, namespace: str, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            mem_key = f"{namespace}:{key}"
+            if mem_key in self._memory:
+                self._memory.move_to_end(mem_key)
+                return self._memory[mem_key]
+            if self._conn is None:
+                return None
+            try:
+                row = self._conn.execute(
+                    "SELECT value FROM llm_cache WHERE namespace = ? AND key = ?", (namespace, key)
+                ).fetchone()
+                if row is None:
+                    return None
+                value = json.loads(row[0])
+            except Exception as e:
+                # A broken cache must not fail the LLM call it sits in front of: treat as a miss
+                logger.warning(f"Failed to read LLM cache entry: {e}")
+                return None
+            self._remember(mem_key, value)
+            return value
+
+    def _remember(self, mem_key: str, value: Dict[str, Any]) -> None:
+        """Add an entry to the in-memory LRU (caller holds the lock)."""
+        self._memory[mem_key] = value
+        self._memory.move_to_end(mem_key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def set(self, namespace: str, key: str, value: Dict[str, Any]) -> None:
+        """Store a JSON-serializable value for key."""
+        with self._lock:
+            self._remember(f"{namespace}:{key}", value)
+            if self._conn is None:
+                return
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO llm_cache (namespace, key, value) VALUES (?, ?, ?)",
+                    (namespace, key, json.dumps(value)),
+                )
+                self._conn.commit()
+            except Exception as e:
+                logger.warning(f"Failed to persist LLM cache entry: {e}")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_default_cache: Optional[LLMResultCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> LLMResultCache:
+    """Get the process-wide LLM result cache (singleton pattern)."""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            path = os.getenv("PRIMEDATA_LLM_CACHE_PATH", str(DEFAULT_CACHE_PATH))
+            if path.strip().lower() in ("", "off", "none"):
+                path = None
+            _default_cache = LLMResultCache(path)
+        return _default_cache
@@ -14,7 +14,7 @@ from loguru import logger
 std_logger = std_logging.getLogger(__name__)
 
 try:
-    from openai import OpenAI
+    from openai import AsyncOpenAI, OpenAI
 
     OPENAI_AVAILABLE = True
 except ImportError:
@@ -22,6 +22,15 @@ except ImportError:
     logger.warning("OpenAI package not available. LLM optimization will not work.")
     std_logger.warning("OpenAI package not available. LLM optimization will not work.")
 
+# Bump whenever the optimization prompt or sampling settings change, so cached results are not reused
+PROMPT_VERSION = "v1"
+
+SYSTEM_PROMPT = (
+    "You are an expert at cleaning and optimizing text for AI/ML processing. "
+    "Fix OCR errors, improve text quality, and normalize formatting while "
+    "preserving all factual information and meaning. Only fix errors and formatting."
+)
+
 
 class LLMOptimizationService:
     """Service for LLM-based text optimization."""
@@ -52,14 +61,17 @@ class LLMOptimizationService:
             raise ValueError("OpenAI API key is required. Set OPENAI_API_KEY environment variable or pass api_key parameter.")
 
         self.model = model
+        self.base_url = base_url
         # Set timeout to 30 seconds to prevent hanging requests
         import httpx
 
+        self._timeout = httpx.Timeout(30.0, connect=10.0)  # 30s timeout, 10s connect timeout
         self.client = OpenAI(
             api_key=self.api_key,
             base_url=base_url,
-            timeout=httpx.Timeout(30.0, connect=10.0),  # 30s timeout, 10s connect timeout
+            timeout=self._timeout,
         )
+        self._async_client = None  # Created lazily for concurrent optimization
 
         # Get pricing for model (default to gpt-4-turbo-preview if unknown)
         self.pricing = self.MODEL_PRICING.get(model, self.MODEL_PRICING["gpt-4-turbo-preview"])
@@ -83,79 +95,101 @@ class LLMOptimizationService:
                 - output_tokens: Output tokens
         """
         if not text or len(text.strip()) == 0:
-            return {
-                "enhanced_text": text,
-                "changes_made": [],
-                "cost_estimate": 0.0,
-                "tokens_used": 0,
-                "input_tokens": 0,
-                "output_tokens": 0,
-            }
-
-        # Build prompt
-        prompt = self._build_optimization_prompt(text, context, preserve_formatting)
+            return self._empty_result(text)
 
         try:
             # Call LLM API
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are an expert at cleaning and optimizing text for AI/ML processing. "
-                        "Fix OCR errors, improve text quality, and normalize formatting while "
-                        "preserving all factual information and meaning. Only fix errors and formatting.",
-                    },
-                    {"role": "user", "content": prompt},
-                ],
-                temperature=0.3,  # Lower temperature for more consistent results
-                max_tokens=min(4096, len(text) + 500),  # Allow some expansion but limit
-            )
+            response = self.client.chat.completions.create(**self._build_request(text, context, preserve_formatting))
+            return self._result_from_response(text, response)
 
-            enhanced_text = response.choices[0].message.content.strip()
-
-            # Calculate cost
-            input_tokens = response.usage.prompt_tokens
-            output_tokens = response.usage.completion_tokens
-            total_tokens = response.usage.total_tokens
-
-            cost_estimate = (input_tokens / 1000) * self.pricing["input"] + (output_tokens / 1000) * self.pricing["output"]
+        except Exception as e:
+            return self._error_result(text, e)
 
-            # Detect changes (simple comparison)
-            changes_made = self._detect_changes(text, enhanced_text)
+    async def enhance_text_async(
+        self, text: str, context: Optional[str] = None, preserve_formatting: bool = True
+    ) -> Dict[str, Any]:
+        """Async variant of enhance_text, sharing one async client across calls."""
+        if not text or len(text.strip()) == 0:
+            return self._empty_result(text)
 
-            logger.info(
-                f"LLM optimization completed: {total_tokens} tokens, "
-                f"cost=${cost_estimate:.4f}, changes={len(changes_made)}"
-            )
-            std_logger.info(
-                f"✅ LLM optimization completed: {total_tokens} tokens, "
-                f"cost=${cost_estimate:.4f}, changes={len(changes_made)}"
+        try:
+            if self._async_client is None:
+                self._async_client = AsyncOpenAI(api_key=self.api_key, base_url=self.base_url, timeout=self._timeout)
+            response = await self._async_client.chat.completions.create(
+                **self._build_request(text, context, preserve_formatting)
             )
+            return self._result_from_response(text, response)
+        except Exception as e:
+            return self._error_result(text, e)
 
-            return {
-                "enhanced_text": enhanced_text,
-                "changes_made": changes_made,
-                "cost_estimate": cost_estimate,
-                "tokens_used": total_tokens,
-                "input_tokens": input_tokens,
-                "output_tokens": output_tokens,
-            }
+    async def aclose(self) -> None:
+        """Close the async client (if one was created)."""
+        if self._async_client is not None:
+            await self._async_client.close()
+            self._async_client = None
 
-        except Exception as e:
-            error_msg = f"LLM optimization failed: {e}"
-            logger.error(error_msg, exc_info=True)
-            std_logger.error(error_msg, exc_info=True)
-            # Return original text on error
-            return {
-                "enhanced_text": text,
-                "changes_made": [],
-                "cost_estimate": 0.0,
-                "tokens_used": 0,
-                "input_tokens": 0,
-                "output_tokens": 0,
-                "error": str(e),
-            }
+    def _build_request(self, text: str, context: Optional[str], preserve_formatting: bool) -> Dict[str, Any]:
+        """Build chat completion request arguments for a text."""
+        prompt = self._build_optimization_prompt(text, context, preserve_formatting)
+        return {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": prompt},
+            ],
+            "temperature": 0.3,  # Lower temperature for more consistent results
+            "max_tokens": min(4096, len(text) + 500),  # Allow some expansion but limit
+        }
+
+    def _result_from_response(self, text: str, response: Any) -> Dict[str, Any]:
+        """Convert a chat completion response into an optimization result."""
+        enhanced_text = response.choices[0].message.content.strip()
+
+        # Calculate cost
+        input_tokens = response.usage.prompt_tokens
+        output_tokens = response.usage.completion_tokens
+        total_tokens = response.usage.total_tokens
+
+        cost_estimate = (input_tokens / 1000) * self.pricing["input"] + (output_tokens / 1000) * self.pricing["output"]
+
+        # Detect changes (simple comparison)
+        changes_made = self._detect_changes(text, enhanced_text)
+
+        logger.info(
+            f"LLM optimization completed: {total_tokens} tokens, " f"cost=${cost_estimate:.4f}, changes={len(changes_made)}"
+        )
+        std_logger.info(
+            f"✅ LLM optimization completed: {total_tokens} tokens, " f"cost=${cost_estimate:.4f}, changes={len(changes_made)}"
+        )
+
+        return {
+            "enhanced_text": enhanced_text,
+            "changes_made": changes_made,
+            "cost_estimate": cost_estimate,
+            "tokens_used": total_tokens,
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+        }
+
+    @staticmethod
+    def _empty_result(text: str) -> Dict[str, Any]:
+        return {
+            "enhanced_text": text,
+            "changes_made": [],
+            "cost_estimate": 0.0,
+            "tokens_used": 0,
+            "input_tokens": 0,
+            "output_tokens": 0,
+        }
+
+    def _error_result(self, text: str, error: Exception) -> Dict[str, Any]:
+        error_msg = f"LLM optimization failed: {error}"
+        logger.error(error_msg, exc_info=True)
+        std_logger.error(error_msg, exc_info=True)
+        # Return original text on error
+        result = self._empty_result(text)
+        result["error"] = str(error)
+        return result
 
     def estimate_cost(self, text_length: int) -> float:
         """
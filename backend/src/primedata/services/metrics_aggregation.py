@@ -0,0 +1,210 @@
+"""
+Metrics aggregation engine for PrimeData.
+
+Loads chunk-level metrics into a columnar frame once and computes global,
+per-file and per-section means/percentiles with group-by instead of
+re-scanning the metric dicts for every file or metric label.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from loguru import logger
+
+try:
+    import numpy as np
+    import pandas as pd
+    from pandas.api.types import is_bool_dtype, is_numeric_dtype
+
+    HAS_PANDAS = True
+except ImportError:
+    HAS_PANDAS = False
+    logger.warning("pandas not available, columnar metrics aggregation will be disabled")
+
+# Columns that carry identifiers rather than scores and are never averaged
+EXCLUDED_COLUMNS = ("file",)
+
+# Default percentiles reported alongside means
+DEFAULT_PERCENTILES = (0.1, 0.5, 0.9)
+
+# Labels used when splitting chunks by AI Trust Score threshold
+AI_READY_LABEL = "AI Ready"
+NON_AI_READY_LABEL = "Non-AI Ready"
+
+
+def _percentile_key(q: float) -> str:
+    """Format a quantile (0-1) as a percentile key, e.g. 0.9 -> 'p90'."""
+    return f"p{int(round(q * 100))}"
+
+
+def _to_float_dict(series: "pd.Series", ndigits: int = 4) -> Dict[str, float]:
+    """Convert a numeric series into a rounded dict, dropping NaN entries."""
+    return {str(k): round(float(v), ndigits) for k, v in series.items() if pd.notna(v)}
+
+
+class MetricsFrame:
+    """Columnar view over chunk-level metric dicts.
+
+    The metric list is converted into a DataFrame once. Numeric metric columns are
+    kept as float64 (missing or non-numeric values become NaN so they are skipped
+    by the aggregations, matching the dict-based aggregation semantics).
+    """
+
+    def __init__(self, metrics: List[Dict[str, Any]]):
+        if not HAS_PANDAS:
+            raise RuntimeError("pandas is required for metrics aggregation")
+
+        self._df = pd.DataFrame.from_records(metrics) if metrics else pd.DataFrame()
+        self._numeric = self._build_numeric_frame(self._df)
+
+    @classmethod
+    def from_metrics(cls, metrics: "List[Dict[str, Any]] | MetricsFrame") -> "MetricsFrame":
+        """Return metrics as a frame, reusing it if it is already a MetricsFrame."""
+        if isinstance(metrics, MetricsFrame):
+            return metrics
+        return cls(metrics)
+
+    @staticmethod
+    def _build_numeric_frame(df: "pd.DataFrame") -> "pd.DataFrame":
+        columns: Dict[str, Any] = {}
+        for col in df.columns:
+            if col in EXCLUDED_COLUMNS:
+                continue
+            series = df[col]
+            if is_bool_dtype(series) or is_numeric_dtype(series):
+                columns[col] = series.astype("float64")
+            elif series.dtype == object:
+                # Mixed columns: keep only int/float values (bool included, as in aggregate_metrics)
+                mask = series.map(lambda v: isinstance(v, (int, float)))
+                if mask.any():
+                    columns[col] = series.where(mask, np.nan).astype("float64")
+        return pd.DataFrame(columns, index=df.index)
+
+    def __len__(self) -> int:
+        return len(self._df)
+
+    @property
+    def numeric_columns(self) -> List[str]:
+        """Names of the numeric metric columns."""
+        return list(self._numeric.columns)
+
+    def _group_keys(self, by: str) -> Optional["pd.Series"]:
+        if by not in self._df.columns:
+            return None
+        return self._df[by].fillna("unknown").astype(str)
+
+    def mean(self, ndigits: int = 4) -> Dict[str, float]:
+        """Global mean of every numeric metric column."""
+        if self._numeric.empty:
+            return {}
+        return _to_float_dict(self._numeric.mean(), ndigits)
+
+    def percentiles(
+        self,
+        q: Sequence[float] = DEFAULT_PERCENTILES,
+        columns: Optional[Iterable[str]] = None,
+        ndigits: int = 4,
+    ) -> Dict[str, Dict[str, float]]:
+        """Global percentiles per metric column, e.g. {"AI_Trust_Score": {"p50": ...}}."""
+        numeric = self._numeric if columns is None else self._numeric[[c for c in columns if c in self._numeric]]
+        if numeric.empty:
+            return {}
+        quantiles = numeric.quantile(list(q))
+        result: Dict[str, Dict[str, float]] = {}
+        for col in quantiles.columns:
+            values = {_percentile_key(qv): round(float(v), ndigits) for qv, v in quantiles[col].items() if pd.notna(v)}
+            if values:
+                result[col] = values
+        return result
+
+    def group_mean(self, by: str, ndigits: int = 4) -> Dict[str, Dict[str, float]]:
+        """Mean of every numeric metric column per group (e.g. by="file" or by="section")."""
+        keys = self._group_keys(by)
+        if keys is None or self._numeric.empty:
+            return {}
+        means = self._numeric.groupby(keys, sort=True).mean()
+        return {str(group): _to_float_dict(row, ndigits) for group, row in means.iterrows()}
+
+    def group_summary(
+        self,
+        by: str,
+        q: Sequence[float] = DEFAULT_PERCENTILES,
+        columns: Optional[Iterable[str]] = None,
+        ndigits: int = 4,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Per-group chunk count, means and percentiles computed from a single group-by.
+
+        Returns:
+            {group: {"count": int, "mean": {metric: value}, "percentiles": {metric: {"p50": ...}}}}
+        """
+        keys = self._group_keys(by)
+        if keys is None or self._numeric.empty:
+            return {}
+
+        numeric = self._numeric if columns is None else self._numeric[[c for c in columns if c in self._numeric]]
+        grouped = numeric.groupby(keys, sort=True)
+        counts = keys.value_counts()
+        means = grouped.mean()
+        quantiles = grouped.quantile(list(q))  # MultiIndex (group, q)
+
+        summary: Dict[str, Dict[str, Any]] = {}
+        for group, mean_row in means.iterrows():
+            group_pct: Dict[str, Dict[str, float]] = {}
+            for qv, row in quantiles.loc[group].iterrows():
+                for col, v in row.items():
+                    if pd.notna(v):
+                        group_pct.setdefault(col, {})[_percentile_key(qv)] = round(float(v), ndigits)
+            summary[str(group)] = {
+                "count": int(counts.get(group, 0)),
+                "mean": _to_float_dict(mean_row, ndigits),
+                "percentiles": group_pct,
+            }
+        return summary
+
+    def category_means(
+        self,
+        threshold: float,
+        score_column: str = "AI_Trust_Score",
+        columns: Optional[Iterable[str]] = None,
+    ) -> "pd.DataFrame":
+        """Mean metrics for AI-ready vs non-AI-ready chunks.
+
+        Chunks are categorised by ``score_column >= threshold`` (missing scores count as 0).
+        The returned DataFrame is indexed by "Category" and only contains categories
+        that have at least one chunk.
+        """
+        numeric = self._numeric if columns is None else self._numeric[[c for c in columns if c in self._numeric]]
+        if score_column in self._numeric:
+            scores = self._numeric[score_column].fillna(0.0)
+        else:
+            scores = pd.Series(0.0, index=self._numeric.index)
+        category = pd.Series(
+            np.where(scores >= threshold, AI_READY_LABEL, NON_AI_READY_LABEL),
+            index=self._numeric.index,
+            name="Category",
+        )
+        return numeric.groupby(category, sort=True).mean()
+
+    def summary(self, q: Sequence[float] = DEFAULT_PERCENTILES) -> Dict[str, Any]:
+        """Global, per-file and per-section breakdown of the metrics."""
+        return {
+            "chunk_count": len(self),
+            "percentiles": self.percentiles(q),
+            "by_file": self.group_summary("file", q),
+            "by_section": self.group_summary("section", q),
+        }
+
+
+def aggregate_metrics_by_group(metrics: List[Dict[str, Any]], by: str = "file") -> Dict[str, Dict[str, float]]:
+    """
+    Aggregate metrics per group value in a single pass.
+
+    Args:
+        metrics: List of metric dictionaries (one per chunk)
+        by: Metric key to group on (e.g., "file" or "section")
+
+    Returns:
+        Mapping of group value to aggregated metrics
+    """
+    if not metrics:
+        return {}
+    return MetricsFrame.from_metrics(metrics).group_mean(by)
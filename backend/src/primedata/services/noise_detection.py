@@ -10,9 +10,57 @@ from typing import Dict, List, Any, Optional
 logger = logging.getLogger(__name__)
 
 
+# Noise categories in matching priority order (earlier categories claim characters first)
+NOISE_CATEGORIES = ("boilerplate", "navigation", "legal_footer")
+
+CompiledNoisePatterns = Dict[str, List["re.Pattern[str]"]]
+
+
+def compile_noise_patterns(
+    noise_patterns: Optional[Dict[str, List[Dict[str, Any]]]] = None
+) -> CompiledNoisePatterns:
+    """
+    Compile playbook noise patterns once so they can be reused across chunks.
+    
+    Args:
+        noise_patterns: Dictionary with 'boilerplate', 'navigation', 'legal_footer' patterns
+                        (defaults are used if not provided)
+    
+    Returns:
+        Dict mapping each noise category to its compiled regexes
+    """
+    if not noise_patterns:
+        noise_patterns = _get_default_noise_patterns()
+
+    compiled: CompiledNoisePatterns = {}
+    for category in NOISE_CATEGORIES:
+        if category not in noise_patterns:
+            continue
+        compiled[category] = []
+        for pattern_config in noise_patterns.get(category) or []:
+            pattern = pattern_config.get('pattern')
+            flags_str = pattern_config.get('flags', '')
+
+            if not pattern:
+                continue
+
+            flags = 0
+            if 'MULTILINE' in flags_str:
+                flags |= re.MULTILINE
+            if 'IGNORECASE' in flags_str:
+                flags |= re.IGNORECASE
+
+            try:
+                compiled[category].append(re.compile(pattern, flags))
+            except Exception as e:
+                logger.warning(f"Error in {category} pattern {pattern}: {e}")
+    return compiled
+
+
 def calculate_noise_ratio(
     chunk_text: str,
-    noise_patterns: Optional[Dict[str, List[Dict[str, Any]]]] = None
+    noise_patterns: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+    compiled_patterns: Optional[CompiledNoisePatterns] = None,
 ) -> Dict[str, Any]:
     """
     Calculate noise ratio for a chunk.
@@ -21,6 +69,8 @@ def calculate_noise_ratio(
         chunk_text: The chunk text to analyze
         noise_patterns: Dictionary with 'boilerplate', 'navigation', 'legal_footer' patterns
                         Each pattern has 'pattern' (regex) and 'flags' (optional)
+        compiled_patterns: Optional output of compile_noise_patterns(); takes precedence over
+                           noise_patterns and avoids recompiling for every chunk
     
     Returns:
         Dict with noise ratio and breakdown
@@ -35,100 +85,26 @@ def calculate_noise_ratio(
             "legal_footer_chars": 0
         }
     
-    if not noise_patterns:
-        # Default patterns if none provided
-        noise_patterns = _get_default_noise_patterns()
+    if compiled_patterns is None:
+        compiled_patterns = compile_noise_patterns(noise_patterns)
     
     total_chars = len(chunk_text)
     noise_chars = 0
-    boilerplate_chars = 0
-    navigation_chars = 0
-    legal_footer_chars = 0
+    category_chars = {category: 0 for category in NOISE_CATEGORIES}
     
     # Track matched positions to avoid double-counting
-    matched_positions = set()
-    
-    # Check boilerplate patterns
-    if 'boilerplate' in noise_patterns:
-        for pattern_config in noise_patterns['boilerplate']:
-            pattern = pattern_config.get('pattern')
-            flags_str = pattern_config.get('flags', '')
-            
-            if not pattern:
-                continue
-            
-            flags = 0
-            if 'MULTILINE' in flags_str:
-                flags |= re.MULTILINE
-            if 'IGNORECASE' in flags_str:
-                flags |= re.IGNORECASE
-            
-            try:
-                regex = re.compile(pattern, flags)
-                for match in regex.finditer(chunk_text):
-                    start, end = match.span()
-                    # Only count if not already matched
-                    if not any(start <= pos < end for pos in matched_positions):
-                        length = end - start
-                        boilerplate_chars += length
-                        noise_chars += length
-                        matched_positions.update(range(start, end))
-            except Exception as e:
-                logger.warning(f"Error in boilerplate pattern {pattern}: {e}")
-    
-    # Check navigation patterns
-    if 'navigation' in noise_patterns:
-        for pattern_config in noise_patterns.get('navigation', []):
-            pattern = pattern_config.get('pattern')
-            flags_str = pattern_config.get('flags', '')
-            
-            if not pattern:
-                continue
-            
-            flags = 0
-            if 'MULTILINE' in flags_str:
-                flags |= re.MULTILINE
-            if 'IGNORECASE' in flags_str:
-                flags |= re.IGNORECASE
-            
-            try:
-                regex = re.compile(pattern, flags)
-                for match in regex.finditer(chunk_text):
-                    start, end = match.span()
-                    if not any(start <= pos < end for pos in matched_positions):
-                        length = end - start
-                        navigation_chars += length
-                        noise_chars += length
-                        matched_positions.update(range(start, end))
-            except Exception as e:
-                logger.warning(f"Error in navigation pattern {pattern}: {e}")
+    matched = bytearray(total_chars)
     
-    # Check legal footer patterns
-    if 'legal_footer' in noise_patterns:
-        for pattern_config in noise_patterns.get('legal_footer', []):
-            pattern = pattern_config.get('pattern')
-            flags_str = pattern_config.get('flags', '')
-            
-            if not pattern:
-                continue
-            
-            flags = 0
-            if 'MULTILINE' in flags_str:
-                flags |= re.MULTILINE
-            if 'IGNORECASE' in flags_str:
-                flags |= re.IGNORECASE
-            
-            try:
-                regex = re.compile(pattern, flags)
-                for match in regex.finditer(chunk_text):
-                    start, end = match.span()
-                    if not any(start <= pos < end for pos in matched_positions):
-                        length = end - start
-                        legal_footer_chars += length
-                        noise_chars += length
-                        matched_positions.update(range(start, end))
-            except Exception as e:
-                logger.warning(f"Error in legal_footer pattern {pattern}: {e}")
+    for category in NOISE_CATEGORIES:
+        for regex in compiled_patterns.get(category, []):
+            for match in regex.finditer(chunk_text):
+                start, end = match.span()
+                # Only count if not already matched
+                if 1 not in matched[start:end]:
+                    length = end - start
+                    category_chars[category] += length
+                    noise_chars += length
+                    matched[start:end] = b"\x01" * length
     
     # Calculate noise ratio
     noise_ratio = (noise_chars / total_chars * 100) if total_chars > 0 else 0.0
@@ -137,9 +113,9 @@ def calculate_noise_ratio(
         "noise_ratio": round(noise_ratio, 2),
         "total_chars": total_chars,
         "noise_chars": noise_chars,
-        "boilerplate_chars": boilerplate_chars,
-        "navigation_chars": navigation_chars,
-        "legal_footer_chars": legal_footer_chars
+        "boilerplate_chars": category_chars["boilerplate"],
+        "navigation_chars": category_chars["navigation"],
+        "legal_footer_chars": category_chars["legal_footer"]
     }
 
 
@@ -0,0 +1,332 @@
+"""
+Retrieval result cache for the playground and chat endpoints.
+
+Identical questions (dashboards, demos, evaluation smoke tests) otherwise
+re-embed the query, re-search Qdrant and re-boost the results every time.
+Results are cached by (endpoint, product, collection/version, normalized query,
+top_k, filters, ACL fingerprint) in a bounded in-process LRU and, when
+configured, a shared Redis tier so that several API workers share hits.
+
+Invalidation uses generation counters: every key embeds the current generation
+of its product and collection, and promoting a version (``set_prod_alias``) or
+re-indexing a collection bumps the generation so stale entries are never read
+again and simply age out. Without the shared tier, invalidations raised in
+another process (e.g. an Airflow indexing task) are bounded by the TTL.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from loguru import logger
+from primedata.core.metrics import record_cache_lookup
+from primedata.services.llm_cache import make_cache_key
+
+try:
+    import redis
+
+    HAS_REDIS = True
+except ImportError:
+    HAS_REDIS = False
+
+DEFAULT_MAX_ENTRIES = 2048
+DEFAULT_TTL_SECONDS = 300  # Well below the 1h presigned URL expiry of cached playground results
+SHARED_KEY_PREFIX = "primedata:query_cache:"
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a query for cache lookups (case-folded, whitespace collapsed)."""
+    return " ".join(query.split()).casefold()
+
+
+def acl_fingerprint(acls: Optional[Iterable[Any]]) -> str:
+    """
+    Fingerprint of a user's ACL entries for a product.
+
+    Users with the same effective ACLs share cache entries; users without ACLs
+    all map to "none".
+    """
+    entries = []
+    for acl in acls or []:
+        access_type = getattr(acl, "access_type", None)
+        entries.append(
+            (
+                str(getattr(access_type, "value", access_type)),
+                getattr(acl, "index_scope", None) or "",
+                getattr(acl, "doc_scope", None) or "",
+                getattr(acl, "field_scope", None) or "",
+            )
+        )
+    if not entries:
+        return "none"
+    return make_cache_key(*sorted(entries))
+
+
+class RedisQueryCacheTier:
+    """Shared cache tier backed by Redis (values and generation counters)."""
+
+    def __init__(self, url: str):
+        self.client = redis.Redis.from_url(url, socket_timeout=0.25, socket_connect_timeout=0.25)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        raw = self.client.get(SHARED_KEY_PREFIX + key)
+        return json.loads(raw) if raw is not None else None
+
+    def set(self, key: str, entry: Dict[str, Any], ttl_seconds: int) -> None:
+        self.client.set(SHARED_KEY_PREFIX + key, json.dumps(entry), ex=ttl_seconds)
+
+    def generations(self, scopes: Tuple[str, ...]) -> Tuple[int, ...]:
+        values = self.client.mget([f"{SHARED_KEY_PREFIX}gen:{scope}" for scope in scopes])
+        return tuple(int(v) if v is not None else 0 for v in values)
+
+    def bump(self, scope: str) -> int:
+        return int(self.client.incr(f"{SHARED_KEY_PREFIX}gen:{scope}"))
+
+
+class QueryResultCache:
+    """Two-tier (in-process LRU + optional shared) cache for retrieval results with TTL and statistics."""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+        shared_tier: Optional[Any] = None,
+        enabled: bool = True,
+    ):
+        """
+        Args:
+            max_entries: Maximum number of entries kept in the in-process tier
+            ttl_seconds: Time-to-live of an entry in both tiers
+            shared_tier: Optional shared tier (get/set/generations/bump), e.g. RedisQueryCacheTier
+            enabled: When False, lookups always miss and nothing is stored
+        """
+        self.max_entries = max(1, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self.shared_tier = shared_tier
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._generations: Dict[str, int] = {}
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.local_hits = 0
+            self.shared_hits = 0
+            self.misses = 0
+            self.errors = 0
+            self.saved_latency_ms = 0.0
+
+    # ---- Keys and invalidation ----
+
+    def _scope_generations(self, scopes: Tuple[str, ...]) -> Tuple[int, ...]:
+        if self.shared_tier is not None:
+            try:
+                return self.shared_tier.generations(scopes)
+            except Exception as e:
+                self._shared_error("read generations", e)
+        with self._lock:
+            return tuple(self._generations.get(scope, 0) for scope in scopes)
+
+    def make_key(
+        self,
+        namespace: str,
+        product_id: Any,
+        collection_name: str,
+        version: Optional[int],
+        query: str,
+        top_k: int,
+        filters: Optional[Dict[str, Any]] = None,
+        acl_fp: str = "none",
+    ) -> str:
+        """
+        Build the cache key for a retrieval request.
+
+        Args:
+            namespace: Endpoint the result belongs to ("playground", "chat")
+            product_id: Product ID
+            collection_name: Resolved Qdrant collection (not the alias)
+            version: Product version being queried
+            query: Raw query text (normalized here)
+            top_k: Number of results requested
+            filters: Any other parameters that change the result (filters, embedding model, ...)
+            acl_fp: ACL fingerprint of the requesting user, see acl_fingerprint()
+
+        Returns:
+            Cache key string
+        """
+        scopes = (f"product:{product_id}", f"collection:{collection_name}")
+        generations = self._scope_generations(scopes)
+        return make_cache_key(
+            namespace,
+            product_id,
+            collection_name,
+            version,
+            normalize_query(query),
+            top_k,
+            json.dumps(filters or {}, sort_keys=True, default=str),
+            acl_fp,
+            *generations,
+        )
+
+    def invalidate_product(self, product_id: Any) -> None:
+        """Invalidate all cached results of a product (e.g. after promoting a version)."""
+        self._bump(f"product:{product_id}")
+
+    def invalidate_collection(self, collection_name: str) -> None:
+        """Invalidate all cached results of a collection (e.g. after re-indexing it)."""
+        self._bump(f"collection:{collection_name}")
+
+    def _bump(self, scope: str) -> None:
+        with self._lock:
+            self._generations[scope] = self._generations.get(scope, 0) + 1
+        if self.shared_tier is not None:
+            try:
+                self.shared_tier.bump(scope)
+            except Exception as e:
+                self._shared_error("bump generation", e)
+        logger.debug(f"Query cache invalidated {scope}")
+
+    # ---- Lookups ----
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached value for key, or None on a miss."""
+        if not self.enabled:
+            return None
+        started = time.perf_counter()
+        now = time.time()
+        entry = None
+        with self._lock:
+            item = self._entries.get(key)
+            if item is not None:
+                expires_at, entry = item
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self.local_hits += 1
+                else:
+                    del self._entries[key]
+                    entry = None
+
+        if entry is None and self.shared_tier is not None:
+            try:
+                entry = self.shared_tier.get(key)
+            except Exception as e:
+                self._shared_error("get", e)
+                entry = None
+            if entry is not None:
+                with self._lock:
+                    self.shared_hits += 1
+                self._store_local(key, entry, now)
+
+        lookup_ms = (time.perf_counter() - started) * 1000
+        record_cache_lookup("query", entry is not None)
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            self.saved_latency_ms += max(0.0, entry.get("latency_ms", 0.0) - lookup_ms)
+        return entry["value"]
+
+    def set(self, key: str, value: Dict[str, Any], latency_ms: float = 0.0) -> None:
+        """
+        Store a JSON-serializable value.
+
+        Args:
+            key: Key from make_key()
+            value: Result to cache
+            latency_ms: Time it took to compute the value (reported as saved latency on hits)
+        """
+        if not self.enabled:
+            return
+        entry = {"value": value, "latency_ms": latency_ms}
+        self._store_local(key, entry, time.time())
+        if self.shared_tier is not None:
+            try:
+                self.shared_tier.set(key, entry, self.ttl_seconds)
+            except Exception as e:
+                self._shared_error("set", e)
+
+    def _store_local(self, key: str, entry: Dict[str, Any], now: float) -> None:
+        with self._lock:
+            self._entries[key] = (now + self.ttl_seconds, entry)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _shared_error(self, operation: str, error: Exception) -> None:
+        with self._lock:
+            self.errors += 1
+        logger.warning(f"Shared query cache {operation} failed: {error}")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counts, hit ratio and latency saved by cache hits."""
+        with self._lock:
+            hits = self.local_hits + self.shared_hits
+            total = hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "shared_tier": self.shared_tier is not None,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": hits,
+                "local_hits": self.local_hits,
+                "shared_hits": self.shared_hits,
+                "misses": self.misses,
+                "hit_ratio": round(hits / total, 4) if total else 0.0,
+                "saved_latency_ms": round(self.saved_latency_ms, 1),
+                "shared_errors": self.errors,
+            }
+
+
+_query_cache: Optional[QueryResultCache] = None
+_query_cache_lock = threading.Lock()
+
+
+def get_query_cache() -> QueryResultCache:
+    """
+    Get the process-wide query result cache (singleton pattern).
+
+    Configured with PRIMEDATA_QUERY_CACHE_ENABLED, PRIMEDATA_QUERY_CACHE_MAX_ENTRIES,
+    PRIMEDATA_QUERY_CACHE_TTL_SECONDS and PRIMEDATA_QUERY_CACHE_REDIS_URL (shared tier).
+    """
+    global _query_cache
+    with _query_cache_lock:
+        if _query_cache is None:
+            enabled = os.getenv("PRIMEDATA_QUERY_CACHE_ENABLED", "true").strip().lower() not in ("0", "false", "no", "off")
+            shared_tier = None
+            redis_url = os.getenv("PRIMEDATA_QUERY_CACHE_REDIS_URL", "").strip()
+            if enabled and redis_url:
+                if HAS_REDIS:
+                    try:
+                        shared_tier = RedisQueryCacheTier(redis_url)
+                    except Exception as e:
+                        logger.warning(f"Could not configure shared query cache ({e}), using in-process cache only")
+                else:
+                    logger.warning("PRIMEDATA_QUERY_CACHE_REDIS_URL is set but redis is not installed")
+            _query_cache = QueryResultCache(
+                max_entries=int(os.getenv("PRIMEDATA_QUERY_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)),
+                ttl_seconds=int(os.getenv("PRIMEDATA_QUERY_CACHE_TTL_SECONDS", DEFAULT_TTL_SECONDS)),
+                shared_tier=shared_tier,
+                enabled=enabled,
+            )
+        return _query_cache
+
+
+def invalidate_query_cache(product_id: Any = None, collection_name: Optional[str] = None) -> None:
+    """Invalidate cached retrieval results for a product and/or collection; never raises."""
+    try:
+        cache = get_query_cache()
+        if product_id is not None:
+            cache.invalidate_product(product_id)
+        if collection_name:
+            cache.invalidate_collection(collection_name)
+    except Exception as e:
+        logger.warning(f"Query cache invalidation failed: {e}")
@@ -2,17 +2,322 @@
 Structured logging service for RAG requests.
 
 Logs RAG requests with all relevant context for evaluation and monitoring.
+
+Logging is off the request path: ``RAGLoggingService.log_request`` only builds a
+log event and puts it on a bounded in-process queue. A background writer thread
+uploads the response texts to object storage (``get_rag_log_response_path``, the
+row keeps ``response_path``) and bulk-inserts the rows every
+PRIMEDATA_RAG_LOG_FLUSH_MS milliseconds or PRIMEDATA_RAG_LOG_BATCH_SIZE rows,
+whichever comes first. When the queue is full, events wait up to
+PRIMEDATA_RAG_LOG_ENQUEUE_TIMEOUT_MS (default 0) and are then dropped and counted.
+Set PRIMEDATA_RAG_LOG_ASYNC=false to write each request synchronously instead.
 """
 
+import atexit
 import hashlib
+import os
+import queue
+import threading
 import time
-from typing import Dict, List, Optional
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
 from uuid import UUID
 
 from loguru import logger
+from primedata.core.metrics import REGISTRY
+from primedata.db.models import RAGRequestLog
+from primedata.services.s3_content_storage import CONTENT_BUCKET, get_rag_log_response_path
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
-from primedata.db.models import RAGRequestLog
+DEFAULT_QUEUE_SIZE = 10000
+DEFAULT_BATCH_SIZE = 200
+DEFAULT_FLUSH_MS = 500
+DEFAULT_ENQUEUE_TIMEOUT_MS = 0
+SHUTDOWN_TIMEOUT_SECONDS = 10.0
+# Log a warning for the first dropped event and then every N drops
+DROP_WARNING_EVERY = 1000
+
+RAG_LOG_EVENTS = REGISTRY.counter(
+    "primedata_rag_log_events_total", "RAG request log events by outcome (enqueued, written, dropped, failed)", ("result",)
+)
+RAG_LOG_QUEUE_DEPTH = REGISTRY.gauge("primedata_rag_log_queue_depth", "RAG request log events waiting to be written")
+RAG_LOG_BATCH_DURATION = REGISTRY.histogram(
+    "primedata_rag_log_batch_seconds", "Time to upload responses and insert one batch of RAG request logs"
+)
+
+_STOP = object()
+
+
+def _response_prompt_hash(query: str, response: Optional[str]) -> Optional[str]:
+    if not response:
+        return None
+    return hashlib.sha256(f"{query}\n{response}".encode()).hexdigest()[:64]
+
+
+class RAGLogWriter:
+    """Bounded queue of RAG log events drained by a background thread in batches.
+
+    The thread is started on the first submit. Events are written in the order
+    they were submitted; a failed batch is counted and logged, not retried.
+    """
+
+    def __init__(
+        self,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_ms: int = DEFAULT_FLUSH_MS,
+        enqueue_timeout_ms: int = DEFAULT_ENQUEUE_TIMEOUT_MS,
+        session_factory: Optional[Callable[[], Session]] = None,
+        storage_client: Any = None,
+    ):
+        """
+        Args:
+            queue_size: Maximum number of events waiting to be written
+            batch_size: Maximum number of rows per insert
+            flush_ms: Maximum time an event waits for its batch to fill up
+            enqueue_timeout_ms: How long submit() waits for room in a full queue before dropping
+            session_factory: Creates database sessions (default: SessionLocal)
+            storage_client: Storage client for response texts (default: get_storage_client())
+        """
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = max(0.0, flush_ms / 1000)
+        self.enqueue_timeout = max(0.0, enqueue_timeout_ms / 1000)
+        self._session_factory = session_factory
+        self._storage_client = storage_client
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max(1, queue_size))
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        self.enqueued = 0
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+        self.batches = 0
+
+    # ---- Producer side ----
+
+    def submit(self, event: Dict[str, Any]) -> bool:
+        """Queue a log event (a RAGRequestLog row plus "response"); False if it was dropped."""
+        if self._closed:
+            self._count_drop("writer closed")
+            return False
+        if self._thread is None:
+            self._start()
+        try:
+            if self.enqueue_timeout > 0:
+                self._queue.put(event, timeout=self.enqueue_timeout)
+            else:
+                self._queue.put_nowait(event)
+        except queue.Full:
+            self._count_drop("queue full")
+            return False
+        with self._lock:
+            self.enqueued += 1
+        RAG_LOG_EVENTS.inc(result="enqueued")
+        return True
+
+    def _count_drop(self, reason: str) -> None:
+        with self._lock:
+            self.dropped += 1
+            dropped = self.dropped
+        RAG_LOG_EVENTS.inc(result="dropped")
+        if dropped == 1 or dropped % DROP_WARNING_EVERY == 0:
+            logger.warning(f"Dropped RAG request log event ({reason}); {dropped} dropped so far")
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name="rag-log-writer", daemon=True)
+            self._thread.start()
+        atexit.register(self.close)
+
+    # ---- Writer thread ----
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            first = self._queue.get()
+            batch: List[Dict[str, Any]] = []
+            if first is _STOP:
+                stopping = True
+            else:
+                batch.append(first)
+            deadline = time.monotonic() + self.flush_interval
+            while not stopping and len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                else:
+                    batch.append(item)
+            try:
+                if batch:
+                    self.write_batch(batch)
+            except Exception as e:
+                with self._lock:
+                    self.failed += len(batch)
+                RAG_LOG_EVENTS.inc(len(batch), result="failed")
+                logger.error(f"Failed to prepare {len(batch)} RAG request logs: {e}")
+            finally:
+                for _ in range(len(batch) + (1 if stopping else 0)):
+                    self._queue.task_done()
+
+    def write_batch(self, events: List[Dict[str, Any]]) -> int:
+        """Upload the responses of a batch and insert its rows; returns the number of rows written.
+
+        Rows are inserted with a session of their own, so a failed write never rolls back
+        a caller's transaction.
+
+        Args:
+            events: Events built by RAGLoggingService.log_request
+        """
+        started = time.perf_counter()
+        rows = []
+        uploads = []
+        for event in events:
+            row = dict(event, response_path=None)
+            response = row.pop("response", None)
+            if row.get("prompt_hash") is None:
+                row["prompt_hash"] = _response_prompt_hash(row["query"], response)
+            if response:
+                row["response_path"] = get_rag_log_response_path(
+                    row["workspace_id"], row["product_id"], row["version"], row["id"]
+                )
+                uploads.append((row, (CONTENT_BUCKET, row["response_path"], response.encode("utf-8"), "text/plain")))
+            rows.append(row)
+
+        if uploads:
+            try:
+                client = self._storage_client
+                if client is None:
+                    from primedata.storage.minio_client import get_storage_client
+
+                    client = get_storage_client()
+                results = client.put_many([upload for _, upload in uploads])
+            except Exception as e:
+                logger.error(f"Failed to upload {len(uploads)} RAG log responses: {e}")
+                results = [None] * len(uploads)
+            for (row, _), result in zip(uploads, results):
+                if result is None or not result.ok:
+                    row["response_path"] = None
+
+        if self._session_factory is None:
+            from primedata.db.database import SessionLocal
+
+            self._session_factory = SessionLocal
+        db = self._session_factory()
+        try:
+            db.execute(insert(RAGRequestLog), rows)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            with self._lock:
+                self.failed += len(rows)
+            RAG_LOG_EVENTS.inc(len(rows), result="failed")
+            logger.error(f"Failed to write {len(rows)} RAG request logs: {e}")
+            return 0
+        finally:
+            db.close()
+
+        with self._lock:
+            self.written += len(rows)
+            self.batches += 1
+        RAG_LOG_EVENTS.inc(len(rows), result="written")
+        RAG_LOG_BATCH_DURATION.observe(time.perf_counter() - started)
+        logger.debug(f"Wrote {len(rows)} RAG request logs ({len(uploads)} responses uploaded)")
+        return len(rows)
+
+    # ---- Lifecycle ----
+
+    def flush(self, timeout: float = SHUTDOWN_TIMEOUT_SECONDS) -> bool:
+        """Wait until every queued event has been written (or failed); False on timeout."""
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if self._thread is None or time.monotonic() >= deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def close(self, timeout: float = SHUTDOWN_TIMEOUT_SECONDS) -> None:
+        """Write what is queued and stop the writer thread; later events are dropped."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+        if thread is None:
+            return
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            logger.warning(f"RAG log writer did not drain within {timeout}s; {self._queue.qsize()} events lost")
+            return
+        thread.join(timeout)
+
+    def stats(self) -> Dict[str, int]:
+        """Event counts and current queue depth."""
+        with self._lock:
+            return {
+                "queued": self._queue.qsize(),
+                "enqueued": self.enqueued,
+                "written": self.written,
+                "dropped": self.dropped,
+                "failed": self.failed,
+                "batches": self.batches,
+            }
+
+
+_rag_log_writer: Optional[RAGLogWriter] = None
+_rag_log_writer_lock = threading.Lock()
+
+
+def rag_log_async_enabled() -> bool:
+    """Whether RAG request logs are written by the background writer (PRIMEDATA_RAG_LOG_ASYNC, default on)."""
+    return os.getenv("PRIMEDATA_RAG_LOG_ASYNC", "true").strip().lower() not in ("0", "false", "no", "off")
+
+
+def get_rag_log_writer() -> RAGLogWriter:
+    """
+    Get the process-wide RAG log writer (singleton pattern).
+
+    Configured with PRIMEDATA_RAG_LOG_QUEUE_SIZE, PRIMEDATA_RAG_LOG_BATCH_SIZE,
+    PRIMEDATA_RAG_LOG_FLUSH_MS and PRIMEDATA_RAG_LOG_ENQUEUE_TIMEOUT_MS.
+    """
+    global _rag_log_writer
+    with _rag_log_writer_lock:
+        if _rag_log_writer is None:
+            _rag_log_writer = RAGLogWriter(
+                queue_size=int(os.getenv("PRIMEDATA_RAG_LOG_QUEUE_SIZE", DEFAULT_QUEUE_SIZE)),
+                batch_size=int(os.getenv("PRIMEDATA_RAG_LOG_BATCH_SIZE", DEFAULT_BATCH_SIZE)),
+                flush_ms=int(os.getenv("PRIMEDATA_RAG_LOG_FLUSH_MS", DEFAULT_FLUSH_MS)),
+                enqueue_timeout_ms=int(os.getenv("PRIMEDATA_RAG_LOG_ENQUEUE_TIMEOUT_MS", DEFAULT_ENQUEUE_TIMEOUT_MS)),
+            )
+        return _rag_log_writer
+
+
+def _collect_queue_depth() -> None:
+    writer = _rag_log_writer
+    RAG_LOG_QUEUE_DEPTH.set(writer.stats()["queued"] if writer is not None else 0)
+
+
+REGISTRY.add_collector(_collect_queue_depth)
+
+
+def shutdown_rag_log_writer(timeout: float = SHUTDOWN_TIMEOUT_SECONDS) -> None:
+    """Drain and stop the process-wide writer (e.g. on application shutdown)."""
+    global _rag_log_writer
+    with _rag_log_writer_lock:
+        writer, _rag_log_writer = _rag_log_writer, None
+    if writer is not None:
+        writer.close(timeout)
 
 
 class RAGLoggingService:
@@ -41,18 +346,22 @@ class RAGLoggingService:
         response_tokens: Optional[int] = None,
         latency_ms: Optional[float] = None,
         sampled_for_eval: bool = False,
-    ) -> RAGRequestLog:
+    ) -> Optional[UUID]:
         """
         Log a RAG request.
-        
+
+        The log is queued for the background writer; with PRIMEDATA_RAG_LOG_ASYNC=false
+        it is written before returning (in a separate session, the caller's ``db`` is
+        never committed or rolled back).
+
         Args:
-            db: Database session
+            db: Database session of the caller (not used for writing the log)
             workspace_id: Workspace ID
             product_id: Product ID
             user_id: User ID (optional)
             version: Product version
             query: Query text
-            response: Generated response (optional)
+            response: Generated response (optional, stored in object storage)
             retrieved_chunk_ids: List of retrieved chunk IDs
             retrieved_doc_ids: List of retrieved document IDs
             retrieval_scores: Retrieval similarity scores
@@ -60,51 +369,47 @@ class RAGLoggingService:
             policy_context: Policy context applied
             acl_applied: Whether ACL was applied
             acl_denied: Whether ACL denied the request
-            prompt_hash: Hash of the prompt used
+            prompt_hash: Hash of the prompt used (defaults to a hash of query and response)
             model: LLM model used
             temperature: Temperature setting
             max_tokens: Max tokens setting
             response_tokens: Number of tokens in response
             latency_ms: Total latency in milliseconds
             sampled_for_eval: Whether this request was sampled for evaluation
-            
+
         Returns:
-            Created RAGRequestLog entry
+            ID of the log entry, or None if it was dropped (queue full) or failed to write
         """
-        # Generate prompt hash if not provided
-        if prompt_hash is None and response:
-            prompt_text = f"{query}\n{response}"
-            prompt_hash = hashlib.sha256(prompt_text.encode()).hexdigest()[:64]
-
-        log_entry = RAGRequestLog(
-            workspace_id=workspace_id,
-            product_id=product_id,
-            user_id=user_id,
-            version=version,
-            query=query,
-            response=response,
-            retrieved_chunk_ids=retrieved_chunk_ids,
-            retrieved_doc_ids=retrieved_doc_ids,
-            retrieval_scores=retrieval_scores,
-            filters_applied=filters_applied,
-            policy_context=policy_context,
-            acl_applied=acl_applied,
-            acl_denied=acl_denied,
-            prompt_hash=prompt_hash,
-            model=model,
-            temperature=temperature,
-            max_tokens=max_tokens,
-            response_tokens=response_tokens,
-            latency_ms=latency_ms,
-            sampled_for_eval=sampled_for_eval,
-        )
-
-        db.add(log_entry)
-        db.commit()
-        db.refresh(log_entry)
-
-        logger.debug(f"Logged RAG request {log_entry.id} for product {product_id}")
-        return log_entry
+        log_id = uuid.uuid4()
+        event = {
+            "id": log_id,
+            "workspace_id": workspace_id,
+            "product_id": product_id,
+            "user_id": user_id,
+            "version": version,
+            "query": query,
+            "response": response,
+            "retrieved_chunk_ids": retrieved_chunk_ids,
+            "retrieved_doc_ids": retrieved_doc_ids,
+            "retrieval_scores": retrieval_scores,
+            "filters_applied": filters_applied,
+            "policy_context": policy_context,
+            "acl_applied": acl_applied,
+            "acl_denied": acl_denied,
+            "prompt_hash": prompt_hash,
+            "model": model,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "response_tokens": response_tokens,
+            "latency_ms": latency_ms,
+            "sampled_for_eval": sampled_for_eval,
+            "timestamp": datetime.now(timezone.utc),
+        }
+
+        writer = get_rag_log_writer()
+        if not rag_log_async_enabled():
+            return log_id if writer.write_batch([event]) else None
+        return log_id if writer.submit(event) else None
 
     @staticmethod
     def get_request_logs(
@@ -126,7 +431,3 @@ class RAGLoggingService:
             query = query.filter(RAGRequestLog.version == version)
 
         return query.order_by(RAGRequestLog.timestamp.desc()).offset(offset).limit(limit).all()
-
-
-
-
@@ -7,9 +7,10 @@ Generates validation summaries (CSV) and trust reports (PDF) from metrics.
 import io
 import json
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from loguru import logger
+from primedata.services.metrics_aggregation import AI_READY_LABEL, NON_AI_READY_LABEL, MetricsFrame
 
 try:
     import pandas as pd
@@ -53,16 +54,13 @@ def generate_validation_summary(
         logger.warning("No metrics provided for validation summary")
         return ""
 
-    df = pd.DataFrame(metrics)
+    frame = MetricsFrame(metrics)
 
     # Check if AI_Trust_Score exists (required for categorization)
-    if "AI_Trust_Score" not in df.columns:
+    if "AI_Trust_Score" not in frame.numeric_columns:
         logger.warning("AI_Trust_Score column not found in metrics, cannot generate validation summary")
         return ""
 
-    # Categorize: AI Ready if score >= threshold
-    df["Category"] = df["AI_Trust_Score"].apply(lambda x: "AI Ready" if x >= threshold else "Non-AI Ready")
-
     # Define expected columns with their display names
     expected_columns = {
         "AI_Trust_Score": "Avg Trust Score",
@@ -80,21 +78,18 @@ def generate_validation_summary(
         "KnowledgeBase_Ready": "Avg KB Readiness",
     }
 
-    # Only aggregate columns that actually exist in the DataFrame (excluding AI_Trust_Score from aggregation)
+    # Only aggregate columns that actually exist in the metrics
     # AI_Trust_Score is used for categorization but should still be included in summary
-    agg_dict = {}
-    rename_dict = {}
-    for col_name, display_name in expected_columns.items():
-        if col_name in df.columns:
-            agg_dict[col_name] = "mean"
-            rename_dict[col_name] = display_name
-
-    if not agg_dict:
+    rename_dict = {
+        col_name: display_name for col_name, display_name in expected_columns.items() if col_name in frame.numeric_columns
+    }
+
+    if not rename_dict:
         logger.warning("No valid metric columns found for aggregation")
         return ""
 
-    # Compute summary stats
-    summary = df.groupby("Category").agg(agg_dict).rename(columns=rename_dict)
+    # Compute summary stats (Category: AI Ready if score >= threshold)
+    summary = frame.category_means(threshold, columns=rename_dict.keys()).rename(columns=rename_dict)
 
     # Convert to CSV string
     csv_buffer = io.StringIO()
@@ -106,6 +101,30 @@ def generate_validation_summary(
     return csv_content
 
 
+def _category_averages(metrics: List[Dict[str, Any]], labels: List[str], threshold: float) -> Tuple[List[float], List[float]]:
+    """Average of each label for AI-ready and non-ready chunks (0 where a category has no values)."""
+    if HAS_PANDAS:
+        # One group-by over all labels
+        category_means = MetricsFrame(metrics).category_means(threshold, columns=labels)
+
+        def _category_values(category: str) -> List[float]:
+            if category not in category_means.index:
+                return [0] * len(labels)
+            row = category_means.loc[category]
+            return [float(row[m]) if m in row and pd.notna(row[m]) else 0 for m in labels]
+
+        return _category_values(AI_READY_LABEL), _category_values(NON_AI_READY_LABEL)
+
+    ai_vals, non_vals = [], []
+    for m in labels:
+        ai_list = [x[m] for x in metrics if x.get("AI_Trust_Score", 0) >= threshold]
+        non_list = [x[m] for x in metrics if x.get("AI_Trust_Score", 0) < threshold]
+
+        ai_vals.append(sum(ai_list) / len(ai_list) if ai_list else 0)
+        non_vals.append(sum(non_list) / len(non_list) if non_list else 0)
+    return ai_vals, non_vals
+
+
 def generate_trust_report(
     metrics: List[Dict[str, Any]],
     threshold: float = 75.0,
@@ -130,15 +149,7 @@ def generate_trust_report(
     # Choose the labels to plot
     labels = ["Completeness", "Accuracy", "Secure", "Quality", "Timeliness"]
 
-    ai_vals, non_vals = [], []
-
-    # Compute average per-metric for AI-ready vs non-ready
-    for m in labels:
-        ai_list = [x[m] for x in metrics if x.get("AI_Trust_Score", 0) >= threshold]
-        non_list = [x[m] for x in metrics if x.get("AI_Trust_Score", 0) < threshold]
-
-        ai_vals.append(sum(ai_list) / len(ai_list) if ai_list else 0)
-        non_vals.append(sum(non_list) / len(non_list) if non_list else 0)
+    ai_vals, non_vals = _category_averages(metrics, labels, threshold)
 
     # Prepare bar chart
     x = range(len(labels))
@@ -8,7 +8,7 @@ from typing import Optional
 from uuid import UUID
 
 from loguru import logger
-from primedata.storage.minio_client import MinIOClient
+from primedata.storage.minio_client import MinIOClient, get_storage_client
 from primedata.storage.paths import (
     playbook_prefix,
     eval_prefix,
@@ -41,7 +41,7 @@ def save_text_to_s3(
         True if successful, False otherwise
     """
     try:
-        client = minio_client or MinIOClient()
+        client = minio_client or get_storage_client()
         success = client.put_bytes(CONTENT_BUCKET, s3_path, content.encode("utf-8"), content_type)
         if success:
             logger.info(f"Saved text content to S3: {s3_path}")
@@ -64,7 +64,7 @@ def load_text_from_s3(s3_path: str, minio_client: Optional[MinIOClient] = None)
         Text content or None if failed
     """
     try:
-        client = minio_client or MinIOClient()
+        client = minio_client or get_storage_client()
         data = client.get_bytes(CONTENT_BUCKET, s3_path)
         if data:
             content = data.decode("utf-8")
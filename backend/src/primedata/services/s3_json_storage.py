@@ -10,7 +10,7 @@ from typing import Any, Dict, Optional, Tuple
 from uuid import UUID
 
 from loguru import logger
-from primedata.storage.minio_client import MinIOClient
+from primedata.storage.minio_client import MinIOClient, get_storage_client
 
 # Size threshold for moving JSON to S3 (1MB)
 JSON_SIZE_THRESHOLD = 1024 * 1024  # 1MB
@@ -60,7 +60,7 @@ def save_json_to_s3(
         S3 path (key) if successful, None otherwise
     """
     try:
-        client = minio_client or MinIOClient()
+        client = minio_client or get_storage_client()
 
         # Build S3 path: ws/{workspace_id}/prod/{product_id}/metadata/{field_name}.json
         # Or: ws/{workspace_id}/prod/{product_id}/v/{version}/metadata/{field_name}.json
@@ -93,7 +93,7 @@ def load_json_from_s3(s3_path: str, minio_client: Optional[MinIOClient] = None)
         Parsed JSON object (dict/list) or None if failed
     """
     try:
-        client = minio_client or MinIOClient()
+        client = minio_client or get_storage_client()
         data = client.get_json(METADATA_BUCKET, s3_path)
         if data is not None:
             logger.info(f"Loaded JSON from S3: {s3_path}")
@@ -116,7 +116,7 @@ def delete_json_from_s3(s3_path: str, minio_client: Optional[MinIOClient] = None
         True if successful, False otherwise
     """
     try:
-        client = minio_client or MinIOClient()
+        client = minio_client or get_storage_client()
         # MinIO client doesn't have a delete method in our wrapper, so we'll need to add it
         # For now, we'll use the underlying client
         from minio.error import S3Error
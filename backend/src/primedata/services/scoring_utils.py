@@ -9,7 +9,7 @@ import json
 import re
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence
 
 try:
     import textstat
@@ -41,10 +41,116 @@ PII_PATTERNS = [
     r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b",
 ]
 
+# All scoring regexes are compiled once at import and shared by every record
+PII_RES = [re.compile(p) for p in PII_PATTERNS]
+SENTENCE_SPLIT_RE = re.compile(r"[.!?]+")
+LIST_RE = re.compile(r"(?:^|\n)[\s]*[•\-\*\+]\s", re.MULTILINE)
+NUMBERED_LIST_RE = re.compile(r"(?:^|\n)[\s]*\d+[\.\)]\s", re.MULTILINE)
+NUMBER_RE = re.compile(r"\b\d+(?:[.,]\d+)?(?:%|\$|USD|EUR|million|billion)?\b")
+DATE_RE = re.compile(
+    r"\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2},?\s+\d{4}\b|\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b|\b\d{4}\b"
+)
+REFERENCE_RE = re.compile(r"\b(?:see|refer|reference|section|chapter|page|table|figure)\s+[\d]+")
+PROPER_NOUN_RE = re.compile(r"\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)+\b")
+DIVERSITY_WORD_RE = re.compile(r"\b[a-z0-9]+\b")
+GENERAL_AUDIENCE_RE = re.compile(r"\b(?:you|your|users?|customers?|readers?|audience)\b")
+DIRECT_ADDRESSING_RE = re.compile(r"\b(?:for|intended\s+for|designed\s+for|targeted\s+to)\s+(?:the\s+)?\w+")
+SIMPLE_LANGUAGE_RE = re.compile(r"\b(simple|easy|clear|straightforward|basic)\b")
+EXAMPLES_RE = re.compile(r"\b(?:example|for instance|such as|including)\b")
+
+CONTEXTUAL_INDICATORS = [
+    "because",
+    "therefore",
+    "however",
+    "although",
+    "in addition",
+    "furthermore",
+    "specifically",
+    "for example",
+    "such as",
+    "including",
+    "namely",
+    "in particular",
+    "according to",
+    "based on",
+    "related to",
+    "associated with",
+    "compared to",
+    "as a result",
+    "consequently",
+    "meanwhile",
+    "furthermore",
+    "moreover",
+]
+
+
+def _term_res(terms: Sequence[str]) -> List["re.Pattern[str]"]:
+    """Compile whole-word patterns for a lexicon."""
+    return [re.compile(r"\b" + re.escape(term) + r"\b") for term in terms]
+
+
+REGULATORY_TERM_RES = _term_res([
+    "supervisor", "auditor", "regulator", "supervision", "regulatory",
+    "compliance officer", "risk manager", "internal audit",
+    "regulatory authority", "supervisory authority", "audit committee",
+    "compliance framework", "regulatory requirement", "supervisory review",
+    "regulatory reporting", "audit trail", "regulatory compliance",
+    "compliance", "supervisory", "audit"
+])
+FINANCE_TERM_RES = _term_res([
+    "bank", "banking", "financial institution", "lender", "borrower",
+    "credit risk", "market risk", "liquidity risk", "operational risk",
+    "capital adequacy", "solvency", "balance sheet", "income statement",
+    "financial statement", "audit", "auditor", "compliance officer",
+    "risk manager", "treasurer", "cfo", "financial analyst", "investor",
+    "shareholder", "stakeholder", "regulatory reporting", "financial"
+])
+# Healthcare audience signals (REMOVED "regulatory" from this list)
+HEALTHCARE_TERM_RES = _term_res(
+    ["hcp", "physician", "patient", "doctor", "nurse", "clinician", "prescriber", "caregiver", "healthcare"]
+)
+BUSINESS_TERM_RES = _term_res(
+    ["executive", "management", "stakeholder", "board", "investor", "shareholder", "revenue", "profit", "quarterly", "annual"]
+)
+TECH_TERM_RES = _term_res(
+    [
+        "developer", "engineer", "api", "sdk", "cli", "code", "implementation",
+        "integration", "deployment", "architecture", "technical",
+    ]
+)
+OPS_TERM_RES = _term_res(
+    ["operations", "monitoring", "maintenance", "support", "service", "infrastructure", "scalability", "performance"]
+)
+LEGAL_TERM_RES = _term_res([
+    "attorney", "lawyer", "counsel", "legal counsel", "compliance",
+    "legal requirement", "legal framework", "jurisdiction", "litigation",
+    "contract", "agreement", "legal entity", "legal obligation"
+])
+
+
+class TextFeatures(NamedTuple):
+    """Tokenization shared across metrics so each record is split only once."""
+
+    text: str
+    text_lower: str
+    words: List[str]
+    sentences: List[str]
+
+
+def prepare_text_features(text: str) -> TextFeatures:
+    """Split text into words and sentences once for all metric functions."""
+    sentences = [s.strip() for s in SENTENCE_SPLIT_RE.split(text) if s.strip()]
+    return TextFeatures(text=text, text_lower=text.lower(), words=text.split(), sentences=sentences)
+
+
+def _count_term_hits(term_res: List["re.Pattern[str]"], text_lower: str) -> int:
+    """Count how many lexicon terms occur in the text."""
+    return sum(1 for term_re in term_res if term_re.search(text_lower))
+
 
 def detect_pii(text: str) -> bool:
     """Detect PII in text."""
-    return any(re.search(p, text) for p in PII_PATTERNS)
+    return any(p.search(text) for p in PII_RES)
 
 
 def score_completeness(tokens) -> float:
@@ -66,7 +172,7 @@ def score_secure(text: str) -> float:
     return 0.0 if detect_pii(text) else 100.0
 
 
-def score_quality(text: str) -> float:
+def score_quality(text: str, features: Optional[TextFeatures] = None) -> float:
     """Score quality using readability metrics and heuristics."""
     if HAS_TEXTSTAT:
         # Use textstat if available
@@ -98,13 +204,13 @@ def score_quality(text: str) -> float:
     if not text or len(text.strip()) < 50:
         return 40.0
 
-    words = text.split()
+    features = features or prepare_text_features(text)
+    words = features.words
     if len(words) < 20:
         return 55.0  # Short text still has some quality
 
     # Calculate average sentence length (heuristic for readability)
-    sentences = re.split(r"[.!?]+", text)
-    sentences = [s.strip() for s in sentences if s.strip()]
+    sentences = features.sentences
     if not sentences:
         return 60.0  # Default for unparseable text
 
@@ -145,34 +251,30 @@ def score_gpt_confidence(text: str) -> float:
     return 85.0
 
 
-def score_context_quality(text: str) -> float:
+def score_context_quality(text: str, features: Optional[TextFeatures] = None) -> float:
     """Score context quality based on text structure and information richness."""
     if not text or len(text.strip()) < 50:
         return 30.0
 
     # Base score for having meaningful content
     score = 40.0  # Start with a baseline - meaningful text has context
-    text_lower = text.lower()
-    words = text.split()
+    features = features or prepare_text_features(text)
+    text_lower = features.text_lower
+    words = features.words
 
     # 1. Structure indicators (paragraphs, headings, lists) - higher weight
     has_paragraphs = "\n\n" in text or text.count("\n") > 3
-    has_lists = bool(re.search(r"(?:^|\n)[\s]*[•\-\*\+]\s", text, re.MULTILINE))
-    has_numbered_lists = bool(re.search(r"(?:^|\n)[\s]*\d+[\.\)]\s", text, re.MULTILINE))
+    has_lists = bool(LIST_RE.search(text))
+    has_numbered_lists = bool(NUMBERED_LIST_RE.search(text))
     if has_paragraphs:
         score += 20.0  # Structured text has better context
     if has_lists or has_numbered_lists:
         score += 15.0
 
     # 2. Information density (numbers, dates, references) - important for context
-    has_numbers = bool(re.search(r"\b\d+(?:[.,]\d+)?(?:%|\$|USD|EUR|million|billion)?\b", text))
-    has_dates = bool(
-        re.search(
-            r"\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2},?\s+\d{4}\b|\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b|\b\d{4}\b",
-            text_lower,
-        )
-    )
-    has_references = bool(re.search(r"\b(?:see|refer|reference|section|chapter|page|table|figure)\s+[\d]+", text_lower))
+    has_numbers = bool(NUMBER_RE.search(text))
+    has_dates = bool(DATE_RE.search(text_lower))
+    has_references = bool(REFERENCE_RE.search(text_lower))
     if has_numbers:
         score += 15.0
     if has_dates:
@@ -181,35 +283,11 @@ def score_context_quality(text: str) -> float:
         score += 10.0
 
     # 3. Contextual keywords (domain-agnostic) - shows coherent writing
-    contextual_indicators = [
-        "because",
-        "therefore",
-        "however",
-        "although",
-        "in addition",
-        "furthermore",
-        "specifically",
-        "for example",
-        "such as",
-        "including",
-        "namely",
-        "in particular",
-        "according to",
-        "based on",
-        "related to",
-        "associated with",
-        "compared to",
-        "as a result",
-        "consequently",
-        "meanwhile",
-        "furthermore",
-        "moreover",
-    ]
-    context_hits = sum(1 for indicator in contextual_indicators if indicator in text_lower)
+    context_hits = sum(1 for indicator in CONTEXTUAL_INDICATORS if indicator in text_lower)
     score += min(context_hits * 2.0, 15.0)  # Max 15 points for contextual language
 
     # 4. Entity mentions (proper nouns, organizations, concepts) - shows real-world context
-    has_proper_nouns = bool(re.search(r"\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)+\b", text))
+    has_proper_nouns = bool(PROPER_NOUN_RE.search(text))
     if has_proper_nouns:
         score += 10.0
 
@@ -252,12 +330,15 @@ def score_metadata_presence(meta: Dict[str, Any]) -> float:
     return min(base_score + quality_bonus, 100.0)
 
 
-def score_audience_intentionality(text: str, domain_type: Optional[str] = None) -> float:
+def score_audience_intentionality(
+    text: str, domain_type: Optional[str] = None, features: Optional[TextFeatures] = None
+) -> float:
     """Score audience intentionality based on audience signals in text.
     
     Args:
         text: Text content to analyze
         domain_type: Optional domain type (e.g., "regulatory", "finance_banking") for domain-specific scoring
+        features: Optional precomputed tokenization of ``text``
         
     Returns:
         Score from 0-100 indicating how well content targets its audience
@@ -265,7 +346,7 @@ def score_audience_intentionality(text: str, domain_type: Optional[str] = None)
     if not text or len(text.strip()) < 20:
         return 0.0
 
-    text_lower = text.lower()
+    text_lower = features.text_lower if features else text.lower()
     score = 0.0
     domain_matched = False
     
@@ -275,30 +356,14 @@ def score_audience_intentionality(text: str, domain_type: Optional[str] = None)
         
         # Regulatory domain
         if domain_type_lower in ["regulatory", "reg"]:
-            regulatory_terms = [
-                "supervisor", "auditor", "regulator", "supervision", "regulatory",
-                "compliance officer", "risk manager", "internal audit",
-                "regulatory authority", "supervisory authority", "audit committee",
-                "compliance framework", "regulatory requirement", "supervisory review",
-                "regulatory reporting", "audit trail", "regulatory compliance",
-                "compliance", "supervisory", "audit"
-            ]
-            regulatory_hits = sum(1 for term in regulatory_terms if re.search(r"\b" + re.escape(term) + r"\b", text_lower))
+            regulatory_hits = _count_term_hits(REGULATORY_TERM_RES, text_lower)
             if regulatory_hits > 0:
                 score += min(regulatory_hits * 20.0, 60.0)
                 domain_matched = True
         
         # Finance/Banking domain
         elif domain_type_lower in ["finance_banking", "finance", "banking"]:
-            finance_terms = [
-                "bank", "banking", "financial institution", "lender", "borrower",
-                "credit risk", "market risk", "liquidity risk", "operational risk",
-                "capital adequacy", "solvency", "balance sheet", "income statement",
-                "financial statement", "audit", "auditor", "compliance officer",
-                "risk manager", "treasurer", "cfo", "financial analyst", "investor",
-                "shareholder", "stakeholder", "regulatory reporting", "financial"
-            ]
-            finance_hits = sum(1 for term in finance_terms if re.search(r"\b" + re.escape(term) + r"\b", text_lower))
+            finance_hits = _count_term_hits(FINANCE_TERM_RES, text_lower)
             if finance_hits > 0:
                 score += min(finance_hits * 18.0, 60.0)
                 domain_matched = True
@@ -306,96 +371,45 @@ def score_audience_intentionality(text: str, domain_type: Optional[str] = None)
     # Generic lexicons (reduced weight when domain matched to prevent saturation)
     generic_multiplier = 0.5 if domain_matched else 1.0  # Reduce generic boosts when domain matched
     
-    # Healthcare audience signals (REMOVED "regulatory" from this list)
-    healthcare_terms = [
-        "hcp",
-        "physician",
-        "patient",
-        "doctor",
-        "nurse",
-        "clinician",
-        "prescriber",
-        "caregiver",
-        "healthcare",
-    ]
-    healthcare_hits = sum(1 for term in healthcare_terms if re.search(r"\b" + re.escape(term) + r"\b", text_lower))
+    # Healthcare audience signals
+    healthcare_hits = _count_term_hits(HEALTHCARE_TERM_RES, text_lower)
     if healthcare_hits > 0:
         score += min(healthcare_hits * 25.0 * generic_multiplier, 50.0 * generic_multiplier)
 
     # Business/Executive audience signals
-    business_terms = [
-        "executive",
-        "management",
-        "stakeholder",
-        "board",
-        "investor",
-        "shareholder",
-        "revenue",
-        "profit",
-        "quarterly",
-        "annual",
-    ]
-    business_hits = sum(1 for term in business_terms if re.search(r"\b" + re.escape(term) + r"\b", text_lower))
+    business_hits = _count_term_hits(BUSINESS_TERM_RES, text_lower)
     if business_hits > 0:
         score += min(business_hits * 15.0 * generic_multiplier, 50.0 * generic_multiplier)
 
     # Technical/Developer audience signals
-    tech_terms = [
-        "developer",
-        "engineer",
-        "api",
-        "sdk",
-        "cli",
-        "code",
-        "implementation",
-        "integration",
-        "deployment",
-        "architecture",
-        "technical",
-    ]
-    tech_hits = sum(1 for term in tech_terms if re.search(r"\b" + re.escape(term) + r"\b", text_lower))
+    tech_hits = _count_term_hits(TECH_TERM_RES, text_lower)
     if tech_hits > 0:
         score += min(tech_hits * 15.0 * generic_multiplier, 50.0 * generic_multiplier)
 
     # Operations audience signals
-    ops_terms = [
-        "operations",
-        "monitoring",
-        "maintenance",
-        "support",
-        "service",
-        "infrastructure",
-        "scalability",
-        "performance",
-    ]
-    ops_hits = sum(1 for term in ops_terms if re.search(r"\b" + re.escape(term) + r"\b", text_lower))
+    ops_hits = _count_term_hits(OPS_TERM_RES, text_lower)
     if ops_hits > 0:
         score += min(ops_hits * 15.0 * generic_multiplier, 50.0 * generic_multiplier)
 
     # Legal domain signals
-    legal_terms = [
-        "attorney", "lawyer", "counsel", "legal counsel", "compliance",
-        "legal requirement", "legal framework", "jurisdiction", "litigation",
-        "contract", "agreement", "legal entity", "legal obligation"
-    ]
-    legal_hits = sum(1 for term in legal_terms if re.search(r"\b" + re.escape(term) + r"\b", text_lower))
+    legal_hits = _count_term_hits(LEGAL_TERM_RES, text_lower)
     if legal_hits > 0:
         score += min(legal_hits * 20.0 * generic_multiplier, 50.0 * generic_multiplier)
 
     # General audience signals (you, your, users, customers) - always apply
-    general_signals = bool(re.search(r"\b(?:you|your|users?|customers?|readers?|audience)\b", text_lower))
+    general_signals = bool(GENERAL_AUDIENCE_RE.search(text_lower))
     if general_signals:
         score += 30.0
 
     # Direct audience addressing (for, intended for, designed for) - always apply
-    direct_addressing = bool(re.search(r"\b(?:for|intended\s+for|designed\s+for|targeted\s+to)\s+(?:the\s+)?\w+", text_lower))
+    direct_addressing = bool(DIRECT_ADDRESSING_RE.search(text_lower))
     if direct_addressing:
         score += 20.0
 
     return min(score, 100.0)
 
 
-def score_diversity(text: str) -> float:
+def score_diversity(text: str, features: Optional[TextFeatures] = None) -> float:
     """Score diversity using Type-Token Ratio (TTR).
     
     TTR measures vocabulary diversity: unique words / total words.
@@ -405,7 +419,7 @@ def score_diversity(text: str) -> float:
         return 0.0
     
     # Extract words (lowercase, alphanumeric)
-    words = re.findall(r'\b[a-z0-9]+\b', text.lower())
+    words = DIVERSITY_WORD_RE.findall(features.text_lower if features else text.lower())
     if not words:
         return 0.0
     
@@ -427,7 +441,7 @@ def score_diversity(text: str) -> float:
     return min(100.0, max(0.0, score))
 
 
-def score_audience_accessibility(meta: Dict[str, Any]) -> float:
+def score_audience_accessibility(meta: Dict[str, Any], features: Optional[TextFeatures] = None) -> float:
     """Score audience accessibility based on detected audience and text readability."""
     audience = str(meta.get("audience", "")).strip().lower()
     text = meta.get("text", "")
@@ -443,9 +457,9 @@ def score_audience_accessibility(meta: Dict[str, Any]) -> float:
 
         # Adjust based on text readability (shorter, clearer sentences = more accessible)
         if text:
-            words = text.split()
-            sentences = re.split(r"[.!?]+", text)
-            sentences = [s.strip() for s in sentences if s.strip()]
+            features = features or prepare_text_features(text)
+            words = features.words
+            sentences = features.sentences
             if sentences:
                 avg_sentence_len = len(words) / len(sentences)
                 # Ideal: 10-20 words per sentence for accessibility
@@ -463,10 +477,10 @@ def score_audience_accessibility(meta: Dict[str, Any]) -> float:
 
     # If no audience detected, check text for accessibility indicators
     if text:
-        text_lower = text.lower()
+        text_lower = features.text_lower if features else text.lower()
         # Check for simple language indicators
-        has_simple_language = bool(re.search(r"\b(simple|easy|clear|straightforward|basic)\b", text_lower))
-        has_examples = bool(re.search(r"\b(?:example|for instance|such as|including)\b", text_lower))
+        has_simple_language = bool(SIMPLE_LANGUAGE_RE.search(text_lower))
+        has_examples = bool(EXAMPLES_RE.search(text_lower))
 
         if has_simple_language or has_examples:
             return 50.0
@@ -474,9 +488,10 @@ def score_audience_accessibility(meta: Dict[str, Any]) -> float:
     return 30.0  # Default lower score if no audience signals found
 
 
-def score_kb_ready(text: str) -> float:
+def score_kb_ready(text: str, features: Optional[TextFeatures] = None) -> float:
     """Score knowledge base readiness."""
-    return 100.0 if len(text.split()) > 50 and "\n" in text else 50.0
+    words = features.words if features else text.split()
+    return 100.0 if len(words) > 50 and "\n" in text else 50.0
 
 
 def load_weights(path: str) -> Dict[str, float]:
@@ -485,13 +500,15 @@ def load_weights(path: str) -> Dict[str, float]:
         return json.load(f)
 
 
-def score_file_data(data: Dict[str, Any], weights: Dict[str, float]) -> Dict[str, Any]:
+def score_file_data(data: Dict[str, Any], weights: Dict[str, float], tokens: Optional[Sequence[Any]] = None) -> Dict[str, Any]:
     """
     Score a file data record using primary scoring methods.
 
     Args:
         data: Record with text and metadata
         weights: Scoring weights dictionary
+        tokens: Optional pre-encoded tokens for the record text (see encode_batch and
+            trust_scoring.score_records_batch)
 
     Returns:
         Dictionary with all 13 metrics + AI_Trust_Score
@@ -499,12 +516,11 @@ def score_file_data(data: Dict[str, Any], weights: Dict[str, float]) -> Dict[str
     text = data.get("text", "")
     meta = data.copy()
 
-    if HAS_TIKTOKEN:
-        tokens = TOK.encode(text)
-    else:
-        tokens = text.split()  # Fallback
+    if tokens is None:
+        tokens = _encode(text)
 
-    words = text.split()
+    features = prepare_text_features(text)
+    words = features.words
     token_score = min(len(tokens) / 1000.0, 1.0) * 100.0
 
     # Prepare meta with text for audience accessibility scoring
@@ -518,16 +534,16 @@ def score_file_data(data: Dict[str, Any], weights: Dict[str, float]) -> Dict[str
         "Completeness": score_completeness(tokens),
         "Accuracy": score_accuracy(words),
         "Secure": score_secure(text),
-        "Quality": score_quality(text),
+        "Quality": score_quality(text, features),
         "Timeliness": score_timeliness(meta.get("timestamp", "")),
         "Token_Count": round(token_score, 2),
         "GPT_Confidence": score_gpt_confidence(text),
-        "Context_Quality": score_context_quality(text),
+        "Context_Quality": score_context_quality(text, features),
         "Metadata_Presence": score_metadata_presence(meta),
-        "Audience_Intentionality": score_audience_intentionality(text, domain_type=domain_type),
-        "Diversity": score_diversity(text),
-        "Audience_Accessibility": score_audience_accessibility(meta_with_text),
-        "KnowledgeBase_Ready": score_kb_ready(text),
+        "Audience_Intentionality": score_audience_intentionality(text, domain_type=domain_type, features=features),
+        "Diversity": score_diversity(text, features),
+        "Audience_Accessibility": score_audience_accessibility(meta_with_text, features),
+        "KnowledgeBase_Ready": score_kb_ready(text, features),
     }
 
     # Penalty adjustments
@@ -542,3 +558,17 @@ def score_file_data(data: Dict[str, Any], weights: Dict[str, float]) -> Dict[str
     scores["AI_Trust_Score"] = round(weighted / total_w, 2)
 
     return scores
+
+
+def _encode(text: str) -> Sequence[Any]:
+    """Tokenize text with tiktoken, falling back to whitespace split."""
+    if HAS_TIKTOKEN:
+        return TOK.encode(text)
+    return text.split()  # Fallback
+
+
+def encode_batch(texts: List[str]) -> List[Sequence[Any]]:
+    """Tokenize many texts at once (tiktoken encodes batches in parallel threads)."""
+    if HAS_TIKTOKEN:
+        return TOK.encode_batch(texts)
+    return [text.split() for text in texts]
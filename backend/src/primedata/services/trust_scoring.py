@@ -6,6 +6,7 @@ Ports AIRD scoring logic with support for primary scorer (scoring_utils) and fal
 
 import json
 import math
+import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -14,11 +15,12 @@ from loguru import logger
 
 # Import AI-Ready metric services
 from primedata.services.chunk_coherence import calculate_chunk_coherence
-from primedata.services.noise_detection import calculate_noise_ratio
+from primedata.services.metrics_aggregation import HAS_PANDAS, MetricsFrame
+from primedata.services.noise_detection import calculate_noise_ratio, compile_noise_patterns
 
 # Try to import primary scorer
 try:
-    from primedata.services.scoring_utils import load_weights, score_file_data
+    from primedata.services.scoring_utils import encode_batch, load_weights, score_file_data
 
     _PRIMARY_SCORER = True
     logger.info("Primary scorer (scoring_utils) available")
@@ -27,6 +29,7 @@ except ImportError:
     logger.warning("Primary scorer not available, using fallback scorer")
     score_file_data = None
     load_weights = None
+    encode_batch = None
 
 # Regex patterns for fallback scorer
 ASCII_RE = re.compile(r"^[\x00-\x7F]+$")
@@ -214,28 +217,39 @@ def score_record(record: Dict[str, Any], weights: Optional[Dict[str, float]] = N
     if weights is None:
         weights = get_scoring_weights()
 
+    return _score_record(record, weights)
+
+
+def _score_record(record: Dict[str, Any], weights: Dict[str, float], tokens: Optional[Any] = None) -> Dict[str, Any]:
+    """Score a record with the primary scorer (optionally with pre-encoded tokens), falling back on failure."""
     if _PRIMARY_SCORER and score_file_data:
         try:
-            return score_file_data(record, weights)
+            return score_file_data(record, weights, tokens=tokens)
         except Exception as e:
             logger.warning(f"Primary scorer failed: {e}, falling back to heuristic scorer")
 
     return _fallback_score_record(record, weights)
 
 
-def aggregate_metrics(metrics: List[Dict[str, Any]]) -> Dict[str, float]:
+def aggregate_metrics(metrics: "List[Dict[str, Any]] | MetricsFrame") -> Dict[str, float]:
     """
     Aggregate metrics across multiple chunks by averaging.
 
     Args:
-        metrics: List of metric dictionaries (one per chunk)
+        metrics: List of metric dictionaries (one per chunk), or a prebuilt MetricsFrame
 
     Returns:
         Aggregated metrics dictionary (Readiness Fingerprint)
     """
+    if isinstance(metrics, MetricsFrame):
+        return metrics.mean() if len(metrics) else {}
+
     if not metrics:
         return {}
 
+    if HAS_PANDAS:
+        return MetricsFrame(metrics).mean()
+
     sums: Dict[str, float] = {}
     counts: Dict[str, int] = {}
 
@@ -278,7 +292,16 @@ def score_record_with_ai_ready_metrics(
     """
     # Get base metrics from existing scorer
     base_metrics = score_record(record, weights)
-    
+    return _add_ai_ready_metrics(base_metrics, record, playbook)
+
+
+def _add_ai_ready_metrics(
+    base_metrics: Dict[str, Any],
+    record: Dict[str, Any],
+    playbook: Optional[Dict[str, Any]] = None,
+    compiled_noise_patterns: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Add Chunk_Coherence and Noise_Free_Score to base metrics (see score_record_with_ai_ready_metrics)."""
     # Extract chunk text and domain_type
     chunk_text = (record.get("text") or "").strip()
     domain_type = record.get("domain_type") or record.get("metadata", {}).get("domain_type")
@@ -308,7 +331,7 @@ def score_record_with_ai_ready_metrics(
     
     # 2. Calculate Noise Ratio (inverted to score: lower noise = higher score)
     noise_patterns = playbook.get("noise_patterns") if playbook else None
-    noise_result = calculate_noise_ratio(chunk_text, noise_patterns)
+    noise_result = calculate_noise_ratio(chunk_text, noise_patterns, compiled_patterns=compiled_noise_patterns)
     # Convert noise ratio to score (0-100, where 0% noise = 100 score)
     noise_score = max(0.0, 100.0 - noise_result["noise_ratio"])
     base_metrics["Noise_Free_Score"] = round(noise_score, 2)
@@ -320,15 +343,81 @@ def score_record_with_ai_ready_metrics(
     return base_metrics
 
 
+def score_records_batch(
+    records: List[Dict[str, Any]],
+    weights: Optional[Dict[str, float]] = None,
+    playbook: Optional[Dict[str, Any]] = None,
+    ai_ready: bool = True,
+    timings: Optional[Dict[str, float]] = None,
+) -> List[Optional[Dict[str, Any]]]:
+    """
+    Score a batch of records (chunks) in one call.
+    
+    Produces the same metrics as score_record / score_record_with_ai_ready_metrics, but
+    loads weights once, compiles the playbook noise patterns once and tokenizes all
+    record texts in a single batch encode.
+    
+    Args:
+        records: Chunk records with text, metadata, etc.
+        weights: Optional scoring weights (uses defaults if not provided)
+        playbook: Optional playbook configuration for noise patterns and coherence settings
+        ai_ready: Include AI-Ready metrics (Chunk_Coherence, Noise_Free_Score)
+        timings: Optional dict the seconds spent per sub-metric group are added to
+            ("tokenize", "base_metrics", "ai_ready_metrics")
+        
+    Returns:
+        List aligned with ``records``; entries are None for records that failed to score
+    """
+    if weights is None:
+        weights = get_scoring_weights()
+
+    compiled_noise_patterns = None
+    if ai_ready:
+        compiled_noise_patterns = compile_noise_patterns(playbook.get("noise_patterns") if playbook else None)
+
+    clock = time.perf_counter
+    started = clock()
+    tokens_list: List[Optional[Any]] = [None] * len(records)
+    if _PRIMARY_SCORER and encode_batch and records:
+        try:
+            tokens_list = list(encode_batch([record.get("text", "") for record in records]))
+        except Exception as e:
+            # Records are tokenized individually (with per-record fallback) instead
+            logger.debug(f"Batch tokenization failed: {e}")
+
+    tokenize_s = clock() - started
+    base_s = ai_ready_s = 0.0
+
+    results: List[Optional[Dict[str, Any]]] = []
+    for record, tokens in zip(records, tokens_list):
+        try:
+            started = clock()
+            scored = _score_record(record, weights, tokens)
+            base_done = clock()
+            base_s += base_done - started
+            if ai_ready:
+                scored = _add_ai_ready_metrics(scored, record, playbook, compiled_noise_patterns)
+                ai_ready_s += clock() - base_done
+            results.append(scored)
+        except Exception as e:
+            logger.error(f"Failed to score chunk {record.get('chunk_id', '')}: {e}")
+            results.append(None)
+
+    if timings is not None:
+        for name, seconds in (("tokenize", tokenize_s), ("base_metrics", base_s), ("ai_ready_metrics", ai_ready_s)):
+            timings[name] = timings.get(name, 0.0) + seconds
+    return results
+
+
 def aggregate_metrics_with_ai_ready(
-    metrics: List[Dict[str, Any]],
+    metrics: "List[Dict[str, Any]] | MetricsFrame",
     preprocessing_stats: Optional[Dict[str, Any]] = None
 ) -> Dict[str, float]:
     """
     Aggregate metrics including AI-Ready metrics.
     
     Args:
-        metrics: List of metric dictionaries (one per chunk)
+        metrics: List of metric dictionaries (one per chunk), or a prebuilt MetricsFrame
         preprocessing_stats: Preprocessing statistics including mid_sentence_boundary_rate
         
     Returns:
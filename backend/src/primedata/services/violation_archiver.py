@@ -12,7 +12,7 @@ from uuid import UUID
 from loguru import logger
 from primedata.db.models import DqViolation
 from primedata.services.s3_json_storage import METADATA_BUCKET, save_json_to_s3
-from primedata.storage.minio_client import MinIOClient
+from primedata.storage.minio_client import MinIOClient, get_storage_client
 from sqlalchemy import and_
 from sqlalchemy.orm import Session
 
@@ -54,7 +54,7 @@ def archive_old_violations(
             violations_by_product[key] = []
         violations_by_product[key].append(violation)
 
-    client = minio_client or MinIOClient()
+    client = minio_client or get_storage_client()
 
     for (product_id, version), violations in violations_by_product.items():
         try:
@@ -151,7 +151,7 @@ def load_archived_violations(product_id: UUID, version: int, minio_client=None)
             logger.error(f"Product {product_id} not found")
             return []
 
-        client = minio_client or MinIOClient()
+        client = minio_client or get_storage_client()
 
         # List all archived violation files for this product/version
         prefix = f"ws/{product.workspace_id}/prod/{product_id}/v/{version}/violations/"
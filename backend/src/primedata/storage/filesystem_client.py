@@ -0,0 +1,278 @@
+"""
+Filesystem-backed storage client with the MinIOClient interface.
+
+Objects live under ``<root>/<bucket>/<key>``, so pipeline code written against
+MinIOClient (AirdStorageAdapter, artifact registration, JSON field storage) runs
+without a MinIO or GCS service, e.g. for local end-to-end profiling and CI.
+"""
+
+import hashlib
+import json
+import mimetypes
+import os
+import shutil
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from loguru import logger
+from primedata.storage.minio_client import STORAGE_BUCKETS, ObjectResult
+
+
+class _FileSink:
+    """Write-only sink handed to put_stream() producers (counts and hashes what is written)."""
+
+    def __init__(self, writer: BinaryIO):
+        self._writer = writer
+        self.size = 0
+        self.sha256 = hashlib.sha256()
+
+    def write(self, data: bytes) -> int:
+        self._writer.write(data)
+        self.sha256.update(data)
+        self.size += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self.size
+
+    def flush(self) -> None:
+        self._writer.flush()
+
+
+class FilesystemStorageClient:
+    """Drop-in replacement for MinIOClient storing objects in a local directory.
+
+    Writes go to a temporary file that is renamed into place, so readers never
+    see partial objects. The SHA-256 of every object written is kept in memory
+    and reported by stat_object(), like the sha256 metadata on MinIO objects.
+    """
+
+    def __init__(self, root: Union[str, Path]):
+        """
+        Args:
+            root: Directory holding one subdirectory per bucket (created if missing)
+        """
+        self.root = Path(root)
+        self.use_gcs = False
+        self.client = None
+        self.gcs_client = None
+        self._sha256: Dict[Tuple[str, str], str] = {}
+        self._lock = threading.Lock()
+        for bucket in STORAGE_BUCKETS:
+            (self.root / bucket).mkdir(parents=True, exist_ok=True)
+
+    def _path(self, bucket: str, key: str) -> Path:
+        parts = [part for part in key.split("/") if part]
+        if not bucket or not parts or any(part in (".", "..") for part in parts) or "/" in bucket:
+            raise ValueError(f"Invalid object path: {bucket}/{key}")
+        return self.root.joinpath(bucket, *parts)
+
+    def _write(self, bucket: str, key: str, produce: Callable[[_FileSink], None]) -> Dict[str, Any]:
+        path = self._path(bucket, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp, "wb") as writer:
+                sink = _FileSink(writer)
+                produce(sink)
+            os.replace(tmp, path)
+        finally:
+            if tmp.exists():
+                tmp.unlink()
+        sha256 = sink.sha256.hexdigest()
+        with self._lock:
+            self._sha256[(bucket, key)] = sha256
+        return {"size": sink.size, "sha256": sha256, "etag": sha256[:32]}
+
+    # ---- Single-object operations ----
+
+    def put_bytes(self, bucket: str, key: str, data: bytes, content_type: Optional[str] = None) -> bool:
+        """Store bytes (see MinIOClient.put_bytes)."""
+        return self.put_bytes_with_info(bucket, key, data, content_type) is not None
+
+    def put_bytes_with_info(
+        self, bucket: str, key: str, data: bytes, content_type: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Store bytes and return 'size', 'sha256' and 'etag', or None if the write failed."""
+        try:
+            return self._write(bucket, key, lambda sink: sink.write(data))
+        except Exception as e:
+            logger.error(f"Failed to write {bucket}/{key}: {e}")
+            return None
+
+    def put_json(self, bucket: str, key: str, obj: Any) -> bool:
+        """Store an object as JSON (see MinIOClient.put_json)."""
+        return self.put_json_with_info(bucket, key, obj) is not None
+
+    def put_json_with_info(self, bucket: str, key: str, obj: Any) -> Optional[Dict[str, Any]]:
+        """Store an object as JSON and return what was written."""
+        try:
+            data = json.dumps(obj, indent=2, default=str).encode("utf-8")
+        except Exception as e:
+            logger.error(f"Failed to serialize JSON for {bucket}/{key}: {e}")
+            return None
+        return self.put_bytes_with_info(bucket, key, data, "application/json")
+
+    def put_stream(
+        self,
+        bucket: str,
+        key: str,
+        produce: Callable[[BinaryIO], None],
+        content_type: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Store an object written by ``produce`` to a sink; nothing is stored if it raises."""
+        try:
+            return self._write(bucket, key, produce)
+        except Exception as e:
+            logger.error(f"Failed to stream {bucket}/{key}: {e}")
+            return None
+
+    def put_object(self, bucket: str, key: str, data: bytes, content_type: str = "application/octet-stream") -> bool:
+        """Store bytes (see MinIOClient.put_object)."""
+        return self.put_bytes(bucket, key, data, content_type)
+
+    def get_object(self, bucket: str, key: str) -> Optional[bytes]:
+        """Object data, or None if it does not exist."""
+        try:
+            return self._path(bucket, key).read_bytes()
+        except (OSError, ValueError):
+            return None
+
+    def get_bytes(self, bucket: str, key: str) -> Optional[bytes]:
+        """Object data, or None if it does not exist."""
+        return self.get_object(bucket, key)
+
+    def get_json(self, bucket: str, key: str) -> Optional[Any]:
+        """Parsed JSON object, or None if it does not exist or is not valid JSON."""
+        data = self.get_object(bucket, key)
+        if data is None:
+            return None
+        try:
+            return json.loads(data.decode("utf-8"))
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            logger.error(f"Failed to parse JSON from {bucket}/{key}: {e}")
+            return None
+
+    def object_exists(self, bucket: str, key: str) -> bool:
+        """Whether the object exists."""
+        try:
+            return self._path(bucket, key).is_file()
+        except ValueError:
+            return False
+
+    def stat_object(self, bucket: str, key: str) -> Optional[Dict[str, Any]]:
+        """'size', 'etag', 'content_type', 'last_modified' and 'sha256' of an object, or None."""
+        try:
+            stat = self._path(bucket, key).stat()
+        except (OSError, ValueError):
+            return None
+        with self._lock:
+            sha256 = self._sha256.get((bucket, key))
+        return {
+            "size": stat.st_size,
+            "etag": sha256[:32] if sha256 else f"{stat.st_mtime_ns:x}",
+            "content_type": mimetypes.guess_type(key)[0] or "application/octet-stream",
+            "last_modified": datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc),
+            "sha256": sha256,
+        }
+
+    def copy_object(self, source_bucket: str, source_key: str, dest_bucket: str, dest_key: str) -> bool:
+        """Copy an object."""
+        try:
+            dest = self._path(dest_bucket, dest_key)
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(self._path(source_bucket, source_key), dest)
+        except (OSError, ValueError) as e:
+            logger.error(f"Failed to copy {source_bucket}/{source_key} to {dest_bucket}/{dest_key}: {e}")
+            return False
+        with self._lock:
+            if (source_bucket, source_key) in self._sha256:
+                self._sha256[(dest_bucket, dest_key)] = self._sha256[(source_bucket, source_key)]
+        return True
+
+    def list_objects(self, bucket: str, prefix: str = "") -> List[Dict[str, Any]]:
+        """Objects of a bucket whose key starts with ``prefix``, sorted by key."""
+        bucket_dir = self.root / bucket
+        objects = []
+        for path in sorted(bucket_dir.rglob("*")) if bucket_dir.is_dir() else []:
+            if not path.is_file() or path.name.startswith("."):
+                continue
+            key = path.relative_to(bucket_dir).as_posix()
+            if key.startswith(prefix):
+                info = self.stat_object(bucket, key)
+                objects.append(
+                    {
+                        "name": key,
+                        "size": info["size"],
+                        "last_modified": info["last_modified"].isoformat(),
+                        "etag": info["etag"],
+                        "content_type": info["content_type"],
+                    }
+                )
+        return objects
+
+    def presign(self, bucket: str, key: str, expiry: int = 3600, inline: bool = False) -> Optional[str]:
+        """file:// URL of the object (None if it does not exist)."""
+        if not bucket or bucket.lower() in ("none", "qdrant") or not self.object_exists(bucket, key):
+            return None
+        return self._path(bucket, key).resolve().as_uri()
+
+    def presign_many(
+        self, objects: Sequence[Tuple[str, str]], expiry: int = 3600, inline: bool = False, **_: Any
+    ) -> List[Optional[str]]:
+        """file:// URLs of many objects, in input order."""
+        return [self.presign(bucket, key, expiry, inline) for bucket, key in objects]
+
+    # ---- Bulk operations (sequential; local disk gains nothing from concurrency) ----
+
+    def get_many(self, objects: Sequence[Union[Tuple[str, str], Tuple[str, str, BinaryIO]]], **_: Any) -> List[ObjectResult]:
+        """Read many objects; (bucket, key, file object) items are copied into the file object."""
+        results = []
+        for item in objects:
+            bucket, key = item[0], item[1]
+            data = self.get_object(bucket, key)
+            if data is None:
+                results.append(ObjectResult(bucket, key, ok=False, error="not found", attempts=1))
+            elif len(item) > 2:
+                item[2].write(data)
+                results.append(ObjectResult(bucket, key, ok=True, attempts=1))
+            else:
+                results.append(ObjectResult(bucket, key, ok=True, data=data, attempts=1))
+        return results
+
+    def put_many(
+        self, objects: Sequence[Tuple[str, str, Union[bytes, BinaryIO], Optional[str]]], **_: Any
+    ) -> List[ObjectResult]:
+        """Write many objects ((bucket, key, bytes or readable file object, content_type) tuples)."""
+        results = []
+        for bucket, key, data, content_type in objects:
+            info = self.put_bytes_with_info(bucket, key, data if isinstance(data, bytes) else data.read(), content_type)
+            results.append(
+                ObjectResult(bucket, key, ok=info is not None, info=info, error=None if info else "write failed", attempts=1)
+            )
+        return results
+
+    def stat_many(self, objects: Sequence[Tuple[str, str]], **_: Any) -> List[ObjectResult]:
+        """Metadata of many objects; missing objects have ok=False, error="not found"."""
+        results = []
+        for bucket, key in objects:
+            info = self.stat_object(bucket, key)
+            results.append(
+                ObjectResult(bucket, key, ok=info is not None, info=info, error=None if info else "not found", attempts=1)
+            )
+        return results
+
+    def delete_many(self, objects: Sequence[Tuple[str, str]], **_: Any) -> List[ObjectResult]:
+        """Delete many objects (deleting a missing object counts as success)."""
+        results = []
+        for bucket, key in objects:
+            try:
+                self._path(bucket, key).unlink(missing_ok=True)
+                with self._lock:
+                    self._sha256.pop((bucket, key), None)
+                results.append(ObjectResult(bucket, key, ok=True, attempts=1))
+            except (OSError, ValueError) as e:
+                results.append(ObjectResult(bucket, key, ok=False, error=str(e), attempts=1))
+        return results
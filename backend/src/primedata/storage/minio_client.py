@@ -3,13 +3,22 @@ MinIO client wrapper for PrimeData storage operations.
 Supports both MinIO (local) and GCS (Google Cloud Storage) via Application Default Credentials.
 """
 
+import hashlib
 import json
 import os
-from typing import Any, Dict, List, Optional
-
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import certifi
+import urllib3
 from loguru import logger
 from minio import Minio
 from minio.error import S3Error
+from primedata.core.metrics import record_cache_lookup, timed_dependency
 from primedata.core.settings import get_settings
 
 # Try to import google-cloud-storage (optional, only needed for GCS)
@@ -28,6 +37,120 @@ except ImportError:
     google = None
     impersonated_credentials = None
 
+# Signed URL cache: URLs are reused while more than PRESIGN_REUSE_MIN_REMAINING of
+# their requested lifetime is left. Expiries are rounded up to PRESIGN_EXPIRY_BUCKET_SECONDS
+# so requests for slightly different expiries share entries.
+PRESIGN_CACHE_MAX_ENTRIES = 10000
+PRESIGN_EXPIRY_BUCKET_SECONDS = 300
+PRESIGN_REUSE_MIN_REMAINING = 0.5
+PRESIGN_MAX_WORKERS = 8
+
+# Bulk operations (get_many/put_many/stat_many/delete_many)
+BULK_MAX_WORKERS = 16
+BULK_RETRIES = 3
+BULK_RETRY_BACKOFF_SECONDS = 0.2
+MINIO_MULTIPART_PART_SIZE = 10 * 1024 * 1024  # Used when streaming uploads of unknown length
+TRANSIENT_S3_ERROR_CODES = {"InternalError", "ServiceUnavailable", "SlowDown", "RequestTimeout", "RequestTimeTooSkewed"}
+
+# After a failed bucket bootstrap (e.g. storage unreachable), wait this long before trying again
+BUCKET_BOOTSTRAP_RETRY_SECONDS = 60.0
+
+# Object metadata key holding the SHA-256 computed on write (x-amz-meta-sha256 on MinIO)
+OBJECT_SHA256_METADATA = "sha256"
+
+STORAGE_BUCKETS = [
+    "primedata-raw",
+    "primedata-clean",
+    "primedata-chunk",
+    "primedata-embed",
+    "primedata-exports",
+    "primedata-config",
+]
+
+
+@dataclass
+class ObjectResult:
+    """Outcome of one object in a bulk storage operation."""
+
+    bucket: str
+    key: str
+    ok: bool
+    data: Optional[bytes] = None  # get_many (when not streamed to a file object)
+    info: Optional[Dict[str, Any]] = None  # stat_many (and size/etag after put_many)
+    error: Optional[str] = None
+    attempts: int = 0
+
+
+def _is_transient_storage_error(error: Exception) -> bool:
+    """Whether a storage error is worth retrying (throttling, 5xx, connection problems)."""
+    if isinstance(error, S3Error):
+        return error.code in TRANSIENT_S3_ERROR_CODES
+    if isinstance(error, (urllib3.exceptions.HTTPError, ConnectionError, TimeoutError)):
+        return True
+    if gcs_exceptions is not None and isinstance(
+        error, (gcs_exceptions.TooManyRequests, gcs_exceptions.InternalServerError, gcs_exceptions.ServiceUnavailable)
+    ):
+        return True
+    return False
+
+
+def _minio_sha256_metadata(stat: Any) -> Optional[str]:
+    """SHA-256 stored as user metadata on a MinIO object, if any."""
+    metadata = getattr(stat, "metadata", None) or {}
+    for name, value in metadata.items():
+        if name.lower() == f"x-amz-meta-{OBJECT_SHA256_METADATA}":
+            return value
+    return None
+
+
+def _is_not_found(error: Exception) -> bool:
+    if isinstance(error, S3Error):
+        return error.code in ("NoSuchKey", "NoSuchBucket", "NoSuchObject")
+    return gcs_exceptions is not None and isinstance(error, gcs_exceptions.NotFound)
+
+
+class _StreamSink:
+    """Write end of an upload pipe: counts and hashes bytes, no seek (so zipfile streams)."""
+
+    def __init__(self, writer: BinaryIO):
+        self._writer = writer
+        self.size = 0
+        self.sha256 = hashlib.sha256()
+
+    def write(self, data: bytes) -> int:
+        self._writer.write(data)
+        self.size += len(data)
+        self.sha256.update(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self.size
+
+    def flush(self) -> None:
+        self._writer.flush()
+
+
+class _StreamSource:
+    """Read end of an upload pipe that fails instead of reporting EOF if the producer failed.
+
+    tell() reports the bytes read so far: GCS resumable uploads use it to track chunk offsets.
+    """
+
+    def __init__(self, reader: BinaryIO):
+        self._reader = reader
+        self.aborted = False
+        self.position = 0
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._reader.read(size)
+        if not data and self.aborted:
+            raise IOError("Streaming upload aborted by producer")
+        self.position += len(data)
+        return data
+
+    def tell(self) -> int:
+        return self.position
+
 
 class MinIOClient:
     """MinIO client wrapper with PrimeData-specific operations.
@@ -39,6 +162,21 @@ class MinIOClient:
     # Class-level cache for GCS presigned URL warnings (log once per unique file)
     _gcs_warning_logged = set()
 
+    # Process-wide signed URL cache: (bucket, key, inline, expiry bucket) -> (url, expires_at)
+    _presign_cache: "OrderedDict[Tuple[str, str, bool, int], Tuple[str, float]]" = OrderedDict()
+    _presign_cache_lock = threading.Lock()
+
+    # Storage clients built on impersonated credentials, per signer service account.
+    # Impersonated credentials refresh themselves, so one client serves all IAM SignBlob calls.
+    _iam_signing_clients: Dict[str, Any] = {}
+    _iam_signing_lock = threading.Lock()
+
+    # Storage backends whose buckets were already bootstrapped in this process
+    _bootstrapped_backends = set()
+    # Storage backend -> time of its last failed bootstrap (retried after BUCKET_BOOTSTRAP_RETRY_SECONDS)
+    _bootstrap_failed_at: Dict[str, float] = {}
+    _bootstrap_lock = threading.Lock()
+
     def __init__(self):
         """Initialize storage client from environment variables.
 
@@ -69,13 +207,14 @@ class MinIOClient:
             try:
                 # Get project ID from settings or let GCS client detect it
                 project_id = settings.GCS_PROJECT_ID
+                self.project_id = project_id
+                self.gcs_pool_maxsize = settings.GCS_POOL_MAXSIZE
 
                 # Initialize GCS client - it will use:
                 # 1. GOOGLE_APPLICATION_CREDENTIALS file if set and exists
                 # 2. VM service account via metadata server (when running on GCP)
                 # 3. gcloud ADC if configured locally
-                self.gcs_client = gcs_storage.Client(project=project_id)
-                self.project_id = project_id
+                self.gcs_client = self._build_gcs_client()
 
                 if self.project_id:
                     logger.info(f"Initialized GCS client for project: {self.project_id}")
@@ -104,31 +243,106 @@ class MinIOClient:
                     raise ValueError("MINIO_SECRET_KEY environment variable must be set for production MinIO")
             
             self.secure = settings.MINIO_SECURE
-            self.client = Minio(self.host, access_key=self.access_key, secret_key=self.secret_key, secure=self.secure)
+            self.pool_maxsize = settings.MINIO_POOL_MAXSIZE
+            self.connect_timeout = settings.MINIO_CONNECT_TIMEOUT
+            self.read_timeout = settings.MINIO_READ_TIMEOUT
+            self.client = self._build_minio_client()
             self.gcs_client = None  # GCS client not used for MinIO
             logger.info(f"Initialized MinIO client for local MinIO at {self.host}")
 
-        # Don't ensure buckets during initialization - do it lazily
-        self._buckets_ensured = False
+        # Don't ensure buckets during initialization - do it lazily, once per process
+        self._bucket_bootstrap = settings.STORAGE_BUCKET_BOOTSTRAP
+        self._backend_id = "gcs" if self.use_gcs else f"minio:{self.host}"
+        self._buckets_ensured = not self._bucket_bootstrap or self._backend_id in MinIOClient._bootstrapped_backends
+
+    def _build_minio_client(self) -> Minio:
+        """Create the MinIO client with a connection pool sized for concurrent callers."""
+        http_client = urllib3.PoolManager(
+            timeout=urllib3.Timeout(connect=self.connect_timeout, read=self.read_timeout),
+            maxsize=self.pool_maxsize,
+            cert_reqs="CERT_REQUIRED",
+            ca_certs=os.environ.get("SSL_CERT_FILE") or certifi.where(),
+            retries=urllib3.Retry(total=5, backoff_factor=0.2, status_forcelist=[500, 502, 503, 504]),
+        )
+        return Minio(
+            self.host,
+            access_key=self.access_key,
+            secret_key=self.secret_key,
+            secure=self.secure,
+            http_client=http_client,
+        )
+
+    def _build_gcs_client(self) -> Any:
+        """Create the GCS client, mounting a larger HTTP connection pool on its session."""
+        gcs_client = gcs_storage.Client(project=self.project_id)
+        try:
+            from requests.adapters import HTTPAdapter
+
+            adapter = HTTPAdapter(pool_connections=self.gcs_pool_maxsize, pool_maxsize=self.gcs_pool_maxsize, max_retries=3)
+            gcs_client._http.mount("https://", adapter)
+        except Exception as e:
+            logger.debug(f"Could not tune GCS connection pool, using defaults: {e}")
+        return gcs_client
+
+    # HTTP clients are bound to the process that built them: pooled sockets must not be shared
+    # with a parent process after fork, so a forked child rebuilds them on first use.
+
+    @property
+    def client(self) -> Optional[Minio]:
+        if self._client is not None and self._client_pid != os.getpid():
+            self._client = self._build_minio_client()
+            self._client_pid = os.getpid()
+        return self._client
+
+    @client.setter
+    def client(self, value: Optional[Minio]) -> None:
+        self._client = value
+        self._client_pid = os.getpid()
+
+    @property
+    def gcs_client(self) -> Any:
+        if self._gcs_client is not None and self._gcs_client_pid != os.getpid():
+            self._gcs_client = self._build_gcs_client()
+            self._gcs_client_pid = os.getpid()
+        return self._gcs_client
+
+    @gcs_client.setter
+    def gcs_client(self, value: Any) -> None:
+        self._gcs_client = value
+        self._gcs_client_pid = os.getpid()
 
     def _ensure_buckets(self):
-        """Ensure all required buckets exist.
+        """Ensure all required buckets exist (once per process and storage backend).
 
         For MinIO: Creates buckets if they don't exist.
         For GCS: Only checks if buckets exist (buckets must be created manually in GCP).
+        Skipped entirely when STORAGE_BUCKET_BOOTSTRAP is disabled (buckets created at deploy time).
         """
         if self._buckets_ensured:
             return
 
-        buckets = [
-            "primedata-raw",
-            "primedata-clean",
-            "primedata-chunk",
-            "primedata-embed",
-            "primedata-exports",
-            "primedata-config",
-        ]
+        with MinIOClient._bootstrap_lock:
+            if self._backend_id in MinIOClient._bootstrapped_backends:
+                self._buckets_ensured = True
+                return
+            failed_at = MinIOClient._bootstrap_failed_at.get(self._backend_id)
+            if failed_at is not None and time.monotonic() - failed_at < BUCKET_BOOTSTRAP_RETRY_SECONDS:
+                return
+            try:
+                self._bootstrap_buckets(STORAGE_BUCKETS)
+            except Exception as e:
+                # Don't fail the caller's operation; retry the bootstrap after a backoff
+                MinIOClient._bootstrap_failed_at[self._backend_id] = time.monotonic()
+                logger.warning(
+                    f"Bucket bootstrap for {self._backend_id} failed, retrying in {BUCKET_BOOTSTRAP_RETRY_SECONDS:.0f}s: {e}"
+                )
+                return
+            MinIOClient._bootstrap_failed_at.pop(self._backend_id, None)
+            MinIOClient._bootstrapped_backends.add(self._backend_id)
+        self._buckets_ensured = True
 
+    def _bootstrap_buckets(self, buckets: List[str]) -> None:
+        """Check (GCS) or create (MinIO) the given buckets."""
         if self.use_gcs:
             # For GCS, just verify buckets exist (don't create)
             for bucket_name in buckets:
@@ -155,8 +369,6 @@ class MinIOClient:
                     # Don't raise - just log warning and continue
                     # This allows the app to start even if MinIO is not available
 
-        self._buckets_ensured = True
-
     def put_bytes(self, bucket: str, key: str, data: bytes, content_type: Optional[str] = None) -> bool:
         """Upload bytes data to storage (MinIO or GCS).
 
@@ -169,26 +381,53 @@ class MinIOClient:
         Returns:
             True if successful, False otherwise
         """
+        return self.put_bytes_with_info(bucket, key, data, content_type) is not None
+
+    @timed_dependency("storage")
+    def put_bytes_with_info(
+        self, bucket: str, key: str, data: bytes, content_type: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Upload bytes data and return what was written.
+
+        The SHA-256 of the data is computed while writing and stored as object
+        metadata (``sha256``), so checksums never require downloading the object again.
+
+        Args:
+            bucket: Bucket name
+            key: Object key
+            data: Bytes data to upload
+            content_type: MIME type (optional)
+
+        Returns:
+            Dictionary with 'size', 'sha256' and 'etag', or None if the upload failed
+        """
         try:
             self._ensure_buckets()
+            sha256 = hashlib.sha256(data).hexdigest()
 
             if self.use_gcs:
                 # Upload to GCS
                 gcs_bucket = self.gcs_client.bucket(bucket)
                 blob = gcs_bucket.blob(key)
+                blob.metadata = {OBJECT_SHA256_METADATA: sha256}
                 blob.upload_from_string(data, content_type=content_type or "application/octet-stream")
                 logger.info(f"Uploaded {len(data)} bytes to GCS {bucket}/{key}")
-                return True
+                return {"size": len(data), "sha256": sha256, "etag": blob.etag}
             else:
                 # Upload to MinIO
                 from io import BytesIO
 
                 data_stream = BytesIO(data)
-                self.client.put_object(
-                    bucket, key, data_stream, length=len(data), content_type=content_type or "application/octet-stream"
+                write = self.client.put_object(
+                    bucket,
+                    key,
+                    data_stream,
+                    length=len(data),
+                    content_type=content_type or "application/octet-stream",
+                    metadata={OBJECT_SHA256_METADATA: sha256},
                 )
                 logger.info(f"Uploaded {len(data)} bytes to MinIO {bucket}/{key}")
-                return True
+                return {"size": len(data), "sha256": sha256, "etag": write.etag}
         except S3Error as e:
             logger.error(f"Failed to upload to {bucket}/{key}: {e}")
             logger.error(f"S3 Error details - Code: {e.code}, Message: {e.message}")
@@ -197,10 +436,10 @@ class MinIOClient:
             if hasattr(e, 'request_id'):
                 logger.error(f"S3 Error Request ID: {e.request_id}")
             logger.error(f"MinIO connection details - Host: {self.host}, Access Key: {self.access_key[:4]}... (first 4 chars), Secure: {self.secure}")
-            return False
+            return None
         except Exception as e:
             logger.error(f"Failed to upload to {bucket}/{key}: {e}")
-            return False
+            return None
 
     def put_json(self, bucket: str, key: str, obj: Any) -> bool:
         """Upload JSON object to MinIO.
@@ -221,6 +460,133 @@ class MinIOClient:
             logger.error(f"Failed to upload JSON to {bucket}/{key}: {e}")
             return False
 
+    def put_json_with_info(self, bucket: str, key: str, obj: Any) -> Optional[Dict[str, Any]]:
+        """Upload JSON object and return what was written (see put_bytes_with_info).
+
+        Args:
+            bucket: Bucket name
+            key: Object key
+            obj: Python object to serialize as JSON
+
+        Returns:
+            Dictionary with 'size', 'sha256' and 'etag', or None if the upload failed
+        """
+        try:
+            json_data = json.dumps(obj, indent=2, default=str)
+        except Exception as e:
+            logger.error(f"Failed to serialize JSON for {bucket}/{key}: {e}")
+            return None
+        return self.put_bytes_with_info(bucket, key, json_data.encode("utf-8"), "application/json")
+
+    @timed_dependency("storage")
+    def put_stream(
+        self,
+        bucket: str,
+        key: str,
+        produce: Callable[[BinaryIO], None],
+        content_type: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Upload an object of unknown size as it is being produced.
+
+        ``produce`` writes the object to a file-like sink (write/flush/tell, not seekable).
+        The data goes through a pipe straight into a multipart upload (MinIO) or a
+        resumable upload (GCS), so memory stays bounded by one part regardless of the
+        object size. If ``produce`` raises, the upload is aborted and nothing is stored.
+        The SHA-256 is only known once the object is complete, so it is added to the
+        object metadata (as put_bytes_with_info stores it) after the upload.
+
+        Args:
+            bucket: Bucket name
+            key: Object key
+            produce: Callable writing the object content to the given sink
+            content_type: MIME type (optional)
+
+        Returns:
+            Dictionary with 'size', 'sha256' and 'etag', or None if producing or uploading failed
+        """
+        self._ensure_buckets()
+        content_type = content_type or "application/octet-stream"
+        read_fd, write_fd = os.pipe()
+        source = _StreamSource(os.fdopen(read_fd, "rb"))
+        writer = os.fdopen(write_fd, "wb")
+        upload: Dict[str, Any] = {}
+
+        def _upload() -> None:
+            try:
+                if self.use_gcs:
+                    blob = self.gcs_client.bucket(bucket).blob(key)
+                    blob.chunk_size = MINIO_MULTIPART_PART_SIZE  # Multiple of 256 KB, bounds buffering
+                    blob.upload_from_file(source, content_type=content_type)
+                    upload["blob"] = blob
+                    upload["etag"] = blob.etag
+                else:
+                    write = self.client.put_object(
+                        bucket, key, source, length=-1, content_type=content_type, part_size=MINIO_MULTIPART_PART_SIZE
+                    )
+                    upload["etag"] = write.etag
+            except Exception as e:
+                upload["error"] = e
+            finally:
+                # Unblocks the producer (broken pipe) if the upload failed early
+                source._reader.close()
+
+        uploader = threading.Thread(target=_upload, name="storage-put-stream", daemon=True)
+        uploader.start()
+        sink = _StreamSink(writer)
+        produce_error = None
+        try:
+            produce(sink)
+            sink.flush()
+        except Exception as e:
+            produce_error = e
+            source.aborted = True
+        finally:
+            try:
+                writer.close()
+            except OSError:
+                pass
+            uploader.join()
+
+        if "error" in upload:
+            # A broken pipe on the producer side is just the consequence of the failed upload
+            logger.error(f"Failed to stream upload to {bucket}/{key}: {upload['error']}")
+            return None
+        if produce_error is not None:
+            logger.error(f"Failed to produce streamed object {bucket}/{key}: {produce_error}")
+            return None
+        sha256 = sink.sha256.hexdigest()
+        etag = self._set_sha256_metadata(bucket, key, sha256, content_type, upload.get("blob"))
+        logger.info(f"Streamed {sink.size} bytes to {bucket}/{key}")
+        return {"size": sink.size, "sha256": sha256, "etag": etag or upload.get("etag")}
+
+    def _set_sha256_metadata(self, bucket: str, key: str, sha256: str, content_type: str, blob: Any = None) -> Optional[str]:
+        """Add the SHA-256 metadata to an uploaded object; returns its new ETag (None on failure).
+
+        GCS patches the blob's metadata; MinIO replaces the metadata with a server-side
+        copy of the object onto itself.
+        """
+        try:
+            if self.use_gcs:
+                blob = blob if blob is not None else self.gcs_client.bucket(bucket).blob(key)
+                blob.metadata = {OBJECT_SHA256_METADATA: sha256}
+                blob.patch()
+                return blob.etag
+            from minio.commonconfig import REPLACE, CopySource
+
+            write = self.client.copy_object(
+                bucket,
+                key,
+                CopySource(bucket, key),
+                metadata={"Content-Type": content_type, OBJECT_SHA256_METADATA: sha256},
+                metadata_directive=REPLACE,
+            )
+            return write.etag
+        except Exception as e:
+            # The object is stored; checksum readers fall back to hashing its content
+            logger.warning(f"Failed to store SHA-256 metadata for {bucket}/{key}: {e}")
+            return None
+
+    @timed_dependency("storage")
     def list_objects(self, bucket: str, prefix: str = "") -> List[Dict[str, Any]]:
         """List objects in bucket with optional prefix.
 
@@ -278,6 +644,8 @@ class MinIOClient:
     def presign(self, bucket: str, key: str, expiry: int = 3600, inline: bool = False) -> Optional[str]:
         """Generate presigned URL for object access.
 
+        Signed URLs are cached per process and reused until they are close to expiry.
+
         Args:
             bucket: Bucket name
             key: Object key
@@ -296,6 +664,94 @@ class MinIOClient:
             logger.error(f"Invalid key: '{key}'. Cannot generate presigned URL.")
             return None
 
+        cache_key, signed_expiry = self._presign_cache_key(bucket, key, expiry, inline)
+        url = self._get_cached_presign(cache_key, expiry)
+        record_cache_lookup("presign", url is not None)
+        if url:
+            return url
+
+        url = self._presign_uncached(bucket, key, signed_expiry, inline)
+        if url:
+            with MinIOClient._presign_cache_lock:
+                cache = MinIOClient._presign_cache
+                cache[cache_key] = (url, time.time() + signed_expiry)
+                cache.move_to_end(cache_key)
+                while len(cache) > PRESIGN_CACHE_MAX_ENTRIES:
+                    cache.popitem(last=False)
+        return url
+
+    def presign_many(
+        self,
+        objects: Sequence[Tuple[str, str]],
+        expiry: int = 3600,
+        inline: bool = False,
+        max_workers: int = PRESIGN_MAX_WORKERS,
+    ) -> List[Optional[str]]:
+        """Generate presigned URLs for many objects at once.
+
+        Cached URLs are returned directly; the rest are signed concurrently, so a
+        response with N results pays at most one round of signing latency.
+
+        Args:
+            objects: (bucket, key) pairs
+            expiry: URL expiry time in seconds (default: 1 hour)
+            inline: If True, URLs display content in the browser instead of downloading
+            max_workers: Maximum number of concurrent signing calls
+
+        Returns:
+            Presigned URLs (None where signing failed), in input order
+        """
+        urls: List[Optional[str]] = [None] * len(objects)
+        to_sign: Dict[Tuple[str, str], List[int]] = {}
+        for index, (bucket, key) in enumerate(objects):
+            if not bucket or not key:
+                continue
+            cache_key, _ = self._presign_cache_key(bucket, key, expiry, inline)
+            cached = self._get_cached_presign(cache_key, expiry)
+            if cached:
+                urls[index] = cached
+            else:
+                to_sign.setdefault((bucket, key), []).append(index)
+
+        if not to_sign:
+            return urls
+
+        pending = list(to_sign)
+        workers = max(1, min(max_workers, len(pending)))
+        if workers == 1:
+            signed = [self.presign(bucket, key, expiry=expiry, inline=inline) for bucket, key in pending]
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="presign") as pool:
+                signed = list(pool.map(lambda obj: self.presign(obj[0], obj[1], expiry=expiry, inline=inline), pending))
+
+        for obj, url in zip(pending, signed):
+            for index in to_sign[obj]:
+                urls[index] = url
+        return urls
+
+    @staticmethod
+    def _presign_cache_key(bucket: str, key: str, expiry: int, inline: bool) -> Tuple[Tuple[str, str, bool, int], int]:
+        """Cache key and the (bucketed) expiry actually used for signing."""
+        bucketed = -(-int(expiry) // PRESIGN_EXPIRY_BUCKET_SECONDS) * PRESIGN_EXPIRY_BUCKET_SECONDS
+        return (bucket, key, bool(inline), bucketed), bucketed
+
+    @staticmethod
+    def _get_cached_presign(cache_key: Tuple[str, str, bool, int], expiry: int) -> Optional[str]:
+        """Return a cached URL that is still valid for a good part of the requested expiry."""
+        with MinIOClient._presign_cache_lock:
+            entry = MinIOClient._presign_cache.get(cache_key)
+            if entry is None:
+                return None
+            url, expires_at = entry
+            if expires_at - time.time() > expiry * PRESIGN_REUSE_MIN_REMAINING:
+                MinIOClient._presign_cache.move_to_end(cache_key)
+                return url
+            del MinIOClient._presign_cache[cache_key]
+            return None
+
+    @timed_dependency("storage")
+    def _presign_uncached(self, bucket: str, key: str, expiry: int, inline: bool) -> Optional[str]:
+        """Sign a URL without consulting the cache."""
         try:
             self._ensure_buckets()
 
@@ -425,24 +881,7 @@ class MinIOClient:
 
             logger.debug(f"Using IAM SignBlob with service account: {signer_sa}")
             
-            # Get source credentials (from metadata server or ADC)
-            source_creds, project = google.auth.default(
-                scopes=["https://www.googleapis.com/auth/cloud-platform"]
-            )
-            
-            # Impersonation lifetime max is typically 3600 seconds
-            lifetime = min(3600, max(300, expiry + 60))
-            
-            # Create impersonated credentials for signing
-            target_creds = impersonated_credentials.Credentials(
-                source_credentials=source_creds,
-                target_principal=signer_sa,
-                target_scopes=["https://www.googleapis.com/auth/devstorage.read_only"],
-                lifetime=lifetime,
-            )
-            
-            # Create storage client with impersonated credentials
-            storage_client = gcs_storage.Client(credentials=target_creds, project=project)
+            storage_client = self._get_iam_signing_client(signer_sa)
             blob = storage_client.bucket(bucket).blob(key)
             
             # Generate signed URL using v4 signing (works with impersonated credentials)
@@ -487,6 +926,37 @@ class MinIOClient:
                 )
             return None
 
+    @staticmethod
+    def _get_iam_signing_client(signer_sa: str) -> Any:
+        """Get (or create once per process) a storage client signing as ``signer_sa``.
+
+        Args:
+            signer_sa: Service account email whose identity signs the URLs
+
+        Returns:
+            GCS storage client built on impersonated credentials
+        """
+        with MinIOClient._iam_signing_lock:
+            storage_client = MinIOClient._iam_signing_clients.get(signer_sa)
+            if storage_client is None:
+                # Get source credentials (from metadata server or ADC)
+                source_creds, project = google.auth.default(scopes=["https://www.googleapis.com/auth/cloud-platform"])
+
+                # Impersonated credentials refresh their token when it expires
+                # (impersonation lifetime max is typically 3600 seconds)
+                target_creds = impersonated_credentials.Credentials(
+                    source_credentials=source_creds,
+                    target_principal=signer_sa,
+                    target_scopes=["https://www.googleapis.com/auth/devstorage.read_only"],
+                    lifetime=3600,
+                )
+
+                # Create storage client with impersonated credentials
+                storage_client = gcs_storage.Client(credentials=target_creds, project=project)
+                MinIOClient._iam_signing_clients[signer_sa] = storage_client
+            return storage_client
+
+    @timed_dependency("storage")
     def get_object(self, bucket: str, key: str) -> Optional[bytes]:
         """Download object as bytes.
 
@@ -533,6 +1003,7 @@ class MinIOClient:
             logger.error(error_msg, exc_info=True)
             return None
 
+    @timed_dependency("storage")
     def put_object(self, bucket: str, key: str, data: bytes, content_type: str = "application/octet-stream") -> bool:
         """Upload object data.
 
@@ -568,6 +1039,7 @@ class MinIOClient:
             logger.error(f"Failed to put object {bucket}/{key}: {e}")
             return False
 
+    @timed_dependency("storage")
     def object_exists(self, bucket: str, key: str) -> bool:
         """Check if object exists.
 
@@ -595,6 +1067,7 @@ class MinIOClient:
         except Exception:
             return False
 
+    @timed_dependency("storage")
     def stat_object(self, bucket: str, key: str) -> Optional[Dict[str, Any]]:
         """Get object metadata (size, ETag, etc.).
 
@@ -603,7 +1076,7 @@ class MinIOClient:
             key: Object key
 
         Returns:
-            Dictionary with 'size', 'etag', 'content_type', 'last_modified', or None if failed
+            Dictionary with 'size', 'etag', 'content_type', 'last_modified', 'sha256' (None for objects written without checksum metadata), or None if failed
         """
         try:
             self._ensure_buckets()
@@ -622,6 +1095,7 @@ class MinIOClient:
                     "etag": blob.etag or blob.md5_hash or "",  # Use ETag or MD5 hash
                     "content_type": blob.content_type,
                     "last_modified": blob.updated,
+                    "sha256": (blob.metadata or {}).get(OBJECT_SHA256_METADATA),
                 }
             else:
                 # Get metadata from MinIO
@@ -631,6 +1105,7 @@ class MinIOClient:
                     "etag": stat.etag,
                     "content_type": stat.content_type,
                     "last_modified": stat.last_modified,
+                    "sha256": _minio_sha256_metadata(stat),
                 }
         except S3Error as e:
             logger.warning(f"Could not get object info for {bucket}/{key}: {e}")
@@ -670,6 +1145,7 @@ class MinIOClient:
             logger.error(f"Failed to parse JSON from {bucket}/{key}: {e}")
             return None
 
+    @timed_dependency("storage")
     def copy_object(self, source_bucket: str, source_key: str, dest_bucket: str, dest_key: str) -> bool:
         """Copy an object from source to destination.
 
@@ -721,5 +1197,336 @@ class MinIOClient:
             return False
 
 
+    # ---- Bulk operations ----
+
+    @timed_dependency("storage")
+    def _run_bulk(
+        self,
+        operation: str,
+        items: Sequence[Any],
+        fn: Callable[[Any], ObjectResult],
+        max_workers: int,
+    ) -> List[ObjectResult]:
+        """Run fn over items with bounded concurrency, returning results in input order."""
+        if not items:
+            return []
+        self._ensure_buckets()
+        started = time.perf_counter()
+        workers = max(1, min(max_workers, len(items)))
+        if workers == 1:
+            results = [fn(item) for item in items]
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"storage-{operation}") as pool:
+                results = list(pool.map(fn, items))
+        failed = sum(1 for r in results if not r.ok)
+        elapsed = time.perf_counter() - started
+        logger.info(
+            f"{operation}: {len(results)} objects ({failed} failed) in {elapsed:.2f}s "
+            f"({len(results) / elapsed if elapsed > 0 else 0:.0f} objects/s, {workers} workers)"
+        )
+        return results
+
+    @staticmethod
+    def _with_retries(bucket: str, key: str, call: Callable[[], ObjectResult], retries: int) -> ObjectResult:
+        """Call ``call`` and retry transient errors with exponential backoff."""
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                result = call()
+                result.attempts = attempt
+                return result
+            except Exception as e:
+                if attempt <= retries and _is_transient_storage_error(e):
+                    time.sleep(BULK_RETRY_BACKOFF_SECONDS * (2 ** (attempt - 1)))
+                    continue
+                return ObjectResult(bucket=bucket, key=key, ok=False, error=f"{type(e).__name__}: {e}", attempts=attempt)
+
+    def get_many(
+        self,
+        objects: Sequence[Union[Tuple[str, str], Tuple[str, str, BinaryIO]]],
+        max_workers: int = BULK_MAX_WORKERS,
+        retries: int = BULK_RETRIES,
+    ) -> List[ObjectResult]:
+        """Download many objects concurrently.
+
+        Args:
+            objects: (bucket, key) pairs, or (bucket, key, file object) to stream the
+                object into a writable binary file object instead of returning bytes
+            max_workers: Maximum number of concurrent downloads
+            retries: Retries per object for transient errors (none when streaming into a
+                non-seekable file object)
+
+        Returns:
+            One ObjectResult per object, in input order (``data`` is set unless streamed)
+        """
+
+        def _get(item) -> ObjectResult:
+            bucket, key = item[0], item[1]
+            fileobj = item[2] if len(item) > 2 else None
+
+            def call() -> ObjectResult:
+                if fileobj is not None and fileobj.seekable():
+                    # Start over on retries
+                    fileobj.seek(0)
+                    fileobj.truncate()
+                if self.use_gcs:
+                    blob = self.gcs_client.bucket(bucket).blob(key)
+                    if fileobj is not None:
+                        blob.download_to_file(fileobj)
+                        return ObjectResult(bucket=bucket, key=key, ok=True)
+                    return ObjectResult(bucket=bucket, key=key, ok=True, data=blob.download_as_bytes())
+                response = self.client.get_object(bucket, key)
+                try:
+                    if fileobj is not None:
+                        for chunk in response.stream(1024 * 1024):
+                            fileobj.write(chunk)
+                        return ObjectResult(bucket=bucket, key=key, ok=True)
+                    return ObjectResult(bucket=bucket, key=key, ok=True, data=response.read())
+                finally:
+                    response.close()
+                    response.release_conn()
+
+            # A retry would append to what a non-seekable sink already received
+            item_retries = retries if fileobj is None or fileobj.seekable() else 0
+            return self._with_retries(bucket, key, call, item_retries)
+
+        return self._run_bulk("get_many", objects, _get, max_workers)
+
+    def put_many(
+        self,
+        objects: Sequence[Tuple[str, str, Union[bytes, BinaryIO], Optional[str]]],
+        max_workers: int = BULK_MAX_WORKERS,
+        retries: int = BULK_RETRIES,
+    ) -> List[ObjectResult]:
+        """Upload many objects concurrently.
+
+        Args:
+            objects: (bucket, key, data, content_type) tuples; data is bytes or a readable
+                binary file object (streamed, must be seekable to be retried)
+            max_workers: Maximum number of concurrent uploads
+            retries: Retries per object for transient errors
+
+        Returns:
+            One ObjectResult per object, in input order (``info`` holds size, etag and,
+            for bytes, the sha256 also stored as object metadata)
+        """
+
+        def _put(item) -> ObjectResult:
+            bucket, key, data, content_type = item
+            content_type = content_type or "application/octet-stream"
+
+            def call() -> ObjectResult:
+                sha256 = None
+                if isinstance(data, (bytes, bytearray)):
+                    from io import BytesIO
+
+                    stream, length = BytesIO(data), len(data)
+                    sha256 = hashlib.sha256(data).hexdigest()
+                else:
+                    stream = data
+                    if stream.seekable():
+                        stream.seek(0, os.SEEK_END)
+                        length = stream.tell()
+                        stream.seek(0)
+                    else:
+                        length = -1
+                metadata = {OBJECT_SHA256_METADATA: sha256} if sha256 else None
+                if self.use_gcs:
+                    blob = self.gcs_client.bucket(bucket).blob(key)
+                    blob.metadata = metadata
+                    blob.upload_from_file(stream, size=length if length >= 0 else None, content_type=content_type)
+                    info = {"size": blob.size, "etag": blob.etag, "sha256": sha256}
+                    return ObjectResult(bucket=bucket, key=key, ok=True, info=info)
+                write = self.client.put_object(
+                    bucket,
+                    key,
+                    stream,
+                    length=length,
+                    content_type=content_type,
+                    metadata=metadata,
+                    part_size=MINIO_MULTIPART_PART_SIZE if length < 0 else 0,
+                )
+                info = {"size": length, "etag": write.etag, "sha256": sha256}
+                return ObjectResult(bucket=bucket, key=key, ok=True, info=info)
+
+            # A retry would re-send the rest of a partly consumed non-seekable stream
+            item_retries = retries if isinstance(data, (bytes, bytearray)) or data.seekable() else 0
+            return self._with_retries(bucket, key, call, item_retries)
+
+        return self._run_bulk("put_many", objects, _put, max_workers)
+
+    def stat_many(
+        self,
+        objects: Sequence[Tuple[str, str]],
+        max_workers: int = BULK_MAX_WORKERS,
+        retries: int = BULK_RETRIES,
+    ) -> List[ObjectResult]:
+        """Get metadata of many objects concurrently.
+
+        Args:
+            objects: (bucket, key) pairs
+            max_workers: Maximum number of concurrent requests
+            retries: Retries per object for transient errors
+
+        Returns:
+            One ObjectResult per object, in input order; ``info`` has the same keys as
+            stat_object() and missing objects have ok=False, error="not found"
+        """
+
+        def _stat(item) -> ObjectResult:
+            bucket, key = item
+
+            def call() -> ObjectResult:
+                try:
+                    if self.use_gcs:
+                        blob = self.gcs_client.bucket(bucket).get_blob(key)
+                        if blob is None:
+                            return ObjectResult(bucket=bucket, key=key, ok=False, error="not found")
+                        info = {
+                            "size": blob.size,
+                            "etag": blob.etag or blob.md5_hash or "",
+                            "content_type": blob.content_type,
+                            "last_modified": blob.updated,
+                            "sha256": (blob.metadata or {}).get(OBJECT_SHA256_METADATA),
+                        }
+                    else:
+                        stat = self.client.stat_object(bucket, key)
+                        info = {
+                            "size": stat.size,
+                            "etag": stat.etag,
+                            "content_type": stat.content_type,
+                            "last_modified": stat.last_modified,
+                            "sha256": _minio_sha256_metadata(stat),
+                        }
+                except Exception as e:
+                    if _is_not_found(e):
+                        return ObjectResult(bucket=bucket, key=key, ok=False, error="not found")
+                    raise
+                return ObjectResult(bucket=bucket, key=key, ok=True, info=info)
+
+            return self._with_retries(bucket, key, call, retries)
+
+        return self._run_bulk("stat_many", objects, _stat, max_workers)
+
+    @timed_dependency("storage")
+    def delete_many(
+        self,
+        objects: Sequence[Tuple[str, str]],
+        max_workers: int = BULK_MAX_WORKERS,
+        retries: int = BULK_RETRIES,
+    ) -> List[ObjectResult]:
+        """Delete many objects.
+
+        Deleting an object that does not exist counts as success.
+
+        Args:
+            objects: (bucket, key) pairs
+            max_workers: Maximum number of concurrent requests (GCS)
+            retries: Retries for transient errors
+
+        Returns:
+            One ObjectResult per object, in input order
+        """
+        if not self.use_gcs and objects:
+            return self._delete_many_minio(objects, retries)
+
+        def _delete(item) -> ObjectResult:
+            bucket, key = item
+
+            def call() -> ObjectResult:
+                try:
+                    self.gcs_client.bucket(bucket).blob(key).delete()
+                except Exception as e:
+                    if not _is_not_found(e):
+                        raise
+                return ObjectResult(bucket=bucket, key=key, ok=True)
+
+            return self._with_retries(bucket, key, call, retries)
+
+        return self._run_bulk("delete_many", objects, _delete, max_workers)
+
+    def _delete_many_minio(self, objects: Sequence[Tuple[str, str]], retries: int) -> List[ObjectResult]:
+        """Delete objects with MinIO's multi-object delete (up to 1000 keys per request)."""
+        from minio.deleteobjects import DeleteObject
+
+        started = time.perf_counter()
+        self._ensure_buckets()
+        by_bucket: Dict[str, List[str]] = {}
+        for bucket, key in objects:
+            by_bucket.setdefault(bucket, []).append(key)
+
+        errors: Dict[Tuple[str, str], str] = {}
+        for bucket, keys in by_bucket.items():
+            for start in range(0, len(keys), 1000):
+                batch = keys[start : start + 1000]
+                result = self._with_retries(
+                    bucket,
+                    "",
+                    lambda: ObjectResult(
+                        bucket=bucket,
+                        key="",
+                        ok=True,
+                        info={
+                            "errors": [
+                                (e.name, f"{e.code}: {e.message}")
+                                # remove_objects is lazy, consuming the iterator performs the deletes
+                                for e in self.client.remove_objects(bucket, [DeleteObject(k) for k in batch])
+                            ]
+                        },
+                    ),
+                    retries,
+                )
+                if not result.ok:
+                    errors.update({(bucket, key): result.error for key in batch})
+                else:
+                    errors.update({(bucket, name): message for name, message in result.info["errors"]})
+
+        results = [
+            ObjectResult(bucket=bucket, key=key, ok=(bucket, key) not in errors, error=errors.get((bucket, key)), attempts=1)
+            for bucket, key in objects
+        ]
+        logger.info(
+            f"delete_many: {len(results)} objects ({len(errors)} failed) in {time.perf_counter() - started:.2f}s"
+        )
+        return results
+
+_storage_client: Optional[MinIOClient] = None
+_storage_client_lock = threading.Lock()
+
+
+def get_storage_client() -> MinIOClient:
+    """Get the process-wide storage client (singleton pattern).
+
+    The client is thread-safe and pools its HTTP connections, so callers should
+    share it instead of constructing MinIOClient() per request.
+    """
+    global _storage_client
+    if _storage_client is None:
+        with _storage_client_lock:
+            if _storage_client is None:
+                _storage_client = MinIOClient()
+    return _storage_client
+
+
+def _reset_storage_client_after_fork() -> None:
+    """Reset locks and drop the singleton in forked children (e.g. Airflow task processes).
+
+    Nothing is rebuilt here: the child creates its storage client on first use, and
+    existing MinIOClient instances rebuild their HTTP clients lazily.
+    """
+    global _storage_client, _storage_client_lock
+    _storage_client = None
+    _storage_client_lock = threading.Lock()
+    MinIOClient._presign_cache_lock = threading.Lock()
+    MinIOClient._iam_signing_lock = threading.Lock()
+    MinIOClient._bootstrap_lock = threading.Lock()
+    MinIOClient._iam_signing_clients = {}
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_storage_client_after_fork)
+
+
 # Global instance
-minio_client = MinIOClient()
+minio_client = get_storage_client()
@@ -120,6 +120,7 @@ def mock_minio_client(monkeypatch):
     mock_client.presign.return_value = "https://example.com/presigned-url"
     
     monkeypatch.setattr("primedata.storage.minio_client.MinIOClient", lambda: mock_client)
+    monkeypatch.setattr("primedata.storage.minio_client._storage_client", mock_client)
     return mock_client
 
 
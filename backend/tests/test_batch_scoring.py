@@ -0,0 +1,40 @@
+from primedata.services.batch_scoring import iter_scored_batches
+from primedata.services.trust_scoring import score_record, score_record_with_ai_ready_metrics, score_records_batch
+
+PLAYBOOK = {"coherence": {"method": "sentence_connectivity"}}
+WEIGHTS = {"Completeness": 1.0, "Quality": 1.0, "Secure": 1.0, "Context_Quality": 1.0}
+
+
+def _records(file_idx, n=5):
+    return [
+        {
+            "chunk_id": f"{file_idx}-{i}",
+            "section": "intro",
+            "text": f"Document {file_idx} chunk {i}. Contact john@example.com for support.\n\nSee section {i} for details.",
+        }
+        for i in range(n)
+    ]
+
+
+def test_batch_matches_per_record_scoring():
+    records = _records(0)
+    assert score_records_batch(records, WEIGHTS, PLAYBOOK) == [
+        score_record_with_ai_ready_metrics(r, WEIGHTS, PLAYBOOK) for r in records
+    ]
+    assert score_records_batch(records, WEIGHTS, ai_ready=False) == [score_record(r, WEIGHTS) for r in records]
+
+
+def test_process_pool_preserves_file_order():
+    batches = [(f"file_{i}", _records(i, n=3)) for i in range(6)]
+    timings = {}
+    results = list(
+        iter_scored_batches(iter(batches), WEIGHTS, PLAYBOOK, max_workers=2, max_in_flight=3, timings=timings)
+    )
+    # Sub-metric timings come back from the worker processes
+    assert set(timings) == {"tokenize", "base_metrics", "ai_ready_metrics"}
+    assert timings["base_metrics"] > 0
+
+    assert [key for key, _, _, _ in results] == [key for key, _ in batches]
+    for (_, records, scored, error) in results:
+        assert error is None
+        assert scored == score_records_batch(records, WEIGHTS, PLAYBOOK)
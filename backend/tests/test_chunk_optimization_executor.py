@@ -0,0 +1,98 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+pytest.importorskip("openai")
+
+from primedata.ingestion_pipeline.aird_stages.optimization.executor import ChunkOptimizationExecutor
+from primedata.services.llm_cache import LLMResultCache
+
+
+class _MockChatHandler(BaseHTTPRequestHandler):
+    """Minimal OpenAI-compatible /chat/completions endpoint that upper-cases the text."""
+
+    calls = 0
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        type(self).calls += 1
+        prompt = body["messages"][-1]["content"]
+        text = prompt.split("Text to optimize:\n", 1)[1].rsplit("\n\nEnhanced text", 1)[0]
+        payload = {
+            "id": "mock",
+            "object": "chat.completion",
+            "created": 0,
+            "model": body["model"],
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": text.upper()}, "finish_reason": "stop"}],
+            "usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15},
+        }
+        data = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def mock_llm_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _MockChatHandler)
+    _MockChatHandler.calls = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/v1"
+    server.shutdown()
+
+
+def test_executor_optimizes_concurrently_and_caches(mock_llm_url, tmp_path):
+    llm_config = {"api_key": "test", "model": "gpt-4o-mini", "base_url": mock_llm_url}
+    texts = [f"chunk number {i}" for i in range(6)]
+    cache = LLMResultCache(str(tmp_path / "llm_cache.sqlite"))
+
+    executor = ChunkOptimizationExecutor(llm_config, max_concurrency=3, tokens_per_minute=100_000, cache=cache)
+    results = executor.optimize_many(texts)
+
+    assert [r["optimized_text"] for r in results] == [t.upper() for t in texts]
+    assert executor.stats.llm_calls == 6 and executor.stats.cache_hits == 0
+    assert executor.stats.total_cost > 0
+    assert _MockChatHandler.calls == 6
+
+    # A re-run (new executor, same persistent cache) makes no API calls
+    rerun = ChunkOptimizationExecutor(llm_config, cache=LLMResultCache(str(tmp_path / "llm_cache.sqlite")))
+    assert [r["optimized_text"] for r in rerun.optimize_many(texts)] == [t.upper() for t in texts]
+    assert rerun.stats.cache_hits == 6 and rerun.stats.llm_calls == 0
+    assert _MockChatHandler.calls == 6
+
+
+def test_optimized_records_keep_the_offsets_of_the_text_they_rewrote(mock_llm_url, monkeypatch, tmp_path):
+    import uuid
+
+    from primedata.ingestion_pipeline.aird_stages.preprocess import ChunkedDocument, PreprocessStage, _build_record
+    from primedata.ingestion_pipeline.aird_stages.utils.chunking import Chunk, text_from_runs
+
+    document = "alpha text\n\nbeta text"
+    records = [
+        _build_record("doc", "doc.txt", "doc", 1, "body", "Body", text, i, 2, uuid.uuid4(), char_span=span)
+        for i, (text, span) in enumerate([("alpha text", (0, 10)), ("beta text", (12, 21))])
+    ]
+    stage = PreprocessStage(product_id=uuid.uuid4(), version=1, workspace_id=uuid.uuid4())
+    stage._optimization_config = {"llm_config": {"api_key": "test", "model": "gpt-4o-mini", "base_url": mock_llm_url}}
+    stage._chunk_optimization_stats = {"llm_optimized": 0, "failed": 0, "total_cost": 0.0}
+    monkeypatch.setenv("PRIMEDATA_LLM_CACHE_PATH", str(tmp_path / "llm_cache.sqlite"))
+
+    stage._optimize_chunk_records(records, [(1, "beta text", "Body", "body")], {})
+
+    optimized = records[1]
+    assert optimized["text"] == "BETA TEXT" and optimized["llm_optimized"]
+    assert (optimized["char_start"], optimized["char_end"]) == (12, 21)
+    assert (records[0]["char_start"], records[0]["char_end"]) == (0, 10) and "llm_optimized" not in records[0]
+
+    chunks = [Chunk(0, 10, ((0, 10, None),)), Chunk(12, 21, ((12, 21, None),))]
+    materialized = list(ChunkedDocument(document, records, chunks).iter_records())
+    assert [r["text"] for r in materialized] == ["alpha text", "BETA TEXT"]
+    assert [text_from_runs(document, r["char_runs"]) for r in materialized] == ["alpha text", "beta text"]
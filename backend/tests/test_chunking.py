@@ -0,0 +1,160 @@
+"""Golden outputs of sentence_chunk/paragraph_chunk (must not change with chunker internals) and chunk spans."""
+
+import pytest
+
+from primedata.ingestion_pipeline.aird_stages.utils.chunking import (
+    paragraph_chunk,
+    paragraph_chunk_spans,
+    sentence_chunk,
+    sentence_chunk_spans,
+    text_from_runs,
+)
+
+SENTENCES = "First sentence here. Second one follows!  Third\nwraps a line? Fourth is last."
+LONG_SENTENCE = "Short intro. " + "word " * 40 + "end. Tail sentence."
+PARAGRAPHS = "Para one has text.\n\nPara two is here.\n   \nPara three closes."
+INDENTED = "Heading line\n    indented body line one\n    indented body line two\nBack left"
+
+GOLDEN = [
+    (
+        sentence_chunk,
+        SENTENCES,
+        (8, 1, 10),
+        [
+            "First sentence here",
+            "First sentence here Second one",
+            "one follows",
+            "Second one follows Third wraps",
+            "wraps a line",
+            "Third\nwraps a line Fourth is last.",
+        ],
+    ),
+    (
+        paragraph_chunk,
+        SENTENCES,
+        (8, 1, 10),
+        [
+            "First sentence here",
+            "First sentence here Second one",
+            "one follows",
+            "First sentence here Second one",
+            "one follows Third wraps a line",
+            "Second one follows Third wraps",
+            "wraps a line Fourth is last.",
+        ],
+    ),
+    (
+        sentence_chunk,
+        LONG_SENTENCE,
+        (10, 1, 12),
+        [
+            "Short intro. word word word word word",
+            "word word word word word word word word",
+            "word word word word word word word word",
+            "word word word word word word word word",
+            "word word word word word word word word",
+            "word word word word word word word word",
+            "word word word word word word word end",
+            "word word word word word word word end",
+            "word word word word word word word end",
+            "word end Tail sentence.",
+        ],
+    ),
+    (
+        paragraph_chunk,
+        LONG_SENTENCE,
+        (10, 1, 12),
+        [
+            "Short intro. word word word word word",
+            "word word word word word word word word",
+            "word word word word word word word word",
+            "word word word word word word word word",
+            "word word word word word word word word",
+            "word word word word word word word word",
+            "word word word word word word word end",
+            "word word word word word word word end",
+            "word word word word word word word end",
+            "word end Tail sentence.",
+        ],
+    ),
+    (
+        sentence_chunk,
+        PARAGRAPHS,
+        (10, 1, 0),
+        [
+            "Para one has text Para two is here",
+            "Para two is here Para three closes.",
+        ],
+    ),
+    (
+        paragraph_chunk,
+        PARAGRAPHS,
+        (10, 1, 0),
+        [
+            "Para one has text.\n\nPara two is here.",
+            "Para two is here.\n\nPara three closes.",
+        ],
+    ),
+    (
+        sentence_chunk,
+        INDENTED,
+        (6, 1, 0),
+        [
+            "Heading line indented",
+            "body line one indented",
+            "body line two Back left",
+            "body line two Back left",
+        ],
+    ),
+    (
+        paragraph_chunk,
+        INDENTED,
+        (6, 1, 0),
+        [
+            "Heading line",
+            "indented body line one",
+            "indented body line two",
+            "indented body line two",
+            "Back left",
+        ],
+    ),
+]
+
+
+@pytest.mark.parametrize("chunker,body,args,expected", GOLDEN)
+def test_chunkers_match_golden_output(chunker, body, args, expected):
+    assert chunker(body, *args) == expected
+
+
+def test_chunkers_handle_empty_bodies():
+    assert paragraph_chunk("  \n ", 10, 1, 0) == []
+    assert sentence_chunk("", 10, 1, 0) == []
+
+
+
+@pytest.mark.parametrize(
+    "spans,chunker", [(sentence_chunk_spans, sentence_chunk), (paragraph_chunk_spans, paragraph_chunk)]
+)
+def test_chunk_spans_of_a_section_match_chunking_the_section_alone(spans, chunker):
+    # Only the middle section of a document buffer is chunked
+    section = INDENTED + "\n\n" + LONG_SENTENCE
+    source = PARAGRAPHS + "\n\n" + section + "\n\n" + SENTENCES
+    start, end = len(PARAGRAPHS) + 2, len(PARAGRAPHS) + 2 + len(section)
+    chunks = spans(source, 8, 1, 10, start, end)
+
+    assert [chunk.text(source) for chunk in chunks] == chunker(section, 8, 1, 10)
+    for chunk in chunks:
+        assert start <= chunk.start < chunk.end <= end
+        # The span starts and ends with the chunk's words (sentence punctuation is dropped from the text)
+        span_words, text_words = source[chunk.start : chunk.end].split(), chunk.text(source).split()
+        assert span_words[0].startswith(text_words[0]) and span_words[-1].startswith(text_words[-1])
+
+
+@pytest.mark.parametrize("spans", [sentence_chunk_spans, paragraph_chunk_spans])
+@pytest.mark.parametrize("body", [SENTENCES, LONG_SENTENCE, PARAGRAPHS, INDENTED + "\n\n" + LONG_SENTENCE])
+def test_chunk_runs_rebuild_the_chunk_text_from_source_slices(spans, body):
+    for chunk in spans(body, 8, 1, 10):
+        runs = chunk.runs(body)
+        assert text_from_runs(body, runs) == chunk.text(body)
+        # Runs are source slices of the chunk's span joined by whitespace
+        assert all(chunk.start <= start <= end <= chunk.end and not prefix.strip() for start, end, prefix in runs)
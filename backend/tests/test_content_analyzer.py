@@ -13,3 +13,52 @@ def test_build_representative_sample_large_text_contains_markers_and_caps():
     assert len(sample) <= 20000
     assert "=== MIDDLE SAMPLE ===" in sample
     assert "=== END SAMPLE ===" in sample
+
+
+def test_build_representative_sample_can_keep_line_structure():
+    text = "\n".join(f"Line {i} of the document." for i in range(3000))
+    sample = build_representative_sample(text, chunk=5000, max_total=20000, preserve_structure=True)
+
+    assert len(sample) <= 20000
+    assert "MIDDLE SAMPLE" not in sample
+    # Segments are cut at line boundaries and joined as paragraphs
+    lines = [line for line in sample.split("\n") if line]
+    assert all(line in text.split("\n") for line in lines)
+    assert sample.count("\n\n") == 2
+
+
+def test_preview_chunking_uses_the_preprocess_chunkers():
+    from primedata.analysis.chunk_preview import clear_preview_caches
+    from primedata.analysis.content_analyzer import ChunkingConfig, ChunkingStrategy, ContentType, content_analyzer
+
+    content = "\n\n".join(
+        f"Paragraph {i} starts here. It has a second sentence about retrieval. And a third one." for i in range(40)
+    )
+    config = ChunkingConfig(60, 10, 20, 200, ChunkingStrategy.SENTENCE_BOUNDARY, ContentType.GENERAL, 1.0, "test")
+    clear_preview_caches()
+
+    first = content_analyzer._simulate_chunking(content, config, playbook_id="TECH")
+    assert len(first) > 1
+    # Sentence chunks end at sentence boundaries, unlike fixed character windows
+    assert all(chunk["text"].rstrip(".").endswith(("here", "retrieval", "one")) for chunk in first)
+    assert [chunk["chunk_index"] for chunk in first] == list(range(len(first)))
+    # Same sample and settings are served from the result cache
+    assert content_analyzer._simulate_chunking(content, config, playbook_id="TECH") is first
+
+
+def test_pattern_scan_matches_per_pattern_findall():
+    import re
+
+    from primedata.analysis.content_analyzer import content_analyzer
+
+    text = (
+        "WHEREAS the parties agree, pursuant to  the EBA guidelines, in accordance with\nBasel.\n"
+        "Market\n risk and interest  rate risk on the balance sheet; Kapital and ſec (folded case).\n"
+        "## API endpoint\n  * query the index\ndef handler(request):\n# comment\n1.2 Results and findings\n"
+        "[see](http://example.com) party_x bank-risk 10:30 PM John: hi"
+    )
+    matches = content_analyzer._pattern_scanner.scan(text)
+    for content_type, patterns in content_analyzer.content_patterns.items():
+        for index, pattern in enumerate(patterns):
+            expected = re.findall(pattern, text, re.IGNORECASE | re.MULTILINE)
+            assert matches.get((content_type, index), []) == expected, pattern
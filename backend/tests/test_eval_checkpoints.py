@@ -0,0 +1,66 @@
+import uuid
+from types import SimpleNamespace
+
+from primedata.evaluation.harness.runner import CHECKPOINT_BUCKET, EvaluationRunner
+from primedata.storage import minio_client as storage_module
+from primedata.storage.filesystem_client import FilesystemStorageClient
+
+
+class _FakeQdrant:
+    def search_batch(self, collection_name, query_vectors, limit, with_vectors):
+        return [[{"id": 1, "score": 0.9, "payload": {"chunk_id": "c1", "text": "chunk text"}}] for _ in query_vectors]
+
+
+class _FakeEvaluator:
+    """Evaluator stand-in recording the queries it scores."""
+
+    def __init__(self):
+        self.scored = []
+        embedder = SimpleNamespace(embed_batch=lambda queries: [[0.1, 0.2] for _ in queries])
+        self.metric_registry = SimpleNamespace(embedding_generator=embedder, judge=None)
+
+    def evaluate_query(self, query, **kwargs):
+        self.scored.append(query)
+        return {"groundedness": {"score": 1.0, "passed": True}}
+
+
+def _runner(tmp_path, monkeypatch):
+    monkeypatch.setattr(storage_module, "minio_client", FilesystemStorageClient(tmp_path))
+    runner = EvaluationRunner(db=None, checkpoint_every=1)
+    runner.evaluator = _FakeEvaluator()
+    return runner
+
+
+def _item(query):
+    return SimpleNamespace(id=uuid.uuid4(), query=query, expected_chunks=None, expected_docs=None, extra_metadata=None)
+
+
+def test_pipelined_runner_resumes_from_checkpoint(tmp_path, monkeypatch):
+    runner = _runner(tmp_path, monkeypatch)
+    items = [_item(f"question {i}") for i in range(3)]
+    prefix = EvaluationRunner._checkpoint_prefix(uuid.uuid4(), uuid.uuid4(), 1, uuid.uuid4())
+    runner._write_checkpoint(prefix, 0, [{"item_id": str(items[1].id), "query": items[1].query, "answer": "saved"}])
+
+    results, resumed = runner._evaluate_items(items, _FakeQdrant(), "collection", None, None, prefix)
+
+    assert resumed == 1
+    assert sorted(runner.evaluator.scored) == ["question 0", "question 2"]
+    assert [r["item_id"] for r in results] == [str(item.id) for item in items]
+    assert results[1]["answer"] == "saved"
+    assert results[0]["retrieved_chunk_ids"] == ["c1"] and results[0]["answer_method"] == "template"
+    assert len(storage_module.minio_client.list_objects(CHECKPOINT_BUCKET, prefix)) == 3
+
+
+def test_checkpoint_is_deleted_without_touching_other_runs(tmp_path, monkeypatch):
+    runner = _runner(tmp_path, monkeypatch)
+    workspace_id, product_id = uuid.uuid4(), uuid.uuid4()
+    finished = EvaluationRunner._checkpoint_prefix(workspace_id, product_id, 1, uuid.uuid4())
+    other = EvaluationRunner._checkpoint_prefix(workspace_id, product_id, 1, uuid.uuid4())
+    for prefix in (finished, other):
+        runner._write_checkpoint(prefix, 0, [{"item_id": "a"}])
+        runner._write_checkpoint(prefix, 1, [{"item_id": "b"}])
+
+    runner._delete_checkpoint(finished)
+
+    assert storage_module.minio_client.list_objects(CHECKPOINT_BUCKET, finished) == []
+    assert runner._load_checkpoint(other)[1] == 2
@@ -0,0 +1,294 @@
+import hashlib
+import io
+import json
+import zipfile
+
+import numpy as np
+import pytest
+
+from primedata.services.export_bundles import write_export_bundle
+from primedata.storage.minio_client import MinIOClient
+
+
+class _FakeQdrant:
+    """Pages through in-memory points like QdrantClient.scroll_points."""
+
+    def __init__(self, n_points, dim):
+        self.points = [
+            {"id": i, "vector": [float(i)] * dim, "payload": {"chunk_id": f"c{i}", "text": f"chunk {i}"}}
+            for i in range(n_points)
+        ]
+        self.dim = dim
+
+    def get_collection_info(self, collection_name):
+        return {"points_count": len(self.points), "config": {"vector_size": self.dim, "distance": "Cosine"}}
+
+    def scroll_points(self, collection_name, limit, offset=None, with_payload=True, with_vector=False):
+        start = offset or 0
+        end = min(start + limit, len(self.points))
+        return {"points": self.points[start:end], "next_page_offset": end if end < len(self.points) else None}
+
+
+class _Unseekable:
+    def __init__(self):
+        self.buffer = io.BytesIO()
+
+    def write(self, data):
+        return self.buffer.write(data)
+
+    def flush(self):
+        pass
+
+
+def test_export_bundle_streams_parts_with_float32_vectors():
+    sink = _Unseekable()
+    manifest = write_export_bundle(sink, _FakeQdrant(25, 8), "col", {"export_info": {}}, page_size=10)
+
+    assert manifest["total_points"] == 25 and [p["rows"] for p in manifest["parts"]] == [10, 10, 5]
+
+    with zipfile.ZipFile(io.BytesIO(sink.buffer.getvalue())) as bundle:
+        assert json.loads(bundle.read("manifest.json")) == manifest
+        vectors = np.load(io.BytesIO(bundle.read("vectors/part-00001.npy")))
+        chunks = bundle.read("chunks/part-00001.jsonl").decode().splitlines()
+
+    assert vectors.dtype == np.float32 and vectors.shape == (10, 8)
+    assert [json.loads(line)["chunk_id"] for line in chunks] == [f"c{i}" for i in range(10, 20)]
+    assert vectors[0, 0] == 10.0
+
+
+def test_put_stream_uploads_produced_bytes_and_aborts_on_error(monkeypatch):
+    uploaded = {}
+
+    class _FakeMinio:
+        def put_object(self, bucket, key, data, length, content_type=None, part_size=0):
+            body = b""
+            while True:
+                part = data.read(4096)
+                if not part:
+                    break
+                body += part
+            uploaded[key] = body
+            return type("Write", (), {"etag": "etag"})()
+
+        def copy_object(self, bucket, key, source, metadata=None, metadata_directive=None):
+            assert (source.bucket_name, source.object_name) == (bucket, key) and metadata_directive == "REPLACE"
+            uploaded[f"{key}.metadata"] = metadata
+            return type("Write", (), {"etag": "etag-2"})()
+
+    client = MinIOClient()
+    client._buckets_ensured = True
+    monkeypatch.setattr(client, "client", _FakeMinio())
+    monkeypatch.setattr(client, "use_gcs", False)
+
+    info = client.put_stream("primedata-exports", "ok", lambda sink: [sink.write(b"x" * 100_000) for _ in range(3)])
+    assert info["size"] == 300_000 and uploaded["ok"] == b"x" * 300_000
+    assert uploaded["ok.metadata"]["sha256"] == info["sha256"] == hashlib.sha256(b"x" * 300_000).hexdigest()
+    assert info["etag"] == "etag-2"
+
+    def _failing(sink):
+        sink.write(b"partial")
+        raise ValueError("boom")
+
+    assert client.put_stream("primedata-exports", "bad", _failing) is None
+    assert "bad" not in uploaded
+
+
+class _FakeGcsBlob:
+    """Blob whose upload_from_file without a size behaves like a resumable upload (tracks offsets with tell())."""
+
+    def __init__(self, store, key):
+        self.store, self.key = store, key
+        self.chunk_size = None
+        self.metadata = None
+        self.etag = None
+
+    def upload_from_file(self, stream, content_type=None):
+        body = b""
+        while True:
+            start = stream.tell()
+            chunk = stream.read(self.chunk_size)
+            assert stream.tell() == start + len(chunk)
+            body += chunk
+            if len(chunk) < self.chunk_size:
+                break
+        self.store[self.key] = body
+        self.etag = "gcs-etag-1"
+
+    def patch(self):
+        self.store[f"{self.key}.metadata"] = dict(self.metadata)
+        self.etag = "gcs-etag-2"
+
+
+class _FakeGcs:
+    def __init__(self):
+        self.store = {}
+
+    def bucket(self, name):
+        return type("Bucket", (), {"blob": lambda _, key: _FakeGcsBlob(self.store, key)})()
+
+
+def _gcs_storage_client(monkeypatch):
+    import primedata.storage.minio_client as module
+
+    monkeypatch.setattr(module, "MINIO_MULTIPART_PART_SIZE", 64 * 1024)
+    client = MinIOClient()
+    client._buckets_ensured = True
+    gcs = _FakeGcs()
+    monkeypatch.setattr(client, "use_gcs", True)
+    monkeypatch.setattr(client, "gcs_client", gcs)
+    return client, gcs
+
+
+def test_put_stream_resumable_upload_to_gcs_with_sha256_metadata(monkeypatch):
+    client, gcs = _gcs_storage_client(monkeypatch)
+    data = bytes(range(256)) * 1000  # Several resumable chunks
+
+    info = client.put_stream("primedata-exports", "bundle.zip", lambda sink: sink.write(data))
+
+    assert gcs.store["bundle.zip"] == data
+    assert info == {"size": len(data), "sha256": hashlib.sha256(data).hexdigest(), "etag": "gcs-etag-2"}
+    assert gcs.store["bundle.zip.metadata"] == {"sha256": info["sha256"]}
+
+
+def test_processed_jsonl_streams_to_gcs(monkeypatch):
+    import uuid
+
+    from primedata.ingestion_pipeline.aird_stages.storage import AirdStorageAdapter
+
+    client, gcs = _gcs_storage_client(monkeypatch)
+    storage = AirdStorageAdapter(uuid.uuid4(), uuid.uuid4(), 1, minio_client=client)
+    records = [{"chunk_id": f"c{i}", "text": "chunk text " * 20} for i in range(1000)]
+
+    key = storage.put_processed_jsonl("doc", iter(records))
+
+    body = gcs.store[key]
+    assert [json.loads(line) for line in body.decode("utf-8").split("\n")] == records
+    assert storage.get_written_info("primedata-clean", key)["sha256"] == hashlib.sha256(body).hexdigest()
+
+
+def test_bundle_import_memory_maps_vectors_and_verifies_checksums(tmp_path):
+    from primedata.services.bundle_import import (
+        BundleVerificationError,
+        _upsert_parallel,
+        iter_bundle_points,
+        open_part_vectors,
+        read_manifest,
+        verify_bundle,
+    )
+
+    sink = _Unseekable()
+    write_export_bundle(sink, _FakeQdrant(25, 8), "col", {"export_info": {}}, page_size=10)
+    bundle_path = tmp_path / "bundle.zip"
+    bundle_path.write_bytes(sink.buffer.getvalue())
+
+    with zipfile.ZipFile(bundle_path) as bundle:
+        manifest = read_manifest(bundle)
+        verify_bundle(bundle, manifest)
+
+        vectors = open_part_vectors(str(bundle_path), bundle, manifest["parts"][2])
+        assert isinstance(vectors, np.memmap) and vectors.shape == (5, 8) and vectors[4, 0] == 24.0
+
+        upserted = []
+
+        class _Target:
+            def upsert_points(self, collection_name, points, batch_size=50):
+                upserted.extend(points)
+                return True
+
+        batches = iter_bundle_points(str(bundle_path), bundle, manifest, "p2", 3, "new_col", batch_size=4)
+        assert _upsert_parallel(_Target(), "new_col", batches, max_workers=2) == 25
+
+    assert sorted(p["payload"]["chunk_id"] for p in upserted) == sorted(f"c{i}" for i in range(25))
+    assert {(p["payload"]["product_id"], p["payload"]["version"]) for p in upserted} == {("p2", 3)}
+
+    manifest["parts"][1]["vectors_sha256"] = "0" * 64
+    with zipfile.ZipFile(bundle_path) as bundle, pytest.raises(BundleVerificationError):
+        verify_bundle(bundle, manifest)
+
+
+def _recompressed_bundle(tmp_path):
+    """Bundle whose parts were repacked with compression (vectors can't be mapped from the zip)."""
+    sink = _Unseekable()
+    write_export_bundle(sink, _FakeQdrant(25, 8), "col", {"export_info": {}}, page_size=10)
+    bundle_path = tmp_path / "bundle.zip"
+    with zipfile.ZipFile(io.BytesIO(sink.buffer.getvalue())) as source, zipfile.ZipFile(
+        bundle_path, "w", zipfile.ZIP_DEFLATED
+    ) as target:
+        for name in source.namelist():
+            target.writestr(name, source.read(name))
+    return bundle_path
+
+
+def test_compressed_parts_are_extracted_to_a_removed_temp_dir(tmp_path, monkeypatch):
+    import tempfile
+
+    from primedata.services.bundle_import import iter_bundle_points, read_manifest
+
+    bundle_path = _recompressed_bundle(tmp_path)
+    temp_root = tmp_path / "tmp"
+    temp_root.mkdir()
+    monkeypatch.setattr(tempfile, "tempdir", str(temp_root))
+
+    with zipfile.ZipFile(bundle_path) as bundle:
+        manifest = read_manifest(bundle)
+        points = [p for batch in iter_bundle_points(str(bundle_path), bundle, manifest, "p2", 3, "new_col") for p in batch]
+
+    assert len(points) == 25 and points[24]["vector"][0] == 24.0
+    assert list(temp_root.iterdir()) == []
+
+
+def test_failed_import_removes_the_partial_collection(tmp_path):
+    import uuid
+    from types import SimpleNamespace
+
+    from primedata.db.models import PipelineRunStatus
+    from primedata.services.bundle_import import import_bundle_file
+
+    bundle_path = _recompressed_bundle(tmp_path)
+    product = SimpleNamespace(id=uuid.uuid4(), workspace_id=uuid.uuid4(), name="prod", embedding_config={})
+
+    class _Session:
+        rolled_back = False
+
+        def query(self, model):
+            return self
+
+        def filter(self, *args):
+            return self
+
+        def first(self):
+            return product
+
+        def rollback(self):
+            self.rolled_back = True
+
+        def commit(self):
+            pass
+
+    class _Target:
+        def __init__(self):
+            self.collections = set()
+
+        def get_collection_name(self, workspace_id, product_id, version, product_name):
+            return f"ws_{workspace_id}_v{version}"
+
+        def list_collections(self):
+            return list(self.collections)
+
+        def ensure_collection(self, collection_name, vector_size, distance, tenant=None, embedding_model=None):
+            self.collections.add(collection_name)
+            return True
+
+        def upsert_points(self, collection_name, points, batch_size=50):
+            return False  # e.g. Qdrant went away mid-import
+
+        def delete_collection(self, collection_name):
+            self.collections.discard(collection_name)
+            return True
+
+    db, target = _Session(), _Target()
+    pipeline_run = SimpleNamespace(product_id=product.id, version=2, metrics={}, status=None, finished_at=None)
+    stats = import_bundle_file(db, str(bundle_path), pipeline_run, qdrant_client=target)
+
+    assert "error" in stats and pipeline_run.status == PipelineRunStatus.FAILED
+    assert db.rolled_back and target.collections == set()
@@ -0,0 +1,64 @@
+import hashlib
+import uuid
+
+from primedata.ingestion_pipeline.aird_stages.storage import AirdStorageAdapter
+from primedata.storage.filesystem_client import FilesystemStorageClient
+
+
+def test_filesystem_client_matches_minio_client_semantics(tmp_path):
+    client = FilesystemStorageClient(tmp_path)
+    info = client.put_bytes_with_info("primedata-raw", "ws/a/doc.txt", b"hello")
+    assert info["size"] == 5 and info["sha256"] == hashlib.sha256(b"hello").hexdigest()
+    assert client.stat_object("primedata-raw", "ws/a/doc.txt")["sha256"] == info["sha256"]
+    assert client.get_json("primedata-raw", "missing.json") is None
+    assert client.put_json("primedata-exports", "run/metrics.json", {"stages": 2})
+    assert client.get_json("primedata-exports", "run/metrics.json") == {"stages": 2}
+
+    # A failing producer leaves nothing behind
+    def _fail(sink):
+        sink.write(b"partial")
+        raise RuntimeError("boom")
+
+    assert client.put_stream("primedata-clean", "out.jsonl", _fail) is None
+    assert not client.object_exists("primedata-clean", "out.jsonl")
+    assert [obj["name"] for obj in client.list_objects("primedata-raw", "ws/")] == ["ws/a/doc.txt"]
+
+    results = client.stat_many([("primedata-raw", "ws/a/doc.txt"), ("primedata-raw", "nope")])
+    assert [r.ok for r in results] == [True, False] and results[1].error == "not found"
+    assert client.put_bytes("primedata-raw", "../escape", b"x") is False
+
+
+def test_storage_adapter_round_trips_through_the_filesystem(tmp_path):
+    client = FilesystemStorageClient(tmp_path)
+    storage = AirdStorageAdapter(uuid.uuid4(), uuid.uuid4(), 1, minio_client=client)
+    records = [{"chunk_id": f"c{i}", "text": f"chunk {i}"} for i in range(3)]
+    storage.put_processed_jsonl("doc", iter(records))
+    assert storage.get_processed_jsonl("doc") == records
+
+
+def test_processed_records_slice_the_stored_normalized_document(tmp_path):
+    from primedata.ingestion_pipeline.aird_stages.playbooks import load_playbook_yaml
+    from primedata.ingestion_pipeline.aird_stages.preprocess import PreprocessStage
+
+    body = " ".join(f"Sentence {i} covers the product pipeline, release {i % 7}!" for i in range(400))
+    raw_text = "\n".join(f"=== PAGE {page} ===\n{body}\n\n    Indented note {page}\n    continues here" for page in (1, 2))
+    stage = PreprocessStage(product_id=uuid.uuid4(), version=1, workspace_id=uuid.uuid4())
+    chunking_config = {
+        "mode": "manual",
+        "manual_settings": {"chunking_strategy": "sentence", "chunk_size": 60, "chunk_overlap": 30},
+    }
+    document, _ = stage._process_document(raw_text, "doc", "doc.txt", load_playbook_yaml("TECH"), "TECH", chunking_config)
+
+    storage = AirdStorageAdapter(uuid.uuid4(), uuid.uuid4(), 1, minio_client=FilesystemStorageClient(tmp_path))
+    storage.put_processed_jsonl("doc", document.iter_records())
+    key = storage.put_normalized_document("doc", document.document)
+    assert key.endswith("doc.normalized.txt")
+
+    buffer = storage.get_normalized_document("doc")
+    records = storage.get_processed_jsonl("doc")
+    assert len(records) > 10
+    for rec in records:
+        assert "".join(prefix + buffer[start:end] for start, end, prefix in rec["char_runs"]) == rec["text"]
+        assert rec["char_start"] == rec["char_runs"][0][0] and rec["char_end"] == rec["char_runs"][-1][1]
+        if len(rec["char_runs"]) == 1:
+            assert buffer[rec["char_start"] : rec["char_end"]] == rec["text"]
@@ -0,0 +1,51 @@
+import threading
+
+from primedata.evaluation.metrics.groundedness import GroundednessMetric
+from primedata.evaluation.metrics.judge import JudgeExecutor
+from primedata.services.llm_cache import LLMResultCache
+
+
+class _FakeJudgeClient:
+    model = "fake-judge"
+
+    def __init__(self):
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def generate(self, prompt, temperature=0.0, max_tokens=10):
+        with self._lock:
+            self.calls += 1
+        return {"text": "yes" if "revenue" in prompt.split("Claim:")[1] else "no"}
+
+
+def test_groundedness_judges_claims_concurrently_and_caches_verdicts(tmp_path):
+    client = _FakeJudgeClient()
+    judge = JudgeExecutor(client, max_concurrency=4, cache=LLMResultCache(str(tmp_path / "judge.sqlite")))
+    metric = GroundednessMetric(llm_client=client, judge=judge)
+    answer = "The revenue grew strongly in the last quarter. The weather on Mars was pleasant this year."
+    chunks = [{"text": "Quarterly revenue grew strongly."}]
+
+    first = metric.evaluate(answer, chunks, threshold=0.5)
+    assert first.details["supported_claims"] == 1 and first.details["unsupported_claims"] == 1
+    assert client.calls == 2
+
+    second = metric.evaluate(answer, chunks, threshold=0.5)
+    assert second.score == first.score
+    assert client.calls == 2
+    stats = judge.stats()
+    assert stats["judge_calls"] == 2 and stats["cache_hits"] == 2
+    judge.close()
+
+
+def test_llm_cache_memory_is_bounded_and_read_errors_are_misses(tmp_path):
+    cache = LLMResultCache(str(tmp_path / "cache.sqlite"), max_memory_entries=2)
+    for i in range(3):
+        cache.set("ns", f"k{i}", {"v": i})
+    assert len(cache._memory) == 2 and "ns:k0" not in cache._memory
+    assert cache.get("ns", "k0") == {"v": 0}  # evicted from memory, still persisted
+
+    cache._conn.execute("UPDATE llm_cache SET value = 'not json' WHERE key = 'k1'")
+    cache._memory.clear()
+    assert cache.get("ns", "k1") is None
+    cache._conn.execute("DROP TABLE llm_cache")
+    assert cache.get("ns", "k2") is None
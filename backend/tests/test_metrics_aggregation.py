@@ -0,0 +1,63 @@
+import pytest
+
+from primedata.services.fingerprint import aggregate_metrics_by_file, generate_fingerprint_breakdown
+from primedata.services.metrics_aggregation import MetricsFrame
+from primedata.services.reporting import generate_validation_summary
+from primedata.services.trust_scoring import aggregate_metrics
+
+
+def _legacy_mean(metrics):
+    sums, counts = {}, {}
+    for m in metrics:
+        for k, v in m.items():
+            if isinstance(v, (int, float)) and k != "file":
+                sums[k] = sums.get(k, 0.0) + float(v)
+                counts[k] = counts.get(k, 0) + 1
+    return {k: round(total / counts[k], 4) for k, total in sums.items()}
+
+
+METRICS = [
+    {"file": "a.jsonl", "section": "intro", "AI_Trust_Score": 80.0, "Quality": 90.0, "page": 1, "chunk_id": "a1"},
+    {"file": "a.jsonl", "section": "body", "AI_Trust_Score": 60.0, "Quality": 50.0, "page": 2, "chunk_id": "a2"},
+    {"file": "b.jsonl", "section": "body", "AI_Trust_Score": 75.5, "Quality": None, "Secure": 100},
+    {"file": "b.jsonl", "section": "body", "AI_Trust_Score": 20.0, "Quality": "n/a", "Secure": 75},
+]
+
+
+def test_frame_mean_matches_dict_aggregation():
+    assert aggregate_metrics(METRICS) == pytest.approx(_legacy_mean(METRICS))
+    assert set(aggregate_metrics(METRICS)) == set(_legacy_mean(METRICS))
+
+
+def test_group_mean_and_breakdown():
+    frame = MetricsFrame(METRICS)
+    by_file = frame.group_mean("file")
+    assert by_file["a.jsonl"] == pytest.approx(_legacy_mean(METRICS[:2]))
+    assert by_file["b.jsonl"] == pytest.approx(_legacy_mean(METRICS[2:]))
+    assert aggregate_metrics_by_file(METRICS, "missing.jsonl") is None
+
+    breakdown = generate_fingerprint_breakdown(frame)
+    assert breakdown["by_section"]["body"]["count"] == 3
+    assert breakdown["percentiles"]["AI_Trust_Score"]["p50"] == pytest.approx(67.75)
+
+
+def test_validation_summary_categories():
+    csv_content = generate_validation_summary(METRICS, threshold=70.0)
+    lines = csv_content.strip().splitlines()
+    assert lines[0] == "Category,Avg Trust Score,Avg Quality,Avg Secure"
+    assert lines[1].startswith("AI Ready,77.75,90.0,100.0")
+    assert lines[2].startswith("Non-AI Ready,40.0,50.0,75.0")
+
+
+def test_trust_report_averages_fall_back_without_pandas(monkeypatch):
+    from primedata.services import reporting
+
+    labels = ["Quality", "Secure"]
+    metrics = [
+        {"AI_Trust_Score": score, "Quality": quality, "Secure": secure}
+        for score, quality, secure in [(80.0, 90.0, 100), (60.0, 50.0, 75), (90.0, 70.0, 50)]
+    ]
+    with_pandas = reporting._category_averages(metrics, labels, 75.0)
+    monkeypatch.setattr(reporting, "HAS_PANDAS", False)
+    assert reporting._category_averages(metrics, labels, 75.0) == pytest.approx(with_pandas)
+    assert with_pandas == pytest.approx(([80.0, 75.0], [50.0, 75.0]))
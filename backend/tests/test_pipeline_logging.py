@@ -0,0 +1,63 @@
+import json
+
+from loguru import logger
+
+from primedata.ingestion_pipeline.aird_stages.logging import LEVELS, PipelineLogger, pipeline_log_level
+
+
+def _capture(log_level="INFO", **kwargs):
+    messages = []
+    sink_id = logger.add(messages.append, level="TRACE", format="{level}|{message}")
+    log = PipelineLogger("preprocess", level=LEVELS[log_level], sinks=("loguru",), **kwargs)
+    return log, messages, sink_id
+
+
+def test_pipeline_logger_gates_levels_before_formatting():
+    log, messages, sink_id = _capture("INFO")
+
+    class Unformattable:
+        def __format__(self, spec):
+            raise AssertionError("disabled records must not be formatted")
+
+    try:
+        log.debug("chunk {}", Unformattable())
+        log.info("loaded {} ({:,} chars)", "doc", 12000)
+    finally:
+        logger.remove(sink_id)
+    assert [m.strip() for m in messages] == ["INFO|loaded doc (12,000 chars)"]
+
+
+def test_pipeline_logger_samples_repetitive_messages():
+    log, messages, sink_id = _capture(sample_first=2, sample_every=5)
+    try:
+        for i in range(12):
+            log.sampled("empty_page", "WARNING", "Skipping empty page {}", i)
+        log.flush_suppressed()
+    finally:
+        logger.remove(sink_id)
+    lines = [m.strip() for m in messages]
+    assert lines == [
+        "WARNING|Skipping empty page 0",
+        "WARNING|Skipping empty page 1",
+        "WARNING|Skipping empty page 4 (5 occurrences so far)",
+        "WARNING|Skipping empty page 9 (10 occurrences so far)",
+        "INFO|[preprocess] 8 'empty_page' messages suppressed by sampling",
+    ]
+
+
+def test_pipeline_logger_file_summary_is_structured():
+    log, messages, sink_id = _capture()
+    try:
+        log.file_summary("doc", "succeeded", chunks=3, duration_s=0.25)
+    finally:
+        logger.remove(sink_id)
+    record = messages[0].record
+    assert record["extra"]["file_summary"] == {"file_stem": "doc", "status": "succeeded", "chunks": 3, "duration_s": 0.25}
+    assert json.loads(record["message"].split(" file ", 1)[1])["chunks"] == 3
+
+
+def test_pipeline_log_level_per_stage_override(monkeypatch):
+    monkeypatch.setenv("PRIMEDATA_PIPELINE_LOG_LEVEL", "WARNING")
+    monkeypatch.setenv("PRIMEDATA_PIPELINE_LOG_LEVEL_PREPROCESS", "debug")
+    assert pipeline_log_level("preprocess") == LEVELS["DEBUG"]
+    assert pipeline_log_level("scoring") == LEVELS["WARNING"]
@@ -0,0 +1,33 @@
+import threading
+
+from primedata.storage.minio_client import MinIOClient
+
+
+def test_presign_many_reuses_cached_urls_and_signs_concurrently(monkeypatch):
+    client = MinIOClient()
+    MinIOClient._presign_cache.clear()
+    calls = []
+    lock = threading.Lock()
+
+    def fake_sign(bucket, key, expiry, inline):
+        with lock:
+            calls.append((bucket, key, expiry, inline))
+        return f"https://signed/{bucket}/{key}?inline={inline}&X-Amz-Expires={expiry}"
+
+    monkeypatch.setattr(client, "_presign_uncached", fake_sign)
+
+    objects = [("primedata-clean", f"doc-{i % 5}.txt") for i in range(20)]
+    urls = client.presign_many(objects, expiry=3600, inline=True)
+
+    assert urls == [f"https://signed/{b}/{k}?inline=True&X-Amz-Expires=3600" for b, k in objects]
+    assert len(calls) == 5  # Duplicates are signed once
+
+    # Cached URLs are reused, also for expiries falling in the same bucket
+    assert client.presign("primedata-clean", "doc-0.txt", expiry=3500, inline=True) == urls[0]
+    assert client.presign_many([("primedata-clean", "doc-1.txt"), ("", "")], inline=True) == [urls[1], None]
+    assert len(calls) == 5
+
+    # Different disposition is a different URL
+    client.presign("primedata-clean", "doc-0.txt", expiry=3600, inline=False)
+    assert len(calls) == 6
+    MinIOClient._presign_cache.clear()
@@ -0,0 +1,78 @@
+import uuid
+from datetime import datetime, timedelta
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from primedata.core.metrics import (
+    HTTP_REQUEST_DURATION,
+    REGISTRY,
+    REQUEST_DEPENDENCY_DURATION,
+    MetricsRegistry,
+    timed_dependency,
+)
+from primedata.core.metrics_middleware import MetricsMiddleware
+from primedata.ingestion_pipeline.aird_stages.base import StageResult, StageStatus
+from primedata.ingestion_pipeline.aird_stages.stage_metrics import export_stage_metrics
+
+
+def test_registry_renders_prometheus_text_format():
+    registry = MetricsRegistry()
+    registry.counter("jobs_total", "Jobs", ("kind",)).inc(2, kind='say "hi"')
+    latency = registry.histogram("latency_seconds", "Latency", buckets=(0.1, 1.0))
+    latency.observe(0.05)
+    latency.observe(0.5)
+    latency.observe(3)
+
+    lines = registry.render().splitlines()
+    assert "# TYPE jobs_total counter" in lines
+    assert 'jobs_total{kind="say \\"hi\\""} 2' in lines
+    assert 'latency_seconds_bucket{le="0.1"} 1' in lines
+    assert 'latency_seconds_bucket{le="1"} 2' in lines
+    assert 'latency_seconds_bucket{le="+Inf"} 3' in lines
+    assert "latency_seconds_count 3" in lines and "latency_seconds_sum 3.55" in lines
+
+
+def test_middleware_labels_route_templates_and_dependency_time():
+    @timed_dependency("qdrant")
+    def search():
+        return []
+
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/items/{item_id}")
+    def get_item(item_id: str):
+        search()
+        return {"id": item_id}
+
+    client = TestClient(app)
+    before = HTTP_REQUEST_DURATION.count(method="GET", route="/items/{item_id}", status="200")
+    for item_id in ("a", "b"):
+        assert client.get(f"/items/{item_id}").status_code == 200
+    assert client.get("/nope").status_code == 404
+
+    assert HTTP_REQUEST_DURATION.count(method="GET", route="/items/{item_id}", status="200") == before + 2
+    assert HTTP_REQUEST_DURATION.count(method="GET", route="unmatched", status="404") >= 1
+    assert REQUEST_DEPENDENCY_DURATION.count(route="/items/{item_id}", dependency="qdrant") >= 2
+    assert 'route="/items/a"' not in REGISTRY.render()
+
+
+def test_stage_metrics_written_to_textfile(tmp_path):
+    started = datetime(2026, 1, 1)
+    result = StageResult(
+        status=StageStatus.SUCCEEDED,
+        stage_name="preprocess",
+        product_id=uuid.uuid4(),
+        version=1,
+        metrics={"total_chunks": 50},
+        started_at=started,
+        finished_at=started + timedelta(seconds=2),
+        profile={"spans": {"file/fetch": {"bytes": 0}, "file/fetch/download": {"bytes": 4096}}},
+    )
+    export_stage_metrics(result, textfile_dir=str(tmp_path), pushgateway_url="")
+
+    text = (tmp_path / "aird_stage_preprocess.prom").read_text()
+    assert 'aird_stage_last_run_records_per_second{stage="preprocess"} 25' in text
+    assert 'aird_stage_last_run_bytes_read{stage="preprocess"} 4096' in text
+    assert 'aird_stage_last_run_status{stage="preprocess",status="succeeded"} 1' in text
@@ -0,0 +1,213 @@
+from types import SimpleNamespace
+
+from qdrant_client.http import models
+
+from primedata.indexing.qdrant_client import REGISTRY_COLLECTION, QdrantClient
+
+
+class _FakeQdrant:
+    """Registry lookups and collection listing of a Qdrant server with one shared-layout tenant."""
+
+    def __init__(self, registry):
+        self.registry = registry
+        self.retrieves = 0
+
+    def retrieve(self, collection_name, ids, with_payload):
+        self.retrieves += 1
+        return [SimpleNamespace(payload=entry) for entry in self.registry.values() if entry["id"] in ids]
+
+    def get_collections(self):
+        names = ["ws_w1__legacy__v_1", "primedata_shared__minilm__d384", REGISTRY_COLLECTION]
+        return SimpleNamespace(collections=[SimpleNamespace(name=name) for name in names])
+
+    def scroll(self, collection_name, scroll_filter, limit, offset, with_payload):
+        points = [SimpleNamespace(payload=e) for e in self.registry.values() if e["kind"] == "collection"]
+        return points, None
+
+
+def test_shared_layout_resolves_logical_names_to_tenant_filters(monkeypatch):
+    from primedata.indexing import qdrant_client as module
+
+    monkeypatch.setenv("QDRANT_COLLECTION_LAYOUT", "shared")
+    monkeypatch.setattr(QdrantClient, "_registry_cache", {})
+    client = QdrantClient()
+    tenant = {"workspace_id": "w1", "product_id": "p1", "collection_id": "ws_w1__docs__v_2"}
+    physical = client.shared_collection_name("minilm", 384)
+    client.client = _FakeQdrant(
+        {
+            "ws_w1__docs__v_2": {
+                "id": module._registry_point_id("ws_w1__docs__v_2"),
+                "kind": "collection",
+                "name": "ws_w1__docs__v_2",
+                "physical": physical,
+                "tenant": tenant,
+            }
+        }
+    )
+
+    assert physical == "primedata_shared__minilm__d384"
+    assert client._resolve("ws_w1__docs__v_2") == (physical, tenant)
+    # Unregistered names are per-version collections (mixed layouts during migration)
+    assert client._resolve("ws_w1__legacy__v_1") == ("ws_w1__legacy__v_1", None)
+    client._resolve("ws_w1__docs__v_2")
+    assert client.client.retrieves == 2  # Both lookups cached
+
+    # The tenant always wins over caller filters
+    assert client._with_tenant({"product_id": "other", "version": 2}, tenant) == {**tenant, "version": 2}
+    assert client.list_collections() == ["ws_w1__legacy__v_1", "ws_w1__docs__v_2"]
+
+
+def test_per_version_layout_ignores_registry(monkeypatch):
+    monkeypatch.delenv("QDRANT_COLLECTION_LAYOUT", raising=False)
+    client = QdrantClient()
+    client.client = _FakeQdrant({})
+
+    assert client._resolve("ws_w1__docs__v_2") == ("ws_w1__docs__v_2", None)
+    assert client.client.retrieves == 0
+
+
+def test_registry_entries_changed_by_another_process_expire(monkeypatch):
+    from primedata.indexing import qdrant_client as module
+
+    monkeypatch.setenv("QDRANT_COLLECTION_LAYOUT", "shared")
+    monkeypatch.setattr(QdrantClient, "_registry_cache", {})
+    client = QdrantClient()
+    entry = {
+        "id": module._registry_point_id("ws_w1__docs__v_2"),
+        "kind": "collection",
+        "name": "ws_w1__docs__v_2",
+        "physical": "primedata_shared__minilm__d384",
+        "tenant": {"workspace_id": "w1", "product_id": "p1", "collection_id": "ws_w1__docs__v_2"},
+    }
+    registry = {"ws_w1__docs__v_2": entry}
+    client.client = _FakeQdrant(registry)
+    assert client._resolve("ws_w1__docs__v_2")[0] == "primedata_shared__minilm__d384"
+
+    # Another process re-registers the name under a new embedding model, then deletes it
+    registry["ws_w1__docs__v_2"] = {**entry, "physical": "primedata_shared__openai__d1536"}
+    assert client._resolve("ws_w1__docs__v_2")[0] == "primedata_shared__minilm__d384"  # Still cached
+    monkeypatch.setattr(module, "REGISTRY_POSITIVE_TTL_SECONDS", 0.0)
+    assert client._resolve("ws_w1__docs__v_2")[0] == "primedata_shared__openai__d1536"
+    registry.clear()
+    assert client._resolve("ws_w1__docs__v_2") == ("ws_w1__docs__v_2", None)
+
+
+class _RecordingQdrant:
+    """Qdrant server that keeps the tenant registry and records every call on other collections."""
+
+    def __init__(self):
+        self.collections = set()
+        self.registry = {}
+        self.calls = []
+
+    def collection_exists(self, collection_name):
+        return collection_name in self.collections
+
+    def create_collection(self, collection_name, **kwargs):
+        self.collections.add(collection_name)
+
+    def create_payload_index(self, collection_name, field_name, field_schema):
+        self.calls.append(("create_payload_index", collection_name, field_name))
+
+    def retrieve(self, collection_name, ids, with_payload):
+        return [SimpleNamespace(payload=payload) for point_id, payload in self.registry.items() if point_id in ids]
+
+    def upsert(self, collection_name, points, wait):
+        if collection_name == REGISTRY_COLLECTION:
+            self.registry.update((point.id, point.payload) for point in points)
+        else:
+            self.calls.append(("upsert", collection_name, points))
+
+    def delete(self, collection_name, points_selector, wait):
+        if collection_name == REGISTRY_COLLECTION:
+            for point_id in points_selector.points:
+                self.registry.pop(point_id, None)
+        else:
+            self.calls.append(("delete", collection_name, points_selector.filter))
+
+    def query_points(self, collection_name, query, limit, query_filter, **kwargs):
+        self.calls.append(("query_points", collection_name, query_filter))
+        return SimpleNamespace(points=[])
+
+    def scroll(self, collection_name, scroll_filter, limit, offset, **kwargs):
+        self.calls.append(("scroll", collection_name, scroll_filter))
+        return [], None
+
+    def delete_collection(self, collection_name):
+        self.calls.append(("delete_collection", collection_name, None))
+
+
+def _conditions(query_filter):
+    assert isinstance(query_filter, models.Filter)
+    return {(condition.key, condition.match.value) for condition in query_filter.must}
+
+
+def _shared_client(monkeypatch):
+    monkeypatch.setenv("QDRANT_COLLECTION_LAYOUT", "shared")
+    monkeypatch.setattr(QdrantClient, "_registry_cache", {})
+    client = QdrantClient()
+    client.client = _RecordingQdrant()
+    return client
+
+
+TENANT = {"workspace_id": "w1", "product_id": "p1", "collection_id": "ws_w1__docs__v_2"}
+
+
+def test_ensure_tenant_collection_registers_and_moves_tenants(monkeypatch):
+    client = _shared_client(monkeypatch)
+    fake = client.client
+
+    tenant = {"workspace_id": "w1", "product_id": "p1"}
+    assert client.ensure_collection("ws_w1__docs__v_2", 384, tenant=tenant, embedding_model="minilm")
+    assert "primedata_shared__minilm__d384" in fake.collections
+    indexed = {field for call, name, field in fake.calls if call == "create_payload_index" and name != REGISTRY_COLLECTION}
+    assert indexed == {"workspace_id", "product_id", "collection_id", "version"}
+    assert client._resolve("ws_w1__docs__v_2") == ("primedata_shared__minilm__d384", TENANT)
+
+    # Same model and dimension: nothing changes
+    fake.calls.clear()
+    assert client.ensure_collection("ws_w1__docs__v_2", 384, tenant=TENANT, embedding_model="minilm")
+    assert fake.calls == []
+
+    # New embedding model: the tenant's old points are dropped and the name moves to the new shared collection
+    assert client.ensure_collection("ws_w1__docs__v_2", 1536, tenant=TENANT, embedding_model="openai")
+    deletes = [(name, _conditions(selector)) for call, name, selector in fake.calls if call == "delete"]
+    assert deletes == [("primedata_shared__minilm__d384", set(TENANT.items()))]
+    assert client._resolve("ws_w1__docs__v_2") == ("primedata_shared__openai__d1536", TENANT)
+
+
+def test_tenant_data_paths_are_scoped_to_the_tenant(monkeypatch):
+    client = _shared_client(monkeypatch)
+    client.ensure_collection("ws_w1__docs__v_2", 2, tenant=TENANT, embedding_model="minilm")
+    fake = client.client
+    fake.calls.clear()
+    physical = "primedata_shared__minilm__d2"
+
+    points = [{"id": 1, "vector": [0.1, 0.2], "payload": {"text": "a", "product_id": "spoofed", "version": 2}}]
+    assert client.upsert_points("ws_w1__docs__v_2", points)
+    client.search_points("ws_w1__docs__v_2", [0.1, 0.2], filter_conditions={"product_id": "other", "section": "body"})
+    client.scroll_points("ws_w1__docs__v_2", filter_conditions={"chunk_id": "c1"})
+
+    upsert, search, scroll = fake.calls
+    assert upsert[:2] == ("upsert", physical)
+    # The tenant fields overwrite whatever the point payload says
+    assert upsert[2][0].payload == {"text": "a", "version": 2, **TENANT}
+    assert search[:2] == ("query_points", physical)
+    assert _conditions(search[2]) == {("section", "body"), *TENANT.items()}
+    assert scroll[:2] == ("scroll", physical)
+    assert _conditions(scroll[2]) == {("chunk_id", "c1"), *TENANT.items()}
+
+
+def test_deleting_a_tenant_collection_deletes_only_its_points(monkeypatch):
+    client = _shared_client(monkeypatch)
+    client.ensure_collection("ws_w1__docs__v_2", 2, tenant=TENANT, embedding_model="minilm")
+    fake = client.client
+    fake.calls.clear()
+
+    assert client.delete_collection("ws_w1__docs__v_2")
+
+    assert [(call, name) for call, name, _ in fake.calls] == [("delete", "primedata_shared__minilm__d2")]
+    assert _conditions(fake.calls[0][2]) == set(TENANT.items())
+    assert fake.registry == {}
+    # The name is forgotten, so it resolves to a per-version collection again
+    assert client._resolve("ws_w1__docs__v_2") == ("ws_w1__docs__v_2", None)
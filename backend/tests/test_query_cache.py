@@ -0,0 +1,49 @@
+from types import SimpleNamespace
+
+from primedata.services.query_cache import QueryResultCache, acl_fingerprint
+
+
+def _key(cache, query="What is AIRD?", acl_fp="none"):
+    return cache.make_key(
+        "playground",
+        product_id="p1",
+        collection_name="ws_1__prod_p1__v_2",
+        version=2,
+        query=query,
+        top_k=5,
+        acl_fp=acl_fp,
+    )
+
+
+def test_query_cache_hits_normalized_queries_and_tracks_saved_latency():
+    cache = QueryResultCache(max_entries=2, ttl_seconds=60)
+    cache.set(_key(cache), {"results": [1, 2]}, latency_ms=120.0)
+
+    assert cache.get(_key(cache, query="  what is   AIRD? ")) == {"results": [1, 2]}
+    assert cache.get(_key(cache, query="something else")) is None
+
+    stats = cache.stats()
+    assert stats["hits"] == 1 and stats["misses"] == 1 and stats["hit_ratio"] == 0.5
+    assert 0 < stats["saved_latency_ms"] <= 120.0
+
+    # LRU tier is bounded
+    cache.set(_key(cache, query="a"), {}, 1.0)
+    cache.set(_key(cache, query="b"), {}, 1.0)
+    assert cache.stats()["entries"] == 2
+
+
+def test_query_cache_invalidation_and_acl_isolation():
+    cache = QueryResultCache(ttl_seconds=60)
+    cache.set(_key(cache), {"results": ["stale"]})
+
+    cache.invalidate_product("p1")
+    assert cache.get(_key(cache)) is None
+
+    cache.set(_key(cache), {"results": ["fresh"]})
+    cache.invalidate_collection("ws_1__prod_p1__v_2")
+    assert cache.get(_key(cache)) is None
+
+    restricted = acl_fingerprint([SimpleNamespace(access_type="document", index_scope=None, doc_scope="d1", field_scope=None)])
+    assert restricted != acl_fingerprint([])
+    cache.set(_key(cache), {"results": ["everything"]})
+    assert cache.get(_key(cache, acl_fp=restricted)) is None
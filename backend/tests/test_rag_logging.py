@@ -0,0 +1,102 @@
+import threading
+import uuid
+
+from primedata.services import rag_logging
+from primedata.services.rag_logging import RAGLoggingService, RAGLogWriter
+from primedata.services.s3_content_storage import CONTENT_BUCKET
+from primedata.storage.filesystem_client import FilesystemStorageClient
+
+
+class RecordingSession:
+    """Session stand-in that records the rows of bulk inserts."""
+
+    def __init__(self, rows, gate=None, started=None):
+        self.rows = rows
+        self.gate = gate
+        self.started = started
+
+    def execute(self, statement, rows):
+        if self.started is not None:
+            self.started.set()
+        if self.gate is not None:
+            self.gate.wait(5)
+        self.rows.extend(rows)
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def test_log_request_is_batched_and_response_goes_to_storage(tmp_path, monkeypatch):
+    rows = []
+    storage = FilesystemStorageClient(tmp_path)
+    writer = RAGLogWriter(batch_size=2, flush_ms=20, session_factory=lambda: RecordingSession(rows), storage_client=storage)
+    monkeypatch.setattr(rag_logging, "_rag_log_writer", writer)
+    workspace_id, product_id = uuid.uuid4(), uuid.uuid4()
+
+    log_ids = [
+        RAGLoggingService.log_request(None, workspace_id, product_id, None, 1, f"question {i}", response=f"answer {i}" if i else None)
+        for i in range(3)
+    ]
+    assert writer.flush(5)
+    writer.close()
+
+    assert [row["id"] for row in rows] == log_ids
+    assert "response" not in rows[1] and rows[0]["response_path"] is None and rows[0]["prompt_hash"] is None
+    assert storage.get_object(CONTENT_BUCKET, rows[1]["response_path"]) == b"answer 1"
+    assert writer.stats()["written"] == 3 and writer.stats()["batches"] >= 2
+
+
+def test_full_queue_drops_and_counts_events():
+    rows = []
+    gate, started = threading.Event(), threading.Event()
+    writer = RAGLogWriter(queue_size=1, batch_size=1, flush_ms=0, session_factory=lambda: RecordingSession(rows, gate, started))
+    event = {"id": uuid.uuid4(), "workspace_id": uuid.uuid4(), "product_id": uuid.uuid4(), "version": 1, "query": "q"}
+
+    assert writer.submit(dict(event))
+    assert started.wait(5)  # the writer thread is busy with the first event
+    assert writer.submit(dict(event))  # fills the queue
+    assert not writer.submit(dict(event))
+    gate.set()
+    assert writer.flush(5)
+    writer.close()
+
+    assert writer.stats() == {"queued": 0, "enqueued": 2, "written": 2, "dropped": 1, "failed": 0, "batches": 2}
+    assert len(rows) == 2
+
+
+def test_sync_mode_writes_with_its_own_session(monkeypatch):
+    class FailingSession(RecordingSession):
+        rolled_back = closed = False
+
+        def execute(self, statement, rows):
+            raise RuntimeError("database is down")
+
+        def rollback(self):
+            self.rolled_back = True
+
+        def close(self):
+            self.closed = True
+
+    class CallerSession:
+        def __getattr__(self, name):
+            raise AssertionError(f"caller session used: {name}")
+
+    sessions = []
+
+    def factory():
+        sessions.append(FailingSession([]))
+        return sessions[-1]
+
+    writer = RAGLogWriter(session_factory=factory)
+    monkeypatch.setattr(rag_logging, "_rag_log_writer", writer)
+    monkeypatch.setenv("PRIMEDATA_RAG_LOG_ASYNC", "false")
+
+    assert RAGLoggingService.log_request(CallerSession(), uuid.uuid4(), uuid.uuid4(), None, 1, "q") is None
+    assert len(sessions) == 1 and sessions[0].rolled_back and sessions[0].closed
+    writer.close()
@@ -0,0 +1,98 @@
+import random
+import zlib
+
+import numpy as np
+import pytest
+
+from primedata.evaluation.gates.gate_evaluator import GateEvaluator
+from primedata.evaluation.metrics.relevance import RelevanceMetric
+from primedata.evaluation.metrics.retrieval import RetrievalMetric, compute_retrieval_metrics_batch
+
+
+def test_batch_metrics_match_per_query_metrics():
+    rng = random.Random(7)
+    ranked = [[f"c{rng.randint(0, 20)}" for _ in range(rng.randint(0, 12))] for _ in range(200)]
+    relevant = [[f"c{rng.randint(0, 20)}" for _ in range(rng.randint(1, 4))] for _ in range(200)]
+
+    batch = compute_retrieval_metrics_batch(ranked, relevant, k_values=[5, 10], n_bootstrap=200)
+
+    metric = RetrievalMetric()
+    expected_mrr = sum(metric.calculate_mrr(r, e) for r, e in zip(ranked, relevant)) / len(ranked)
+    expected_ndcg = sum(metric.calculate_ndcg_at_k(r, e, k=5) for r, e in zip(ranked, relevant)) / len(ranked)
+    assert batch["num_queries"] == 200
+    assert batch["metrics"]["mrr"]["mean"] == pytest.approx(expected_mrr)
+    assert batch["metrics"]["ndcg_at_5"]["mean"] == pytest.approx(expected_ndcg)
+    assert batch["metrics"]["mrr"]["ci_low"] <= expected_mrr <= batch["metrics"]["mrr"]["ci_high"]
+
+
+def test_gates_use_batch_retrieval_metrics():
+    per_query = [
+        {"retrieved_chunk_ids": ["a", "b"], "expected_chunk_ids": ["a"], "metrics": {}},
+        {"retrieved_chunk_ids": ["c", "d"], "expected_chunk_ids": ["d"], "metrics": {}},
+    ]
+    result = GateEvaluator(thresholds={"retrieval_mrr_min": 0.7}).evaluate_gates({}, per_query)
+    assert result["gates"]["retrieval_mrr_min"]["actual"] == pytest.approx(0.75)
+    assert result["all_passed"]
+
+
+def test_run_aggregates_use_the_batch_metrics():
+    from primedata.evaluation.harness.runner import EvaluationRunner
+
+    rng = random.Random(3)
+    per_query = [
+        {
+            "retrieved_chunk_ids": [f"c{rng.randint(0, 9)}" for _ in range(5)],
+            "expected_chunk_ids": [f"c{rng.randint(0, 9)}"],
+            "metrics": {"groundedness": {"score": rng.random()}, "relevance": {"score": rng.random()}},
+        }
+        for _ in range(100)
+    ]
+    per_query[0]["metrics"].pop("relevance")
+    per_query.append({"error": "timeout", "metrics": {"groundedness": {"score": 0.0}}})
+
+    aggregates = EvaluationRunner.__new__(EvaluationRunner)._calculate_aggregates(per_query)
+
+    grounded = [r["metrics"]["groundedness"]["score"] for r in per_query[:100]]
+    assert aggregates["groundedness"]["mean"] == pytest.approx(sum(grounded) / 100)
+    assert (aggregates["groundedness"]["min"], aggregates["groundedness"]["max"]) == (min(grounded), max(grounded))
+    assert aggregates["groundedness"]["ci_low"] < aggregates["groundedness"]["mean"] < aggregates["groundedness"]["ci_high"]
+    assert aggregates["relevance"]["count"] == 99
+    # Ranking metrics are the ones the quality gates use
+    gates = GateEvaluator(thresholds={"retrieval_mrr_min": 0.0}).evaluate_gates({}, per_query)
+    assert aggregates["retrieval_mrr"]["mean"] == pytest.approx(gates["gates"]["retrieval_mrr_min"]["actual"])
+    assert aggregates["retrieval_mrr"]["count"] == 100
+
+
+class _TextEmbedder:
+    """Deterministic embedder recording the texts of each embed_batch call."""
+
+    def __init__(self):
+        self.calls = []
+
+    def embed_batch(self, texts):
+        self.calls.append(list(texts))
+        return [np.random.default_rng(zlib.crc32(text.encode())).random(4) for text in texts]
+
+
+def test_chunk_embedding_matrix_uses_stored_vectors_and_embeds_the_rest_once():
+    embedder = _TextEmbedder()
+    stored = {text: vector.tolist() for text, vector in zip(["a", "b"], embedder.embed_batch(["a", "b"]))}
+    embedder.calls.clear()
+    chunks = [
+        {"text": "a", "embedding": stored["a"]},  # retrieved with_vectors
+        {"text": "c"},  # no stored vector
+        {"text": ""},  # skipped
+        {"text": "b", "embedding": stored["b"]},
+        {"text": "d", "embedding": [1.0, 2.0]},  # wrong dimension: re-embedded
+    ]
+    metric = RelevanceMetric(embedding_generator=embedder)
+
+    matrix = metric._chunk_embedding_matrix(chunks, 4)
+
+    expected = np.vstack([np.asarray(v, dtype=np.float32) for v in _TextEmbedder().embed_batch(["a", "c", "b", "d"])])
+    np.testing.assert_allclose(matrix, expected, rtol=1e-6)
+    assert embedder.calls == [["c", "d"]]
+
+    # Re-embedded vectors are cached for later queries over the same chunks
+    np.testing.assert_allclose(metric._chunk_embedding_matrix(chunks, 4), expected, rtol=1e-6)
+    assert len(embedder.calls) == 1
@@ -0,0 +1,74 @@
+from uuid import uuid4
+
+from primedata.ingestion_pipeline.aird_stages.base import AirdStage, StageStatus
+from primedata.ingestion_pipeline.aird_stages.tracing import StageTracer, merge_profiles, trace_span
+
+
+def test_spans_nest_and_aggregate_per_path():
+    tracer = StageTracer("preprocess", enabled=True)
+    for _ in range(3):
+        with tracer.span("file") as file_span:
+            with tracer.span("fetch"):
+                # Code below the stage nests under the open span without a tracer reference
+                with trace_span("pdf_extract") as span:
+                    span.add(bytes=100, records=2)
+            tracer.record("chunk", 0.5, records=4)
+            file_span.add(records=4)
+
+    profile = tracer.collect()
+    spans = profile["spans"]
+    assert set(spans) == {"file", "file/fetch", "file/fetch/pdf_extract", "file/chunk"}
+    assert spans["file"]["count"] == 3 and spans["file"]["records"] == 12
+    assert spans["file/fetch/pdf_extract"]["bytes"] == 300
+    assert spans["file/chunk"]["total_s"] == 1.5 and spans["file/chunk"]["max_s"] == 0.5
+    # Outside a traced stage, and after collect(), spans are no-ops and nothing is left over
+    with trace_span("orphan") as span:
+        span.add(bytes=1)
+    assert tracer.collect()["spans"] == {}
+
+
+def test_unclosed_child_spans_end_with_their_parent():
+    tracer = StageTracer("indexing", enabled=True)
+    parent = tracer.span("file")
+    tracer.span("process")  # e.g. left open by an early return
+    parent.end()
+    with tracer.span("store"):
+        pass
+    assert set(tracer.collect()["spans"]) == {"file", "file/process", "store"}
+
+
+def test_merge_profiles_adds_counts_and_keeps_maxima():
+    target = {"peak_rss_mb": 100.0, "spans": {"fetch": {"count": 1, "total_s": 1.0, "max_s": 1.0, "bytes": 5, "records": 1}}}
+    merge_profiles(
+        target,
+        {
+            "peak_rss_mb": 150.0,
+            "spans": {
+                "fetch": {"count": 2, "total_s": 0.5, "max_s": 0.3, "bytes": 5, "records": 2},
+                "artifact_register": {"count": 1, "total_s": 0.2, "max_s": 0.2, "bytes": 0, "records": 7},
+            },
+        },
+    )
+    assert target["peak_rss_mb"] == 150.0
+    assert target["spans"]["fetch"] == {"count": 3, "total_s": 1.5, "max_s": 1.0, "bytes": 10, "records": 3}
+    assert target["spans"]["artifact_register"]["records"] == 7
+
+
+def test_stage_result_carries_the_profile():
+    class EchoStage(AirdStage):
+        @property
+        def stage_name(self) -> str:
+            return "echo"
+
+        def execute(self, context):
+            with self.tracer.span("work") as span:
+                span.add(records=len(context["items"]))
+            return self._create_result(StageStatus.SUCCEEDED, metrics={})
+
+    stage = EchoStage(uuid4(), 1, uuid4())
+    stage.tracer.enabled = True
+    result = stage.execute({"items": [1, 2, 3]})
+    assert result.profile["spans"]["work"]["records"] == 3
+    assert result.to_dict()["profile"] == result.profile
+    # Each execution gets its own profile
+    assert stage.execute({"items": [1]}).profile["spans"]["work"]["count"] == 1
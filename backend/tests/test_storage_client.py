@@ -0,0 +1,244 @@
+import os
+
+import pytest
+import urllib3
+
+from primedata.storage import minio_client as storage_module
+from primedata.storage.minio_client import MinIOClient, get_storage_client
+
+
+def test_storage_client_is_process_singleton_with_one_time_bucket_bootstrap(monkeypatch):
+    assert get_storage_client() is get_storage_client()
+    assert storage_module.minio_client is get_storage_client()
+
+    bootstraps = []
+    monkeypatch.setattr(MinIOClient, "_bootstrapped_backends", set())
+    monkeypatch.setattr(MinIOClient, "_bootstrap_buckets", lambda self, buckets: bootstraps.append(list(buckets)))
+
+    first, second = MinIOClient(), MinIOClient()
+    first._ensure_buckets()
+    first._ensure_buckets()
+    second._ensure_buckets()
+    assert len(bootstraps) == 1
+
+    # Clients created after the bootstrap skip it without any storage calls
+    assert MinIOClient()._buckets_ensured
+
+
+def test_failed_bucket_bootstrap_is_logged_and_retried_after_backoff(monkeypatch):
+    import primedata.storage.minio_client as module
+
+    attempts = []
+
+    def unreachable(self, buckets):
+        attempts.append(list(buckets))
+        raise urllib3.exceptions.MaxRetryError(None, "http://minio", "connection refused")
+
+    monkeypatch.setattr(MinIOClient, "_bootstrapped_backends", set())
+    monkeypatch.setattr(MinIOClient, "_bootstrap_failed_at", {})
+    monkeypatch.setattr(MinIOClient, "_bootstrap_buckets", unreachable)
+    client = MinIOClient()
+
+    client._ensure_buckets()  # does not raise
+    client._ensure_buckets()  # within the backoff: no new attempt
+    assert len(attempts) == 1 and not client._buckets_ensured
+
+    monkeypatch.setattr(module, "BUCKET_BOOTSTRAP_RETRY_SECONDS", 0.0)
+    monkeypatch.setattr(MinIOClient, "_bootstrap_buckets", lambda self, buckets: attempts.append(list(buckets)))
+    client._ensure_buckets()
+    assert len(attempts) == 2 and client._buckets_ensured and not MinIOClient._bootstrap_failed_at
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork")
+def test_forked_child_gets_fresh_connection_pool():
+    client = get_storage_client()
+    parent_pool = client.client._http if client.client is not None else client.gcs_client._http
+
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:  # Child
+        # The singleton is rebuilt on first use; instances held elsewhere reconnect lazily
+        child = get_storage_client()
+        child_pool = child.client._http if child.client is not None else child.gcs_client._http
+        held_pool = client.client._http if client.client is not None else client.gcs_client._http
+        fresh = child is not client and child_pool is not parent_pool and held_pool is not parent_pool
+        os.write(write_fd, b"1" if fresh else b"0")
+        os._exit(0)
+    os.close(write_fd)
+    os.waitpid(pid, 0)
+    assert os.read(read_fd, 1) == b"1"
+    os.close(read_fd)
+
+
+class _FakeMinio:
+    """In-memory stand-in for the minio.Minio client, failing the first get of each key transiently."""
+
+    def __init__(self):
+        self.objects = {}
+        self.metadata = {}
+        self.failed_once = set()
+
+    def put_object(self, bucket, key, data, length, content_type="application/octet-stream", metadata=None, part_size=0):
+        body = data.read()
+        self.objects[(bucket, key)] = body
+        self.metadata[(bucket, key)] = {f"x-amz-meta-{k}": v for k, v in (metadata or {}).items()}
+        return type("Write", (), {"etag": f"etag-{len(body)}"})()
+
+    def get_object(self, bucket, key):
+        from minio.error import S3Error
+
+        if (bucket, key) not in self.failed_once:
+            self.failed_once.add((bucket, key))
+            raise S3Error("SlowDown", "slow down", key, "req", "host", None)
+        body = self.objects[(bucket, key)]
+
+        class _Response:
+            def read(self):
+                return body
+
+            def stream(self, amt):
+                yield body
+
+            def close(self):
+                pass
+
+            def release_conn(self):
+                pass
+
+        return _Response()
+
+    def stat_object(self, bucket, key):
+        from minio.error import S3Error
+
+        if (bucket, key) not in self.objects:
+            raise S3Error("NoSuchKey", "missing", key, "req", "host", None)
+        body = self.objects[(bucket, key)]
+        return type(
+            "Stat",
+            (),
+            {
+                "size": len(body),
+                "etag": "e",
+                "content_type": "text/plain",
+                "last_modified": None,
+                "metadata": self.metadata.get((bucket, key), {}),
+            },
+        )()
+
+    def remove_objects(self, bucket, delete_objects):
+        for obj in delete_objects:
+            self.objects.pop((bucket, obj._name), None)
+        return iter(())
+
+
+def test_bulk_operations_retry_transient_errors_and_stream(monkeypatch, tmp_path):
+    import io
+
+    import primedata.storage.minio_client as module
+
+    monkeypatch.setattr(module, "BULK_RETRY_BACKOFF_SECONDS", 0.0)
+    client = MinIOClient()
+    client._buckets_ensured = True
+    fake = _FakeMinio()
+    monkeypatch.setattr(client, "client", fake)
+    monkeypatch.setattr(client, "use_gcs", False)
+
+    source = tmp_path / "big.txt"
+    source.write_bytes(b"streamed content")
+    with open(source, "rb") as f:
+        puts = client.put_many(
+            [("primedata-raw", f"k{i}", f"value {i}".encode(), "text/plain") for i in range(20)]
+            + [("primedata-raw", "file", f, None)]
+        )
+    assert all(r.ok for r in puts) and puts[-1].info["size"] == len(b"streamed content")
+
+    gets = client.get_many([("primedata-raw", f"k{i}") for i in range(20)])
+    assert [r.data for r in gets] == [f"value {i}".encode() for i in range(20)]
+    assert all(r.attempts == 2 for r in gets)  # First attempt hit a transient SlowDown
+
+    sink = io.BytesIO()
+    assert client.get_many([("primedata-raw", "file", sink)])[0].ok
+    assert sink.getvalue() == b"streamed content"
+
+    stats = client.stat_many([("primedata-raw", "k0"), ("primedata-raw", "missing")])
+    assert stats[0].ok and stats[0].info["size"] == len(b"value 0")
+    assert not stats[1].ok and stats[1].error == "not found"
+
+    deletes = client.delete_many([("primedata-raw", f"k{i}") for i in range(20)])
+    assert all(r.ok for r in deletes) and list(fake.objects) == [("primedata-raw", "file")]
+
+
+def test_checksum_recorded_on_write_and_readable_without_download(monkeypatch):
+    import hashlib
+
+    client = MinIOClient()
+    client._buckets_ensured = True
+    fake = _FakeMinio()
+    monkeypatch.setattr(client, "client", fake)
+    monkeypatch.setattr(client, "use_gcs", False)
+
+    info = client.put_bytes_with_info("primedata-clean", "a.jsonl", b'{"text": "x"}', "application/x-ndjson")
+    assert info["sha256"] == hashlib.sha256(b'{"text": "x"}').hexdigest() and info["size"] == 13
+
+    # The checksum travels with the object, so a HEAD is enough to read it back
+    assert client.stat_object("primedata-clean", "a.jsonl")["sha256"] == info["sha256"]
+    assert client.stat_many([("primedata-clean", "a.jsonl")])[0].info["sha256"] == info["sha256"]
+
+
+class _NonSeekable:
+    """Readable/writable stream that cannot seek (like a socket or pipe)."""
+
+    def __init__(self, data=b""):
+        self.data = bytearray(data)
+        self.position = 0
+
+    def seekable(self):
+        return False
+
+    def read(self, size=-1):
+        end = len(self.data) if size < 0 else self.position + size
+        chunk = bytes(self.data[self.position : end])
+        self.position += len(chunk)
+        return chunk
+
+    def write(self, chunk):
+        self.data.extend(chunk)
+        return len(chunk)
+
+
+def test_non_seekable_streams_are_not_retried_after_a_mid_stream_failure(monkeypatch):
+    import primedata.storage.minio_client as module
+    from urllib3.exceptions import ProtocolError
+
+    monkeypatch.setattr(module, "BULK_RETRY_BACKOFF_SECONDS", 0.0)
+    client = MinIOClient()
+    client._buckets_ensured = True
+    fake = _FakeMinio()
+    monkeypatch.setattr(client, "client", fake)
+    monkeypatch.setattr(client, "use_gcs", False)
+
+    def put_object_failing_mid_stream(bucket, key, data, length, **kwargs):
+        data.read(4)
+        raise ProtocolError("connection reset")
+
+    monkeypatch.setattr(fake, "put_object", put_object_failing_mid_stream)
+    result = client.put_many([("primedata-raw", "stream", _NonSeekable(b"0123456789"), None)])[0]
+    assert not result.ok and result.attempts == 1 and ("primedata-raw", "stream") not in fake.objects
+
+    fake.objects[("primedata-raw", "doc")] = b"payload"
+
+    class _Response:
+        def stream(self, amt):
+            yield b"pay"
+            raise ProtocolError("connection reset")
+
+        def close(self):
+            pass
+
+        def release_conn(self):
+            pass
+
+    monkeypatch.setattr(fake, "get_object", lambda bucket, key: _Response())
+    sink = _NonSeekable()
+    result = client.get_many([("primedata-raw", "doc", sink)])[0]
+    assert not result.ok and result.attempts == 1 and bytes(sink.data) == b"pay"
@@ -930,9 +930,9 @@ export default function ProductDetailPage() {
       if (response.data) {
         setResultModalData({
           type: 'success',
-          title: 'Export Created',
-          message: 'Export bundle has been created successfully',
-          details: `Bundle: ${response.data.bundle_name} (${formatFileSize(response.data.size_bytes)})`
+          title: 'Export Started',
+          message: 'Export bundle is being built in the background and will appear in the list when ready',
+          details: `Bundle: ${response.data.bundle_name}`
         })
         setShowResultModal(true)
         setShowCreateExportModal(false)